@@ -0,0 +1,128 @@
+# Copyright (c) 2026 Roboto Technologies, Inc.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Benchmark: streaming as-of alignment vs. materialize-then-``pandas.merge_asof``.
+
+Aligns synthetic IMU (1 kHz) and GPS (10 Hz) streams onto wheel odometry (50 Hz)
+rows, two ways:
+
+* ``stream``: :py:func:`roboto.experimental.topics.align_batches`, consuming the
+  streams batch by batch as a topic read yields them.
+* ``pandas``: every stream collected into a DataFrame first, then joined with
+  ``pandas.merge_asof``, as analyses commonly do today.
+
+Each runs in a freshly spawned process so its peak resident memory is its own. No Roboto
+deployment is needed; the streams are generated in the shape topic reads yield.
+
+    python packages/roboto/examples/align_topics_benchmark.py --minutes 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import resource
+import time
+import typing
+
+import numpy as np
+import pyarrow as pa
+
+from roboto.experimental.topics import AlignMethod, align_batches
+from roboto.experimental.topics.batch_transforms import timestamp_field
+
+BATCH_ROWS = 65_536
+"""Rows per generated batch, about what a Parquet row group decodes to."""
+
+TOLERANCE_NS = 200_000_000
+"""Largest gap, in nanoseconds, between an odometry row and the row aligned to it."""
+
+
+def synthetic_stream(rate_hz: int, minutes: float, fields: list[str], seed: int):
+    """Yield a topic-shaped stream: a marked timestamp column and one struct of float64 fields."""
+    rng = np.random.default_rng(seed)
+    period_ns = 1_000_000_000 // rate_hz
+    total = int(minutes * 60 * rate_hz)
+    schema = pa.schema(
+        [timestamp_field(), pa.field("data", pa.struct([pa.field(name, pa.float64()) for name in fields]))]
+    )
+    # One block of jitter and values, reused by every batch, so generating the
+    # stream costs little next to aligning it.
+    jitter = rng.integers(0, period_ns // 4, BATCH_ROWS)
+    values = pa.StructArray.from_arrays([pa.array(rng.standard_normal(BATCH_ROWS)) for _ in fields], names=fields)
+    for start in range(0, total, BATCH_ROWS):
+        count = min(BATCH_ROWS, total - start)
+        # Jittered sample times, as real sensors deliver them.
+        timestamps = np.arange(start, start + count, dtype=np.int64) * period_ns + jitter[:count]
+        yield pa.RecordBatch.from_arrays([pa.array(timestamps), values.slice(0, count)], schema=schema)
+
+
+def streams(minutes: float):
+    return (
+        synthetic_stream(50, minutes, ["vx", "wz"], seed=1),
+        synthetic_stream(1000, minutes, ["ax", "ay", "az", "gx", "gy", "gz"], seed=2),
+        synthetic_stream(10, minutes, ["lat", "lon", "alt"], seed=3),
+    )
+
+
+def run_stream(minutes: float, method: AlignMethod) -> int:
+    odometry, imu, gps = streams(minutes)
+    rows = 0
+    for batch in align_batches(odometry, {"imu": imu, "gps": gps}, method=method, tolerance=TOLERANCE_NS):
+        rows += batch.num_rows
+    return rows
+
+
+def run_pandas(minutes: float, method: AlignMethod) -> int:
+    import pandas as pd
+
+    def to_frame(batches, prefix: str):
+        table = pa.Table.from_batches(list(batches)).flatten()
+        frame = table.to_pandas()
+        return frame.rename(columns={name: f"{prefix}.{name}" for name in frame.columns if name != "_index"})
+
+    odometry, imu, gps = (
+        to_frame(batches, prefix) for batches, prefix in zip(streams(minutes), ("odom", "imu", "gps"))
+    )
+    direction = typing.cast(
+        typing.Literal["backward", "forward", "nearest"], "nearest" if method is AlignMethod.NEAREST else method.value
+    )
+    joined = pd.merge_asof(odometry, imu, on="_index", direction=direction, tolerance=TOLERANCE_NS)
+    joined = pd.merge_asof(joined, gps, on="_index", direction=direction, tolerance=TOLERANCE_NS)
+    return len(joined)
+
+
+def measure(mode: str, minutes: float, method: AlignMethod) -> None:
+    started = time.perf_counter()
+    rows = (run_stream if mode == "stream" else run_pandas)(minutes, method)
+    elapsed = time.perf_counter() - started
+    peak_mib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{mode:>7}: {elapsed:6.2f} s, peak RSS {peak_mib:7.0f} MiB, {rows} aligned rows", flush=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--minutes", type=float, default=30.0, help="Length of the synthetic recording.")
+    parser.add_argument(
+        "--method",
+        choices=[method.value for method in AlignMethod if method is not AlignMethod.INTERPOLATE],
+        default=AlignMethod.BACKWARD.value,
+        help="Alignment method; pandas has no interpolating as-of join to compare against.",
+    )
+    args = parser.parse_args()
+    method = AlignMethod(args.method)
+
+    print(f"Aligning {args.minutes:g} minutes of IMU (1 kHz) and GPS (10 Hz) onto odometry (50 Hz), {method.value}:")
+    # Spawned, not forked, so each measurement starts from a fresh interpreter.
+    context = multiprocessing.get_context("spawn")
+    for mode in ("stream", "pandas"):
+        process = context.Process(target=measure, args=(mode, args.minutes, method))
+        process.start()
+        process.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+# Copyright (c) 2026 Roboto Technologies, Inc.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Benchmark: bytes on the wire and latency of API calls with and without body compression.
+
+Runs a local stub API server and calls it through :py:class:`roboto.http.HttpClient`
+with :py:class:`~roboto.http.HttpCompressionOptions` off and on:
+
+* ``GET page``: a page of file records, the shape of a paginated listing.
+* ``POST body``: a large JSON request body, the shape of a bulk update.
+
+The stub compresses responses with the best coding the client accepts (zstd
+when the ``zstandard`` package is installed, else gzip) and decompresses gzip
+request bodies. ``--bandwidth`` throttles the stub's reads and writes to
+emulate a slow or metered link.
+
+    python packages/roboto/examples/api_compression_benchmark.py --bandwidth 1250000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import http.server
+import importlib
+import json
+import socketserver
+import threading
+import time
+import types
+import typing
+
+from roboto.http import (
+    HttpClient,
+    HttpClientOptions,
+    HttpCompressionOptions,
+    PooledHttpTransport,
+    UrllibTransport,
+)
+
+zstandard: typing.Optional[types.ModuleType]
+try:
+    zstandard = importlib.import_module("zstandard")
+except ImportError:
+    zstandard = None
+
+PAGE_ITEMS = 1_000
+"""File records per ``GET`` page."""
+
+POST_ITEMS = 3_000
+"""Items in the ``POST`` body."""
+
+COMPRESS_REQUESTS_OVER = 16 * 1024
+"""Request bodies larger than this are gzipped when compression is on."""
+
+
+class _WireStats:
+    """Bytes the stub server sent and received, counted around each measured call."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.sent = 0
+        self.received = 0
+
+    def reset(self) -> None:
+        with self.lock:
+            self.sent = 0
+            self.received = 0
+
+
+def make_server(stats: _WireStats, bandwidth: float) -> socketserver.TCPServer:
+    def throttle(nbytes: int) -> None:
+        if bandwidth:
+            time.sleep(nbytes / bandwidth)
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def log_message(self, *args: typing.Any) -> None:
+            pass
+
+        def do_GET(self) -> None:
+            with stats.lock:
+                stats.received += len(str(self.headers))
+            items = [
+                {
+                    "file_id": f"fl_{i:012d}",
+                    "relative_path": f"logs/2026-10-{i % 30:02d}/run_{i}/bag.mcap",
+                    "size": i * 1013,
+                    "org_id": "og_abcdefgh",
+                    "association_id": "ds_0123456789",
+                    "tags": ["robot-7", "nightly"],
+                    "metadata": {"vehicle": f"v{i % 12}", "firmware": "1.4.2"},
+                    "created": "2026-10-01T12:00:00Z",
+                    "ingestion_status": "Ingested",
+                }
+                for i in range(PAGE_ITEMS)
+            ]
+            self.send_json({"data": {"items": items, "next_token": None}})
+
+        def do_POST(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length)
+            throttle(length)
+            with stats.lock:
+                stats.received += length + len(str(self.headers))
+            body = gzip.decompress(raw) if self.headers.get("Content-Encoding") == "gzip" else raw
+            self.send_json({"data": {"received": len(body)}})
+
+        def send_json(self, payload: typing.Any) -> None:
+            body = json.dumps(payload).encode()
+            accepted = self.headers.get("Accept-Encoding", "")
+            coding = None
+            if "zstd" in accepted and zstandard is not None:
+                body, coding = zstandard.ZstdCompressor(level=3).compress(body), "zstd"
+            elif "gzip" in accepted:
+                body, coding = gzip.compress(body, 6), "gzip"
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            if coding is not None:
+                self.send_header("Content-Encoding", coding)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            with stats.lock:
+                # Roughly the status line and headers, plus the body.
+                stats.sent += 200 + len(body)
+            throttle(len(body))
+            self.wfile.write(body)
+
+    class Server(socketserver.ThreadingMixIn, http.server.HTTPServer):
+        daemon_threads = True
+
+    return Server(("127.0.0.1", 0), Handler)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=10, help="Measured calls per case.")
+    parser.add_argument(
+        "--bandwidth", type=float, default=0.0, help="Link bandwidth to emulate, in bytes/s; 0 for loopback speed."
+    )
+    args = parser.parse_args()
+
+    stats = _WireStats()
+    server = make_server(stats, args.bandwidth)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    post_body = {"items": [{"file_id": f"fl_{i:012d}", "metadata": {"k": "v" * 20, "n": i}} for i in range(POST_ITEMS)]}
+    settings = {
+        "off": HttpCompressionOptions(),
+        "on": HttpCompressionOptions(accept_compressed_responses=True, compress_requests_over=COMPRESS_REQUESTS_OVER),
+    }
+    print(f"{'transport':9} {'compress':8} {'call':9} {'down KiB':>9} {'up KiB':>9} {'ms/call':>8}")
+    for transport_name, transport in (("pooled", PooledHttpTransport), ("urllib", UrllibTransport)):
+        for setting, compression in settings.items():
+            client = HttpClient(
+                default_endpoint=base, options=HttpClientOptions(compression=compression), transport=transport()
+            )
+            calls: dict[str, typing.Callable[[], typing.Any]] = {
+                "GET page": lambda: client.get(f"{base}/files").to_dict(json_path=["data", "items"]),
+                "POST body": lambda: client.post(f"{base}/files", data=post_body).to_dict(),
+            }
+            for call_name, call in calls.items():
+                # One unmeasured call opens the connection.
+                call()
+                stats.reset()
+                started = time.perf_counter()
+                for _ in range(args.calls):
+                    call()
+                per_call_ms = (time.perf_counter() - started) / args.calls * 1000
+                print(
+                    f"{transport_name:9} {setting:8} {call_name:9} {stats.sent / args.calls / 1024:9.1f} "
+                    f"{stats.received / args.calls / 1024:9.1f} {per_call_ms:8.1f}"
+                )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+# Copyright (c) 2026 Roboto Technologies, Inc.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Benchmark: many processes reading one cached Parquet file, memory-mapped vs. buffered.
+
+Writes a synthetic topic file (a timestamp column, numeric columns, and a string
+column) the way the topic-data cache holds one, then starts ``--readers`` spawned
+processes that each open it with
+:py:func:`roboto.formats.parquet.open_cached_parquet_file` and read every row
+group's timestamp and numeric columns with
+:py:func:`~roboto.formats.parquet.read_row_groups`. The readers start together
+and run concurrently; the run is repeated with ``memory_map`` off and on.
+
+Reported per open mode: wall time, total rows/s across readers, and each
+reader's peak resident and private memory. Resident memory counts the shared
+file pages a mapped reader has touched, which the page cache holds once for all
+readers; private memory is what each reader holds alone. Memory is sampled from
+``/proc/self/smaps_rollup``, so this runs on Linux only.
+
+    python packages/roboto/examples/cached_parquet_readers_benchmark.py --readers 8 --rows 4000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import multiprocessing.synchronize
+import pathlib
+import tempfile
+import threading
+import time
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from roboto.formats.parquet import open_cached_parquet_file, read_row_groups
+
+NUMERIC_COLUMNS = 12
+"""float64 columns in the synthetic file; every reader reads all of them."""
+
+ROWS_PER_ROW_GROUP = 100_000
+"""Rows per row group in the synthetic file."""
+
+
+def write_topic_file(path: pathlib.Path, rows: int) -> None:
+    rng = np.random.default_rng(0)
+    columns: dict[str, pa.Array] = {"ts": pa.array(np.arange(rows, dtype=np.int64) * 1_000)}
+    for i in range(NUMERIC_COLUMNS):
+        columns[f"c{i}"] = pa.array(rng.standard_normal(rows))
+    columns["s"] = pa.array([f"x{i % 1000}" for i in range(rows)])
+    pq.write_table(pa.table(columns), path, row_group_size=ROWS_PER_ROW_GROUP)
+
+
+def _memory_kib() -> dict[str, int]:
+    usage = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[1].isdigit():
+                usage[parts[0].rstrip(":")] = int(parts[1])
+    return usage
+
+
+def read_all(
+    path: pathlib.Path,
+    memory_map: bool,
+    start: multiprocessing.synchronize.Barrier,
+    results: multiprocessing.Queue,
+) -> None:
+    """Read every row group of ``path`` once, reporting (seconds, rows, peak RSS KiB, peak private KiB)."""
+    peak = {"rss": 0, "private": 0}
+    done = threading.Event()
+
+    def sample() -> None:
+        while not done.is_set():
+            usage = _memory_kib()
+            peak["rss"] = max(peak["rss"], usage["Rss"])
+            peak["private"] = max(peak["private"], usage["Private_Clean"] + usage["Private_Dirty"])
+            time.sleep(0.005)
+
+    parquet_file = open_cached_parquet_file(path, memory_map=memory_map)
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    columns = ["ts", *(f"c{i}" for i in range(NUMERIC_COLUMNS))]
+    start.wait()
+    started = time.perf_counter()
+    rows = 0
+    for table in read_row_groups(parquet_file, list(range(parquet_file.num_row_groups)), columns):
+        rows += table.num_rows
+    elapsed = time.perf_counter() - started
+    done.set()
+    sampler.join()
+    results.put((elapsed, rows, peak["rss"], peak["private"]))
+
+
+def measure(path: pathlib.Path, readers: int, memory_map: bool) -> None:
+    context = multiprocessing.get_context("spawn")
+    start = context.Barrier(readers)
+    results: multiprocessing.Queue = context.Queue()
+    processes = [context.Process(target=read_all, args=(path, memory_map, start, results)) for _ in range(readers)]
+    for process in processes:
+        process.start()
+    reports = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+
+    wall = max(elapsed for elapsed, _, _, _ in reports)
+    rows = sum(rows for _, rows, _, _ in reports)
+    rss = [peak_rss / 1024 for _, _, peak_rss, _ in reports]
+    private = [peak_private / 1024 for _, _, _, peak_private in reports]
+    print(
+        f"{'mmap' if memory_map else 'buffered':>8}: {wall:6.2f} s, {rows / wall / 1e6:5.1f} Mrows/s, "
+        f"peak RSS/reader {min(rss):.0f}-{max(rss):.0f} MiB, "
+        f"peak private/reader {min(private):.0f}-{max(private):.0f} MiB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--readers", type=int, default=8, help="Concurrent reader processes.")
+    parser.add_argument("--rows", type=int, default=4_000_000, help="Rows in the synthetic cached file.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = pathlib.Path(directory) / "topic.parquet"
+        write_topic_file(path, args.rows)
+        print(f"{args.readers} readers of one {path.stat().st_size / 2**20:.0f} MiB cached file:")
+        for memory_map in (False, True):
+            measure(path, args.readers, memory_map)
+
+
+if __name__ == "__main__":
+    main()
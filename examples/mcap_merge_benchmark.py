@@ -0,0 +1,173 @@
+# Copyright (c) 2026 Roboto Technologies, Inc.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Benchmark: reading a topic split across many MCAP representation files.
+
+Writes synthetic JSON-encoded MCAP files, one field per file, and serves them
+from a local HTTP server that honors ``Range`` requests, standing in for object
+storage. ``--latency`` delays each response to emulate the round trip to a
+remote store. The topic is then read with
+:py:meth:`~roboto.domain.topics.mcap_topic_reader.McapTopicReader.get_data`,
+which opens every file and merges their messages by log time into one row per
+time. No Roboto deployment is needed; signed URLs resolve to the local server.
+
+Half of the files log at even offsets and half at odd ones, so merged rows
+interleave. The printed digest of the rows lets runs on different versions be
+compared.
+
+    python packages/roboto/examples/mcap_merge_benchmark.py --files 50 --latency 0.03
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import functools
+import hashlib
+import http.server
+import json
+import pathlib
+import re
+import socketserver
+import tempfile
+import threading
+import time
+import typing
+
+from mcap.writer import Writer
+
+from roboto.association import Association, AssociationType
+from roboto.domain.topics import (
+    CanonicalDataType,
+    MessagePathRecord,
+    MessagePathRepresentationMapping,
+    RepresentationRecord,
+    RepresentationStorageFormat,
+)
+from roboto.domain.topics.mcap_topic_reader import McapTopicReader
+
+
+def write_files(directory: pathlib.Path, files: int, messages: int) -> None:
+    for i in range(files):
+        with open(directory / f"fl_{i}.mcap", "wb") as f:
+            writer = Writer(f, chunk_size=64 * 1024)
+            writer.start()
+            schema = {"type": "object", "properties": {f"v{i}": {"type": "integer"}}}
+            schema_id = writer.register_schema("Sample", "jsonschema", json.dumps(schema).encode())
+            channel_id = writer.register_channel("/samples", "json", schema_id)
+            for k in range(messages):
+                log_time = k * 1_000 + (0 if i % 2 == 0 else 500)
+                writer.add_message(
+                    channel_id, log_time=log_time, publish_time=log_time, data=json.dumps({f"v{i}": k}).encode()
+                )
+            writer.finish()
+
+
+def make_server(directory: pathlib.Path, latency: float) -> socketserver.TCPServer:
+    class Handler(http.server.SimpleHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args: typing.Any) -> None:
+            pass
+
+        def do_GET(self) -> None:
+            time.sleep(latency)
+            path = pathlib.Path(self.translate_path(self.path.split("?")[0]))
+            if not path.is_file():
+                self.send_error(404)
+                return
+            size = path.stat().st_size
+            match = re.match(r"bytes=(\d*)-(\d*)", self.headers.get("Range", ""))
+            with open(path, "rb") as f:
+                if match is None:
+                    data = f.read()
+                    self.send_response(200)
+                else:
+                    first, last = match.groups()
+                    if first == "":
+                        start, end = max(0, size - int(last)), size - 1
+                    else:
+                        start, end = int(first), min(int(last), size - 1) if last else size - 1
+                    f.seek(start)
+                    data = f.read(end - start + 1)
+                    self.send_response(206)
+                    self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    class Server(socketserver.ThreadingMixIn, http.server.HTTPServer):
+        daemon_threads = True
+
+    return Server(("127.0.0.1", 0), functools.partial(Handler, directory=str(directory)))
+
+
+def mappings(files: int) -> list[MessagePathRepresentationMapping]:
+    now = datetime.datetime.now(datetime.timezone.utc)
+    result = []
+    for i in range(files):
+        representation = RepresentationRecord(
+            association=Association(association_type=AssociationType.File, association_id=f"fl_{i}"),
+            created=now,
+            modified=now,
+            representation_id=f"rp_{i}",
+            storage_format=RepresentationStorageFormat.MCAP,
+            topic_id="tp_benchmark",
+            version=1,
+        )
+        message_path = MessagePathRecord(
+            canonical_data_type=CanonicalDataType.Number,
+            created=now,
+            created_by="benchmark",
+            data_type="int",
+            message_path=f"v{i}",
+            message_path_id=f"mp_{i}",
+            modified=now,
+            modified_by="benchmark",
+            org_id="og_benchmark",
+            path_in_schema=[f"v{i}"],
+            source_path=f"v{i}",
+            topic_id="tp_benchmark",
+        )
+        result.append(MessagePathRepresentationMapping(message_paths=[message_path], representation=representation))
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=50, help="Representation files the topic is split across.")
+    parser.add_argument("--messages", type=int, default=2_000, help="Messages per file.")
+    parser.add_argument("--latency", type=float, default=0.03, help="Seconds the server waits before each response.")
+    parser.add_argument("--repeat", type=int, default=3, help="Reads to run; the fastest is reported.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        write_files(pathlib.Path(directory), args.files, args.messages)
+        server = make_server(pathlib.Path(directory), args.latency)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        reader = McapTopicReader(signed_url_resolver=lambda file_id: f"{base}/{file_id}.mcap")
+        topic_mappings = mappings(args.files)
+
+        best = float("inf")
+        rows = 0
+        digest = ""
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            rows = 0
+            hasher = hashlib.sha256()
+            for timestamp, row in reader.get_data(topic_mappings):
+                rows += 1
+                hasher.update(repr((timestamp, sorted(row.items()))).encode())
+            best = min(best, time.perf_counter() - started)
+            digest = hasher.hexdigest()[:16]
+        server.shutdown()
+
+    print(f"{args.files} files, {rows} merged rows, best of {args.repeat}: {best:.2f} s, digest {digest}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+# Copyright (c) 2026 Roboto Technologies, Inc.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Benchmark: row-by-row iteration of a Parquet-backed topic with ``ParquetTopicReader.get_data``.
+
+Writes a synthetic Parquet topic file (a nanosecond timestamp column, a few
+rows with null timestamps, and three data columns) into a local cache
+directory under the name the reader looks for, then iterates every row through
+:py:meth:`~roboto.domain.topics.parquet.ParquetTopicReader.get_data` and
+reports rows per second. The file is already cached, so no Roboto deployment
+is needed. The printed checksum lets runs on different versions be compared.
+
+    python packages/roboto/examples/parquet_rows_benchmark.py --rows 10000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import logging
+import pathlib
+import tempfile
+import time
+import typing
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from roboto.association import Association, AssociationType
+from roboto.domain.topics import (
+    CanonicalDataType,
+    MessagePathMetadataWellKnown,
+    MessagePathRecord,
+    MessagePathRepresentationMapping,
+    RepresentationRecord,
+    RepresentationStorageFormat,
+)
+from roboto.domain.topics.parquet.parquet_topic_reader import (
+    OUTFILE_NAME_PATTERN,
+    ParquetTopicReader,
+)
+from roboto.http import RobotoClient
+
+ROW_GROUPS = 10
+"""Row groups the synthetic file is split into."""
+
+NULL_TIMESTAMP_FRACTION = 1e-5
+"""Fraction of rows written with a null timestamp, which get_data skips with a warning."""
+
+
+def write_topic_file(path: pathlib.Path, rows: int) -> None:
+    rng = np.random.default_rng(0)
+    timestamps = pa.array(np.arange(rows, dtype=np.int64) * 1_000, mask=rng.random(rows) < NULL_TIMESTAMP_FRACTION)
+    table = pa.table(
+        {
+            "ts": timestamps,
+            "x": pa.array(rng.random(rows)),
+            "y": pa.array(rng.random(rows)),
+            "id": pa.array(rng.integers(0, 100, rows)),
+        }
+    )
+    pq.write_table(table, path, row_group_size=max(1, rows // ROW_GROUPS))
+
+
+def message_path(name: str, data_type: CanonicalDataType, **metadata: str) -> MessagePathRecord:
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return MessagePathRecord(
+        canonical_data_type=data_type,
+        created=now,
+        created_by="benchmark",
+        data_type="float64",
+        message_path=name,
+        message_path_id=f"mp_{name}",
+        metadata=metadata,
+        modified=now,
+        modified_by="benchmark",
+        org_id="og_benchmark",
+        path_in_schema=[name],
+        source_path=name,
+        topic_id="tp_benchmark",
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000_000, help="Rows in the synthetic topic file.")
+    args = parser.parse_args()
+    # Null timestamps are logged per row; keep them out of the timing.
+    logging.disable(logging.WARNING)
+
+    now = datetime.datetime.now(datetime.timezone.utc)
+    representation = RepresentationRecord(
+        association=Association(association_type=AssociationType.File, association_id="fl_benchmark"),
+        created=now,
+        modified=now,
+        representation_id="rp_benchmark",
+        storage_format=RepresentationStorageFormat.PARQUET,
+        topic_id="tp_benchmark",
+        version=1,
+    )
+    timestamp = message_path("ts", CanonicalDataType.Timestamp, **{MessagePathMetadataWellKnown.Unit.value: "ns"})
+    mapping = MessagePathRepresentationMapping(
+        message_paths=[
+            timestamp,
+            message_path("x", CanonicalDataType.Number),
+            message_path("y", CanonicalDataType.Number),
+            message_path("id", CanonicalDataType.Number),
+        ],
+        representation=representation,
+    )
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        path = pathlib.Path(cache_dir) / OUTFILE_NAME_PATTERN.format(
+            repr_id=representation.representation_id, file_id=representation.association.association_id
+        )
+        write_topic_file(path, args.rows)
+        # The file is already cached, so the reader never calls the API.
+        reader = ParquetTopicReader(roboto_client=typing.cast(RobotoClient, None), cache_dir=pathlib.Path(cache_dir))
+
+        started = time.perf_counter()
+        rows = 0
+        checksum = 0
+        for ts, row in reader.get_data(
+            [mapping],
+            timestamp_message_path_representation_mapping=MessagePathRepresentationMapping(
+                message_paths=[timestamp], representation=representation
+            ),
+        ):
+            rows += 1
+            checksum += ts + row["id"]
+        elapsed = time.perf_counter() - started
+
+    print(f"{rows} rows in {elapsed:.1f} s, {rows / elapsed:,.0f} rows/s, checksum {checksum}")
+
+
+if __name__ == "__main__":
+    main()
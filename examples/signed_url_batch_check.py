@@ -0,0 +1,247 @@
+# Copyright (c) 2026 Roboto Technologies, Inc.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Check: bulk signed-URL minting and its fallback to single-file calls.
+
+Resolves signed URLs through :py:class:`~roboto.storage.SignedUrlCache` against a
+:py:class:`~roboto.testing.StubRobotoClient` and counts the API calls made:
+
+* many files are minted with one ``POST v1/files/signed-url/batch`` per
+  :py:data:`~roboto.storage.SIGNED_URL_BATCH_SIZE` files, not one ``GET`` each;
+* cached URLs are reused without a call;
+* a file the bulk response omits is minted singly and raises as it would alone;
+* an API without the bulk route, answering it with 400, 403, 404, 405, or 501,
+  is served by single-file calls, and the bulk route is not tried again;
+* a 403 that single-file calls share is raised, and the bulk route stays in use;
+* any other error status is raised without falling back.
+
+Error responses reach the cache the way :py:class:`~roboto.http.RobotoClient`
+raises them, mapped from an :py:class:`~roboto.exceptions.HttpError`. Exits
+non-zero on the first failed check.
+
+    python packages/roboto/examples/signed_url_batch_check.py
+"""
+
+from __future__ import annotations
+
+import collections
+import email.message
+import io
+import json
+import threading
+import time
+import typing
+import urllib.error
+
+from roboto.exceptions import (
+    HttpError,
+    RobotoHttpExceptionParse,
+    RobotoNotFoundException,
+    RobotoServiceException,
+    RobotoUnauthorizedException,
+)
+from roboto.http.response import HttpResponse
+from roboto.storage import (
+    SIGNED_URL_BATCH_SIZE,
+    SignedUrlBatchRequest,
+    SignedUrlBatchResponse,
+    SignedUrlCache,
+)
+from roboto.testing import StubRobotoClient
+
+BATCH_ROUTE = "v1/files/signed-url/batch"
+
+MISSING_ROUTE_RESPONSES: dict[int, typing.Any] = {
+    400: {"message": "Invalid request"},
+    403: {"message": "Missing Authentication Token"},
+    404: {"message": "Not Found"},
+    405: {"message": "Method Not Allowed"},
+    501: {"message": "Not Implemented"},
+}
+"""Bodies an API without the bulk route answers it with, by status."""
+
+
+class CountingStubClient(StubRobotoClient):
+    """A stub client that counts calls by method and serializes them, as fallback mints run concurrently."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: collections.Counter[str] = collections.Counter()
+        self.__lock = threading.Lock()
+
+    def __enter__(self) -> CountingStubClient:
+        return self
+
+    def get(self, *args: typing.Any, **kwargs: typing.Any) -> HttpResponse:
+        with self.__lock:
+            self.calls["GET"] += 1
+            return super().get(*args, **kwargs)
+
+    def post(self, *args: typing.Any, **kwargs: typing.Any) -> HttpResponse:
+        with self.__lock:
+            self.calls["POST"] += 1
+            return super().post(*args, **kwargs)
+
+
+def url_for(file_id: str) -> str:
+    signed_at = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+    return f"https://bucket.s3.amazonaws.com/{file_id}?X-Amz-Date={signed_at}&X-Amz-Expires=3600"
+
+
+def error_response(status: int, body: typing.Any) -> Exception:
+    """The exception :py:class:`~roboto.http.RobotoClient` raises for an error response."""
+    http_error = urllib.error.HTTPError(
+        "https://stub.roboto.test", status, "error", email.message.Message(), io.BytesIO(json.dumps(body).encode())
+    )
+    try:
+        with RobotoHttpExceptionParse():
+            raise HttpError(http_error)
+    except Exception as exc:
+        return exc
+    raise AssertionError("unreachable")
+
+
+def file_ids(prefix: str, count: int) -> list[str]:
+    return [f"fl_{prefix}_{i}" for i in range(count)]
+
+
+def requests_batch(batch: list[str]) -> typing.Callable[[typing.Any], bool]:
+    def matches(data: typing.Any) -> bool:
+        return isinstance(data, SignedUrlBatchRequest) and data.file_ids == batch
+
+    return matches
+
+
+def expect_batches(client: StubRobotoClient, ids: list[str], omit: typing.Collection[str] = ()) -> None:
+    for start in range(0, len(ids), SIGNED_URL_BATCH_SIZE):
+        batch = ids[start : start + SIGNED_URL_BATCH_SIZE]
+        client.expect_post(
+            BATCH_ROUTE,
+            response=SignedUrlBatchResponse(signed_urls={i: url_for(i) for i in batch if i not in omit}),
+            request_body_matcher=requests_batch(batch),
+        )
+
+
+def expect_singles(client: StubRobotoClient, ids: list[str]) -> None:
+    for file_id in ids:
+        client.expect_get(f"v1/files/{file_id}/signed-url", response={"url": url_for(file_id)})
+
+
+def check(condition: bool, message: str) -> None:
+    if not condition:
+        raise SystemExit(f"FAILED: {message}")
+
+
+def check_bulk() -> None:
+    ids = file_ids("bulk", 300)
+    with CountingStubClient() as client:
+        expect_batches(client, ids)
+        urls = SignedUrlCache().signed_urls(client, ids)
+    check(list(urls) == ids, "URLs are returned in the order asked for")
+    check(client.calls == {"POST": 1}, f"300 files take 1 POST and no GET, took {dict(client.calls)}")
+    print("300 files: 1 POST, 0 GET")
+
+    ids = file_ids("bulk", 1200)
+    with CountingStubClient() as client:
+        expect_batches(client, ids)
+        SignedUrlCache().signed_urls(client, ids)
+    check(client.calls == {"POST": 3}, f"1200 files take 3 POSTs, took {dict(client.calls)}")
+    print("1200 files: 3 POST, 0 GET")
+
+
+def check_cached() -> None:
+    ids = file_ids("cached", 50)
+    cache = SignedUrlCache()
+    with CountingStubClient() as client:
+        expect_batches(client, ids)
+        first = cache.signed_urls(client, ids)
+        second = cache.signed_urls(client, ids)
+    check(first == second, "cached URLs are reused")
+    check(client.calls == {"POST": 1}, f"cached files take no call, took {dict(client.calls)}")
+    print("cached files: no call")
+
+
+def check_omitted() -> None:
+    ids = file_ids("omitted", 10)
+    missing = ids[3]
+    with CountingStubClient() as client:
+        expect_batches(client, ids, omit={missing})
+        client.expect_get(f"v1/files/{missing}/signed-url", response=RobotoNotFoundException("File not found"))
+        try:
+            SignedUrlCache().signed_urls(client, ids)
+        except RobotoNotFoundException:
+            pass
+        else:
+            check(False, "an omitted missing file raises RobotoNotFoundException")
+    print("omitted file: minted singly, raises RobotoNotFoundException")
+
+
+def check_missing_route(status: int, body: typing.Any) -> None:
+    cache = SignedUrlCache()
+    first, second = file_ids(f"{status}_a", 20), file_ids(f"{status}_b", 20)
+    with CountingStubClient() as client:
+        client.expect_post(BATCH_ROUTE, response=error_response(status, body))
+        expect_singles(client, first)
+        urls = cache.signed_urls(client, first)
+        check(list(urls) == first, f"HTTP {status}: every file gets a URL")
+
+        expect_singles(client, second)
+        cache.signed_urls(client, second)
+    check(
+        client.calls == {"POST": 1, "GET": 40},
+        f"HTTP {status}: falls back to single calls without retrying the bulk route, took {dict(client.calls)}",
+    )
+    print(f"missing route, HTTP {status}: falls back to single calls, bulk route not retried")
+
+
+def check_refused() -> None:
+    ids = file_ids("refused", 5)
+    denied = error_response(403, {"message": "Forbidden"})
+    # Not verified on exit: single-file mints still queued when the first one raises are cancelled.
+    client = CountingStubClient()
+    client.expect_post(BATCH_ROUTE, response=denied)
+    for file_id in ids:
+        client.expect_get(f"v1/files/{file_id}/signed-url", response=denied)
+    try:
+        SignedUrlCache().signed_urls(client, ids)
+    except RobotoUnauthorizedException:
+        pass
+    else:
+        check(False, "a 403 single-file calls share raises RobotoUnauthorizedException")
+
+    expect_batches(client, ids)
+    SignedUrlCache().signed_urls(client, ids)
+    check(client.calls["POST"] == 2, f"the bulk route stays in use after a real 403, took {dict(client.calls)}")
+    print("refused files, HTTP 403: raised, bulk route still used")
+
+
+def check_server_error() -> None:
+    ids = file_ids("error", 5)
+    with CountingStubClient() as client:
+        client.expect_post(BATCH_ROUTE, response=error_response(500, {"message": "Internal Server Error"}))
+        try:
+            SignedUrlCache().signed_urls(client, ids)
+        except RobotoServiceException:
+            pass
+        else:
+            check(False, "HTTP 500 raises RobotoServiceException")
+    check(client.calls == {"POST": 1}, f"HTTP 500 does not fall back, took {dict(client.calls)}")
+    print("HTTP 500: raised, no fallback")
+
+
+def main() -> None:
+    check_bulk()
+    check_cached()
+    check_omitted()
+    for status, body in MISSING_ROUTE_RESPONSES.items():
+        check_missing_route(status, body)
+    check_refused()
+    check_server_error()
+    print("all checks passed")
+
+
+if __name__ == "__main__":
+    main()
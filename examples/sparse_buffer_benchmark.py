@@ -0,0 +1,72 @@
+# Copyright (c) 2026 Roboto Technologies, Inc.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Microbenchmark: SparseBuffer inserts and lookups over many non-contiguous regions.
+
+A long MCAP read through :py:class:`~roboto.storage.HttpRangeReader` buffers
+many non-contiguous chunk fetches. This inserts that many 1 KB regions, with
+gaps between them, in shuffled order, then looks up a span inside each one.
+Both operations start with a binary search over the regions, so the time per
+operation grows slowly with the region count; an insert also shifts the sorted
+region lists, a memmove that stays small at these sizes.
+
+Only ``add_region`` and ``find_region`` are timed, so the script also runs
+against older ``SparseBuffer`` implementations for comparison.
+
+    python packages/roboto/examples/sparse_buffer_benchmark.py --regions 10000 20000 40000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from roboto.storage.sparse_buffer import SparseBuffer
+
+REGION_SIZE = 1_000
+"""Bytes per inserted region."""
+
+REGION_STRIDE = 2_000
+"""Distance between region starts; the bytes in between stay uncovered."""
+
+
+def run(region_count: int, seed: int) -> tuple[float, float]:
+    """Return the seconds taken to insert ``region_count`` regions, then to look one span up in each."""
+    buffer = SparseBuffer(region_count * REGION_STRIDE)
+    order = list(range(region_count))
+    random.Random(seed).shuffle(order)
+    data = b"x" * REGION_SIZE
+
+    started = time.perf_counter()
+    for index in order:
+        buffer.add_region(index * REGION_STRIDE, data)
+    inserted = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for index in order:
+        if buffer.find_region(index * REGION_STRIDE + 10, 100) is None:
+            raise RuntimeError(f"Region {index} missing after insert")
+    looked_up = time.perf_counter() - started
+    return inserted, looked_up
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--regions", type=int, nargs="+", default=[10_000, 20_000], help="Region counts to benchmark.")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for the insertion order.")
+    args = parser.parse_args()
+
+    for region_count in args.regions:
+        inserted, looked_up = run(region_count, args.seed)
+        print(
+            f"{region_count:>7} regions: insert {inserted:7.3f} s ({inserted / region_count * 1e6:6.2f} us/op), "
+            f"lookup {looked_up:7.3f} s ({looked_up / region_count * 1e6:6.2f} us/op)"
+        )
+
+
+if __name__ == "__main__":
+    main()
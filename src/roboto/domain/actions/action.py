@@ -11,7 +11,7 @@ import typing
 from ...exceptions import (
     RobotoIllegalArgumentException,
 )
-from ...http import RobotoClient
+from ...http import PaginatedList, RobotoClient, iter_items
 from ...query import QuerySpecification
 from ...sentinels import (
     NotSet,
@@ -320,20 +320,17 @@ class Action:
 
         url_path = "v1/actions/query" if accessibility == Accessibility.Organization else "v1/actions/query/actionhub"
 
-        while True:
+        def fetch_page(page_token: typing.Optional[str]) -> PaginatedList[ActionRecord]:
             response = roboto_client.post(
                 url_path,
-                data=spec,
+                data=spec if page_token is None else spec.model_copy(update={"after": page_token}),
                 idempotent=True,
                 owner_org_id=owner_org_id,
             )
-            paginated_results = response.to_paginated_list(ActionRecord)
-            for record in paginated_results.items:
-                yield cls(record, roboto_client)
-            if paginated_results.next_token:
-                spec.after = paginated_results.next_token
-            else:
-                break
+            return response.to_paginated_list(ActionRecord)
+
+        for record in iter_items(fetch_page, page_token=spec.after):
+            yield cls(record, roboto_client)
 
     def __init__(
         self,
@@ -8,7 +8,7 @@ import collections.abc
 import datetime
 import typing
 
-from ...http import RobotoClient, StreamedList
+from ...http import PaginatedList, RobotoClient, StreamedList, iter_items
 from ...query import QuerySpecification
 from ...waiters import Interval, wait_for
 from .action_record import (
@@ -153,20 +153,16 @@ class Invocation:
             msg = "are not known attributes of Invocation" if plural else "is not a known attribute of Invocation"
             raise ValueError(f"{unknown} {msg}. Known attributes: {known}")
 
-        while True:
+        def fetch_page(page_token: typing.Optional[str]) -> PaginatedList[InvocationRecord]:
             response = roboto_client.post(
                 "v1/actions/invocations/query",
-                data=spec,
+                data=spec if page_token is None else spec.model_copy(update={"after": page_token}),
                 owner_org_id=owner_org_id,
             )
+            return response.to_paginated_list(InvocationRecord)
 
-            paginated_results = response.to_paginated_list(InvocationRecord)
-            for record in paginated_results.items:
-                yield cls(record, roboto_client)
-            if paginated_results.next_token:
-                spec.after = paginated_results.next_token
-            else:
-                break
+        for record in iter_items(fetch_page, page_token=spec.after):
+            yield cls(record, roboto_client)
 
     def __init__(
         self,
@@ -327,19 +323,16 @@ class Invocation:
             RobotoNotFoundException: If the invocation is not found.
             RobotoUnauthorizedException: If the caller lacks permission to access logs.
         """
-        while True:
+
+        def fetch_page(page_token: typing.Optional[str]) -> PaginatedList[LogRecord]:
             response = self.__roboto_client.get(
                 f"v1/actions/invocations/{self.id}/logs",
                 query={"page_token": page_token} if page_token else None,
                 owner_org_id=self.org_id,
             )
-            paginated_results = response.to_paginated_list(LogRecord)
-            for record in paginated_results.items:
-                yield record
-            if paginated_results.next_token:
-                page_token = paginated_results.next_token
-            else:
-                break
+            return response.to_paginated_list(LogRecord)
+
+        yield from iter_items(fetch_page, page_token=page_token)
 
     def is_queued_for_scheduling(self) -> bool:
         """
@@ -12,7 +12,7 @@ import typing
 
 import cron_converter
 
-from ...http import RobotoClient
+from ...http import PaginatedList, RobotoClient, iter_items
 from ...query import (
     Comparator,
     Condition,
@@ -490,24 +490,18 @@ class ScheduledTrigger:
             "trigger_type": TriggerType.Scheduled.value,
         }
 
-        page_token: typing.Optional[str] = None
-        while True:
+        def fetch_page(page_token: typing.Optional[str]) -> PaginatedList[TriggerEvaluationRecord]:
+            page_query_params = dict(query_params)
             if page_token:
-                query_params["page_token"] = page_token
+                page_query_params["page_token"] = page_token
 
-            result_page = self.__roboto_client.get(
+            return self.__roboto_client.get(
                 f"v1/triggers/{self.name}/evaluations",
-                query=query_params,
+                query=page_query_params,
                 owner_org_id=self.org_id,
             ).to_paginated_list(TriggerEvaluationRecord)
 
-            for record in result_page.items:
-                yield record
-
-            if result_page.next_token:
-                page_token = result_page.next_token
-            else:
-                break
+        yield from iter_items(fetch_page)
 
     def get_invocations(self) -> collections.abc.Generator[Invocation, None, None]:
         """Get the scheduled invocations initiated by this trigger, if any.
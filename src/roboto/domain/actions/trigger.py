@@ -9,7 +9,7 @@ import datetime
 import typing
 
 from ...exceptions import RobotoConflictException
-from ...http import RobotoClient
+from ...http import PaginatedList, RobotoClient, iter_items
 from ...query import (
     Comparator,
     Condition,
@@ -110,23 +110,19 @@ class Trigger:
             >>> print(f"Found {len(successful)} successful trigger evaluations")
         """
         roboto_client = RobotoClient.defaulted(roboto_client)
-        page_token: typing.Optional[str] = None
-        while True:
+
+        def fetch_page(page_token: typing.Optional[str]) -> PaginatedList[TriggerEvaluationRecord]:
             query_params: dict[str, typing.Any] = {}
             if page_token is not None:
                 query_params["page_token"] = page_token
 
-            paginated_results = roboto_client.get(
+            return roboto_client.get(
                 f"v1/triggers/dataset/id/{dataset_id}/evaluations",
                 query=query_params,
                 owner_org_id=owner_org_id,
             ).to_paginated_list(TriggerEvaluationRecord)
-            for record in paginated_results.items:
-                yield record
-            if paginated_results.next_token:
-                page_token = paginated_results.next_token
-            else:
-                break
+
+        yield from iter_items(fetch_page)
 
     @classmethod
     def create(
@@ -278,20 +274,17 @@ class Trigger:
         roboto_client = RobotoClient.defaulted(roboto_client)
         spec = spec or QuerySpecification()
 
-        while True:
+        def fetch_page(page_token: typing.Optional[str]) -> PaginatedList[TriggerRecord]:
             response = roboto_client.post(
                 "v1/triggers/query",
-                data=spec,
+                data=spec if page_token is None else spec.model_copy(update={"after": page_token}),
                 owner_org_id=owner_org_id,
                 idempotent=True,
             )
-            paginated_results = response.to_paginated_list(TriggerRecord)
-            for record in paginated_results.items:
-                yield cls(record, roboto_client)
-            if paginated_results.next_token:
-                spec.after = paginated_results.next_token
-            else:
-                break
+            return response.to_paginated_list(TriggerRecord)
+
+        for record in iter_items(fetch_page, page_token=spec.after):
+            yield cls(record, roboto_client)
 
     def __init__(
         self,
@@ -381,21 +374,18 @@ class Trigger:
         if limit is not None:
             query_params["limit"] = limit
 
-        while True:
+        def fetch_page(page_token: typing.Optional[str]) -> PaginatedList[TriggerEvaluationRecord]:
+            page_query_params = dict(query_params)
             if page_token is not None:
-                query_params["page_token"] = page_token
+                page_query_params["page_token"] = page_token
             response = self.__roboto_client.get(
                 f"v1/triggers/{self.name}/evaluations",
-                query=query_params,
+                query=page_query_params,
                 owner_org_id=self.org_id,
             )
-            paginated_results = response.to_paginated_list(TriggerEvaluationRecord)
-            for record in paginated_results.items:
-                yield record
-            if paginated_results.next_token:
-                page_token = paginated_results.next_token
-            else:
-                break
+            return response.to_paginated_list(TriggerEvaluationRecord)
+
+        yield from iter_items(fetch_page, page_token=page_token)
 
     def get_invocations(self) -> collections.abc.Generator[Invocation, None, None]:
         query_spec = QuerySpecification(
@@ -13,7 +13,7 @@ from ...auth import (
     EditAccessRequest,
     GetAccessResponse,
 )
-from ...http import RobotoClient
+from ...http import PaginatedList, RobotoClient, iter_items
 from ...query import (
     QuerySpecification,
     SortDirection,
@@ -154,21 +154,17 @@ class Collection:
 
         query_params = {"content_mode": content_mode.value}
 
-        while True:
-            paginated_result = roboto_client.post(
+        def fetch_page(page_token: typing.Optional[str]) -> PaginatedList[CollectionRecord]:
+            return roboto_client.post(
                 "v1/collections/search",
                 query=query_params,
-                data=spec.model_dump(mode="json"),
+                data=spec.model_copy(update={"after": page_token}).model_dump(mode="json"),
                 owner_org_id=owner_org_id,
                 idempotent=True,
             ).to_paginated_list(CollectionRecord)
 
-            for record in paginated_result.items:
-                yield cls(record=record, roboto_client=roboto_client)
-            if paginated_result.next_token:
-                spec.after = paginated_result.next_token
-            else:
-                break
+        for record in iter_items(fetch_page):
+            yield cls(record=record, roboto_client=roboto_client)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Collection):
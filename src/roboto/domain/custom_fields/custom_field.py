@@ -15,7 +15,7 @@ from ...exceptions import (
     RobotoInvalidStateTransitionException,
     RobotoNotFoundException,
 )
-from ...http import RobotoClient
+from ...http import PaginatedList, RobotoClient, iter_items
 from ...sentinels import NotSet, NotSetType, remove_not_set
 from ...waiters import wait_for
 from ...warnings import experimental
@@ -264,10 +264,8 @@ class CustomField:
             statuses or (CustomFieldStatus.Creating, CustomFieldStatus.Ready, CustomFieldStatus.Failed)
         )
 
-        page_token: typing.Optional[str] = None
-
-        while True:
-            result_page = roboto_client.post(
+        def fetch_page(page_token: typing.Optional[str]) -> PaginatedList[CustomFieldRecord]:
+            return roboto_client.post(
                 path="v1/custom-fields/query",
                 data=ListCustomFieldsRequest(
                     page_token=page_token, entity_type=entity_type, statuses=defaulted_statuses
@@ -276,13 +274,8 @@ class CustomField:
                 owner_org_id=owner_org_id,
             ).to_paginated_list(CustomFieldRecord)
 
-            for record in result_page.items:
-                yield cls(record, roboto_client)
-
-            if not result_page.next_token:
-                break
-
-            page_token = result_page.next_token
+        for record in iter_items(fetch_page):
+            yield cls(record, roboto_client)
 
     def __init__(self, record: CustomFieldRecord, roboto_client: RobotoClient) -> None:
         self.__record = record
@@ -27,7 +27,7 @@ from ...exceptions import (
     RobotoDeviceNotFoundException,
 )
 from ...experimental.sessions import Session, SessionFile
-from ...http import PaginatedList, RobotoClient
+from ...http import PaginatedList, RobotoClient, iter_items
 from ...logging import default_logger, maybe_pluralize
 from ...paths import excludespec_from_patterns
 from ...progress import (
@@ -383,21 +383,16 @@ class Dataset:
             msg = "are not known attributes of Dataset" if plural else "is not a known attribute of Dataset"
             raise ValueError(f"{unknown} {msg}. Known attributes: {known}")
 
-        while True:
-            paginated_results = roboto_client.post(
+        def fetch_page(page_token: typing.Optional[str]) -> PaginatedList[DatasetRecord]:
+            return roboto_client.post(
                 "v1/datasets/query",
-                data=spec,
+                data=spec if page_token is None else spec.model_copy(update={"after": page_token}),
                 owner_org_id=owner_org_id,
                 idempotent=True,
             ).to_paginated_list(DatasetRecord)
 
-            for record in paginated_results.items:
-                yield cls(record, roboto_client)
-
-            if paginated_results.next_token:
-                spec.after = paginated_results.next_token
-            else:
-                break
+        for record in iter_items(fetch_page, page_token=spec.after):
+            yield cls(record, roboto_client)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Dataset):
@@ -1086,18 +1081,13 @@ class Dataset:
     def list_directories(
         self,
     ) -> collections.abc.Generator[DirectoryRecord, None, None]:
-        page_token: typing.Optional[str] = None
-        while True:
-            paginated_results = self.__roboto_client.get(
+        def fetch_page(page_token: typing.Optional[str]) -> PaginatedList[DirectoryRecord]:
+            return self.__roboto_client.get(
                 f"v1/files/association/id/{self.dataset_id}/directories",
                 query={"page_token": page_token},
             ).to_record(PaginatedList[DirectoryRecord])
-            for record in paginated_results.items:
-                yield record
-            if paginated_results.next_token:
-                page_token = paginated_results.next_token
-            else:
-                break
+
+        yield from iter_items(fetch_page)
 
     def list_files(
         self,
@@ -1144,19 +1134,15 @@ class Dataset:
             images/side_camera_001.jpg
         """
 
-        page_token: typing.Optional[str] = None
-        while True:
-            paginated_results = self.__list_files_page(
+        def fetch_page(page_token: typing.Optional[str]) -> PaginatedList[FileRecord]:
+            return self.__list_files_page(
                 page_token=page_token,
                 include_patterns=include_patterns,
                 exclude_patterns=exclude_patterns,
             )
-            for record in paginated_results.items:
-                yield File(record, self.__roboto_client)
-            if paginated_results.next_token:
-                page_token = paginated_results.next_token
-            else:
-                break
+
+        for record in iter_items(fetch_page):
+            yield File(record, self.__roboto_client)
 
     def put_metadata(
         self,
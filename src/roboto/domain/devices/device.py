@@ -12,7 +12,7 @@ import urllib.parse
 from ...auth.scope import ApiScope
 from ...exceptions import RobotoDomainException
 from ...experimental.sessions import Session, SessionRecord
-from ...http import RobotoClient
+from ...http import PaginatedList, RobotoClient, iter_items
 from ...updates import CustomFieldChangeset, MetadataChangeset
 from ...warnings import experimental
 from ..tokens import (
@@ -168,23 +168,18 @@ class Device:
         """
         roboto_client = RobotoClient.defaulted(roboto_client)
 
-        next_token: typing.Optional[str] = None
-        while True:
+        def fetch_page(next_token: typing.Optional[str]) -> PaginatedList[DeviceRecord]:
             query_params: dict[str, typing.Any] = {}
             if next_token:
                 query_params["page_token"] = str(next_token)
 
-            results = roboto_client.get(
+            return roboto_client.get(
                 f"v1/devices/org/{org_id}",
                 query=query_params,
             ).to_paginated_list(DeviceRecord)
 
-            for item in results.items:
-                yield cls(record=item, roboto_client=roboto_client)
-
-            next_token = results.next_token
-            if not next_token:
-                break
+        for item in iter_items(fetch_page):
+            yield cls(record=item, roboto_client=roboto_client)
 
     @classmethod
     def from_id(
@@ -475,24 +470,20 @@ class Device:
             >>> for session in device.list_sessions():
             ...     print(session.name)
         """
-        next_token: typing.Optional[str] = None
-        while True:
+
+        def fetch_page(next_token: typing.Optional[str]) -> PaginatedList[SessionRecord]:
             query: dict[str, typing.Any] = {}
             if next_token:
                 query["page_token"] = next_token
 
-            page = self.__roboto_client.get(
+            return self.__roboto_client.get(
                 f"v1/devices/id/{self.encoded_device_id}/sessions",
                 owner_org_id=self.org_id,
                 query=query,
             ).to_paginated_list(SessionRecord)
 
-            for record in page.items:
-                yield Session(record=record, roboto_client=self.__roboto_client)
-
-            next_token = page.next_token
-            if not next_token:
-                break
+        for record in iter_items(fetch_page):
+            yield Session(record=record, roboto_client=self.__roboto_client)
 
     def put_metadata(self, metadata: dict[str, typing.Any]) -> "Device":
         """Add or update metadata fields for this device.
@@ -16,7 +16,7 @@ from ...association import Association
 from ...exceptions import (
     RobotoInvalidRequestException,
 )
-from ...http import RobotoClient
+from ...http import PaginatedList, RobotoClient, iter_items
 from ...logging import default_logger
 from ...sentinels import (
     NotSet,
@@ -272,19 +272,14 @@ class Event:
             return
 
         # This will return all events that have an association with this dataset or any of its files or topics
-        next_token: typing.Optional[str] = None
-        while True:
-            results = roboto_client.get(
+        def fetch_page(next_token: typing.Optional[str]) -> PaginatedList[EventRecord]:
+            return roboto_client.get(
                 f"v1/datasets/{dataset_id}/events",
                 query={"page_token": next_token} if next_token is not None else None,
             ).to_paginated_list(EventRecord)
 
-            for item in results.items:
-                yield cls(record=item, roboto_client=roboto_client)
-
-            next_token = results.next_token
-            if not next_token:
-                break
+        for item in iter_items(fetch_page):
+            yield cls(record=item, roboto_client=roboto_client)
 
     @classmethod
     def get_by_file(
@@ -410,21 +405,18 @@ class Event:
         """
         roboto_client = RobotoClient.defaulted(roboto_client)
 
-        next_token: typing.Optional[str] = None
-        while True:
-            request = QueryEventsForAssociationsRequest(associations=list(associations), page_token=next_token)
+        associations = list(associations)
+
+        def fetch_page(next_token: typing.Optional[str]) -> PaginatedList[EventRecord]:
+            request = QueryEventsForAssociationsRequest(associations=associations, page_token=next_token)
 
-            results = roboto_client.post(
+            return roboto_client.post(
                 "v1/events/query/for_associations",
                 data=request,
             ).to_paginated_list(EventRecord)
 
-            for item in results.items:
-                yield cls(record=item, roboto_client=roboto_client)
-
-            next_token = results.next_token
-            if not next_token:
-                break
+        for item in iter_items(fetch_page):
+            yield cls(record=item, roboto_client=roboto_client)
 
     @classmethod
     def from_id(cls, event_id: str, roboto_client: typing.Optional[RobotoClient] = None) -> "Event":
@@ -13,7 +13,7 @@ import typing
 import urllib.parse
 
 from ...association import Association
-from ...http import BatchRequest, RobotoClient
+from ...http import BatchRequest, PaginatedList, RobotoClient, iter_items
 from ...progress import (
     NoopProgressMonitor,
     TqdmProgressMonitor,
@@ -374,18 +374,14 @@ class File:
             msg = "are not known attributes of File" if plural else "is not a known attribute of File"
             raise ValueError(f"{unknown} {msg}. Known attributes: {known}")
 
-        while True:
-            paginated_results = roboto_client.post(
-                "v1/files/query", data=spec, owner_org_id=owner_org_id, idempotent=True
+        def fetch_page(page_token: typing.Optional[str]) -> PaginatedList[FileRecord]:
+            page_spec = spec if page_token is None else spec.model_copy(update={"after": page_token})
+            return roboto_client.post(
+                "v1/files/query", data=page_spec, owner_org_id=owner_org_id, idempotent=True
             ).to_paginated_list(FileRecord)
 
-            for record in paginated_results.items:
-                yield cls(record, roboto_client)
-
-            if paginated_results.next_token:
-                spec.after = paginated_results.next_token
-            else:
-                break
+        for record in iter_items(fetch_page, page_token=spec.after):
+            yield cls(record, roboto_client)
 
     def __init__(
         self,
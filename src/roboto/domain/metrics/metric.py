@@ -12,7 +12,7 @@ import urllib.parse
 
 from roboto.warnings import experimental
 
-from ...http import RobotoClient
+from ...http import PaginatedList, RobotoClient, iter_items
 from ...logging import default_logger
 from ...sentinels import NotSet, NotSetType, remove_not_set
 from ...time import Time, to_epoch_nanoseconds
@@ -90,21 +90,19 @@ class MetricDefinition:
             ...     print(definition.name, "-", definition.description)
         """
         roboto_client = RobotoClient.defaulted(roboto_client)
-        next_token: typing.Optional[str] = None
-        while True:
+
+        def fetch_page(next_token: typing.Optional[str]) -> PaginatedList[MetricDefinitionRecord]:
             query_params: dict[str, typing.Any] = {}
             if next_token:
                 query_params["page_token"] = next_token
-            results = roboto_client.get(
+            return roboto_client.get(
                 "v1/metrics/definitions/",
                 owner_org_id=owner_org_id,
                 query=query_params,
             ).to_paginated_list(MetricDefinitionRecord)
-            for item in results.items:
-                yield cls(item, roboto_client)
-            next_token = results.next_token
-            if not next_token:
-                break
+
+        for item in iter_items(fetch_page):
+            yield cls(item, roboto_client)
 
     @classmethod
     def create(
@@ -482,23 +480,21 @@ class Metric:
             include_session_ids=include_session_ids,
             include_invocation_ids=include_invocation_ids,
         )
-        next_token: typing.Optional[str] = None
-        while True:
+
+        def fetch_page(next_token: typing.Optional[str]) -> PaginatedList[MetricRecord]:
             query_params: dict[str, typing.Any] = {}
             if next_token:
                 query_params["page_token"] = next_token
-            results = roboto_client.post(
+            return roboto_client.post(
                 "v1/metrics/query",
                 data=request,
                 owner_org_id=owner_org_id,
                 idempotent=True,
                 query=query_params,
             ).to_paginated_list(MetricRecord)
-            for record in results.items:
-                yield cls(record, roboto_client)
-            next_token = results.next_token
-            if not next_token:
-                break
+
+        for record in iter_items(fetch_page):
+            yield cls(record, roboto_client)
 
     @classmethod
     def aggregate(
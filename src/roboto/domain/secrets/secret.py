@@ -14,7 +14,7 @@ import typing
 import boto3
 import pydantic
 
-from ...http import RobotoClient
+from ...http import PaginatedList, RobotoClient, iter_items
 from . import AwsSecretsManagerAccessCreds
 from .record import (
     CreateSecretRequest,
@@ -165,24 +165,19 @@ class Secret:
         """
         roboto_client = RobotoClient.defaulted(roboto_client)
 
-        next_token: typing.Optional[str] = None
-        while True:
+        def fetch_page(next_token: typing.Optional[str]) -> PaginatedList[SecretRecord]:
             query_params: dict[str, typing.Any] = {}
             if next_token:
                 query_params["page_token"] = str(next_token)
 
-            results = roboto_client.get(
+            return roboto_client.get(
                 "v1/secrets",
                 owner_org_id=org_id,
                 query=query_params,
             ).to_paginated_list(SecretRecord)
 
-            for item in results.items:
-                yield cls(record=item, roboto_client=roboto_client)
-
-            next_token = results.next_token
-            if not next_token:
-                break
+        for item in iter_items(fetch_page):
+            yield cls(record=item, roboto_client=roboto_client)
 
     @classmethod
     def from_name(
@@ -10,7 +10,7 @@ import collections.abc
 import typing
 import urllib.parse
 
-from ...http import RobotoClient
+from ...http import PaginatedList, RobotoClient, iter_items
 from .operations import (
     CreateSkillRequest,
     CreateSkillVersionRequest,
@@ -227,22 +227,20 @@ class Skill:
             >>> all_visible = list(Skill.list_for_org())
         """
         roboto_client = RobotoClient.defaulted(roboto_client)
-        next_token: typing.Optional[str] = None
-        while True:
+
+        def fetch_page(next_token: typing.Optional[str]) -> PaginatedList[SkillSummary]:
             query: dict[str, typing.Any] = {}
             if next_token:
                 query["page_token"] = next_token
             if scope is not None:
                 query["scope"] = scope.value
-            page = roboto_client.get(
+            return roboto_client.get(
                 "v1/skills",
                 caller_org_id=caller_org_id,
                 query=query,
             ).to_paginated_list(SkillSummary)
-            yield from page.items
-            if not page.next_token:
-                break
-            next_token = page.next_token
+
+        yield from iter_items(fetch_page)
 
     def __init__(self, record: SkillRecord, roboto_client: RobotoClient):
         self.__record: SkillRecord = record
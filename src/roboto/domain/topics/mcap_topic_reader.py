@@ -7,15 +7,19 @@
 from __future__ import annotations
 
 import collections.abc
+import concurrent.futures
+import heapq
 import logging
 import typing
 
+import mcap.reader
+
 from ...association import AssociationType
 from ...compat import import_optional_dependency
-from ...formats.mcap import McapReader, open_for_window
+from ...formats.mcap import ColumnarMcapDecoder, McapReader, open_for_window
 from ...http import RobotoClient
 from ...logging import default_logger
-from ...storage import HttpRangeReader, as_io_bytes
+from ...storage import HttpRangeReader, as_io_bytes, signed_url_for_file, signed_urls_for_files
 from .record import (
     MessagePathRepresentationMapping,
     RepresentationStorageFormat,
@@ -24,9 +28,13 @@ from .topic_reader import Timestamp, TopicReader
 
 if typing.TYPE_CHECKING:
     import pandas  # pants: no-infer-dep
+    import pyarrow  # pants: no-infer-dep
 
 logger = default_logger()
 
+_MAX_CONCURRENT_OPENS = 16
+"""Representation files opened at once, each fetching its summary and in-window chunks."""
+
 
 class SignedUrlResolver(typing.Protocol):
     """Resolves a file ID to a signed download URL."""
@@ -35,14 +43,22 @@ class SignedUrlResolver(typing.Protocol):
 
 
 class RobotoClientUrlResolver:
-    """A :class:`SignedUrlResolver` that fetches signed URLs via the Roboto API."""
+    """A :class:`SignedUrlResolver` that fetches signed URLs via the Roboto API.
+
+    URLs come from the process-wide :py:class:`~roboto.storage.SignedUrlCache`,
+    so a file read again while its URL is still valid costs no API call, and
+    :py:meth:`resolve_many` mints the URLs of several files in one call.
+    """
 
     def __init__(self, roboto_client: RobotoClient):
         self.__roboto_client = roboto_client
 
     def __call__(self, file_id: str) -> str:
-        signed_url_response = self.__roboto_client.get(f"v1/files/{file_id}/signed-url")
-        return signed_url_response.to_dict(json_path=["data", "url"])
+        return signed_url_for_file(self.__roboto_client, file_id)
+
+    def resolve_many(self, file_ids: collections.abc.Iterable[str]) -> dict[str, str]:
+        """Signed URLs for several files at once, the uncached ones minted in bulk."""
+        return signed_urls_for_files(self.__roboto_client, file_ids)
 
 
 class McapTopicReader(TopicReader):
@@ -99,57 +115,10 @@ class McapTopicReader(TopicReader):
         end_time: typing.Optional[int] = None,
         timestamp_message_path_representation_mapping: typing.Optional[MessagePathRepresentationMapping] = None,
     ) -> collections.abc.Generator[tuple[Timestamp, dict[str, typing.Any]], None, None]:
-        # Convert to list to allow multiple iterations
-        mappings_list = list(message_paths_to_representations)
-
         http_readers: list[HttpRangeReader] = []
-        mcap_readers: list[McapReader] = []
-
         try:
-            for message_path_repr_map in mappings_list:
-                representation = message_path_repr_map.representation
-                association = representation.association
-
-                if association.association_type != AssociationType.File:
-                    logger.warning(
-                        "Unable to get data for message paths %r (not a file association)",
-                        [record.message_path for record in message_path_repr_map.message_paths],
-                    )
-                    continue
-
-                file_id = association.association_id
-                signed_url = self.__signed_url_resolver(file_id)
-
-                http_reader = open_for_window(signed_url, start_time=start_time, end_time=end_time)
-                http_readers.append(http_reader)
-
-                mcap_reader = McapReader(
-                    stream=as_io_bytes(http_reader),
-                    fields=[record.to_field_selection() for record in message_path_repr_map.message_paths],
-                    start_time=start_time,
-                    end_time=end_time,
-                )
-                mcap_readers.append(mcap_reader)
-
-            if logger.isEnabledFor(logging.DEBUG):
-                for reader in mcap_readers:
-                    logger.debug(
-                        "Reader will pick %r fields from data",
-                        reader.field_paths,
-                    )
-
-            while any(reader.has_next for reader in mcap_readers):
-                full_record = {}
-                log_time = min(reader.next_envelope_timestamp.log_time for reader in mcap_readers)
-                for reader in mcap_readers:
-                    if reader.next_message_is_time_aligned(log_time):
-                        decoded_message = reader.next()
-                        if decoded_message is None:
-                            continue
-                        full_record.update(decoded_message.to_dict())
-
-                yield log_time, full_record
-
+            opened = self.__open_representations(message_paths_to_representations, start_time, end_time, http_readers)
+            yield from self.__merge_decoded_messages(opened, start_time, end_time)
         finally:
             for http_reader in http_readers:
                 http_reader.close()
@@ -161,15 +130,301 @@ class McapTopicReader(TopicReader):
         end_time: typing.Optional[int] = None,
         timestamp_message_path_representation_mapping: typing.Optional[MessagePathRepresentationMapping] = None,
     ) -> tuple[pandas.Series, pandas.DataFrame]:
+        """Read the requested fields into a timestamp series and a flattened DataFrame.
+
+        When every representation is a file :py:class:`~roboto.formats.mcap.columnar.ColumnarMcapDecoder`
+        can decode, messages are decoded straight into Arrow columns and merged
+        across representations by log time without building a per-message
+        ``dict``. Otherwise (e.g. JSON-encoded files) rows come from :py:meth:`get_data`.
+        Either way the result is the same: the columns :py:func:`pandas.json_normalize`
+        makes of :py:meth:`get_data` records, except that sequence-valued fields
+        always hold lists.
+        """
         pd = import_optional_dependency("pandas", "analytics")
-        timestamps = []
-        data = []
-        for timestamp, record in self.get_data(
-            message_paths_to_representations=message_paths_to_representations,
-            start_time=start_time,
-            end_time=end_time,
-        ):
-            timestamps.append(timestamp)
-            data.append(record)
+        http_readers: list[HttpRangeReader] = []
+        try:
+            opened = self.__open_representations(message_paths_to_representations, start_time, end_time, http_readers)
+            decoders = [
+                ColumnarMcapDecoder.for_summary(
+                    mcap.reader.SeekingReader(as_io_bytes(http_reader)).get_summary(),
+                    [record.to_field_selection() for record in mapping.message_paths],
+                )
+                for mapping, http_reader in opened
+            ]
+            if opened and all(decoder is not None for decoder in decoders):
+                decoded = [
+                    typing.cast(ColumnarMcapDecoder, decoder).decode_window(http_reader, start_time, end_time)
+                    for decoder, (_, http_reader) in zip(decoders, opened)
+                ]
+                if any(values.num_rows for _, values in decoded):
+                    return _merge_columnar(decoded)
+                records: collections.abc.Iterable[tuple[Timestamp, dict[str, typing.Any]]] = []
+            else:
+                for _, http_reader in opened:
+                    http_reader.seek(0)
+                records = self.__merge_decoded_messages(opened, start_time, end_time)
+
+            timestamps = []
+            data = []
+            for timestamp, record in records:
+                timestamps.append(timestamp)
+                data.append(record)
+            return pd.Series(timestamps), pd.json_normalize(data=data)
+        finally:
+            for http_reader in http_readers:
+                http_reader.close()
+
+    def __open_representations(
+        self,
+        message_paths_to_representations: collections.abc.Iterable[MessagePathRepresentationMapping],
+        start_time: typing.Optional[int],
+        end_time: typing.Optional[int],
+        http_readers: list[HttpRangeReader],
+    ) -> list[tuple[MessagePathRepresentationMapping, HttpRangeReader]]:
+        """Open each file representation with its in-window chunks prefetched.
+
+        Every file's signed URL is resolved up front, so a
+        :py:class:`RobotoClientUrlResolver` mints them all in one bulk call, and
+        the files are then opened concurrently. Non-file representations are
+        logged and skipped. Every reader opened is also appended to
+        ``http_readers``, which the caller closes, so readers opened alongside
+        one that failed are still released.
+        """
+        file_mappings: list[MessagePathRepresentationMapping] = []
+        for message_path_repr_map in message_paths_to_representations:
+            if message_path_repr_map.representation.association.association_type != AssociationType.File:
+                logger.warning(
+                    "Unable to get data for message paths %r (not a file association)",
+                    [record.message_path for record in message_path_repr_map.message_paths],
+                )
+                continue
+            file_mappings.append(message_path_repr_map)
+
+        file_ids = [mapping.representation.association.association_id for mapping in file_mappings]
+        resolver = self.__signed_url_resolver
+        if isinstance(resolver, RobotoClientUrlResolver):
+            signed_urls = resolver.resolve_many(file_ids)
+        else:
+            signed_urls = {file_id: resolver(file_id) for file_id in file_ids}
+
+        if not file_ids:
+            return []
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(file_ids), _MAX_CONCURRENT_OPENS),
+            thread_name_prefix="roboto-mcap-open",
+        ) as executor:
+            futures = [
+                executor.submit(
+                    open_for_window, signed_urls[file_id], start_time=start_time, end_time=end_time, cache_id=file_id
+                )
+                for file_id in file_ids
+            ]
+
+        opened: list[tuple[MessagePathRepresentationMapping, HttpRangeReader]] = []
+        error: typing.Optional[BaseException] = None
+        for message_path_repr_map, future in zip(file_mappings, futures):
+            try:
+                http_reader = future.result()
+            except BaseException as exc:
+                error = error or exc
+                continue
+            http_readers.append(http_reader)
+            opened.append((message_path_repr_map, http_reader))
+        if error is not None:
+            raise error
+        return opened
+
+    @staticmethod
+    def __merge_decoded_messages(
+        opened: collections.abc.Sequence[tuple[MessagePathRepresentationMapping, HttpRangeReader]],
+        start_time: typing.Optional[int],
+        end_time: typing.Optional[int],
+    ) -> collections.abc.Generator[tuple[Timestamp, dict[str, typing.Any]], None, None]:
+        """Decode each representation message by message and merge them into rows by log time."""
+        mcap_readers = [
+            McapReader(
+                stream=as_io_bytes(http_reader),
+                fields=[record.to_field_selection() for record in message_path_repr_map.message_paths],
+                start_time=start_time,
+                end_time=end_time,
+            )
+            for message_path_repr_map, http_reader in opened
+        ]
+
+        if logger.isEnabledFor(logging.DEBUG):
+            for reader in mcap_readers:
+                logger.debug(
+                    "Reader will pick %r fields from data",
+                    reader.field_paths,
+                )
+
+        # Each row takes the next message from every reader pending at the earliest
+        # log time, merged in reader order. A heap of (next log time, reader index)
+        # finds those readers without scanning the ones that are not, and pops
+        # readers tied on log time in index order.
+        pending = [
+            (reader.next_envelope_timestamp.log_time, index)
+            for index, reader in enumerate(mcap_readers)
+            if reader.has_next
+        ]
+        heapq.heapify(pending)
+        while pending:
+            log_time = pending[0][0]
+            aligned = []
+            while pending and pending[0][0] == log_time:
+                aligned.append(heapq.heappop(pending)[1])
+
+            full_record: dict[str, typing.Any] = {}
+            for index in aligned:
+                reader = mcap_readers[index]
+                decoded_message = reader.next()
+                if reader.has_next:
+                    heapq.heappush(pending, (reader.next_envelope_timestamp.log_time, index))
+                if decoded_message is not None:
+                    full_record.update(decoded_message.to_dict())
+
+            yield log_time, full_record
+
+
+def _merge_columnar(
+    decoded: collections.abc.Sequence[tuple[pyarrow.Array, pyarrow.Table]],
+) -> tuple[pandas.Series, pandas.DataFrame]:
+    """Merge representations decoded by :py:class:`ColumnarMcapDecoder` into one frame.
+
+    Produces what :py:meth:`McapTopicReader.get_data_as_df` builds from
+    :py:meth:`McapTopicReader.get_data`, vectorized. That merge emits one row per
+    step at the earliest pending log time, taking the next message from every
+    representation at that time; so the ``k``-th message a representation logs
+    at a given time lands on the ``k``-th row for that time. Each row is a shallow
+    ``dict.update`` over the representations in order, so a later
+    representation's top-level field replaces an earlier one's wherever both
+    contribute to a row.
+    """
+    np = import_optional_dependency("numpy", "analytics")
+    pd = import_optional_dependency("pandas", "analytics")
+
+    frames = [_to_json_normalized_frame(values) for _, values in decoded]
+    times = [log_times.to_numpy() for log_times, _ in decoded]
+    if len(decoded) == 1:
+        (frame,), (merged_times,) = frames, times
+        names = _json_normalized_column_order([frame.columns])
+        return pd.Series(merged_times), frame[names]
+
+    ranks = []
+    for rep_times in times:
+        # Rank of each message among its representation's messages at the same log time.
+        positions = np.arange(len(rep_times))
+        group_starts = np.ones(len(rep_times), dtype=bool)
+        group_starts[1:] = rep_times[1:] != rep_times[:-1]
+        ranks.append(positions - np.maximum.accumulate(np.where(group_starts, positions, 0)))
+
+    # A merged row per (log time, rank) any representation has. Ranks at one log
+    # time run 0..n-1, so a message's row is its time's first row plus its rank.
+    keys = np.unique(np.stack([np.concatenate(times), np.concatenate(ranks)], axis=1), axis=0)
+    merged_times = keys[:, 0].astype(np.int64)
+    row_count = len(merged_times)
+
+    columns: dict[str, typing.Any] = {}
+    # Per column: the rows a representation fills, and the dtypes it is decoded as.
+    filled: dict[str, typing.Any] = {}
+    dtypes: dict[str, set[typing.Any]] = {}
+    present_by_rep = []
+    for rep_times, rep_ranks, frame in zip(times, ranks, frames):
+        rows = np.searchsorted(merged_times, rep_times, side="left") + rep_ranks
+        present = np.zeros(row_count, dtype=bool)
+        present[rows] = True
+        present_by_rep.append(present)
+        for name in frame.columns:
+            dtypes.setdefault(name, set()).add(frame[name].dtype)
+        frame = frame.set_axis(rows).reindex(pd.RangeIndex(row_count))
+        roots = {_root_of(name) for name in frame.columns}
+        for name in columns:
+            if name not in frame.columns and _root_of(name) in roots:
+                columns[name] = columns[name].where(~present)
+                filled[name] &= ~present
+        for name in frame.columns:
+            if name in columns:
+                columns[name] = frame[name].where(present, columns[name])
+                filled[name] |= present
+            else:
+                columns[name] = frame[name]
+                filled[name] = present.copy()
+
+    # Reindexing onto the merged rows holds missing values as NaN, which widens
+    # integer columns to float64 and boolean ones to object. json_normalize does
+    # the same, but only for a column some row lacks; one every row fills keeps
+    # the dtype its representations decode it as.
+    for name, rows_filled in filled.items():
+        if len(dtypes[name]) == 1 and rows_filled.all():
+            columns[name] = columns[name].astype(next(iter(dtypes[name])))
+
+    # Rows differ in shape only by which representations contribute to them, so
+    # each distinct combination, taken in order of its first row, stands in for
+    # all of its rows when ordering columns as json_normalize would.
+    combinations = sum(present.astype(np.int64) << rep for rep, present in enumerate(present_by_rep))
+    _, first_rows = np.unique(combinations, return_index=True)
+    records = []
+    for row in sorted(first_rows):
+        record: dict[str, list[str]] = {}
+        for frame, present in zip(frames, present_by_rep):
+            if present[row]:
+                # Like the dict.update it mirrors: a replaced field keeps its place.
+                record.update(_columns_by_root(frame.columns))
+        records.append([name for root_columns in record.values() for name in root_columns])
+    names = _json_normalized_column_order(records)
+    return pd.Series(merged_times), pd.DataFrame(
+        {name: columns[name] for name in names}, index=pd.RangeIndex(row_count)
+    )
+
+
+def _root_of(column_name: str) -> str:
+    return column_name.split(".", 1)[0]
+
+
+def _columns_by_root(column_names: collections.abc.Iterable[str]) -> dict[str, list[str]]:
+    """Group flattened column names under their top-level field, in order."""
+    by_root: dict[str, list[str]] = {}
+    for name in column_names:
+        by_root.setdefault(_root_of(name), []).append(name)
+    return by_root
+
+
+def _json_normalized_column_order(records: collections.abc.Iterable[collections.abc.Iterable[str]]) -> list[str]:
+    """Column order :py:func:`pandas.json_normalize` gives rows whose flattened keys come in the given orders.
+
+    Within a row, top-level non-struct fields go ahead of flattened structs; across
+    rows, columns appear in order of first occurrence.
+    """
+    names: dict[str, None] = {}
+    for record in records:
+        record = list(record)
+        names.update(dict.fromkeys(name for name in record if "." not in name))
+        names.update(dict.fromkeys(name for name in record if "." in name))
+    return list(names)
 
-        return pd.Series(timestamps), pd.json_normalize(data=data)
+
+def _to_json_normalized_frame(values: pyarrow.Table) -> pandas.DataFrame:
+    """Convert decoded columns to the dtypes :py:func:`pandas.json_normalize` infers from decoded messages.
+
+    Integers widen to ``int64`` and floats to ``float64``, as from Python scalars;
+    sequence columns hold Python lists.
+    """
+    pa = import_optional_dependency("pyarrow", "analytics")
+    pd = import_optional_dependency("pandas", "analytics")
+
+    columns: dict[str, typing.Any] = {}
+    for name, column in zip(values.column_names, values.columns):
+        column_type = column.type
+        if (
+            pa.types.is_list(column_type)
+            or pa.types.is_large_list(column_type)
+            or pa.types.is_fixed_size_list(column_type)
+        ):
+            columns[name] = pd.Series(column.to_pylist(), dtype=object)
+            continue
+        if pa.types.is_integer(column_type) and column_type != pa.uint64():
+            column = column.cast(pa.int64())
+        elif pa.types.is_floating(column_type):
+            column = column.cast(pa.float64())
+        columns[name] = column.to_pandas()
+    return pd.DataFrame(columns, index=pd.RangeIndex(values.num_rows))
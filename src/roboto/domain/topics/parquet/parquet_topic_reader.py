@@ -19,8 +19,12 @@ from ....formats.parquet import (
     compute_time_filter_mask,
     extract_timestamp_field,
     extract_timestamps,
+    filter_rows,
+    open_cached_parquet_file,
     parquet_file_from_url,
+    read_row_groups,
     resolve_columns,
+    row_groups_matching,
     should_read_row_group,
 )
 from ....http import RobotoClient
@@ -31,7 +35,9 @@ from ....storage.cache import (
     FetchMode,
     choose_fetch_mode,
     download_to_cache,
+    record_cache_hit,
 )
+from ....storage.signed_url_cache import signed_url_for_file
 from ..record import (
     CanonicalDataType,
     MessagePathMetadataWellKnown,
@@ -45,6 +51,7 @@ from ..topic_reader import Timestamp, TopicReader
 if typing.TYPE_CHECKING:
     import pandas  # pants: no-infer-dep
     import pyarrow  # pants: no-infer-dep
+    import pyarrow.compute  # pants: no-infer-dep
     import pyarrow.parquet  # pants: no-infer-dep
 
 
@@ -53,6 +60,13 @@ logger = default_logger()
 OUTFILE_NAME_PATTERN = "{repr_id}_{file_id}.parquet"
 """Filename template for locally cached Parquet files."""
 
+_ROW_CONVERSION_BATCH_SIZE = 64 * 1024
+"""Rows converted from Arrow to Python objects at a time by ``get_data``.
+
+Converting in batches keeps the per-row cost to a plain tuple yield while
+bounding how many Python row dicts exist at once to a slice of a row group,
+rather than the whole row group."""
+
 
 class _ReadContext(typing.NamedTuple):
     """Shared state prepared for reading a Parquet-backed topic."""
@@ -66,6 +80,11 @@ class _ReadContext(typing.NamedTuple):
 class ParquetTopicReader(TopicReader):
     """Private interface for retrieving topic data stored in Parquet files.
 
+    Every read accepts ``where``, a :py:class:`pyarrow.compute.Expression` over the
+    projected columns (e.g. ``pc.field("battery", "voltage") < 11.0``). Row groups whose
+    column statistics rule it out are never fetched, and the rest are filtered to it
+    before any row is converted or accumulated.
+
     Note:
         This is not intended as a public API.
         To access topic data, prefer the ``get_data`` or ``get_data_as_df`` methods
@@ -99,9 +118,8 @@ class ParquetTopicReader(TopicReader):
         start_time: typing.Optional[int] = None,
         end_time: typing.Optional[int] = None,
         timestamp_message_path_representation_mapping: typing.Optional[MessagePathRepresentationMapping] = None,
+        where: typing.Optional[pyarrow.compute.Expression] = None,
     ) -> collections.abc.Generator[tuple[Timestamp, dict[str, typing.Any]], None, None]:
-        pc = import_optional_dependency("pyarrow.compute", "analytics")
-
         if timestamp_message_path_representation_mapping is None:
             raise NotImplementedError(
                 "Reading data from a Parquet file requires one column to be marked as a 'CanonicalDataType.Timestamp'. "
@@ -115,40 +133,8 @@ class ParquetTopicReader(TopicReader):
         if ctx is None:
             return
 
-        for row_group_idx in range(ctx.parquet_file.metadata.num_row_groups):
-            row_group_metadata = ctx.parquet_file.metadata.row_group(row_group_idx)
-            if not should_read_row_group(
-                row_group_metadata,
-                ctx.timestamp_field,
-                start_time,
-                end_time,
-            ):
-                continue
-
-            row_group_table = ctx.parquet_file.read_row_group(
-                row_group_idx,
-                columns=ctx.columns,
-            )
-
-            timestamps = extract_timestamps(row_group_table, ctx.timestamp_field)
-
-            # Drop the timestamp column if it wasn't originally requested
-            if not ctx.include_timestamp_column:
-                row_group_table = row_group_table.drop_columns(ctx.timestamp_field.field.name)
-
-            filter_mask = compute_time_filter_mask(timestamps, start_time, end_time)
-            if filter_mask is not None:
-                row_group_table = pc.filter(row_group_table, filter_mask)
-                timestamps = pc.filter(timestamps, filter_mask)
-
-            # Yield tuples of (timestamp, row_dict)
-            for idx, row in enumerate(row_group_table.to_pylist()):
-                timestamp = timestamps[idx]
-                if pc.is_null(timestamp, nan_is_null=True):
-                    logger.warning("Skipping row %d, timestamp is null", idx)
-                    continue
-
-                yield timestamp.as_py(), row
+        for timestamps, row_group_table in self.__read_row_groups(ctx, start_time, end_time, where):
+            yield from _rows_with_timestamps(row_group_table, timestamps)
 
     def get_data_as_df(
         self,
@@ -156,10 +142,10 @@ class ParquetTopicReader(TopicReader):
         start_time: typing.Optional[int] = None,
         end_time: typing.Optional[int] = None,
         timestamp_message_path_representation_mapping: typing.Optional[MessagePathRepresentationMapping] = None,
+        where: typing.Optional[pyarrow.compute.Expression] = None,
     ) -> tuple[pandas.Series, pandas.DataFrame]:
         pd = import_optional_dependency("pandas", "analytics")
         pa = import_optional_dependency("pyarrow", "analytics")
-        pc = import_optional_dependency("pyarrow.compute", "analytics")
 
         if timestamp_message_path_representation_mapping is None:
             raise NotImplementedError(
@@ -176,35 +162,7 @@ class ParquetTopicReader(TopicReader):
 
         timestamps = []
         tables = []
-
-        for row_group_idx in range(ctx.parquet_file.metadata.num_row_groups):
-            row_group_metadata = ctx.parquet_file.metadata.row_group(row_group_idx)
-            if not should_read_row_group(
-                row_group_metadata,
-                ctx.timestamp_field,
-                start_time,
-                end_time,
-            ):
-                continue
-
-            row_group_table = ctx.parquet_file.read_row_group(
-                row_group_idx,
-                columns=ctx.columns,
-            )
-
-            row_group_timestamps = extract_timestamps(row_group_table, ctx.timestamp_field)
-
-            if not ctx.include_timestamp_column:
-                # The timestamp column was not included in the column projection list.
-                row_group_table = row_group_table.drop_columns(
-                    ctx.timestamp_field.field.name,
-                )
-
-            filter_mask = compute_time_filter_mask(row_group_timestamps, start_time, end_time)
-            if filter_mask is not None:
-                row_group_table = pc.filter(row_group_table, filter_mask)
-                row_group_timestamps = pc.filter(row_group_timestamps, filter_mask)
-
+        for row_group_timestamps, row_group_table in self.__read_row_groups(ctx, start_time, end_time, where):
             timestamps.append(row_group_timestamps)
             tables.append(row_group_table)
 
@@ -216,6 +174,29 @@ class ParquetTopicReader(TopicReader):
 
         return combined_timestamps.to_pandas(), combined_tables.to_pandas()
 
+    def get_data_as_batches(
+        self,
+        message_paths_to_representations: collections.abc.Iterable[MessagePathRepresentationMapping],
+        start_time: typing.Optional[int] = None,
+        end_time: typing.Optional[int] = None,
+        timestamp_message_path_representation_mapping: typing.Optional[MessagePathRepresentationMapping] = None,
+        where: typing.Optional[pyarrow.compute.Expression] = None,
+    ) -> collections.abc.Generator[tuple[pyarrow.Array, pyarrow.Table], None, None]:
+        if timestamp_message_path_representation_mapping is None:
+            raise NotImplementedError(
+                "Reading data from a Parquet file requires one column to be marked as a 'CanonicalDataType.Timestamp'. "
+                "This is likely an issue with data ingestion. Please reach out to Roboto support."
+            )
+
+        ctx = self.__prepare_read(
+            message_paths_to_representations,
+            timestamp_message_path_representation_mapping,
+        )
+        if ctx is None:
+            return
+
+        yield from self.__read_row_groups(ctx, start_time, end_time, where)
+
     def __ensure_single_parquet_file_per_topic(
         self,
         message_paths_to_representations: collections.abc.Iterable[MessagePathRepresentationMapping],
@@ -245,8 +226,7 @@ class ParquetTopicReader(TopicReader):
             )
         file_id = representation.association.association_id
         logger.debug("Getting signed url for file '%s'", file_id)
-        signed_url_response = self.__roboto_client.get(f"v1/files/{file_id}/signed-url")
-        return signed_url_response.to_dict(json_path=["data", "url"])
+        return signed_url_for_file(self.__roboto_client, file_id)
 
     def __parquet_file_from_remote_streaming(self, representation: RepresentationRecord) -> pyarrow.parquet.ParquetFile:
         """Open a Parquet file over HTTP via a signed URL (no local download)."""
@@ -307,22 +287,30 @@ class ParquetTopicReader(TopicReader):
         """Download the Parquet file to local cache (if not already cached) and open it.
 
         Files are stored under ``<cache_dir>/<repr_id>_<file_id>.parquet`` and
-        re-used across calls. Concurrent access is safe: an in-process lock keyed
+        re-used across calls, with reuse and downloads recorded in the cache
+        directory's index so its size limit evicts the least recently used
+        files first. Concurrent access is safe: an in-process lock keyed
         on the cache path dedupes downloads between threads, and an atomic
         temp-file-plus-rename pattern guarantees that any file visible at the
         final path is complete — readers in this or other processes never
-        observe a partial download.
+        observe a partial download. The cached file is opened memory-mapped.
         """
-        pq = import_optional_dependency("pyarrow.parquet", "analytics")
-
         outfile = self.__cached_outfile_for(representation)
-        if not outfile.exists():
-            download_to_cache(
-                lambda: self.__get_signed_url_for_representation_file(representation),
-                outfile,
-            )
-
-        return pq.ParquetFile(outfile)
+        file_id = representation.association.association_id
+        if outfile.exists():
+            record_cache_hit(outfile, file_id)
+            try:
+                return open_cached_parquet_file(outfile)
+            except FileNotFoundError:
+                # Evicted by another process between the existence check and the open.
+                pass
+
+        download_to_cache(
+            lambda: self.__get_signed_url_for_representation_file(representation),
+            outfile,
+            source_id=file_id,
+        )
+        return open_cached_parquet_file(outfile)
 
     def __prepare_read(
         self,
@@ -384,6 +372,62 @@ class ParquetTopicReader(TopicReader):
             include_timestamp_column=include_timestamp_column,
         )
 
+    def __read_row_groups(
+        self,
+        ctx: _ReadContext,
+        start_time: typing.Optional[int],
+        end_time: typing.Optional[int],
+        where: typing.Optional[pyarrow.compute.Expression],
+    ) -> collections.abc.Generator[tuple[pyarrow.Array, pyarrow.Table], None, None]:
+        """Yield ``(timestamps, table)`` for each row group overlapping the time window, filtered to it.
+
+        Row groups whose statistics rule them out, by time or by ``where``, are never read.
+        The rest are selected up front and read concurrently by
+        :py:func:`~roboto.formats.parquet.read_row_groups` on the process-wide read
+        scheduler, which pre-buffers a streamed file's column chunks in a few parallel
+        requests; they are yielded in file order.
+        """
+        # Imported here: roboto.experimental.topics imports this package while it initializes.
+        from ....experimental.topics.scheduler import shared_read_scheduler
+
+        pc = import_optional_dependency("pyarrow.compute", "analytics")
+
+        file_metadata = ctx.parquet_file.metadata
+        matching = (
+            row_groups_matching(file_metadata, ctx.parquet_file.schema_arrow, where) if where is not None else None
+        )
+        selected = [
+            row_group_idx
+            for row_group_idx in range(file_metadata.num_row_groups)
+            if (matching is None or matching[row_group_idx])
+            and should_read_row_group(
+                file_metadata.row_group(row_group_idx),
+                ctx.timestamp_field,
+                start_time,
+                end_time,
+            )
+        ]
+
+        row_group_tables = read_row_groups(
+            ctx.parquet_file, selected, columns=ctx.columns, scheduler=shared_read_scheduler()
+        )
+        for row_group_table in row_group_tables:
+            timestamps: pyarrow.Array = extract_timestamps(row_group_table, ctx.timestamp_field)
+
+            if not ctx.include_timestamp_column:
+                # The timestamp column was not included in the column projection list.
+                row_group_table = row_group_table.drop_columns(ctx.timestamp_field.field.name)
+
+            filter_mask = compute_time_filter_mask(timestamps, start_time, end_time)
+            if filter_mask is not None:
+                row_group_table = pc.filter(row_group_table, filter_mask)
+                timestamps = pc.filter(timestamps, filter_mask)
+
+            if where is not None:
+                row_group_table, timestamps = filter_rows(row_group_table, timestamps, where)
+
+            yield timestamps, row_group_table
+
     def __timestamp_message_path(
         self, message_path_representation_mapping: MessagePathRepresentationMapping
     ) -> MessagePathRecord:
@@ -397,3 +441,28 @@ class ParquetTopicReader(TopicReader):
             "Could not determine timestamp for topic ingested as Parquet. "
             "This is likely a problem with data ingestion. Please reach out to Roboto support."
         )
+
+
+def _rows_with_timestamps(
+    table: pyarrow.Table,
+    timestamps: pyarrow.Array,
+) -> collections.abc.Generator[tuple[Timestamp, dict[str, typing.Any]], None, None]:
+    """Yield ``(timestamp, row_dict)`` for each row of a row group whose timestamp is not null.
+
+    Null handling is done once over the whole row group and conversion to Python
+    objects a batch at a time, so no Arrow compute or scalar boxing happens per row.
+    """
+    pc = import_optional_dependency("pyarrow.compute", "analytics")
+
+    null_mask = pc.is_null(timestamps, nan_is_null=True)
+    if null_mask.true_count:
+        for idx in pc.indices_nonzero(null_mask).to_pylist():
+            logger.warning("Skipping row %d, timestamp is null", idx)
+        valid_mask = pc.invert(null_mask)
+        table = table.filter(valid_mask)
+        timestamps = timestamps.filter(valid_mask)
+
+    for offset in range(0, table.num_rows, _ROW_CONVERSION_BATCH_SIZE):
+        rows = table.slice(offset, _ROW_CONVERSION_BATCH_SIZE).to_pylist()
+        batch_timestamps = timestamps.slice(offset, _ROW_CONVERSION_BATCH_SIZE).to_pylist()
+        yield from zip(batch_timestamps, rows)
@@ -16,7 +16,8 @@ import urllib.parse
 from ...association import Association
 from ...compat import import_optional_dependency
 from ...exceptions import RobotoConflictException
-from ...http import RobotoClient
+from ...formats import Downsample
+from ...http import PaginatedList, RobotoClient, iter_items
 from ...logging import default_logger
 from ...sentinels import (
     NotSet,
@@ -455,24 +456,19 @@ class Topic:
             Counter({'/camera/image': 2, '/imu/data': 2})
         """
         roboto_client = RobotoClient.defaulted(roboto_client)
-        page_token: typing.Optional[str] = None
 
-        while True:
+        def fetch_page(page_token: typing.Optional[str]) -> PaginatedList[TopicRecord]:
             query_params: dict[str, typing.Any] = {}
             if page_token:
                 query_params["page_token"] = str(page_token)
 
-            paginated_results = roboto_client.get(
+            return roboto_client.get(
                 f"v1/datasets/{dataset_id}/topics",
                 query=query_params,
             ).to_paginated_list(TopicRecord)
 
-            for record in paginated_results.items:
-                yield cls(record=record, roboto_client=roboto_client)
-            if paginated_results.next_token:
-                page_token = paginated_results.next_token
-            else:
-                break
+        for record in iter_items(fetch_page):
+            yield cls(record=record, roboto_client=roboto_client)
 
     @classmethod
     def get_by_file(
@@ -512,20 +508,16 @@ class Topic:
         roboto_client = RobotoClient.defaulted(roboto_client)
         encoded_association = Association.file(file_id).url_encode()
 
-        page_token: typing.Optional[str] = None
-        while True:
+        def fetch_page(page_token: typing.Optional[str]) -> PaginatedList[TopicRecord]:
             response = roboto_client.get(
                 f"v1/topics/association/{encoded_association}",
                 owner_org_id=owner_org_id,
                 query={"page_token": page_token} if page_token else None,
             )
-            paginated_results = response.to_paginated_list(TopicRecord)
-            for topic_record in paginated_results.items:
-                yield cls(topic_record, roboto_client)
-            if paginated_results.next_token:
-                page_token = paginated_results.next_token
-            else:
-                break
+            return response.to_paginated_list(TopicRecord)
+
+        for topic_record in iter_items(fetch_page):
+            yield cls(topic_record, roboto_client)
 
     def __init__(
         self,
@@ -965,6 +957,7 @@ class Topic:
         end_time: typing.Optional[Time] = None,
         cache_dir: typing.Union[str, pathlib.Path, None] = None,
         representation_selector: RepresentationSelector = RepresentationSelector.raw(),
+        downsample: typing.Optional[Downsample] = None,
     ) -> pandas.DataFrame:
         """Return this topic's underlying data as a pandas DataFrame.
 
@@ -987,6 +980,10 @@ class Topic:
                 Defaults to :py:meth:`RepresentationSelector.raw` — original, untransformed data.
                 Pass a ``RepresentationSelector`` to request a specific content format or
                 transformation pipeline.
+            downsample: Reduce the data to plot size by time bucket while it is read
+                (see :py:class:`~roboto.formats.Downsample`), so a long, high-rate topic
+                never has to fit in memory whole. Struct-typed paths come back as
+                dot-delimited leaf columns. If None, every row is returned.
 
         Returns:
             pandas DataFrame containing the topic data, indexed by log time.
@@ -1026,6 +1023,10 @@ class Topic:
             >>> df_accel = topic.get_data_as_df(message_paths_include=["acceleration"])
             >>> xyz = np.stack(df_accel["acceleration"].to_numpy())  # shape (N, 3)
 
+            >>> # Plot six hours of IMU data as one mean per second
+            >>> from roboto.formats import Downsample
+            >>> df_plot = topic.get_data_as_df(downsample=Downsample(bucket_width=1_000_000_000))
+
         Tip:
             For many topics, parallelize with a thread pool:
 
@@ -1043,6 +1044,7 @@ class Topic:
             end_time=end_time,
             cache_dir_override=cache_dir,
             representation_selector=representation_selector,
+            downsample=downsample,
         )
 
     def get_message_path(self, message_path: str) -> MessagePath:
@@ -11,6 +11,7 @@ import pathlib
 import typing
 
 from ...compat import import_optional_dependency
+from ...formats import Downsample, Downsampler
 from ...http import RobotoClient
 from ...logging import default_logger
 from ...time import (
@@ -139,6 +140,7 @@ class TopicDataService:
         end_time: typing.Optional[Time] = None,
         cache_dir_override: typing.Union[str, pathlib.Path, None] = None,
         representation_selector: RepresentationSelector = RepresentationSelector.raw(),
+        downsample: typing.Optional[Downsample] = None,
     ) -> pandas.DataFrame:
         """Retrieve data for a specific topic as a pandas DataFrame with optional filtering.
 
@@ -153,6 +155,9 @@ class TopicDataService:
             cache_dir_override: Override the default cache directory for downloads.
             representation_selector: Criteria for selecting among multiple representations.
                 Defaults to :py:meth:`RepresentationSelector.raw`.
+            downsample: Reduce the rows to plot size by time bucket as they are read,
+                rather than after materializing them all. The result's struct fields
+                are flattened into dot-delimited leaf columns. If None, every row is returned.
 
         Returns:
             pandas.DataFrame
@@ -172,6 +177,15 @@ class TopicDataService:
         start_time_ns = to_epoch_nanoseconds(start_time) if start_time is not None else None
         end_time_ns = to_epoch_nanoseconds(end_time) if end_time is not None else None
 
+        if downsample is not None:
+            return self.__get_downsampled_df(
+                selected_mappings,
+                downsample,
+                start_time=start_time_ns,
+                end_time=end_time_ns,
+                cache_dir_override=cache_dir_override,
+            )
+
         if McapTopicReader.accepts(selected_mappings):
             reader: TopicReader = McapTopicReader(self.__roboto_client)
             timestamps, df = reader.get_data_as_df(
@@ -202,6 +216,45 @@ class TopicDataService:
 
         return df
 
+    def __get_downsampled_df(
+        self,
+        selected_mappings: list[MessagePathRepresentationMapping],
+        downsample: Downsample,
+        start_time: typing.Optional[int],
+        end_time: typing.Optional[int],
+        cache_dir_override: typing.Union[str, pathlib.Path, None],
+    ) -> pandas.DataFrame:
+        pd = import_optional_dependency("pandas", "analytics")
+
+        timestamp_mapping: typing.Optional[MessagePathRepresentationMapping] = None
+        if McapTopicReader.accepts(selected_mappings):
+            reader: TopicReader = McapTopicReader(self.__roboto_client)
+        elif ParquetTopicReader.accepts(selected_mappings):
+            reader = ParquetTopicReader(self.__roboto_client, cache_dir=self.__resolve_cache_dir(cache_dir_override))
+            timestamp_mapping = self.__find_timestamp_message_path_mapping(selected_mappings)
+        else:
+            raise NotImplementedError("No compatible reader found for this data. Please reach out to Roboto support.")
+
+        # Buckets align to start_time; the Downsampler takes an inclusive upper bound.
+        downsampler = Downsampler(
+            downsample,
+            start_time=start_time,
+            end_time=end_time - 1 if end_time is not None else None,
+        )
+        for timestamps, values in reader.get_data_as_batches(
+            selected_mappings,
+            start_time=start_time,
+            end_time=end_time,
+            timestamp_message_path_representation_mapping=timestamp_mapping,
+        ):
+            downsampler.add(timestamps, values)
+
+        timestamps, values = downsampler.finish()
+        df = values.to_pandas()
+        df = df.set_index(pd.to_datetime(timestamps.to_numpy(), unit="ns", utc=True))
+        df.index.name = "_index"
+        return df
+
     def __resolve_cache_dir(self, cache_dir_override: typing.Union[str, pathlib.Path, None] = None) -> pathlib.Path:
         # Resolves only — does not create. The Parquet reader creates the directory
         # lazily, and only when it has actually decided to write a file to it.
@@ -10,16 +10,21 @@ import abc
 import collections.abc
 import typing
 
+from ...compat import import_optional_dependency
 from .record import (
     MessagePathRepresentationMapping,
 )
 
 if typing.TYPE_CHECKING:
     import pandas  # pants: no-infer-dep
+    import pyarrow  # pants: no-infer-dep
 
 
 Timestamp: typing.TypeAlias = typing.Union[int, float]
 
+_ROWS_PER_ARROW_BATCH = 64 * 1024
+"""Rows of ``get_data`` output encoded to Arrow at a time by the default ``TopicReader.get_data_as_batches``."""
+
 
 class TopicReader(abc.ABC):
     """Private interface for retrieving topic data of a particular format.
@@ -54,3 +59,33 @@ class TopicReader(abc.ABC):
         end_time: typing.Optional[int] = None,
         timestamp_message_path_representation_mapping: typing.Optional[MessagePathRepresentationMapping] = None,
     ) -> tuple[pandas.Series, pandas.DataFrame]: ...
+
+    def get_data_as_batches(
+        self,
+        message_paths_to_representations: collections.abc.Iterable[MessagePathRepresentationMapping],
+        start_time: typing.Optional[int] = None,
+        end_time: typing.Optional[int] = None,
+        timestamp_message_path_representation_mapping: typing.Optional[MessagePathRepresentationMapping] = None,
+    ) -> collections.abc.Generator[tuple[pyarrow.Array, pyarrow.Table], None, None]:
+        """Yield the rows ``get_data`` would, as ``(timestamps, rows)`` Arrow batches of bounded size.
+
+        Readers that decode to Arrow natively should override this. The default
+        encodes ``get_data``'s rows a slice at a time, inferring column types per slice.
+        """
+        pa = import_optional_dependency("pyarrow", "analytics")
+
+        timestamps: list[int] = []
+        rows: list[dict[str, typing.Any]] = []
+        for timestamp, row in self.get_data(
+            message_paths_to_representations,
+            start_time=start_time,
+            end_time=end_time,
+            timestamp_message_path_representation_mapping=timestamp_message_path_representation_mapping,
+        ):
+            timestamps.append(int(timestamp))
+            rows.append(row)
+            if len(rows) == _ROWS_PER_ARROW_BATCH:
+                yield pa.array(timestamps, pa.int64()), pa.Table.from_pylist(rows)
+                timestamps, rows = [], []
+        if rows:
+            yield pa.array(timestamps, pa.int64()), pa.Table.from_pylist(rows)
@@ -6,10 +6,13 @@
 
 """Topics APIs in active refinement; see :py:mod:`roboto.experimental` for the stability contract."""
 
+from .align import AlignMethod, align_batches, align_topics
 from .batch_transforms import (
     TIMESTAMP_FIELD_METADATA_KEY,
     timestamp_column_index,
 )
+from .dataset import TopicDataset, TopicFragment
+from .metadata_cache import configure_topic_metadata_cache
 from .operations import (
     FieldAddress,
     ReadPlanRequest,
@@ -30,11 +33,13 @@ from .read_plan import (
     TimeWindow,
 )
 from .record import RepresentationRecord, RepresentationSelector
+from .scheduler import configure_read_scheduler
 from .topic import FieldAddressLike, SessionContext, Topic
 
 __all__ = [
     "PLAN_VERSION",
     "TIMESTAMP_FIELD_METADATA_KEY",
+    "AlignMethod",
     "FieldAddress",
     "FieldAddressLike",
     "ReadPlan",
@@ -54,5 +59,11 @@ __all__ = [
     "SessionContext",
     "TimeWindow",
     "Topic",
+    "TopicDataset",
+    "TopicFragment",
+    "align_batches",
+    "align_topics",
+    "configure_read_scheduler",
+    "configure_topic_metadata_cache",
     "timestamp_column_index",
 ]
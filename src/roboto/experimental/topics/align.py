@@ -0,0 +1,447 @@
+# Copyright (c) 2026 Roboto Technologies, Inc.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Streaming as-of alignment of several topics' data onto one topic's timestamps.
+
+Sensor fusion joins topics recorded at different rates (e.g. IMU at 1 kHz, wheel
+odometry at 50 Hz, GPS at 10 Hz) by time. :py:func:`align_batches` does so while
+the topics are read: each row of a reference stream is matched, per other stream,
+to the row at or before it, at or after it, the nearest, or a linear interpolation
+between the two (see :py:class:`AlignMethod`), optionally within a tolerance.
+
+Streams are consumed one batch at a time. Each other stream buffers only the rows
+that can still match: those at or after the reference rows not yet aligned, plus
+the candidate matches of the reference batch being aligned. Memory is therefore
+bounded by a reference batch and about one batch of each other stream, rather than
+every topic's whole window as a materialize-then-``pandas.merge_asof`` join holds.
+"""
+
+from __future__ import annotations
+
+import collections.abc
+import enum
+import pathlib
+import typing
+
+from ...compat import import_optional_dependency
+from ...storage import CachePolicy
+from ...time import Time, to_epoch_nanoseconds
+from .batch_transforms import timestamp_column_index
+
+if typing.TYPE_CHECKING:
+    import numpy  # pants: no-infer-dep
+    import pyarrow  # pants: no-infer-dep
+
+    from .topic import Topic
+
+
+class AlignMethod(str, enum.Enum):
+    """Which row of another stream is aligned to each reference row."""
+
+    BACKWARD = "backward"
+    """The latest row at or before the reference row (``pandas.merge_asof``'s default)."""
+
+    FORWARD = "forward"
+    """The earliest row at or after the reference row."""
+
+    NEAREST = "nearest"
+    """Whichever of the ``BACKWARD`` and ``FORWARD`` rows is closer in time; the earlier on a tie."""
+
+    INTERPOLATE = "interpolate"
+    """A linear interpolation between the ``BACKWARD`` and ``FORWARD`` rows, at the reference row's time.
+
+    Integer and floating-point values, including those nested in structs, are
+    interpolated as ``float64``; any other value is taken from the nearer row. The
+    stream's timestamp becomes the reference row's. A reference row that is not
+    bracketed by a row on each side (within the tolerance) gets no match, unless a
+    row falls exactly on it."""
+
+
+def align_batches(
+    reference: collections.abc.Iterable[pyarrow.RecordBatch],
+    others: collections.abc.Mapping[str, collections.abc.Iterable[pyarrow.RecordBatch]],
+    method: AlignMethod = AlignMethod.BACKWARD,
+    tolerance: typing.Optional[int] = None,
+) -> collections.abc.Generator[pyarrow.RecordBatch, None, None]:
+    """Align the rows of ``others`` onto the rows of ``reference``, batch by batch, as the streams are read.
+
+    Streams are topic-data batches, as yielded by
+    :py:meth:`~roboto.experimental.topics.Topic.get_data_as_record_batches`, each with a
+    timestamp column located by :py:func:`~roboto.experimental.topics.timestamp_column_index`.
+    Each output batch is one reference batch's rows, in time order, with one struct
+    column added per other stream, named by its key in ``others``. The struct holds
+    the matched row's fields, including its timestamp column, and is null where no
+    row matches. Batches of one stream may carry different schemas (partitions can
+    differ), so the struct's type can vary between output batches.
+
+    Every stream must be in time order across batches; rows within a batch are
+    sorted as they arrive. A topic read is in time order unless its partitions'
+    time ranges overlap. Rows with a null timestamp are dropped.
+
+    Args:
+        reference: The stream whose rows are the output rows.
+        others: The streams to align onto them, by the name of the column each becomes.
+        method: Which row of another stream each reference row is aligned to.
+        tolerance: Largest time difference, in nanoseconds, between a reference row
+            and a row aligned to it. ``None`` allows any difference.
+
+    Yields:
+        The reference stream's batches, time-sorted, each extended with one struct
+        column per other stream.
+
+    Raises:
+        ValueError: ``tolerance`` is negative, a key of ``others`` names a column of
+            the reference stream, or a stream goes back in time between batches.
+
+    Examples:
+        Attach to each odometry row the latest GPS fix from the half second before it:
+
+        >>> from roboto.experimental.topics import Topic, align_batches
+        >>> odometry, gps = Topic.from_id("ti_odom"), Topic.from_id("ti_gps")
+        >>> for batch in align_batches(
+        ...     odometry.get_data_as_record_batches(start_time=t0, end_time=t1),
+        ...     {"gps": gps.get_data_as_record_batches(start_time=t0, end_time=t1)},
+        ...     tolerance=500_000_000,
+        ... ):
+        ...     print(batch.column("gps"))
+    """
+    pa = import_optional_dependency("pyarrow", "analytics")
+
+    if tolerance is not None and tolerance < 0:
+        raise ValueError(f"tolerance must not be negative, got {tolerance}")
+
+    streams = [_AlignedStream(name, batches) for name, batches in others.items()]
+    reference_stream = _SortedBatches("reference", reference)
+    for batch, timestamps in reference_stream:
+        collisions = [stream.name for stream in streams if stream.name in batch.schema.names]
+        if collisions:
+            raise ValueError(f"Aligned stream names {collisions} collide with columns of the reference stream")
+        for stream in streams:
+            aligned = stream.align(timestamps, method, tolerance)
+            batch = batch.append_column(pa.field(stream.name, aligned.type), aligned)
+        yield batch
+
+
+def align_topics(
+    reference: Topic,
+    others: collections.abc.Mapping[str, Topic],
+    start_time: typing.Optional[Time] = None,
+    end_time: typing.Optional[Time] = None,
+    method: AlignMethod = AlignMethod.BACKWARD,
+    tolerance: typing.Optional[int] = None,
+    cache_policy: CachePolicy = CachePolicy.ADAPTIVE,
+    cache_dir: typing.Union[str, pathlib.Path, None] = None,
+) -> collections.abc.Generator[pyarrow.RecordBatch, None, None]:
+    """Read several topics over one window and align them onto ``reference``'s rows; see :py:func:`align_batches`.
+
+    Every topic is read in full (all fields) with
+    :py:meth:`~roboto.experimental.topics.Topic.get_data_as_record_batches`; the
+    reads run concurrently on the shared read scheduler. With a ``tolerance``, the
+    other topics are read that much beyond the window on the side(s) ``method``
+    looks, so reference rows near the window's edges still find their matches. To
+    project fields or filter rows, call :py:func:`align_batches` with reads of your own.
+
+    Args:
+        reference: The topic whose rows are the output rows.
+        others: The topics to align onto them, by the name of the column each becomes.
+        start_time: See :py:meth:`~roboto.experimental.topics.Topic.get_data_as_record_batches`.
+        end_time: See :py:meth:`~roboto.experimental.topics.Topic.get_data_as_record_batches`.
+        method: See :py:func:`align_batches`.
+        tolerance: See :py:func:`align_batches`.
+        cache_policy: See :py:meth:`~roboto.experimental.topics.Topic.get_data_as_record_batches`.
+        cache_dir: See :py:meth:`~roboto.experimental.topics.Topic.get_data_as_record_batches`.
+
+    Examples:
+        >>> from roboto.experimental.topics import AlignMethod, Topic, align_topics
+        >>> odometry, gps = Topic.from_id("ti_odom"), Topic.from_id("ti_gps")
+        >>> for batch in align_topics(odometry, {"gps": gps}, start_time=t0, end_time=t1, method=AlignMethod.NEAREST):
+        ...     print(batch.num_rows)
+    """
+    other_start: typing.Optional[Time] = start_time
+    other_end: typing.Optional[Time] = end_time
+    if tolerance is not None:
+        if start_time is not None and method is not AlignMethod.FORWARD:
+            other_start = to_epoch_nanoseconds(start_time) - tolerance
+        if end_time is not None and method is not AlignMethod.BACKWARD:
+            other_end = to_epoch_nanoseconds(end_time) + tolerance
+
+    yield from align_batches(
+        reference.get_data_as_record_batches(
+            start_time=start_time, end_time=end_time, cache_policy=cache_policy, cache_dir=cache_dir
+        ),
+        {
+            name: topic.get_data_as_record_batches(
+                start_time=other_start, end_time=other_end, cache_policy=cache_policy, cache_dir=cache_dir
+            )
+            for name, topic in others.items()
+        },
+        method=method,
+        tolerance=tolerance,
+    )
+
+
+class _SortedBatches:
+    """Iterates a stream's non-empty batches, each sorted by time, with its timestamps as an ``int64`` array.
+
+    Raises ``ValueError`` when a batch starts before the previous one ended.
+    """
+
+    def __init__(self, name: str, batches: collections.abc.Iterable[pyarrow.RecordBatch]):
+        self.__name = name
+        self.__batches = iter(batches)
+        self.__last: typing.Optional[int] = None
+
+    def __iter__(self) -> collections.abc.Iterator[tuple[pyarrow.RecordBatch, numpy.ndarray]]:
+        return self
+
+    def __next__(self) -> tuple[pyarrow.RecordBatch, numpy.ndarray]:
+        np = import_optional_dependency("numpy", "analytics")
+
+        while True:
+            batch = next(self.__batches)
+            column = batch.column(timestamp_column_index(batch.schema))
+            if column.null_count:
+                batch = batch.filter(column.is_valid())
+                column = batch.column(timestamp_column_index(batch.schema))
+            if batch.num_rows == 0:
+                continue
+
+            timestamps = np.asarray(column.to_numpy(zero_copy_only=False), dtype=np.int64)
+            if np.any(timestamps[1:] < timestamps[:-1]):
+                order = np.argsort(timestamps, kind="stable")
+                batch = batch.take(order)
+                timestamps = timestamps[order]
+            if self.__last is not None and timestamps[0] < self.__last:
+                raise ValueError(
+                    f"Stream {self.__name!r} goes back in time, from {self.__last} to {timestamps[0]}: "
+                    "alignment needs each stream in time order. A topic read is out of order when its "
+                    "partitions overlap in time; align each non-overlapping stretch separately."
+                )
+            self.__last = int(timestamps[-1])
+            return batch, timestamps
+
+
+class _AlignedStream:
+    """One stream being aligned, holding only the rows that may still match a reference row."""
+
+    def __init__(self, name: str, batches: collections.abc.Iterable[pyarrow.RecordBatch]):
+        np = import_optional_dependency("numpy", "analytics")
+
+        self.__name = name
+        self.__batches = _SortedBatches(name, batches)
+        self.__exhausted = False
+        # Leading buffered rows already reduced to the current reference rows' neighbours.
+        self.__compacted = 0
+        self.__rows: typing.Optional[pyarrow.Table] = None
+        self.__timestamps: numpy.ndarray = np.empty(0, dtype=np.int64)
+
+    @property
+    def name(self) -> str:
+        """The name of the column the stream becomes."""
+        return self.__name
+
+    def align(self, reference: numpy.ndarray, method: AlignMethod, tolerance: typing.Optional[int]) -> pyarrow.Array:
+        """The struct array of rows aligned to the sorted ``reference`` timestamps, null where none matches."""
+        np = import_optional_dependency("numpy", "analytics")
+        pa = import_optional_dependency("pyarrow", "analytics")
+
+        # Read until a row lies beyond the last reference row, so every reference
+        # row has both neighbours it could match buffered (or the stream is over).
+        last = reference[-1]
+        self.__compacted = 0
+        while not self.__exhausted and (len(self.__timestamps) == 0 or self.__timestamps[-1] <= last):
+            self.__pull(reference)
+
+        rows = self.__rows
+        if rows is None:
+            return pa.nulls(len(reference), pa.struct([]))
+
+        timestamps = self.__timestamps
+        before = np.searchsorted(timestamps, reference, side="right") - 1
+        after = np.searchsorted(timestamps, reference, side="left")
+        has_before = before >= 0
+        has_after = after < len(timestamps)
+        if tolerance is not None:
+            has_before &= reference - timestamps[np.maximum(before, 0)] <= tolerance
+            has_after &= timestamps[np.minimum(after, len(timestamps) - 1)] - reference <= tolerance
+
+        if method is AlignMethod.INTERPOLATE:
+            aligned = self.__interpolate(rows, reference, before, after, has_before, has_after)
+        else:
+            if method is AlignMethod.BACKWARD:
+                indices, matched = before, has_before
+            elif method is AlignMethod.FORWARD:
+                indices, matched = after, has_after
+            else:
+                before_gap = reference - timestamps[np.maximum(before, 0)]
+                after_gap = timestamps[np.minimum(after, len(timestamps) - 1)] - reference
+                use_after = has_after & (~has_before | (after_gap < before_gap))
+                indices = np.where(use_after, after, before)
+                matched = has_before | has_after
+            aligned = _to_struct(rows.take(pa.array(np.where(matched, indices, 0), mask=~matched)))
+
+        self.__discard_before(int(last))
+        return aligned
+
+    def __discard_before(self, timestamp: int) -> None:
+        """Drop the rows no reference row at or after ``timestamp`` can match."""
+        timestamps = self.__timestamps
+        keep_from = _first_needed(timestamps, timestamp)
+        if keep_from and self.__rows is not None:
+            self.__rows = self.__rows.slice(keep_from)
+            self.__timestamps = timestamps[keep_from:]
+
+    def __interpolate(
+        self,
+        rows: pyarrow.Table,
+        reference: numpy.ndarray,
+        before: numpy.ndarray,
+        after: numpy.ndarray,
+        has_before: numpy.ndarray,
+        has_after: numpy.ndarray,
+    ) -> pyarrow.Array:
+        np = import_optional_dependency("numpy", "analytics")
+        pa = import_optional_dependency("pyarrow", "analytics")
+
+        timestamps = self.__timestamps
+        exact = has_after & (timestamps[np.minimum(after, len(timestamps) - 1)] == reference)
+        # A row exactly at the reference time is its own interpolation.
+        before = np.where(exact, after, before)
+        matched = exact | (has_before & has_after)
+        low = np.where(matched, before, 0)
+        high = np.where(matched, after, 0)
+        span = (timestamps[high] - timestamps[low]).astype(np.float64)
+        weights = np.divide(
+            (reference - timestamps[low]).astype(np.float64), span, out=np.zeros(len(reference)), where=span > 0
+        )
+
+        mask = pa.array(~matched)
+        low_rows = rows.take(pa.array(low, mask=~matched))
+        high_rows = rows.take(pa.array(high, mask=~matched))
+        timestamp_index = timestamp_column_index(rows.schema)
+        fields = []
+        arrays = []
+        for index, field in enumerate(rows.schema):
+            if index == timestamp_index:
+                array = pa.array(reference, pa.int64(), mask=~matched)
+            else:
+                array = _interpolate_array(
+                    low_rows.column(index).combine_chunks(), high_rows.column(index).combine_chunks(), weights
+                )
+            arrays.append(array)
+            fields.append(pa.field(field.name, array.type))
+        if not arrays:
+            return pa.nulls(len(reference), pa.struct([]))
+        return pa.StructArray.from_arrays(arrays, fields=fields, mask=mask)
+
+    def __pull(self, reference: numpy.ndarray) -> None:
+        """Buffer the stream's next batch, keeping only the rows the ``reference`` rows or later ones may match."""
+        np = import_optional_dependency("numpy", "analytics")
+        pa = import_optional_dependency("pyarrow", "analytics")
+
+        try:
+            batch, timestamps = next(self.__batches)
+        except StopIteration:
+            self.__exhausted = True
+            return
+
+        table = pa.Table.from_batches([batch])
+        if self.__rows is None:
+            rows, all_timestamps = table, timestamps
+        else:
+            # Partitions may differ in schema; permissive promotion unifies them.
+            rows = pa.concat_tables([self.__rows, table], promote_options="permissive")
+            all_timestamps = np.concatenate([self.__timestamps, timestamps])
+
+        # Of the rows up to the last reference row, only each reference row's
+        # neighbours can match it; a later reference row's neighbours are at or
+        # after the last one's. Dropping the rest bounds the buffer when this
+        # stream is much denser than the reference. Rows before ``compacted`` were
+        # already reduced to neighbours by an earlier pull for the same reference
+        # rows, so only the rows since then are searched, against only the
+        # reference rows near them.
+        compacted = self.__compacted
+        tail_from = _first_needed(all_timestamps, int(reference[-1]))
+        if tail_from > compacted:
+            region = all_timestamps[compacted:tail_from]
+            # The reference rows within the region, and one on each side of it.
+            nearby_from = max(0, int(np.searchsorted(reference, region[0], side="left")) - 1)
+            nearby_to = int(np.searchsorted(reference, region[-1], side="right")) + 1
+            nearby = reference[nearby_from:nearby_to]
+            keep = np.zeros(len(region), dtype=bool)
+            before = np.searchsorted(region, nearby, side="right") - 1
+            keep[before[before >= 0]] = True
+            after = np.searchsorted(region, nearby, side="left")
+            keep[after[after < len(region)]] = True
+            if not keep.all():
+                indices = np.flatnonzero(keep)
+                # Only the new rows are copied; the rows kept before stay as they are.
+                rows = pa.concat_tables(
+                    [
+                        rows.slice(0, compacted),
+                        rows.slice(compacted, len(region)).take(pa.array(indices)),
+                        rows.slice(tail_from),
+                    ]
+                )
+                all_timestamps = np.concatenate(
+                    [all_timestamps[:compacted], region[indices], all_timestamps[tail_from:]]
+                )
+                tail_from = compacted + len(indices)
+            self.__compacted = tail_from
+
+        self.__rows = rows
+        self.__timestamps = all_timestamps
+
+
+def _first_needed(timestamps: numpy.ndarray, timestamp: int) -> int:
+    """Index of the first of the sorted ``timestamps`` a row at or after ``timestamp`` can be aligned to.
+
+    That is the first row at ``timestamp``, or else the last row before it.
+    """
+    np = import_optional_dependency("numpy", "analytics")
+
+    first_at = int(np.searchsorted(timestamps, timestamp, side="left"))
+    last_at_or_before = int(np.searchsorted(timestamps, timestamp, side="right")) - 1
+    return max(0, min(first_at, last_at_or_before))
+
+
+def _interpolate_array(low: pyarrow.Array, high: pyarrow.Array, weights: numpy.ndarray) -> pyarrow.Array:
+    """Interpolate between aligned arrays: numbers linearly, struct fields recursively, anything else by nearness."""
+    pa = import_optional_dependency("pyarrow", "analytics")
+    pc = import_optional_dependency("pyarrow.compute", "analytics")
+
+    data_type = low.type
+    if pa.types.is_struct(data_type):
+        struct_type = typing.cast("pyarrow.StructType", data_type)
+        # flatten() folds each struct's own nulls into its children.
+        low_children = typing.cast("pyarrow.StructArray", low).flatten()
+        high_children = typing.cast("pyarrow.StructArray", high).flatten()
+        children = [
+            _interpolate_array(low_child, high_child, weights)
+            for low_child, high_child in zip(low_children, high_children)
+        ]
+        fields = [pa.field(struct_type.field(i).name, child.type) for i, child in enumerate(children)]
+        mask = pc.or_(low.is_null(), high.is_null())
+        return pa.StructArray.from_arrays(children, fields=fields, mask=mask)
+    if pa.types.is_integer(data_type) or pa.types.is_floating(data_type):
+        low_values = pc.cast(low, pa.float64())
+        high_values = pc.cast(high, pa.float64())
+        return pc.add(low_values, pc.multiply(pc.subtract(high_values, low_values), pa.array(weights)))
+    return pc.if_else(pa.array(weights <= 0.5), low, high)
+
+
+def _to_struct(rows: pyarrow.Table) -> pyarrow.Array:
+    """Pack taken rows into one struct array, null where the take index was null."""
+    pa = import_optional_dependency("pyarrow", "analytics")
+
+    if rows.num_columns == 0:
+        return pa.nulls(rows.num_rows, pa.struct([]))
+    timestamps = rows.column(timestamp_column_index(rows.schema))
+    arrays = [column.combine_chunks() for column in rows.columns]
+    # The stream's timestamp becomes an ordinary field of the struct: only the
+    # reference's stays marked, so the output has exactly one timestamp column.
+    fields = [pa.field(field.name, field.type) for field in rows.schema]
+    return pa.StructArray.from_arrays(arrays, fields=fields, mask=timestamps.combine_chunks().is_null())
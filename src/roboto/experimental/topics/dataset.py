@@ -0,0 +1,496 @@
+# Copyright (c) 2026 Roboto Technologies, Inc.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""A topic's data exposed to query engines with column and filter pushdown.
+
+:py:class:`TopicDataset` implements the scanning surface of
+:py:class:`pyarrow.dataset.Dataset` (``schema``, ``scanner``, ``to_batches``,
+``to_table``, ``head``, ``count_rows``, ``get_fragments``) over a topic's read
+plan, plus the Arrow C stream protocol, so pyarrow, Polars
+(``polars.scan_pyarrow_dataset``), and DuckDB (through a scanner or the stream
+protocol) can query it. Arrow's ``Dataset`` cannot be subclassed from Python, so
+the surface is implemented rather than inherited.
+
+A scan pushes its work into the read:
+
+* Selected columns, and the columns a filter references, become the read-plan
+  request's ``fields_include``, so only their files are fetched and decoded.
+* A filter on the timestamp column narrows the requested time window, and
+  drops partitions whose extent it rules out.
+* A filter that does not reference the timestamp column is passed down as the
+  read's ``where``, pruning Parquet row groups by their statistics. One that does
+  is applied to the decoded rows, whose timestamps are then absolute.
+
+Each :py:class:`~roboto.experimental.topics.ReadPlanPartition` of the plan is a
+:py:class:`TopicFragment`.
+"""
+
+from __future__ import annotations
+
+import abc
+import collections.abc
+import typing
+
+from ...compat import import_optional_dependency
+from .batch_transforms import timestamp_column_index, timestamp_field
+from .read_plan import ReadPlan, ReadPlanPartition, TimeWindow
+
+if typing.TYPE_CHECKING:
+    import pyarrow  # pants: no-infer-dep
+    import pyarrow.compute  # pants: no-infer-dep
+    import pyarrow.dataset  # pants: no-infer-dep
+
+PlanResolver = typing.Callable[[TimeWindow, typing.Optional[frozenset[str]]], ReadPlan]
+"""Resolves the read plan for a window, narrowed to the given top-level columns (``None`` for all of them)."""
+
+PlanDecoder = typing.Callable[
+    [ReadPlan, typing.Optional[frozenset[str]], typing.Optional["pyarrow.compute.Expression"]],
+    collections.abc.Iterator["pyarrow.RecordBatch"],
+]
+"""Decodes a non-empty plan, projected to the given top-level columns (``None`` for the plan's whole
+projection) and filtered by a ``where`` expression."""
+
+
+class _Scannable(abc.ABC):
+    """The scan methods :py:class:`TopicDataset` and :py:class:`TopicFragment` share, built on ``to_batches``."""
+
+    @property
+    @abc.abstractmethod
+    def schema(self) -> pyarrow.Schema:
+        """The Arrow schema scanned batches conform to."""
+
+    @abc.abstractmethod
+    def to_batches(
+        self,
+        columns: typing.Optional[collections.abc.Sequence[str]] = None,
+        filter: typing.Optional[pyarrow.compute.Expression] = None,
+        **kwargs: typing.Any,
+    ) -> collections.abc.Iterator[pyarrow.RecordBatch]:
+        """Yield the rows ``filter`` keeps, projected to ``columns``."""
+
+    def __arrow_c_stream__(self, requested_schema: typing.Optional[object] = None) -> object:
+        """Export every row as an Arrow C stream, for engines that consume the stream protocol."""
+        return self.to_reader().__arrow_c_stream__(requested_schema)
+
+    def count_rows(self, filter: typing.Optional[pyarrow.compute.Expression] = None, **kwargs: typing.Any) -> int:
+        """Count the rows ``filter`` keeps. Decodes the data: plans carry no row counts."""
+        timestamp_name = self.schema.field(timestamp_column_index(self.schema)).name
+        return sum(batch.num_rows for batch in self.to_batches(columns=[timestamp_name], filter=filter))
+
+    def head(
+        self,
+        num_rows: int,
+        columns: typing.Optional[collections.abc.Sequence[str]] = None,
+        filter: typing.Optional[pyarrow.compute.Expression] = None,
+        **kwargs: typing.Any,
+    ) -> pyarrow.Table:
+        """Return the first ``num_rows`` rows, decoding no further than needed to produce them."""
+        pa = import_optional_dependency("pyarrow", "analytics")
+
+        batches: list[pyarrow.RecordBatch] = []
+        remaining = num_rows
+        scan = self.to_batches(columns=columns, filter=filter)
+        try:
+            if remaining > 0:
+                for batch in scan:
+                    batches.append(batch.slice(0, remaining))
+                    remaining -= batch.num_rows
+                    if remaining <= 0:
+                        # Stop before the scan decodes another batch.
+                        break
+        finally:
+            if isinstance(scan, collections.abc.Generator):
+                scan.close()
+        return pa.Table.from_batches(batches, schema=_output_schema(self.schema, columns))
+
+    def scanner(
+        self,
+        columns: typing.Optional[collections.abc.Sequence[str]] = None,
+        filter: typing.Optional[pyarrow.compute.Expression] = None,
+        **kwargs: typing.Any,
+    ) -> pyarrow.dataset.Scanner:
+        """Return a one-shot :py:class:`pyarrow.dataset.Scanner` of the rows ``filter`` keeps, projected to ``columns``.
+
+        The projection and filter are pushed into the read; the scanner hands the
+        result to any consumer of Arrow scanners, such as DuckDB.
+        """
+        ds = import_optional_dependency("pyarrow.dataset", "analytics")
+
+        return ds.Scanner.from_batches(self.to_reader(columns=columns, filter=filter))
+
+    def to_reader(
+        self,
+        columns: typing.Optional[collections.abc.Sequence[str]] = None,
+        filter: typing.Optional[pyarrow.compute.Expression] = None,
+    ) -> pyarrow.RecordBatchReader:
+        """Return a :py:class:`pyarrow.RecordBatchReader` of the rows ``filter`` keeps, projected to ``columns``."""
+        pa = import_optional_dependency("pyarrow", "analytics")
+
+        return pa.RecordBatchReader.from_batches(
+            _output_schema(self.schema, columns), self.to_batches(columns=columns, filter=filter)
+        )
+
+    def to_table(
+        self,
+        columns: typing.Optional[collections.abc.Sequence[str]] = None,
+        filter: typing.Optional[pyarrow.compute.Expression] = None,
+        **kwargs: typing.Any,
+    ) -> pyarrow.Table:
+        """Read the rows ``filter`` keeps, projected to ``columns``, into a table."""
+        pa = import_optional_dependency("pyarrow", "analytics")
+
+        return pa.Table.from_batches(
+            list(self.to_batches(columns=columns, filter=filter)), schema=_output_schema(self.schema, columns)
+        )
+
+
+class TopicDataset(_Scannable):
+    """A topic's data within a time window, scannable like a :py:class:`pyarrow.dataset.Dataset`.
+
+    Obtained from :py:meth:`~roboto.experimental.topics.Topic.get_data_as_dataset`.
+    Every scan resolves its own read plan, narrowed to the columns and time range it
+    needs; see the module documentation for what is pushed down. Keyword arguments
+    that pyarrow's scan methods accept but that do not apply here (e.g.
+    ``batch_size``) are accepted and ignored.
+
+    The schema holds one column per top-level field and the timestamp column
+    (locate it with :py:func:`~roboto.experimental.topics.timestamp_column_index`),
+    which filters reference like any other column, e.g.
+    ``pc.field("_index") >= t0``. Unless given, the schema is discovered from the
+    first decoded batch, as pyarrow discovers a dataset's schema from its first
+    fragment; every scanned batch is conformed to it, with columns a partition
+    lacks filled with nulls.
+    """
+
+    def __init__(
+        self,
+        resolve_plan: PlanResolver,
+        decode_plan: PlanDecoder,
+        window: TimeWindow,
+        schema: typing.Optional[pyarrow.Schema] = None,
+    ):
+        """
+        Args:
+            resolve_plan: Resolves the plan for a window, narrowed to some top-level columns.
+            decode_plan: Decodes a plan's rows.
+            window: The time window the dataset covers.
+            schema: The dataset's schema; ``None`` discovers it from the data.
+        """
+        self.__resolve_plan = resolve_plan
+        self.__decode_plan = decode_plan
+        self.__window = window
+        self.__schema = schema
+
+    @property
+    def schema(self) -> pyarrow.Schema:
+        """The dataset's Arrow schema, discovered from the first decoded batch unless it was given."""
+        if self.__schema is None:
+            self.__schema = self.__discover_schema()
+        return self.__schema
+
+    @property
+    def window(self) -> TimeWindow:
+        """The time window the dataset covers."""
+        return self.__window
+
+    def get_fragments(
+        self, filter: typing.Optional[pyarrow.compute.Expression] = None
+    ) -> collections.abc.Iterator[TopicFragment]:
+        """Yield a fragment per read-plan partition, skipping those whose extent ``filter`` rules out."""
+        schema = self.schema
+        window = _narrow_window(self.__window, schema, filter)
+        if window is None:
+            return
+        plan = self.__resolve_plan(window, None)
+        for partition in _partitions_matching(plan, schema, filter):
+            yield TopicFragment(partition, plan, schema, self.__decode_plan)
+
+    def to_batches(
+        self,
+        columns: typing.Optional[collections.abc.Sequence[str]] = None,
+        filter: typing.Optional[pyarrow.compute.Expression] = None,
+        **kwargs: typing.Any,
+    ) -> collections.abc.Generator[pyarrow.RecordBatch, None, None]:
+        """Yield the rows ``filter`` keeps, projected to ``columns``, in read-plan partition order."""
+        schema = self.schema
+        needed = _needed_columns(schema, columns, filter)
+        window = _narrow_window(self.__window, schema, filter)
+        if window is None:
+            return
+        plan = self.__resolve_plan(window, needed)
+        yield from _scan(plan, _partitions_matching(plan, schema, filter), schema, self.__decode_plan, columns, filter)
+
+    def __discover_schema(self) -> pyarrow.Schema:
+        """The schema of the first batch the window decodes to, decoding one partition at a time."""
+        pa = import_optional_dependency("pyarrow", "analytics")
+
+        plan = self.__resolve_plan(self.__window, None)
+        for partition in plan.partitions:
+            batches = self.__decode_plan(plan.model_copy(update={"partitions": (partition,)}), None, None)
+            try:
+                batch = next(batches, None)
+            finally:
+                if isinstance(batches, collections.abc.Generator):
+                    batches.close()
+            if batch is not None:
+                return batch.schema
+        return pa.schema([timestamp_field()])
+
+
+class TopicFragment(_Scannable):
+    """One read-plan partition of a :py:class:`TopicDataset`, scannable like a :py:class:`pyarrow.dataset.Fragment`.
+
+    A fragment's files are fixed by the plan it came from, so a column selection
+    narrows what is decoded from them (each scan task decodes only its share of the
+    selected fields, and scan tasks holding none of them are skipped) rather than
+    which files the plan names.
+    """
+
+    def __init__(
+        self,
+        partition: ReadPlanPartition,
+        plan: ReadPlan,
+        schema: pyarrow.Schema,
+        decode_plan: PlanDecoder,
+    ):
+        self.__partition = partition
+        self.__plan = plan.model_copy(update={"partitions": (partition,)})
+        self.__schema = schema
+        self.__decode_plan = decode_plan
+
+    @property
+    def partition(self) -> ReadPlanPartition:
+        """The read-plan partition this fragment reads."""
+        return self.__partition
+
+    @property
+    def partition_expression(self) -> pyarrow.compute.Expression:
+        """What every row of the fragment satisfies: a timestamp within the partition's extent."""
+        return _extent_expression(self.__schema, self.__partition.extent.min, self.__partition.extent.max)
+
+    @property
+    def schema(self) -> pyarrow.Schema:
+        """The schema of the dataset the fragment belongs to."""
+        return self.__schema
+
+    def to_batches(
+        self,
+        columns: typing.Optional[collections.abc.Sequence[str]] = None,
+        filter: typing.Optional[pyarrow.compute.Expression] = None,
+        **kwargs: typing.Any,
+    ) -> collections.abc.Generator[pyarrow.RecordBatch, None, None]:
+        """Yield the partition's rows ``filter`` keeps, projected to ``columns``."""
+        partitions = _partitions_matching(self.__plan, self.__schema, filter)
+        yield from _scan(self.__plan, partitions, self.__schema, self.__decode_plan, columns, filter)
+
+
+def _conform(batch: pyarrow.RecordBatch, schema: pyarrow.Schema) -> pyarrow.RecordBatch:
+    """Select and cast ``batch``'s columns to ``schema``, filling a missing column with nulls."""
+    pa = import_optional_dependency("pyarrow", "analytics")
+
+    if batch.schema.equals(schema):
+        return batch
+    arrays = []
+    for field in schema:
+        index = batch.schema.get_field_index(field.name)
+        if index < 0:
+            arrays.append(pa.nulls(batch.num_rows, field.type))
+            continue
+        column = batch.column(index)
+        arrays.append(column if column.type.equals(field.type) else column.cast(field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _extent_expression(schema: pyarrow.Schema, start: int, end: int) -> pyarrow.compute.Expression:
+    """The expression ``start <= timestamp <= end`` over the schema's timestamp column."""
+    pc = import_optional_dependency("pyarrow.compute", "analytics")
+
+    timestamp = pc.field(schema.field(timestamp_column_index(schema)).name)
+    return (timestamp >= start) & (timestamp <= end)
+
+
+def _may_match_each(
+    schema: pyarrow.Schema, filter: pyarrow.compute.Expression, extents: collections.abc.Sequence[tuple[int, int]]
+) -> list[bool]:
+    """Whether ``filter`` can hold for a row whose timestamp is in each ``[start, end]`` of ``extents``.
+
+    Arrow's expression simplifier decides: a fragment per extent, whose partition
+    expression bounds the timestamp, stands in for the rows, and one dataset of them
+    keeps the fragments the filter may still be true for. Each fragment's path is
+    its extent's index; no fragment is ever read.
+    """
+    ds = import_optional_dependency("pyarrow.dataset", "analytics")
+    fs = import_optional_dependency("pyarrow.fs", "analytics")
+
+    dataset = ds.FileSystemDataset.from_paths(
+        [str(index) for index in range(len(extents))],
+        schema=schema,
+        format=ds.ParquetFileFormat(),
+        filesystem=fs.LocalFileSystem(),
+        partitions=[_extent_expression(schema, start, end) for start, end in extents],
+    )
+    matches = [False] * len(extents)
+    for fragment in dataset.get_fragments(filter=filter):
+        matches[int(fragment.path)] = True
+    return matches
+
+
+def _narrow_window(
+    window: TimeWindow, schema: pyarrow.Schema, filter: typing.Optional[pyarrow.compute.Expression]
+) -> typing.Optional[TimeWindow]:
+    """Shrink ``window`` to the timestamps ``filter`` can hold for, or ``None`` when it rules out all of them.
+
+    Each bound is found by bisection over :py:func:`_may_match_each`, so any filter
+    the simplifier can bound (comparisons, ranges, and their conjunctions) narrows
+    the window, whatever else it tests. A disjunction narrows to its hull. The two
+    bisections advance together, probing both bounds' candidates in one dataset.
+    """
+    if filter is None or schema.field(timestamp_column_index(schema)).name not in _referenced_fields(filter, schema):
+        return window
+    if not _may_match_each(schema, filter, [(window.start, window.end)])[0]:
+        return None
+
+    # The largest start such that [window.start, start - 1] holds no match lies in
+    # [start_low, start_high]; the smallest end such that [end + 1, window.end]
+    # holds none lies in [end_low, end_high].
+    start_low, start_high = window.start, window.end
+    end_low, end_high = window.start, window.end
+    while start_low < start_high or end_low < end_high:
+        start_middle = (start_low + start_high + 1) // 2
+        end_middle = (end_low + end_high) // 2
+        probes = []
+        if start_low < start_high:
+            probes.append((window.start, start_middle - 1))
+        if end_low < end_high:
+            probes.append((end_middle + 1, window.end))
+        matches = iter(_may_match_each(schema, filter, probes))
+        if start_low < start_high:
+            if next(matches):
+                start_high = start_middle - 1
+            else:
+                start_low = start_middle
+        if end_low < end_high:
+            if next(matches):
+                end_low = end_middle + 1
+            else:
+                end_high = end_middle
+    return TimeWindow(start=start_low, end=end_low)
+
+
+def _needed_columns(
+    schema: pyarrow.Schema,
+    columns: typing.Optional[collections.abc.Sequence[str]],
+    filter: typing.Optional[pyarrow.compute.Expression],
+) -> typing.Optional[frozenset[str]]:
+    """The top-level fields a scan must decode: those selected and those ``filter`` references.
+
+    ``None`` when every field is selected, or when only the timestamp column is:
+    a read must project at least one field.
+    """
+    if columns is None:
+        return None
+    timestamp_name = schema.field(timestamp_column_index(schema)).name
+    needed = {name for name in columns if name != timestamp_name}
+    if filter is not None:
+        needed.update(name for name in _referenced_fields(filter, schema) if name != timestamp_name)
+    return frozenset(needed) if needed else None
+
+
+def _output_schema(schema: pyarrow.Schema, columns: typing.Optional[collections.abc.Sequence[str]]) -> pyarrow.Schema:
+    """Project the dataset schema to ``columns``, in their order.
+
+    Raises:
+        pyarrow.ArrowInvalid: A column is not in the schema.
+    """
+    pa = import_optional_dependency("pyarrow", "analytics")
+
+    if columns is None:
+        return schema
+    fields = []
+    for name in columns:
+        index = schema.get_field_index(name)
+        if index < 0:
+            raise pa.ArrowInvalid(f"No column {name!r} in the topic dataset; columns are {schema.names}")
+        fields.append(schema.field(index))
+    return pa.schema(fields, metadata=schema.metadata)
+
+
+def _partitions_matching(
+    plan: ReadPlan, schema: pyarrow.Schema, filter: typing.Optional[pyarrow.compute.Expression]
+) -> tuple[ReadPlanPartition, ...]:
+    """The plan's partitions whose extent ``filter`` does not rule out."""
+    if not plan.partitions or filter is None:
+        return plan.partitions
+    if schema.field(timestamp_column_index(schema)).name not in _referenced_fields(filter, schema):
+        return plan.partitions
+    matches = _may_match_each(
+        schema, filter, [(partition.extent.min, partition.extent.max) for partition in plan.partitions]
+    )
+    return tuple(partition for partition, match in zip(plan.partitions, matches) if match)
+
+
+def _referenced_fields(filter: pyarrow.compute.Expression, schema: pyarrow.Schema) -> frozenset[str]:
+    """The top-level fields of ``schema`` that ``filter`` references.
+
+    Expressions are opaque to Python, so each field is tested by binding the filter
+    to the schema without it: binding fails exactly when the filter refers to the
+    field, by name or through a nested reference. A filter that does not bind to the
+    full schema either is taken to reference every field.
+    """
+    pa = import_optional_dependency("pyarrow", "analytics")
+    ds = import_optional_dependency("pyarrow.dataset", "analytics")
+
+    def binds(fields: list[pyarrow.Field]) -> bool:
+        try:
+            ds.InMemoryDataset(pa.schema(fields).empty_table()).scanner(filter=filter)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+            return False
+        return True
+
+    fields = list(schema)
+    if not binds(fields):
+        return frozenset(schema.names)
+    return frozenset(
+        field.name for index, field in enumerate(fields) if not binds(fields[:index] + fields[index + 1 :])
+    )
+
+
+def _scan(
+    plan: ReadPlan,
+    partitions: tuple[ReadPlanPartition, ...],
+    schema: pyarrow.Schema,
+    decode_plan: PlanDecoder,
+    columns: typing.Optional[collections.abc.Sequence[str]],
+    filter: typing.Optional[pyarrow.compute.Expression],
+) -> collections.abc.Generator[pyarrow.RecordBatch, None, None]:
+    """Decode ``partitions`` of ``plan``, filter the rows, and conform them to the projected dataset schema."""
+    output_schema = _output_schema(schema, columns)
+    if not partitions:
+        return
+
+    timestamp_name = schema.field(timestamp_column_index(schema)).name
+    # Pushed-down filters see stored timestamps under a decoder-chosen name, so a
+    # filter on the timestamp column is applied once the rows carry absolute time.
+    time_filter = filter if filter is not None and timestamp_name in _referenced_fields(filter, schema) else None
+    batches = decode_plan(
+        plan.model_copy(update={"partitions": partitions}),
+        _needed_columns(schema, columns, filter),
+        None if time_filter is not None else filter,
+    )
+    try:
+        for batch in batches:
+            timestamp_index = timestamp_column_index(batch.schema)
+            if batch.schema.field(timestamp_index).name != timestamp_name:
+                names = list(batch.schema.names)
+                names[timestamp_index] = timestamp_name
+                batch = batch.rename_columns(names)
+            if time_filter is not None:
+                batch = batch.filter(time_filter)
+            if batch.num_rows:
+                yield _conform(batch, output_schema)
+    finally:
+        if isinstance(batches, collections.abc.Generator):
+            batches.close()
@@ -6,7 +6,9 @@
 
 from __future__ import annotations
 
+import collections
 import collections.abc
+import queue
 import typing
 
 import mcap.reader
@@ -14,8 +16,7 @@ import mcap.reader
 from ....compat import import_optional_dependency
 from ....domain.topics.record import FieldPath
 from ....exceptions import RobotoInternalException
-from ....formats.mcap import open_for_window
-from ....storage import as_io_bytes
+from ....storage import HttpRangeReader, as_io_bytes
 from ....time import TimeUnit
 from ..batch_transforms import TIMESTAMP_FIELD_NAME, timestamp_field
 from ..read_plan import (
@@ -23,10 +24,12 @@ from ..read_plan import (
     ReadPlanTimestamp,
     TimeWindow,
 )
+from ..scheduler import ScheduledTask, shared_read_scheduler
 from .common import ScanTaskDecodeParams, leaf_most
 
 if typing.TYPE_CHECKING:
     import pyarrow  # pants: no-infer-dep
+    import pyarrow.compute  # pants: no-infer-dep
 
 _SUPPORTED_SCHEMA_ENCODINGS = frozenset({"ros1msg", "ros2msg", "ros2idl", "omgidl", "jsonschema", "json"})
 """Schema encodings our ``mcap_codec`` batch decoder handles.
@@ -37,6 +40,21 @@ msgpack channels carry a ``jsonschema`` schema, so they need no separate entry -
 dispatches on the channel's message encoding, which this path already passes through.
 """
 
+_MAX_CHUNKS_AHEAD = 4
+"""Most chunks of one file queued or running on the read scheduler at once.
+
+Each chunk task fetches its chunk's byte range and then runs it through the Rust
+decoder, which releases the GIL, so one chunk's network wait overlaps another's
+decode. Kept small so one file does not crowd other scan tasks out of the shared
+scheduler."""
+
+_MAX_IN_FLIGHT_CHUNK_BYTES = 64 * 1024 * 1024
+"""Bound on the compressed chunk bytes fetched ahead of the consumer for one file.
+
+A chunk is scheduled only while the chunks in flight (fetching, decoding, or decoded
+but not yet yielded) total less than this, so a file's memory footprint stays bounded
+however large its time window. One chunk is always allowed, even when larger."""
+
 
 def decode_mcap_batches(
     scan_task: ReadPlanScanTask,
@@ -44,13 +62,15 @@ def decode_mcap_batches(
     window: TimeWindow,
     projection_paths: collections.abc.Sequence[FieldPath],
     params: ScanTaskDecodeParams,
+    predicate: typing.Optional["pyarrow.compute.Expression"] = None,
 ) -> collections.abc.Generator["pyarrow.RecordBatch", None, None]:
     """Decode one MCAP scan task into native-order RecordBatches, filtered and projected.
 
     Every chunk's bytes go straight to the Rust ``mcap_codec`` batch decoder, which
     parses and decompresses the chunk, decodes each supported encoding's payloads into
     Arrow columns, and window-filters and timestamps rows in Rust — one RecordBatch per
-    chunk.
+    chunk. Each chunk's batch is then filtered to ``predicate``, when given, on the
+    worker that decoded it.
 
     A chunked, single-schema file whose schema encoding the codec handles
     (:py:data:`_SUPPORTED_SCHEMA_ENCODINGS` — the ROS/CDR family plus JSON and msgpack,
@@ -60,25 +80,20 @@ def decode_mcap_batches(
 
     Batches come out in the file's persisted (native chunk) order, which the partition
     overlay and cross-partition concatenation rely on (see
-    :py:meth:`DecodedScanTask.batches`).
+    :py:meth:`DecodedScanTask.batches`). Chunks are fetched and decoded a few at a time
+    ahead of the consumer (see :py:func:`_decode_mcap_chunks`) rather than the whole
+    window being fetched before the first decode.
 
     Raises:
         RobotoInternalException: The file is not a chunked, single-schema MCAP whose
             schema encoding this read path supports (e.g. an unchunked file or a
             ``protobuf`` channel).
     """
-    start = window.start
-    end = window.end
-
-    signed_url = params.signed_url_resolver(scan_task.object.fs_node_id)
-    if timestamp.kind == "message_log_time":
-        # The chunk index is keyed by log time, so the window bounds the fetch directly.
-        # The mcap end bound is exclusive; the window is inclusive.
-        http_reader = open_for_window(signed_url, start_time=start, end_time=end + 1)
-    else:
-        # A non-log-time timestamp cannot be window-filtered by log time; fetch
-        # everything and let the codec filter per row.
-        http_reader = open_for_window(signed_url)
+    fs_node_id = scan_task.object.fs_node_id
+    signed_url = params.signed_url_resolver(fs_node_id)
+    # Opened without a window prefetch: only the summary is read up front, and
+    # _decode_mcap_chunks fetches each in-window chunk as it schedules its decode.
+    http_reader = HttpRangeReader(signed_url, cache_id=fs_node_id, size=scan_task.object.size_bytes)
 
     try:
         summary = mcap.reader.SeekingReader(as_io_bytes(http_reader)).get_summary()
@@ -90,7 +105,7 @@ def decode_mcap_batches(
                 f"encoding this read path handles (got schema encoding {encoding!r} with "
                 f"{chunk_count} chunk indexes)."
             )
-        yield from _decode_mcap_chunks(http_reader, summary, timestamp, window, projection_paths)
+        yield from _decode_mcap_chunks(http_reader, summary, timestamp, window, projection_paths, predicate)
     finally:
         http_reader.close()
 
@@ -114,15 +129,23 @@ def _decode_mcap_chunks(
     timestamp: ReadPlanTimestamp,
     window: TimeWindow,
     projection_paths: collections.abc.Sequence[FieldPath],
+    predicate: typing.Optional["pyarrow.compute.Expression"] = None,
 ) -> collections.abc.Generator["pyarrow.RecordBatch", None, None]:
     """Decode chunks through the Rust ``mcap_codec`` batch decoder.
 
-    Each in-window chunk's raw bytes (read from the prefetch buffer) go to
-    :py:class:`mcap_codec.McapBatchDecoder`, which parses and decompresses the chunk,
-    decodes each supported encoding's payloads into Arrow columns, reads each row's
-    timestamp, and window-filters and drops undecodable rows — one RecordBatch per
-    chunk, which bounds memory to a chunk's rows. The timestamp column is re-tagged
-    with the stored-time metadata the overlay keys on.
+    Each in-window chunk's raw bytes go to :py:class:`mcap_codec.McapBatchDecoder`,
+    which parses and decompresses the chunk, decodes each supported encoding's payloads
+    into Arrow columns, reads each row's timestamp, and window-filters and drops
+    undecodable rows — one RecordBatch per chunk — which is then filtered to
+    ``predicate`` when given. The timestamp column is re-tagged with the stored-time
+    metadata the overlay keys on.
+
+    Chunks are pipelined: up to :py:data:`_MAX_CHUNKS_AHEAD` at a time are fetched
+    (a parallel range request over the chunk's span) and decoded on the shared
+    :py:class:`~roboto.experimental.topics.scheduler.ReadScheduler`, bounded by
+    :py:data:`_MAX_IN_FLIGHT_CHUNK_BYTES`, and their batches are yielded in chunk
+    order. A chunk's bytes are dropped from the reader's cache once handed to the
+    decoder, so memory tracks the in-flight chunks, not the whole window.
     """
     pa = import_optional_dependency("pyarrow", "analytics")
     # Imported lazily so the Rust extension loads only when a supported channel is read.
@@ -149,8 +172,8 @@ def _decode_mcap_chunks(
         ts_field_path = list(timestamp.field.path) if timestamp.field is not None else None
         ts_unit = timestamp.unit or TimeUnit.Nanoseconds.value
 
-    try:
-        decoder = McapBatchDecoder(
+    def _new_decoder() -> McapBatchDecoder:
+        return McapBatchDecoder(
             schema.encoding,
             message_encoding,
             schema.data,
@@ -164,6 +187,9 @@ def _decode_mcap_chunks(
             ts_field_path,
             ts_unit,
         )
+
+    try:
+        decoder = _new_decoder()
     except Exception:
         # The codec builds its Arrow layout from the schema and rejects a projection or
         # timestamp path the schema does not declare with a bare ValueError. Surface a
@@ -181,14 +207,73 @@ def _decode_mcap_chunks(
     ts_arrow_field = timestamp_field(ts_name)
     log_time_window = timestamp.kind == "message_log_time"
 
-    for chunk_index in sorted(summary.chunk_indexes, key=lambda ci: ci.chunk_start_offset):
-        if log_time_window and (chunk_index.message_end_time < raw_start or chunk_index.message_start_time > raw_end):
-            continue
-        http_reader.seek(chunk_index.chunk_start_offset)
-        chunk_bytes = http_reader.read(chunk_index.chunk_length)
-        batch = decoder.decode_chunks([chunk_bytes], raw_start, raw_end)
-        if batch.num_rows == 0:
-            continue
-        # Re-tag column 0 (the int64 timestamp) with the stored-time metadata marker.
-        marked_schema = batch.schema.set(0, ts_arrow_field)
-        yield pa.RecordBatch.from_arrays(batch.columns, schema=marked_schema)
+    # The chunk index is keyed by log time, so a log-time window selects chunks
+    # directly; any other timestamp is filtered per row by the codec, over every chunk.
+    chunk_indexes = [
+        chunk_index
+        for chunk_index in sorted(summary.chunk_indexes, key=lambda ci: ci.chunk_start_offset)
+        if not log_time_window
+        or (chunk_index.message_end_time >= raw_start and chunk_index.message_start_time <= raw_end)
+    ]
+    if not chunk_indexes:
+        return
+
+    # A decoder holds mutable decode state and cannot be shared by concurrent calls,
+    # so each worker checks one out of this pool, building another when none is idle.
+    idle_decoders: queue.SimpleQueue[McapBatchDecoder] = queue.SimpleQueue()
+    idle_decoders.put(decoder)
+
+    def _decode_chunk(chunk_index: typing.Any) -> "pyarrow.RecordBatch":
+        chunk_start = chunk_index.chunk_start_offset
+        chunk_end = chunk_start + chunk_index.chunk_length - 1
+        http_reader.prefetch_range(chunk_start, chunk_end)
+        chunk_bytes = bytes(http_reader.view(chunk_start, chunk_index.chunk_length))
+        http_reader.discard(chunk_start, chunk_end)
+        try:
+            chunk_decoder = idle_decoders.get_nowait()
+        except queue.Empty:
+            chunk_decoder = _new_decoder()
+        try:
+            batch = chunk_decoder.decode_chunks([chunk_bytes], raw_start, raw_end)
+        finally:
+            idle_decoders.put(chunk_decoder)
+        # Filter here, on the worker, so only matching rows are held in flight.
+        return batch.filter(predicate) if predicate is not None and batch.num_rows else batch
+
+    # Same sliding window as the plan executor's partition pipeline: submit on the
+    # right while the count and byte bounds allow, wait on the oldest on the left,
+    # yield it. Waiting in submission order keeps the native chunk order. Chunk
+    # tasks inherit the priority of the partition being decoded.
+    scheduler = shared_read_scheduler()
+    remaining = iter(chunk_indexes)
+    pending = next(remaining, None)
+    in_flight: collections.deque[tuple[int, ScheduledTask["pyarrow.RecordBatch"]]] = collections.deque()
+    in_flight_bytes = 0
+    try:
+        while pending is not None or in_flight:
+            while pending is not None and (
+                not in_flight
+                or (
+                    len(in_flight) < _MAX_CHUNKS_AHEAD
+                    and in_flight_bytes + pending.chunk_length <= _MAX_IN_FLIGHT_CHUNK_BYTES
+                )
+            ):
+                in_flight.append((pending.chunk_length, scheduler.submit(_decode_chunk, pending)))
+                in_flight_bytes += pending.chunk_length
+                pending = next(remaining, None)
+
+            chunk_length, task = in_flight.popleft()
+            # Exceptions propagate: a failed chunk fetch or decode fails the scan task.
+            batch = task.result()
+            in_flight_bytes -= chunk_length
+            if batch.num_rows == 0:
+                continue
+            # Re-tag column 0 (the int64 timestamp) with the stored-time metadata marker.
+            marked_schema = batch.schema.set(0, ts_arrow_field)
+            yield pa.RecordBatch.from_arrays(batch.columns, schema=marked_schema)
+    finally:
+        # On an early close or a failure, drop the chunks not yet started and wait
+        # out the running ones before the caller closes the reader under them.
+        for _, task in in_flight:
+            if not task.cancel():
+                task.wait()
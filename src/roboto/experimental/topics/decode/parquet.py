@@ -19,9 +19,12 @@ from ....formats.parquet import (
     compute_time_filter_mask,
     extract_timestamp_field,
     extract_timestamps,
+    filter_rows,
     narrow_list_nested_fields,
     open_parquet_file,
+    read_row_groups,
     resolve_columns,
+    row_groups_matching,
     should_narrow_list_nested_fields,
     should_read_row_group,
 )
@@ -31,10 +34,12 @@ from ..read_plan import (
     ReadPlanTimestamp,
     TimeWindow,
 )
+from ..scheduler import shared_read_scheduler
 from .common import ScanTaskDecodeParams, disambiguated_timestamp_name, leaf_most
 
 if typing.TYPE_CHECKING:
     import pyarrow  # pants: no-infer-dep
+    import pyarrow.compute  # pants: no-infer-dep
     import pyarrow.parquet  # pants: no-infer-dep
 
 CACHED_PARQUET_NAME_PATTERN = "{fs_node_id}.parquet"
@@ -83,13 +88,16 @@ def parquet_filtered_row_groups(
     window: TimeWindow,
     projection_paths: collections.abc.Sequence[FieldPath],
     params: ScanTaskDecodeParams,
+    predicate: typing.Optional["pyarrow.compute.Expression"] = None,
 ) -> collections.abc.Generator[tuple["pyarrow.Table", "pyarrow.Int64Array"], None, None]:
     """Yield each surviving row group as ``(projected_table, stored_timestamps)``.
 
     The table holds the projected columns only (the timestamp column is read
     for filtering and dropped when the projection omits it); rows are filtered
-    to ``window`` (inclusive on both ends), and ``stored_timestamps`` is
-    the aligned int64 nanosecond column.
+    to ``window`` (inclusive on both ends) and to ``predicate`` when given, and
+    ``stored_timestamps`` is the aligned int64 nanosecond column. Row groups
+    whose statistics rule out the window or the predicate are never read; the
+    rest are pre-buffered and decoded concurrently, and yielded in file order.
     """
     pc = import_optional_dependency("pyarrow.compute", "analytics")
 
@@ -122,6 +130,7 @@ def parquet_filtered_row_groups(
         policy=params.cache_policy,
         estimated_column_count=estimated_column_count,
         size_bytes=scan_task.object.size_bytes,
+        source_id=fs_node_id,
     )
 
     # schema_arrow and metadata are pyarrow properties that rebuild a wrapper on each access;
@@ -146,13 +155,25 @@ def parquet_filtered_row_groups(
     unit_hint = timestamp.unit if timestamp.unit is not None else "ns"
     timestamp_arrow_field = extract_timestamp_field(arrow_schema, timestamp_selection, unit_hint=unit_hint)
 
+    # Surviving row groups are selected up front so read_row_groups can pre-buffer and decode them concurrently,
+    # on the shared scheduler at the priority of the partition being decoded.
     file_metadata = parquet_file.metadata
+    matching = row_groups_matching(file_metadata, arrow_schema, predicate) if predicate is not None else None
+    selected: list[tuple[int, "pyarrow.parquet.RowGroupMetaData"]] = []
     for row_group_index in range(file_metadata.num_row_groups):
-        row_group_metadata = file_metadata.row_group(row_group_index)
-        if not should_read_row_group(row_group_metadata, timestamp_arrow_field, start, end):
+        if matching is not None and not matching[row_group_index]:
             continue
-
-        row_group_table = parquet_file.read_row_group(row_group_index, columns=columns)
+        row_group_metadata = file_metadata.row_group(row_group_index)
+        if should_read_row_group(row_group_metadata, timestamp_arrow_field, start, end):
+            selected.append((row_group_index, row_group_metadata))
+
+    row_group_tables = read_row_groups(
+        parquet_file,
+        [row_group_index for row_group_index, _ in selected],
+        columns,
+        scheduler=shared_read_scheduler(),
+    )
+    for (_, row_group_metadata), row_group_table in zip(selected, row_group_tables):
         if needs_list_narrowing:
             row_group_table = narrow_list_nested_fields(row_group_table, arrow_schema, field_selections)
 
@@ -174,6 +195,11 @@ def parquet_filtered_row_groups(
                 row_group_table = pc.filter(row_group_table, filter_mask)
                 timestamps = pc.filter(timestamps, filter_mask)
 
+        if predicate is not None:
+            row_group_table, kept_timestamps = filter_rows(row_group_table, timestamps, predicate)
+            # Filtering keeps the array's type.
+            timestamps = typing.cast("pyarrow.Int64Array", kept_timestamps)
+
         yield row_group_table, timestamps
 
 
@@ -183,17 +209,18 @@ def decode_parquet_batches(
     window: TimeWindow,
     projection_paths: collections.abc.Sequence[FieldPath],
     params: ScanTaskDecodeParams,
+    predicate: typing.Optional["pyarrow.compute.Expression"] = None,
 ) -> collections.abc.Generator["pyarrow.RecordBatch", None, None]:
     """Wrap each surviving Parquet row group into a RecordBatch, prefixed with the stored-time column.
 
-    Empty row groups are skipped. The timestamp column name is suffixed until it
+    Row groups left empty by the window or ``predicate`` are skipped. The timestamp column name is suffixed until it
     stops colliding with a projected column, the same disambiguation the MCAP path
     applies.
     """
     pa = import_optional_dependency("pyarrow", "analytics")
 
     for row_group_table, timestamps in parquet_filtered_row_groups(
-        scan_task, timestamp, window, projection_paths, params
+        scan_task, timestamp, window, projection_paths, params, predicate
     ):
         if row_group_table.num_rows == 0:
             continue
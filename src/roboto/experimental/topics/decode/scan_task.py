@@ -20,12 +20,16 @@ from .common import DecodedScanTask, ScanTaskDecodeParams
 from .mcap import decode_mcap_batches
 from .parquet import decode_parquet_batches
 
+if typing.TYPE_CHECKING:
+    import pyarrow.compute  # pants: no-infer-dep
+
 ScanTaskDecoder = typing.Callable[
     [
         ReadPlanScanTask,
         ReadPlanPartition,
         TimeWindow,
         collections.abc.Sequence[FieldPath],
+        typing.Optional["pyarrow.compute.Expression"],
     ],
     DecodedScanTask,
 ]
@@ -33,8 +37,9 @@ ScanTaskDecoder = typing.Callable[
 
 Called with the scan task, its partition (for the timestamp designation), the
 window translated into the partition's stored-time domain, the projection
-restricted to the scan task's subtree. Produced timestamps are in the
-stored-time domain; the executor applies the partition's ``time_offset_ns``.
+restricted to the scan task's subtree, and a row predicate over that projection
+(or ``None``). Produced timestamps are in the stored-time domain; the executor
+applies the partition's ``time_offset_ns``.
 """
 
 
@@ -48,7 +53,9 @@ def make_scan_task_decoder(
 
     Timestamps are keyed off the partition's timestamp designation and produced in the stored-time domain;
     the caller applies the partition's ``time_offset_ns``.
-    Rows are filtered to the decoder's ``window`` (inclusive on both ends) and projected to its ``projection_paths``.
+    Rows are filtered to the decoder's ``window`` (inclusive on both ends) and ``predicate``, and projected to its
+    ``projection_paths``. Parquet skips row groups whose statistics rule out the predicate; MCAP filters each chunk
+    as soon as it decodes.
 
     MCAP scan tasks decode through the Rust ``mcap_codec`` batch decoder, which reads each column's
     Arrow type from the file's own embedded schema -- no ingestion-declared schema tree is needed.
@@ -58,8 +65,9 @@ def make_scan_task_decoder(
         params: Execution inputs (URL resolution and cache policy).
 
     Returns:
-        A decoder that, given a scan task, its plan partition, an inclusive time window, and the projected
-        field paths the scan task covers, returns the decoded scan task; consume its batches once.
+        A decoder that, given a scan task, its plan partition, an inclusive time window, the projected
+        field paths the scan task covers, and an optional row predicate, returns the decoded scan task;
+        consume its batches once.
 
     Raises:
         The returned decoder raises:
@@ -73,18 +81,19 @@ def make_scan_task_decoder(
         partition: ReadPlanPartition,
         window: TimeWindow,
         projection_paths: collections.abc.Sequence[FieldPath],
+        predicate: typing.Optional[pyarrow.compute.Expression],
     ) -> DecodedScanTask:
         if scan_task.format == RepresentationStorageFormat.MCAP:
             return DecodedScanTask(
                 batches_factory=lambda: decode_mcap_batches(
-                    scan_task, partition.timestamp, window, projection_paths, params
+                    scan_task, partition.timestamp, window, projection_paths, params, predicate
                 ),
             )
 
         if scan_task.format == RepresentationStorageFormat.PARQUET:
             return DecodedScanTask(
                 batches_factory=lambda: decode_parquet_batches(
-                    scan_task, partition.timestamp, window, projection_paths, params
+                    scan_task, partition.timestamp, window, projection_paths, params, predicate
                 ),
             )
 
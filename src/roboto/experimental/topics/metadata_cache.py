@@ -0,0 +1,337 @@
+# Copyright (c) 2026 Roboto Technologies, Inc.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Process-wide caches of the metadata a topic read resolves before it touches data.
+
+Every :py:meth:`~roboto.experimental.topics.Topic.get_data_as_record_batches` call
+first posts a read-plan request and then fetches the plan's schema fields: two API
+round trips that dominate a small read, such as one step of an event scrubber or
+a video frame. Two caches remove them:
+
+* :py:class:`SchemaFieldCache` keeps schema field lists by organization and schema
+  checksum. A checksum is derived from a schema's content, so an entry never goes
+  stale and is kept until evicted by recency. Entries can also be persisted to
+  disk, so a new process starts warm.
+* :py:class:`ReadPlanMemo` reuses the plan resolved for an identical request (same
+  topic, window, fields, and selections) for a few seconds. The TTL bounds how
+  long a read can miss data ingested into its window after the plan was resolved.
+  Plans are kept per :py:class:`~roboto.http.RobotoClient`, since what a plan names
+  depends on the caller's access.
+
+Both are enabled by default; see :py:func:`configure_topic_metadata_cache`.
+"""
+
+from __future__ import annotations
+
+import collections
+import hashlib
+import json
+import os
+import pathlib
+import threading
+import time
+import typing
+import uuid
+import weakref
+
+from ...domain.topics import SchemaFieldRecord
+from ...logging import default_logger
+from .read_plan import ReadPlan
+
+if typing.TYPE_CHECKING:
+    from ...http import RobotoClient
+
+logger = default_logger()
+
+DEFAULT_SCHEMA_CACHE_MAX_ENTRIES = 256
+"""Default number of schemas whose fields are kept in memory; the least recently used are dropped beyond it."""
+
+DEFAULT_READ_PLAN_TTL_SECONDS = 10.0
+"""Default time, in seconds, a resolved read plan is reused for an identical request."""
+
+DEFAULT_READ_PLAN_MAX_ENTRIES = 1024
+"""Default number of read plans kept per client; the least recently used are dropped beyond it."""
+
+SCHEMA_CACHE_SUBDIR = "topic-schemas"
+"""Directory, under the SDK cache directory, that holds persisted schema fields by default."""
+
+
+class SchemaFieldCache:
+    """Schema field lists keyed by organization and schema checksum, in memory and optionally on disk.
+
+    Persisted entries are small JSON files, one per schema, written atomically and
+    never evicted: a schema's fields are a few kilobytes and never change. A
+    persisted entry that cannot be read is treated as a miss. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_SCHEMA_CACHE_MAX_ENTRIES,
+        cache_dir: typing.Union[str, pathlib.Path, None] = None,
+    ):
+        """
+        Args:
+            max_entries: Most schemas kept in memory.
+            cache_dir: Directory to persist schema fields in; ``None`` keeps them in memory only.
+
+        Raises:
+            ValueError: ``max_entries`` is less than 1.
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        self.__max_entries = max_entries
+        self.__cache_dir = pathlib.Path(cache_dir) if cache_dir is not None else None
+        self.__lock = threading.Lock()
+        self.__entries: collections.OrderedDict[tuple[str, str], tuple[SchemaFieldRecord, ...]] = (
+            collections.OrderedDict()
+        )
+
+    @property
+    def cache_dir(self) -> typing.Optional[pathlib.Path]:
+        """Directory schema fields are persisted in, or ``None`` when kept in memory only."""
+        return self.__cache_dir
+
+    @property
+    def max_entries(self) -> int:
+        """Most schemas kept in memory."""
+        return self.__max_entries
+
+    def clear(self) -> None:
+        """Forget every schema held in memory. Persisted entries are left on disk."""
+        with self.__lock:
+            self.__entries.clear()
+
+    def get(self, org_id: str, checksum: str) -> typing.Optional[tuple[SchemaFieldRecord, ...]]:
+        """The cached fields of the schema with ``checksum`` in ``org_id``, or ``None`` on a miss."""
+        key = (org_id, checksum)
+        with self.__lock:
+            fields = self.__entries.get(key)
+            if fields is not None:
+                self.__entries.move_to_end(key)
+                return fields
+
+        fields = self.__load(org_id, checksum)
+        if fields is not None:
+            self.__remember(key, fields)
+        return fields
+
+    def put(self, org_id: str, checksum: str, fields: typing.Iterable[SchemaFieldRecord]) -> None:
+        """Cache the fields of the schema with ``checksum`` in ``org_id``, persisting them when enabled."""
+        fields = tuple(fields)
+        self.__remember((org_id, checksum), fields)
+        self.__persist(org_id, checksum, fields)
+
+    def __load(self, org_id: str, checksum: str) -> typing.Optional[tuple[SchemaFieldRecord, ...]]:
+        path = self.__path(org_id, checksum)
+        if path is None:
+            return None
+        try:
+            with open(path, "r") as f:
+                return tuple(SchemaFieldRecord.model_validate(field) for field in json.load(f))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            logger.debug("Discarding unreadable persisted schema fields %s", path, exc_info=True)
+            return None
+
+    def __path(self, org_id: str, checksum: str) -> typing.Optional[pathlib.Path]:
+        if self.__cache_dir is None:
+            return None
+        # Hashed, so neither id needs to be a safe file name.
+        return self.__cache_dir / f"{hashlib.sha256(f'{org_id}/{checksum}'.encode()).hexdigest()}.json"
+
+    def __persist(self, org_id: str, checksum: str, fields: tuple[SchemaFieldRecord, ...]) -> None:
+        path = self.__path(org_id, checksum)
+        if path is None:
+            return
+        tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump([field.model_dump(mode="json") for field in fields], f)
+            os.replace(tmp_path, path)
+        except OSError:
+            logger.debug("Failed to persist schema fields to %s; skipping", path, exc_info=True)
+            tmp_path.unlink(missing_ok=True)
+
+    def __remember(self, key: tuple[str, str], fields: tuple[SchemaFieldRecord, ...]) -> None:
+        with self.__lock:
+            self.__entries[key] = fields
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max_entries:
+                self.__entries.popitem(last=False)
+
+
+class ReadPlanMemo:
+    """Reuses a resolved read plan for an identical request until a short TTL elapses.
+
+    Entries are kept per client and keyed by the topic and the serialized request.
+    Thread-safe.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_READ_PLAN_TTL_SECONDS,
+        max_entries: int = DEFAULT_READ_PLAN_MAX_ENTRIES,
+    ):
+        """
+        Args:
+            ttl_seconds: How long a resolved plan is reused.
+            max_entries: Most plans kept per client.
+
+        Raises:
+            ValueError: ``ttl_seconds`` is not positive or ``max_entries`` is less than 1.
+        """
+        if ttl_seconds <= 0:
+            raise ValueError(f"ttl_seconds must be positive, got {ttl_seconds}")
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        self.__ttl_seconds = ttl_seconds
+        self.__max_entries = max_entries
+        self.__lock = threading.Lock()
+        self.__clients: weakref.WeakKeyDictionary[
+            RobotoClient, collections.OrderedDict[tuple[str, str, str], tuple[ReadPlan, float]]
+        ] = weakref.WeakKeyDictionary()
+
+    @property
+    def max_entries(self) -> int:
+        """Most plans kept per client."""
+        return self.__max_entries
+
+    @property
+    def ttl_seconds(self) -> float:
+        """How long a resolved plan is reused."""
+        return self.__ttl_seconds
+
+    def clear(self) -> None:
+        """Forget every memoized plan."""
+        with self.__lock:
+            for plans in self.__clients.values():
+                plans.clear()
+
+    def get(
+        self, roboto_client: RobotoClient, org_id: str, topic_id: str, request_key: str
+    ) -> typing.Optional[ReadPlan]:
+        """The plan resolved for this request within the TTL, or ``None``.
+
+        Args:
+            roboto_client: The client the plan was resolved with.
+            org_id: The topic's organization.
+            topic_id: The topic the plan reads.
+            request_key: The serialized read-plan request.
+        """
+        key = (org_id, topic_id, request_key)
+        with self.__lock:
+            plans = self.__clients.get(roboto_client)
+            if plans is None:
+                return None
+            cached = plans.get(key)
+            if cached is None:
+                return None
+            plan, expires_at = cached
+            if time.monotonic() >= expires_at:
+                del plans[key]
+                return None
+            plans.move_to_end(key)
+            return plan
+
+    def put(self, roboto_client: RobotoClient, org_id: str, topic_id: str, request_key: str, plan: ReadPlan) -> None:
+        """Memoize the plan resolved for this request; see :py:meth:`get` for the arguments."""
+        key = (org_id, topic_id, request_key)
+        with self.__lock:
+            plans = self.__clients.get(roboto_client)
+            if plans is None:
+                plans = collections.OrderedDict()
+                self.__clients[roboto_client] = plans
+            plans[key] = (plan, time.monotonic() + self.__ttl_seconds)
+            plans.move_to_end(key)
+            while len(plans) > self.__max_entries:
+                plans.popitem(last=False)
+
+
+_schema_field_cache: typing.Optional[SchemaFieldCache] = SchemaFieldCache()
+"""The process-wide schema field cache, or ``None`` while disabled."""
+
+_read_plan_memo: typing.Optional[ReadPlanMemo] = ReadPlanMemo()
+"""The process-wide read-plan memo, or ``None`` while disabled."""
+
+
+def configure_topic_metadata_cache(
+    schema_max_entries: int = DEFAULT_SCHEMA_CACHE_MAX_ENTRIES,
+    persist_schemas: bool = False,
+    schema_cache_dir: typing.Union[str, pathlib.Path, None] = None,
+    read_plan_ttl_seconds: typing.Optional[float] = DEFAULT_READ_PLAN_TTL_SECONDS,
+    read_plan_max_entries: int = DEFAULT_READ_PLAN_MAX_ENTRIES,
+    enabled: bool = True,
+) -> None:
+    """Resize, persist, or disable the process-wide caches of schema fields and read plans that topic reads share.
+
+    Both caches are enabled by default, with schemas kept in memory only.
+    Replacing them forgets everything cached in memory so far.
+
+    Args:
+        schema_max_entries: Most schemas whose fields are kept in memory.
+        persist_schemas: Also store schema fields on disk, so later processes
+            skip fetching them.
+        schema_cache_dir: Directory persisted schema fields are stored in.
+            Defaults to a ``topic-schemas`` directory under the SDK cache directory
+            (``ROBOTO_CACHE_DIR`` or the platform's per-user cache directory).
+            Ignored unless ``persist_schemas`` is set.
+        read_plan_ttl_seconds: How long a resolved read plan is reused for an
+            identical request; ``None`` resolves every request anew.
+        read_plan_max_entries: Most read plans kept per client.
+        enabled: Pass ``False`` to disable both caches.
+
+    Raises:
+        ValueError: A maximum is less than 1, or ``read_plan_ttl_seconds`` is not positive.
+
+    Examples:
+        Keep schemas across processes, and reuse plans for a minute:
+
+        >>> from roboto.experimental.topics import configure_topic_metadata_cache
+        >>> configure_topic_metadata_cache(persist_schemas=True, read_plan_ttl_seconds=60)
+    """
+    schema_cache: typing.Optional[SchemaFieldCache] = None
+    read_plan_memo: typing.Optional[ReadPlanMemo] = None
+    if enabled:
+        if persist_schemas and schema_cache_dir is None:
+            # Imported here so this module does not load config at import time.
+            from ...config import resolve_cache_dir
+            from ...env import RobotoEnv
+
+            schema_cache_dir = resolve_cache_dir(RobotoEnv(), ensure_exists=False) / SCHEMA_CACHE_SUBDIR
+        schema_cache = SchemaFieldCache(schema_max_entries, schema_cache_dir if persist_schemas else None)
+        if read_plan_ttl_seconds is not None:
+            read_plan_memo = ReadPlanMemo(read_plan_ttl_seconds, read_plan_max_entries)
+
+    global _schema_field_cache, _read_plan_memo
+    _schema_field_cache = schema_cache
+    _read_plan_memo = read_plan_memo
+
+
+def shared_read_plan_memo() -> typing.Optional[ReadPlanMemo]:
+    """Return the process-wide read-plan memo, or ``None`` if it is disabled."""
+    return _read_plan_memo
+
+
+def shared_schema_field_cache() -> typing.Optional[SchemaFieldCache]:
+    """Return the process-wide schema field cache, or ``None`` if it is disabled."""
+    return _schema_field_cache
+
+
+def _reset_after_fork() -> None:
+    """Give a forked child fresh caches, whose locks no parent thread can be holding."""
+    global _schema_field_cache, _read_plan_memo
+    schema_cache = _schema_field_cache
+    if schema_cache is not None:
+        _schema_field_cache = SchemaFieldCache(schema_cache.max_entries, schema_cache.cache_dir)
+    read_plan_memo = _read_plan_memo
+    if read_plan_memo is not None:
+        _read_plan_memo = ReadPlanMemo(read_plan_memo.ttl_seconds, read_plan_memo.max_entries)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -4,14 +4,14 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
-"""Overlay a partition's scan-task streams into one nested RecordBatch.
+"""Overlay a partition's scan-task streams into nested RecordBatches.
 
 A partition resolves to one or more scan tasks, each a representation layer
 decoded into the public nested shape: a RecordBatch with a metadata-marked
 ``_index`` timestamp column. A row's leaf fields can be shredded across these
 layers (record-shredding style), each layer owning a subtree; this module
 reassembles each row by gathering every leaf from its owning layer and merging
-the layers into one batch.
+the layers, a window of aligned rows at a time.
 
 The model is a per-leaf positional join:
 
@@ -98,73 +98,99 @@ def _leaf_paths_under_type(data_type: "pyarrow.DataType", prefix: FieldPath) ->
 
 
 def overlay_streams(
-    streams: collections.abc.Sequence[collections.abc.Sequence["pyarrow.RecordBatch"]],
+    streams: collections.abc.Sequence[collections.abc.Iterable["pyarrow.RecordBatch"]],
     leaf_paths_per_stream: collections.abc.Sequence[collections.abc.Sequence[FieldPath]],
-) -> typing.Optional["pyarrow.RecordBatch"]:
-    """Merge position-aligned scan-task streams into one nested RecordBatch, last-writer-wins per leaf.
+) -> collections.abc.Generator["pyarrow.RecordBatch", None, None]:
+    """Merge position-aligned scan-task streams into nested RecordBatches, last-writer-wins per leaf.
+
+    The merge streams: it holds one batch per stream at a time, so memory stays
+    bounded by the streams' batch sizes rather than the partition's size. Streams
+    batch their rows independently, so at each step the merge cuts every stream's
+    current batch down to the shortest remaining run (zero-copy slices), merges
+    those equal-length windows, and carries the remainders into the next step.
 
     Args:
-        streams: One sequence of public-shape RecordBatches per scan task,
+        streams: One iterable of public-shape RecordBatches per scan task,
             ordered lowest-precedence first. Each stream must already be in
             persisted row order (its decoder's native order); the merge pairs
-            rows positionally and never sorts.
+            rows positionally and never sorts. Streams are consumed lazily, one
+            batch at a time.
         leaf_paths_per_stream: Parallel to ``streams``; each entry is the
             leaf-most projection that stream owns by subtree. A stream owns leaf
             ``L`` iff ``L`` appears in its entry, and the highest-precedence owner
             wins ``L``.
 
-    Returns:
-        The merged partition as one RecordBatch in the public nested shape with a
-        metadata-marked stored-time index column, or ``None`` when every stream is
-        empty (the partition emits no rows).
+    Yields:
+        The merged partition as RecordBatches in the public nested shape with a
+        metadata-marked stored-time index column, in row order. Nothing is yielded
+        when every stream is empty (the partition emits no rows). Batch boundaries
+        are arbitrary, and a batch's schema covers only what its rows' source
+        batches carry; consumers unify them with permissive promotion.
 
     Raises:
         RobotoInternalException: The streams do not share an index — their row
             counts differ, or their ``_index`` values differ element-wise by
-            position.
+            position. Raised when the mismatch is reached, so batches before it
+            may already have been yielded.
     """
-    pa = import_optional_dependency("pyarrow", "analytics")
-    pc = import_optional_dependency("pyarrow.compute", "analytics")
+    iterators = [iter(batches) for batches in streams]
+    # The unmerged remainder of each stream's current batch; None once it is used up.
+    pending: list[typing.Optional["pyarrow.RecordBatch"]] = [None] * len(iterators)
+    merged_rows = 0
+    while True:
+        for index, iterator in enumerate(iterators):
+            if pending[index] is None:
+                pending[index] = _next_nonempty_batch(iterator)
+
+        present = [batch for batch in pending if batch is not None]
+        if not present:
+            return
+        if len(present) != len(pending):
+            ended = [index for index, batch in enumerate(pending) if batch is None]
+            raise RobotoInternalException(
+                "Overlay streams do not share an index: scan-task row counts differ "
+                f"(streams {ended} end after {merged_rows} rows while the others continue). "
+                "Position-aligned overlay requires every stream to carry the same rows."
+            )
+
+        step = min(batch.num_rows for batch in present)
+        windows = [batch.slice(0, step) for batch in present]
+        pending = [batch.slice(step) if batch.num_rows > step else None for batch in present]
+        merged_rows += step
+        yield _overlay_windows(windows, leaf_paths_per_stream)
 
-    # Materialize one table per stream, tolerating per-batch schema drift (an
-    # MCAP scan task can infer different struct child sets across flushes):
-    # permissive promotion unifies them into a single schema, null-filling gaps.
-    tables: list[typing.Optional["pyarrow.Table"]] = []
-    lengths: list[int] = []
-    for batches in streams:
-        batch_list = list(batches)
-        if not batch_list:
-            tables.append(None)
-            lengths.append(0)
-            continue
-        table = pa.concat_tables(
-            [pa.Table.from_batches([batch]) for batch in batch_list],
-            promote_options="permissive",
-        ).combine_chunks()
-        # No sort: every representation of a partition is persisted in the same
-        # row order, so each decoder's native order already aligns row-for-row
-        # across streams. Pairing positionally rather than by index value is what
-        # keeps duplicate-``_index`` rows aligned — a per-stream sort would
-        # reshuffle equal-index rows by each format's own tiebreak and misalign
-        # them. The element-wise index check below guards a decoder that violates
-        # the shared-order contract.
-        tables.append(table)
-        lengths.append(table.num_rows)
-
-    if all(length == 0 for length in lengths):
-        return None
-    if len(set(lengths)) != 1:
-        raise RobotoInternalException(
-            "Overlay streams do not share an index: scan-task row counts differ "
-            f"({lengths}). Position-aligned overlay requires every stream to carry the same rows."
-        )
 
-    present_tables = [table for table in tables if table is not None]
+def _next_nonempty_batch(
+    batches: collections.abc.Iterator["pyarrow.RecordBatch"],
+) -> typing.Optional["pyarrow.RecordBatch"]:
+    """The next batch with rows from ``batches``, or ``None`` when it is exhausted."""
+    for batch in batches:
+        if batch.num_rows > 0:
+            return batch
+    return None
+
+
+def _overlay_windows(
+    windows: collections.abc.Sequence["pyarrow.RecordBatch"],
+    leaf_paths_per_stream: collections.abc.Sequence[collections.abc.Sequence[FieldPath]],
+) -> "pyarrow.RecordBatch":
+    """Merge one equal-length, position-aligned batch per stream into one nested RecordBatch.
+
+    See :py:func:`overlay_streams` for the merge model; ``windows`` is parallel to
+    ``leaf_paths_per_stream``, lowest-precedence first.
+    """
+    pa = import_optional_dependency("pyarrow", "analytics")
+    pc = import_optional_dependency("pyarrow.compute", "analytics")
 
-    length = lengths[0]
-    index_columns: list["pyarrow.Array"] = []
-    for table in present_tables:
-        index_columns.append(table.column(timestamp_column_index(table.schema)).combine_chunks())
+    # No sort: every representation of a partition is persisted in the same row
+    # order, so each decoder's native order already aligns row-for-row across
+    # streams. Pairing positionally rather than by index value is what keeps
+    # duplicate-``_index`` rows aligned — a per-stream sort would reshuffle
+    # equal-index rows by each format's own tiebreak and misalign them. The
+    # element-wise index check below guards a decoder that violates the
+    # shared-order contract.
+    length = windows[0].num_rows
+    index_columns = [window.column(timestamp_column_index(window.schema)) for window in windows]
     reference_index = index_columns[0]
     for index_column in index_columns[1:]:
         if not pc.all(pc.equal(reference_index, index_column)).as_py():
@@ -183,10 +209,10 @@ def overlay_streams(
     # node a stream that elided the subtree would otherwise contribute).
     all_leaves: dict[FieldPath, None] = {}
     for index, leaf_paths in enumerate(leaf_paths_per_stream):
-        table = present_tables[index]
+        window = windows[index]
         for owned in leaf_paths:
-            root_index = table.schema.get_field_index(owned[0])
-            array = _descend_to_leaf(table.column(root_index).combine_chunks(), owned) if root_index >= 0 else None
+            root_index = window.schema.get_field_index(owned[0])
+            array = _descend_to_leaf(window.column(root_index), owned) if root_index >= 0 else None
             descendants = _leaf_paths_under_type(array.type, owned) if array is not None else []
             if descendants:
                 for leaf in descendants:
@@ -202,13 +228,13 @@ def overlay_streams(
         # Highest-precedence owner wins: a stream owns the leaf when one of its
         # subtree-restricted paths is a prefix of it. If that owner decoded nothing
         # there, the leaf is null for every row — a higher-precedence null wins.
-        for index in reversed(range(len(present_tables))):
+        for index in reversed(range(len(windows))):
             if not any(path[: len(owned)] == owned for owned in leaf_paths_per_stream[index]):
                 continue
-            table = present_tables[index]
-            root_index = table.schema.get_field_index(path[0])
+            window = windows[index]
+            root_index = window.schema.get_field_index(path[0])
             if root_index >= 0:
-                leaf_column = _descend_to_leaf(table.column(root_index).combine_chunks(), path)
+                leaf_column = _descend_to_leaf(window.column(root_index), path)
             break
         out_values[path] = leaf_column if leaf_column is not None else pa.nulls(length)
 
@@ -9,6 +9,7 @@ from __future__ import annotations
 import collections
 import collections.abc
 import concurrent.futures
+import threading
 import typing
 
 from ...compat import import_optional_dependency
@@ -27,29 +28,28 @@ from .read_plan import (
     ReadPlanScanTask,
     TimeWindow,
 )
+from .scheduler import ReadScheduler, ScheduledTask, shared_read_scheduler
 
 if typing.TYPE_CHECKING:
     import pyarrow  # pants: no-infer-dep
+    import pyarrow.compute  # pants: no-infer-dep
 
 
-_MAX_PARTITION_WORKERS = 32
-"""Most partitions decoded at once, which also caps how many decoded partitions are buffered in memory.
+_MAX_PARTITIONS_AHEAD = 32
+"""Most partitions of one read decoded ahead of its consumer.
 
-Partition decode waits mostly on the network (fetching a signed URL, then ranged
-GETs), so this follows the standard library's I/O-oriented thread-pool default of
-32 instead of scaling with CPU count."""
-
-_MAX_SCAN_TASK_WORKERS = 8
-"""Most scan tasks decoded at once within a single partition.
-
-Kept small because :py:func:`_resolve_partition` may run inside the partition pool,
-so the two pools multiply; this bounds the worst-case thread count."""
+Partitions decode on the shared :py:class:`~roboto.experimental.topics.scheduler.ReadScheduler`,
+which bounds the threads and buffered bytes across all reads; this only caps one
+read's share of the queue. It matches the scheduler's default worker count, so a
+single read can keep every worker busy."""
 
 
 def execute_plan(
     plan: ReadPlan,
     projection_paths: collections.abc.Sequence[FieldPath],
     decoder: ScanTaskDecoder,
+    read_id: typing.Optional[int] = None,
+    predicate: typing.Optional["pyarrow.compute.Expression"] = None,
 ) -> collections.abc.Generator["pyarrow.RecordBatch", None, None]:
     """Decode the files named by a read plan and yield the topic's rows as RecordBatches.
 
@@ -72,6 +72,13 @@ def execute_plan(
         projection_paths: The columns to read, as explicit field paths. To read every
             column, the caller expands the request against the plan's schema first.
         decoder: Decodes one scan task, choosing the reader by file format.
+        read_id: This read's id from :py:meth:`ReadScheduler.new_read_id`, shared
+            with any work the caller submitted for it ahead of time (e.g. signed-URL
+            minting). ``None`` takes a fresh one.
+        predicate: Keep only the rows it is true for, evaluated over the projected
+            fields. Applied as each file decodes (before any partition is buffered)
+            when one file holds the partition, and to the merged rows otherwise,
+            since a predicate may span columns that different files hold.
 
     Yields:
         RecordBatches. The timestamp column (marked in the schema metadata) holds
@@ -80,35 +87,111 @@ def execute_plan(
     partitions = plan.partitions
     if len(partitions) <= 1:
         for partition in partitions:
-            yield from _resolve_partition(plan, partition, projection_paths, decoder)
+            yield from _resolve_partition(plan, partition, projection_paths, decoder, predicate)
         return
 
-    max_workers = min(_MAX_PARTITION_WORKERS, len(partitions))
-
-    def _buffer_partition(partition: ReadPlanPartition) -> list["pyarrow.RecordBatch"]:
-        return list(_resolve_partition(plan, partition, projection_paths, decoder))
-
-    # Yield partitions in plan order while decoding up to max_workers ahead. The
-    # deque is a sliding window of in-flight decodes: submit on the right, wait on
-    # the oldest on the left, refill its slot, then yield. Waiting in submission
-    # order (not as_completed) is what keeps the cross-partition order contract.
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        remaining = iter(partitions)
-        in_flight: collections.deque[concurrent.futures.Future[list["pyarrow.RecordBatch"]]] = collections.deque()
-        for _ in range(max_workers):
-            try:
-                in_flight.append(executor.submit(_buffer_partition, next(remaining)))
-            except StopIteration:
-                break
+    scheduler = shared_read_scheduler()
+    if read_id is None:
+        read_id = scheduler.new_read_id()
+
+    def _decode_ahead(partition: ReadPlanPartition, wanted: threading.Event) -> _DecodedAhead:
+        # Decode batch by batch, holding each against the budget as it arrives, and
+        # stop once the budget is spent or the consumer has caught up with this
+        # partition; the consumer streams the rest itself.
+        batches = _resolve_partition(plan, partition, projection_paths, decoder, predicate)
+        held: collections.deque["pyarrow.RecordBatch"] = collections.deque()
+        try:
+            while not wanted.is_set() and scheduler.has_buffer_room():
+                batch = next(batches, None)
+                if batch is None:
+                    break
+                scheduler.hold_bytes(batch.nbytes)
+                held.append(batch)
+        except BaseException:
+            # The read fails with this exception; nothing will drain what was held.
+            scheduler.release_bytes(sum(batch.nbytes for batch in held))
+            raise
+        return _DecodedAhead(held, batches)
+
+    # Yield partitions in plan order while decoding ahead. The deque is a sliding
+    # window of look-ahead decodes: submit on the right, take the oldest from the
+    # left, refill, then yield. Taking in submission order (not as_completed) is
+    # what keeps the cross-partition order contract. Each partition is queued at its
+    # plan position, so the scheduler runs the one needed next first, and the window
+    # only grows while the process-wide buffered-bytes budget has room. The partition
+    # being consumed is never buffered whole: its decode stops where it is and the
+    # consumer streams the remainder, so a partition larger than the budget passes
+    # through one batch at a time.
+    remaining = enumerate(partitions)
+    in_flight: collections.deque[tuple[ReadPlanPartition, threading.Event, ScheduledTask[_DecodedAhead]]] = (
+        collections.deque()
+    )
+
+    def _fill() -> None:
+        while len(in_flight) < _MAX_PARTITIONS_AHEAD and (not in_flight or scheduler.has_buffer_room()):
+            position, partition = next(remaining, (-1, None))
+            if partition is None:
+                return
+            wanted = threading.Event()
+            task = scheduler.submit(_decode_ahead, partition, wanted, priority=(position, read_id))
+            in_flight.append((partition, wanted, task))
+
+    try:
+        _fill()
         while in_flight:
-            future = in_flight.popleft()
-            # Exceptions propagate: a failed partition decode fails the read.
-            batches = future.result()
-            try:
-                in_flight.append(executor.submit(_buffer_partition, next(remaining)))
-            except StopIteration:
-                pass
-            yield from batches
+            partition, wanted, task = in_flight.popleft()
+            wanted.set()
+            if task.cancel():
+                # Not started yet: decode it here, straight to the consumer.
+                ahead = _DecodedAhead(
+                    collections.deque(), _resolve_partition(plan, partition, projection_paths, decoder, predicate)
+                )
+            else:
+                # Exceptions propagate: a failed partition decode fails the read.
+                ahead = task.result()
+            _fill()
+            yield from _drain(scheduler, ahead)
+    finally:
+        # Abandoned (closed early or failed): drop queued decodes, stop running ones,
+        # and return their budget when they finish, without waiting for them.
+        for _, wanted, task in in_flight:
+            wanted.set()
+            if not task.cancel():
+                task.add_done_callback(lambda future: _discard_ahead(scheduler, future))
+
+
+class _DecodedAhead(typing.NamedTuple):
+    """A partition decoded ahead of its consumer: the batches held so far and the rest, still to decode."""
+
+    held: collections.deque["pyarrow.RecordBatch"]
+    rest: collections.abc.Generator["pyarrow.RecordBatch", None, None]
+
+
+def _discard_ahead(scheduler: ReadScheduler, future: concurrent.futures.Future[_DecodedAhead]) -> None:
+    """Return an abandoned partition decode's held bytes to the scheduler's budget and stop its decode."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    ahead = future.result()
+    scheduler.release_bytes(sum(batch.nbytes for batch in ahead.held))
+    ahead.held.clear()
+    ahead.rest.close()
+
+
+def _drain(
+    scheduler: ReadScheduler, ahead: _DecodedAhead
+) -> collections.abc.Generator["pyarrow.RecordBatch", None, None]:
+    """Yield a partition's held batches, returning each one's budget as it goes, then stream the rest."""
+    held = ahead.held
+    try:
+        while held:
+            batch = held.popleft()
+            scheduler.release_bytes(batch.nbytes)
+            yield batch
+        yield from ahead.rest
+    finally:
+        scheduler.release_bytes(sum(batch.nbytes for batch in held))
+        held.clear()
+        ahead.rest.close()
 
 
 def projection_for_subtree(
@@ -192,6 +275,11 @@ def _coalesce_scan_tasks(
     same-depth paths, none an ancestor of another, so ``leaf_most`` over it drops
     nothing.
 
+    A group left with nothing to project, because the caller narrowed the projection
+    to other branches (e.g. a dataset scan selecting some columns), is dropped, so its
+    file is never fetched. If every group is left empty, all are kept: the rows still
+    exist, and their timestamps are read from them.
+
     Returns ``(representative_scan_task, union_projection)`` pairs, lowest-precedence
     first, ties in plan order. The representative's own subtree is irrelevant: a
     decoder reads only its file id and format and takes the projection explicitly.
@@ -210,7 +298,8 @@ def _coalesce_scan_tasks(
         for path in projection:
             if path not in union:
                 union.append(path)
-    return list(groups.values())
+    projecting = [group for group in groups.values() if group[1]]
+    return projecting or list(groups.values())
 
 
 def _resolve_partition(
@@ -218,6 +307,7 @@ def _resolve_partition(
     partition: ReadPlanPartition,
     projection_paths: collections.abc.Sequence[FieldPath],
     decoder: ScanTaskDecoder,
+    predicate: typing.Optional["pyarrow.compute.Expression"] = None,
 ) -> collections.abc.Generator["pyarrow.RecordBatch", None, None]:
     """Decode one partition's files, merge them into whole rows, and yield them with absolute timestamps.
 
@@ -240,34 +330,74 @@ def _resolve_partition(
             return
 
         scan_task, projection = grouped[0]
-        decoded = decoder(scan_task, partition, partition_local_window, projection)
+        decoded = decoder(scan_task, partition, partition_local_window, projection, predicate)
         for batch in decoded.batches():
             yield _apply_time_offset(batch, offset)
         return
 
     # Several layers: different files hold different columns of the same rows.
-    # Decode every layer and merge each row column-by-column, higher precedence
-    # winning. Decode concurrently so the layers' fetch/decode network waits
-    # overlap. The merge aligns streams by row position, so each is fully buffered
-    # first -- peak memory is the whole partition's decoded size. This pool may nest
-    # under execute_plan's partition pool, so _MAX_SCAN_TASK_WORKERS stays small to
-    # bound the combined thread count.
-
-    def _scan_task_batches(scan_task: ReadPlanScanTask, projection: list[FieldPath]) -> list["pyarrow.RecordBatch"]:
-        # overlay_streams pairs streams by row position, so a decoder must emit rows
-        # in stored order. MCAP file order and Parquet row order both satisfy this.
-        return list(decoder(scan_task, partition, partition_local_window, projection).batches())
-
-    max_workers = min(_MAX_SCAN_TASK_WORKERS, len(grouped))
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [executor.submit(_scan_task_batches, scan_task, projection) for scan_task, projection in grouped]
-        # Collected in submission (= precedence) order, as the merge requires. A
-        # failed layer decode propagates and fails the read.
-        buffered_streams = [future.result() for future in futures]
-
-    merged = overlay_streams(
-        buffered_streams,
-        [leaf_most(projection) for _, projection in grouped],
-    )
-    if merged is not None:
-        yield _apply_time_offset(merged, offset)
+    # Merge each row column-by-column, higher precedence winning, streaming: the
+    # overlay holds one batch per layer and re-slices them to common row windows,
+    # so peak memory is a few batches per layer, not the whole decoded partition.
+    # Each layer decodes one batch ahead on the shared scheduler while the merge
+    # consumes its current one, so the layers' fetch/decode network waits still
+    # overlap, at this partition's priority.
+    #
+    # overlay_streams pairs streams by row position, so a decoder must emit rows in
+    # stored order. MCAP file order and Parquet row order both satisfy this. For the
+    # same reason no layer filters by the predicate: dropping rows from one layer
+    # would misalign it, and the predicate may span columns of several layers. It
+    # applies to the merged rows instead.
+    scheduler = shared_read_scheduler()
+    layers = [
+        iter(decoder(scan_task, partition, partition_local_window, projection, None).batches())
+        for scan_task, projection in grouped
+    ]
+    # Queue every layer's first batch up front so the layers start decoding
+    # together rather than one by one as the merge first pulls from each.
+    first_batches = [scheduler.submit(next, layer, None) for layer in layers]
+    read_ahead = [_read_ahead(layer, first, scheduler) for layer, first in zip(layers, first_batches)]
+    try:
+        # Streams in precedence order, as the merge requires. A failed layer decode
+        # propagates and fails the read.
+        merged = overlay_streams(read_ahead, [leaf_most(projection) for _, projection in grouped])
+        for batch in merged:
+            if predicate is not None:
+                batch = batch.filter(predicate)
+                if batch.num_rows == 0:
+                    continue
+            yield _apply_time_offset(batch, offset)
+    finally:
+        # Stop every layer's in-flight step (dropping it if queued, waiting it out
+        # if running) so none is mid-advance, then release each decoder's reader and
+        # workers now rather than at garbage collection.
+        for stream in read_ahead:
+            stream.close()
+        for first in first_batches:
+            if not first.cancel():
+                first.wait()
+        for layer in layers:
+            if isinstance(layer, collections.abc.Generator):
+                layer.close()
+
+
+def _read_ahead(
+    batches: collections.abc.Iterator["pyarrow.RecordBatch"],
+    first: ScheduledTask[typing.Optional["pyarrow.RecordBatch"]],
+    scheduler: ReadScheduler,
+) -> collections.abc.Generator["pyarrow.RecordBatch", None, None]:
+    """Yield ``batches``, decoding the next one on ``scheduler`` while the consumer handles the current one.
+
+    ``first`` is the already-submitted ``next(batches, None)`` step.
+    """
+    upcoming = first
+    try:
+        while True:
+            batch = upcoming.result()
+            if batch is None:
+                return
+            upcoming = scheduler.submit(next, batches, None)
+            yield batch
+    finally:
+        if not upcoming.cancel():
+            upcoming.wait()
@@ -0,0 +1,235 @@
+# Copyright (c) 2026 Roboto Technologies, Inc.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""On-disk cache of decoded topic reads, stored as Arrow IPC (Feather v2) files.
+
+Reading the same topic, window, and fields again re-fetches and re-decodes every
+file the read plan names. With the cache, a read's decoded RecordBatches are
+written beside the cached topic-data files as they stream to the caller, and a
+later read resolving to the same plan is served from them: the files are
+memory-mapped and their batches returned zero-copy, with no file fetched or decoded.
+
+An entry is keyed by everything that decides the decoded rows: the plan's schema
+checksum, window, projection, and partitions (their scan tasks' file ids and
+sizes, and their time offsets), plus the row predicate. Batches of one read may
+carry different schemas, which one IPC file cannot hold, so an entry is a run of
+segment files, one per stretch of batches sharing a schema. Segment names carry
+their position and the entry's segment count, so an entry missing any segment
+is recognized as a miss. Segments are recorded in the cache index under the
+entry's key, so eviction removes an entry's segments together.
+"""
+
+from __future__ import annotations
+
+import collections.abc
+import hashlib
+import os
+import pathlib
+import re
+import sqlite3
+import typing
+import uuid
+
+from ...compat import import_optional_dependency
+from ...logging import default_logger
+from ...storage.cache import record_cache_hit
+from ...storage.cache_manager import cache_manager_for
+from .read_plan import ReadPlan
+
+if typing.TYPE_CHECKING:
+    import pyarrow  # pants: no-infer-dep
+    import pyarrow.compute  # pants: no-infer-dep
+    import pyarrow.ipc  # pants: no-infer-dep
+
+logger = default_logger()
+
+RESULT_CACHE_SUBDIR = "decoded"
+"""Subdirectory of the topic-data cache directory holding cached decoded reads."""
+
+_RESULT_CACHE_FORMAT_VERSION = 1
+"""Mixed into every entry key, so a change to what an entry holds never serves an older entry."""
+
+_SEGMENT_NAME_PATTERN = re.compile(r"^(?P<key>[0-9a-f]{64})\.(?P<index>\d+)of(?P<count>\d+)\.arrow$")
+"""Matches a segment file name: ``<key>.<index>of<count>.arrow``."""
+
+
+def result_cache_key(plan: ReadPlan, predicate: typing.Optional[pyarrow.compute.Expression] = None) -> str:
+    """Key the decoded result of executing ``plan``, filtered to ``predicate``.
+
+    The plan names the schema checksum, window, projection, and each partition's
+    time offset and scan tasks (file ids, sizes, formats, and precedence), which
+    together fix the decoded rows.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{_RESULT_CACHE_FORMAT_VERSION}\n".encode())
+    digest.update(plan.model_dump_json().encode())
+    digest.update(b"\n")
+    digest.update(str(predicate).encode() if predicate is not None else b"")
+    return digest.hexdigest()
+
+
+def read_cached_result(
+    cache_dir: pathlib.Path, key: str
+) -> typing.Optional[collections.abc.Generator[pyarrow.RecordBatch, None, None]]:
+    """Return the cached batches for ``key``, or ``None`` on a miss.
+
+    Every segment is memory-mapped before this returns, so an entry evicted while
+    its batches are being consumed stays readable. The batches reference the
+    mapped files directly, without copying.
+
+    Args:
+        cache_dir: The result cache directory.
+        key: The entry's key, from :py:func:`result_cache_key`.
+    """
+    pa = import_optional_dependency("pyarrow", "analytics")
+
+    segments: dict[int, pathlib.Path] = {}
+    count: typing.Optional[int] = None
+    try:
+        candidates = list(cache_dir.glob(f"{key}.*.arrow"))
+    except OSError:
+        return None
+    for path in candidates:
+        match = _SEGMENT_NAME_PATTERN.match(path.name)
+        if match is None:
+            continue
+        segment_count = int(match["count"])
+        if count is not None and segment_count != count:
+            # Leftovers of an entry written with a different segmentation; the mix cannot be trusted.
+            return None
+        count = segment_count
+        segments[int(match["index"])] = path
+    if count is None or sorted(segments) != list(range(count)):
+        return None
+
+    try:
+        readers = [pa.ipc.open_file(pa.memory_map(str(segments[index]))) for index in range(count)]
+    except (OSError, pa.ArrowInvalid):
+        logger.debug("Cached decoded result %s is unreadable; treating it as a miss", key, exc_info=True)
+        return None
+
+    for path in segments.values():
+        record_cache_hit(path, key)
+
+    def _batches() -> collections.abc.Generator[pyarrow.RecordBatch, None, None]:
+        for reader in readers:
+            for index in range(reader.num_record_batches):
+                yield reader.get_batch(index)
+
+    return _batches()
+
+
+def caching_result(
+    batches: collections.abc.Iterable[pyarrow.RecordBatch], cache_dir: pathlib.Path, key: str
+) -> collections.abc.Generator[pyarrow.RecordBatch, None, None]:
+    """Pass ``batches`` through unchanged, writing them to the cache under ``key`` as they go.
+
+    Segments are written to uniquely named ``.part`` files and renamed into place
+    only once every batch has been read, so an abandoned or failed read caches
+    nothing, and concurrent writers of one key never expose a partial entry.
+    Afterwards the cache directory's limits (see
+    :py:func:`~roboto.storage.configure_cache_limits`) are enforced, evicting least
+    recently used entries. A failure to write the cache is logged and never fails
+    the read.
+
+    Args:
+        batches: The decoded batches of the read.
+        cache_dir: The result cache directory.
+        key: The entry's key, from :py:func:`result_cache_key`.
+    """
+    pa = import_optional_dependency("pyarrow", "analytics")
+
+    writer: typing.Optional[_SegmentWriter] = _SegmentWriter(cache_dir, key)
+    try:
+        for batch in batches:
+            if writer is not None:
+                try:
+                    writer.write(batch)
+                except (OSError, pa.ArrowException):
+                    logger.debug("Failed to cache decoded result %s; skipping", key, exc_info=True)
+                    writer.abandon()
+                    writer = None
+            yield batch
+
+        if writer is not None:
+            try:
+                writer.commit()
+            except (OSError, pa.ArrowException, sqlite3.Error):
+                logger.debug("Failed to cache decoded result %s; skipping", key, exc_info=True)
+                writer.abandon()
+            writer = None
+    finally:
+        if writer is not None:
+            writer.abandon()
+
+
+class _SegmentWriter:
+    """Writes one entry's segments to ``.part`` files, starting a new segment whenever the schema changes."""
+
+    def __init__(self, cache_dir: pathlib.Path, key: str):
+        self.__cache_dir = cache_dir
+        self.__key = key
+        self.__token = uuid.uuid4().hex
+        self.__parts: list[pathlib.Path] = []
+        self.__writer: typing.Optional[pyarrow.ipc.RecordBatchFileWriter] = None
+        self.__schema: typing.Optional[pyarrow.Schema] = None
+
+    def abandon(self) -> None:
+        """Discard every segment written so far."""
+        self.__close_segment()
+        for part in self.__parts:
+            part.unlink(missing_ok=True)
+        self.__parts.clear()
+
+    def commit(self) -> None:
+        """Rename the segments into place, replacing any earlier entry for the key, and enforce the directory's limits.
+
+        A read that yielded no batches is cached as one empty segment, so it is not re-read either.
+        """
+        pa = import_optional_dependency("pyarrow", "analytics")
+
+        if not self.__parts:
+            self.__open_segment(pa.schema([]))
+        self.__close_segment()
+
+        count = len(self.__parts)
+        paths = [self.__cache_dir / f"{self.__key}.{index}of{count}.arrow" for index in range(count)]
+        # Segments of an earlier entry for the key, written with a different segment
+        # count or left after a partial eviction, would make every read a miss.
+        for stale in self.__cache_dir.glob(f"{self.__key}.*of*.arrow"):
+            if stale not in paths and _SEGMENT_NAME_PATTERN.match(stale.name) is not None:
+                stale.unlink(missing_ok=True)
+        for part, path in zip(self.__parts, paths):
+            os.replace(part, path)
+        self.__parts.clear()
+
+        manager = cache_manager_for(self.__cache_dir)
+        for path in paths:
+            manager.record_access(path, self.__key)
+        # Keeping one segment keeps the whole entry: segments share the key as their source id.
+        manager.enforce_limits(keep=paths[0])
+
+    def write(self, batch: pyarrow.RecordBatch) -> None:
+        if self.__schema is None or not batch.schema.equals(self.__schema, check_metadata=True):
+            self.__close_segment()
+            self.__open_segment(batch.schema)
+        typing.cast("pyarrow.ipc.RecordBatchFileWriter", self.__writer).write_batch(batch)
+
+    def __close_segment(self) -> None:
+        if self.__writer is not None:
+            self.__writer.close()
+            self.__writer = None
+            self.__schema = None
+
+    def __open_segment(self, schema: pyarrow.Schema) -> None:
+        pa = import_optional_dependency("pyarrow", "analytics")
+
+        self.__cache_dir.mkdir(parents=True, exist_ok=True)
+        part = self.__cache_dir / f"{self.__key}.{len(self.__parts)}.{self.__token}.part"
+        self.__parts.append(part)
+        # Uncompressed, so a cached batch maps straight out of the file with no decode.
+        self.__writer = pa.ipc.new_file(str(part), schema)
+        self.__schema = schema
@@ -0,0 +1,331 @@
+# Copyright (c) 2026 Roboto Technologies, Inc.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Process-wide work scheduler for read-plan execution.
+
+Reading a topic fans out at several levels: partitions decode concurrently, a
+partition's layers decode concurrently, an MCAP file's chunks fetch and decode
+concurrently, and every file needs a signed URL minted first. Giving each level
+its own thread pool multiplies thread counts and lets concurrent reads compete
+without any global limit. Instead, all of that work is submitted to one
+:py:class:`ReadScheduler`, shared by every read in the process:
+
+* A fixed number of worker threads (started on demand and kept for later reads)
+  bounds how much work runs at once, and with it how many fetches are in flight.
+* Queued work runs in priority order. A task's priority is the plan position of
+  the partition it serves, so the partition a consumer needs next, and every
+  fetch and decode under it, goes ahead of speculative work on later partitions.
+  Work a task submits inherits that task's priority.
+* Batches decoded ahead of their consumer count against a process-wide byte
+  budget, which :py:func:`~roboto.experimental.topics.plan_execution.execute_plan`
+  consults before decoding further ahead. The partition being consumed streams
+  to its consumer instead, so it never counts against the budget.
+
+Work waits only on work below it (a partition on its layers, a layer on its
+chunks), and waiting on a task that has not started yet runs it on the waiting
+thread instead. So nested submission cannot deadlock however small the pool is,
+and a consumer blocked on the next partition never waits behind a queue.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import contextvars
+import heapq
+import itertools
+import os
+import threading
+import typing
+
+T = typing.TypeVar("T")
+
+Priority = tuple[int, int]
+"""``(plan_position, read_id)``: lower runs first; ties run in submission order."""
+
+DEFAULT_MAX_WORKERS = 32
+"""Default number of worker threads.
+
+Read work waits mostly on the network, so this follows the standard library's
+I/O-oriented thread-pool default of 32 and matches the storage connection pool's
+per-host bound, rather than scaling with CPU count."""
+
+DEFAULT_MAX_BUFFERED_BYTES = 2 * 1024 * 1024 * 1024
+"""Default budget for decoded partitions held ahead of their consumers, across all reads (2 GiB)."""
+
+_URGENT: Priority = (-1, 0)
+"""Priority of work submitted outside any scheduled task.
+
+Such work is submitted by a consumer's own thread, which is by definition
+waiting for it, so it ranks ahead of every plan position."""
+
+_current_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar("roboto_read_priority", default=_URGENT)
+"""Priority of the scheduled task running on this thread, inherited by the work it submits."""
+
+
+class ScheduledTask(typing.Generic[T]):
+    """A unit of work submitted to a :py:class:`ReadScheduler`.
+
+    Like a :py:class:`concurrent.futures.Future`, except that :py:meth:`result`
+    runs the work on the calling thread if no worker has started it yet.
+    """
+
+    def __init__(
+        self,
+        scheduler: ReadScheduler,
+        priority: Priority,
+        fn: typing.Callable[..., T],
+        args: tuple[typing.Any, ...],
+    ) -> None:
+        self.__scheduler = scheduler
+        self.__priority = priority
+        self.__fn = fn
+        self.__args = args
+        self.__future: concurrent.futures.Future[T] = concurrent.futures.Future()
+        # Whether a thread has taken this task to run or cancel it; set under the scheduler's lock.
+        self._claimed = False
+
+    @property
+    def priority(self) -> Priority:
+        return self.__priority
+
+    def add_done_callback(self, fn: typing.Callable[[concurrent.futures.Future[T]], object]) -> None:
+        """Call ``fn`` with the underlying future once the task completes or is cancelled."""
+        self.__future.add_done_callback(fn)
+
+    def cancel(self) -> bool:
+        """Cancel the task if it has not started; return whether it was cancelled."""
+        if not self.__scheduler._claim(self):
+            return self.__future.cancelled()
+        self.__future.cancel()
+        return True
+
+    def done(self) -> bool:
+        return self.__future.done()
+
+    def result(self) -> T:
+        """The task's return value, running it here if it has not started; raises what the task raised."""
+        if self.__scheduler._claim(self):
+            self._run()
+        return self.__future.result()
+
+    def wait(self) -> None:
+        """Block until the task has finished or been cancelled, running it here if it has not started.
+
+        Unlike :py:meth:`result`, does not raise what the task raised.
+        """
+        if self.__scheduler._claim(self):
+            self._run()
+        concurrent.futures.wait([self.__future])
+
+    def _run(self) -> None:
+        """Run the task with its priority in effect. Call only after claiming it."""
+        if not self.__future.set_running_or_notify_cancel():
+            return
+        token = _current_priority.set(self.__priority)
+        try:
+            result = self.__fn(*self.__args)
+        except BaseException as exc:
+            self.__future.set_exception(exc)
+        else:
+            self.__future.set_result(result)
+        finally:
+            _current_priority.reset(token)
+            # Drop references to the work's inputs (e.g. a decoder's generator).
+            self.__fn = None  # type: ignore[assignment]
+            self.__args = ()
+
+
+class ReadScheduler:
+    """A priority-ordered worker pool with a byte budget for buffered results.
+
+    See the module documentation for the scheduling model. Obtain the shared
+    instance with :py:func:`shared_read_scheduler`.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_buffered_bytes: int = DEFAULT_MAX_BUFFERED_BYTES,
+    ) -> None:
+        """
+        Args:
+            max_workers: Most tasks run at once by worker threads. Threads waiting
+                on a task may run it themselves, on top of this.
+            max_buffered_bytes: Budget checked by :py:meth:`has_buffer_room`.
+
+        Raises:
+            ValueError: ``max_workers`` is less than 1 or ``max_buffered_bytes`` is negative.
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        if max_buffered_bytes < 0:
+            raise ValueError(f"max_buffered_bytes must be non-negative, got {max_buffered_bytes}")
+        self.__max_workers = max_workers
+        self.__max_buffered_bytes = max_buffered_bytes
+        self.__condition = threading.Condition()
+        # Min-heap of (priority, sequence, task). Claimed tasks are skipped when popped.
+        self.__queue: list[tuple[Priority, int, ScheduledTask[typing.Any]]] = []
+        self.__sequence = itertools.count()
+        self.__read_ids = itertools.count()
+        self.__workers = 0
+        self.__idle_workers = 0
+        self.__buffered_bytes = 0
+        self.__shut_down = False
+
+    @property
+    def buffered_bytes(self) -> int:
+        """Bytes currently reported held by :py:meth:`hold_bytes` and not yet released."""
+        return self.__buffered_bytes
+
+    def has_buffer_room(self) -> bool:
+        """Whether the bytes held ahead of consumers are under this scheduler's budget."""
+        return self.__buffered_bytes < self.__max_buffered_bytes
+
+    def hold_bytes(self, nbytes: int) -> None:
+        """Count ``nbytes`` of decoded results held ahead of their consumer against the budget."""
+        with self.__condition:
+            self.__buffered_bytes += nbytes
+
+    def release_bytes(self, nbytes: int) -> None:
+        """Return ``nbytes`` previously counted with :py:meth:`hold_bytes`."""
+        with self.__condition:
+            self.__buffered_bytes -= nbytes
+
+    def new_read_id(self) -> int:
+        """A fresh id for one read, breaking priority ties between concurrent reads in start order."""
+        return next(self.__read_ids)
+
+    def shutdown(self) -> None:
+        """Let the worker threads exit once the queue drains. Later submissions still run, on the waiter's thread."""
+        with self.__condition:
+            self.__shut_down = True
+            self.__condition.notify_all()
+
+    def submit(
+        self,
+        fn: typing.Callable[..., T],
+        *args: typing.Any,
+        priority: typing.Optional[Priority] = None,
+    ) -> ScheduledTask[T]:
+        """Queue ``fn(*args)`` to run on a worker thread.
+
+        Args:
+            fn: The work.
+            *args: Positional arguments for ``fn``.
+            priority: Where the work ranks in the queue. ``None`` inherits the
+                priority of the scheduled task doing the submitting, or ranks ahead
+                of all plan positions when submitted from outside the scheduler.
+
+        Returns:
+            A handle to wait on or cancel the work.
+        """
+        if priority is None:
+            priority = _current_priority.get()
+        task = ScheduledTask(self, priority, fn, args)
+        with self.__condition:
+            heapq.heappush(self.__queue, (priority, next(self.__sequence), task))
+            if self.__idle_workers == 0 and self.__workers < self.__max_workers and not self.__shut_down:
+                self.__workers += 1
+                threading.Thread(target=self.__work, name="roboto-read-scheduler", daemon=True).start()
+            else:
+                self.__condition.notify()
+        return task
+
+    def _claim(self, task: ScheduledTask[typing.Any]) -> bool:
+        """Take ``task`` to run or cancel; False if another thread already has."""
+        with self.__condition:
+            if task._claimed:
+                return False
+            task._claimed = True
+            return True
+
+    def __work(self) -> None:
+        while True:
+            with self.__condition:
+                task = self.__next_unclaimed()
+                while task is None:
+                    if self.__shut_down:
+                        self.__workers -= 1
+                        return
+                    self.__idle_workers += 1
+                    self.__condition.wait()
+                    self.__idle_workers -= 1
+                    task = self.__next_unclaimed()
+                task._claimed = True
+            task._run()
+
+    def __next_unclaimed(self) -> typing.Optional[ScheduledTask[typing.Any]]:
+        """Pop the highest-priority task nobody has claimed. The caller holds the lock."""
+        while self.__queue:
+            _, _, task = heapq.heappop(self.__queue)
+            if not task._claimed:
+                return task
+        return None
+
+
+_scheduler_limits: tuple[int, int] = (DEFAULT_MAX_WORKERS, DEFAULT_MAX_BUFFERED_BYTES)
+"""The ``(max_workers, max_buffered_bytes)`` the shared scheduler is (re)created with."""
+
+_scheduler: typing.Optional[ReadScheduler] = None
+"""The shared scheduler, created lazily on first use."""
+
+_scheduler_guard = threading.Lock()
+"""Guards creation and replacement of ``_scheduler``."""
+
+
+def configure_read_scheduler(
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    max_buffered_bytes: int = DEFAULT_MAX_BUFFERED_BYTES,
+) -> None:
+    """Resize the process-wide scheduler that topic reads run their fetch and decode work on.
+
+    Reads started afterwards use the new limits; reads already running finish on
+    the scheduler they started with. Call once at startup, before reading.
+
+    Args:
+        max_workers: Most fetch and decode tasks run at once, across all reads.
+        max_buffered_bytes: Most decoded bytes held ahead of consumers, across all
+            reads, before reads stop decoding further ahead. Each read still
+            decodes the partition it needs next.
+
+    Raises:
+        ValueError: ``max_workers`` is less than 1 or ``max_buffered_bytes`` is negative.
+
+    Examples:
+        >>> from roboto.experimental.topics import configure_read_scheduler
+        >>> configure_read_scheduler(max_workers=8, max_buffered_bytes=512 * 1024 * 1024)
+    """
+    scheduler = ReadScheduler(max_workers, max_buffered_bytes)
+    global _scheduler, _scheduler_limits
+    with _scheduler_guard:
+        previous = _scheduler
+        _scheduler_limits = (max_workers, max_buffered_bytes)
+        _scheduler = scheduler
+    if previous is not None:
+        previous.shutdown()
+
+
+def shared_read_scheduler() -> ReadScheduler:
+    """Return the process-wide read scheduler, creating it with the configured limits on first use."""
+    global _scheduler
+    scheduler = _scheduler
+    if scheduler is not None:
+        return scheduler
+    with _scheduler_guard:
+        if _scheduler is None:
+            _scheduler = ReadScheduler(*_scheduler_limits)
+        return _scheduler
+
+
+def _reset_after_fork() -> None:
+    """Drop the inherited scheduler in a forked child, whose worker threads did not survive the fork."""
+    global _scheduler, _scheduler_guard
+    _scheduler = None
+    _scheduler_guard = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
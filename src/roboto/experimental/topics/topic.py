@@ -7,7 +7,6 @@
 from __future__ import annotations
 
 import collections.abc
-import concurrent.futures
 import pathlib
 import typing
 
@@ -23,25 +22,36 @@ from ...domain.topics import (
 )
 from ...env import RobotoEnv
 from ...exceptions import RobotoInternalException
+from ...formats import Downsample, Downsampler
 from ...http import RobotoClient
-from ...storage import CachePolicy
+from ...storage import (
+    SIGNED_URL_BATCH_SIZE,
+    CachePolicy,
+    signed_url_for_file,
+    signed_urls_for_files,
+)
 from ...time import Time, to_epoch_nanoseconds
 from . import batch_transforms, plan_execution
+from .dataset import TopicDataset
 from .decode import (
     CACHED_PARQUET_NAME_PATTERN,
     ScanTaskDecodeParams,
     make_scan_task_decoder,
 )
+from .metadata_cache import shared_read_plan_memo, shared_schema_field_cache
 from .operations import (
     FieldAddress,
     ReadPlanRequest,
     RepresentationPreference,
 )
-from .read_plan import ReadPlan
+from .read_plan import ReadPlan, TimeWindow
+from .result_cache import RESULT_CACHE_SUBDIR, caching_result, read_cached_result, result_cache_key
+from .scheduler import ReadScheduler, ScheduledTask, shared_read_scheduler
 
 if typing.TYPE_CHECKING:
     import pandas  # pants: no-infer-dep
     import pyarrow  # pants: no-infer-dep
+    import pyarrow.compute  # pants: no-infer-dep
 
 FieldAddressLike = typing.Union[FieldAddress, collections.abc.Sequence[str]]
 """A field-subtree address, as a :py:class:`~roboto.experimental.topics.FieldAddress`
@@ -57,12 +67,6 @@ components explicitly instead."""
 TOPIC_DATA_CACHE_SUBDIR = "topic-data"
 """Subdirectory of the client's cache directory where fetched topic data files are cached."""
 
-_MAX_SIGNED_URL_WORKERS = 32
-"""Upper bound on the thread pool that mints scan-task signed URLs concurrently.
-
-Minting is a pure network wait, so the bound follows the stdlib's
-I/O-oriented executor default of 32 rather than scaling with core count."""
-
 
 class SessionContext(pydantic.BaseModel):
     """The Session a Topic is scoped to: limits topic operations to the Session's associated files
@@ -215,6 +219,9 @@ class Topic:
         timeline_source_name: typing.Optional[str] = None,
         cache_policy: CachePolicy = CachePolicy.ADAPTIVE,
         cache_dir: typing.Union[str, pathlib.Path, None] = None,
+        downsample: typing.Optional[Downsample] = None,
+        where: typing.Optional[pyarrow.compute.Expression] = None,
+        cache_results: bool = False,
     ) -> collections.abc.Generator[tuple[Timestamp, dict[str, typing.Any]], None, None]:
         """Yield this topic's data within a time window, as ``(timestamp, record)`` pairs.
 
@@ -242,6 +249,9 @@ class Topic:
             timeline_source_name: See :py:meth:`get_data_as_record_batches`.
             cache_policy: See :py:meth:`get_data_as_record_batches`.
             cache_dir: See :py:meth:`get_data_as_record_batches`.
+            downsample: See :py:meth:`get_data_as_record_batches`.
+            where: See :py:meth:`get_data_as_record_batches`.
+            cache_results: See :py:meth:`get_data_as_record_batches`.
 
         Yields:
             ``(timestamp, record)`` tuples for the in-window rows, filtered and
@@ -269,6 +279,9 @@ class Topic:
             timeline_source_name=timeline_source_name,
             cache_policy=cache_policy,
             cache_dir=cache_dir,
+            downsample=downsample,
+            where=where,
+            cache_results=cache_results,
         ):
             timestamp_index = batch_transforms.timestamp_column_index(batch.schema)
             timestamps = batch.column(timestamp_index).to_pylist()
@@ -291,6 +304,9 @@ class Topic:
         timeline_source_name: typing.Optional[str] = None,
         cache_policy: CachePolicy = CachePolicy.ADAPTIVE,
         cache_dir: typing.Union[str, pathlib.Path, None] = None,
+        downsample: typing.Optional[Downsample] = None,
+        where: typing.Optional[pyarrow.compute.Expression] = None,
+        cache_results: bool = False,
     ) -> collections.abc.Generator["pyarrow.RecordBatch", None, None]:
         """Yield this topic's data within a time window, as Arrow RecordBatches.
 
@@ -339,6 +355,28 @@ class Topic:
                 to a ``topic-data`` subdirectory of ``ROBOTO_CACHE_DIR``, or
                 the platform-conventional per-user cache directory when that is
                 unset.
+            downsample: Reduce the window's rows to plot size as they are read,
+                by time bucket (see :py:class:`~roboto.formats.Downsample`).
+                Batches are folded into per-bucket aggregates as they decode,
+                so memory stays proportional to the result rather than the window.
+                The result arrives as one time-sorted batch whose struct fields
+                are flattened into dot-delimited leaf columns. ``None`` returns every row.
+            where: Keep only the rows this :py:class:`pyarrow.compute.Expression` is true for,
+                e.g. ``pc.field("battery", "voltage") < 11.0``. It is evaluated over the
+                projected fields (referencing any other field raises ``pyarrow.ArrowInvalid``)
+                as the data decodes: Parquet row groups whose column statistics rule it out
+                are never fetched, and every decoded batch is filtered before it is buffered.
+                When ``downsample`` is also given, only matching rows are downsampled.
+                ``None`` keeps every row in the window.
+            cache_results: Cache the decoded rows on local disk, under a ``decoded``
+                subdirectory of ``cache_dir``, and serve a later read of the same
+                window, fields, and ``where`` from them. Such a read still resolves
+                its read plan, which names the files that back the window, but when the plan is
+                unchanged no file is fetched or decoded: the cached Arrow IPC files are
+                memory-mapped and their batches returned without copying. ``downsample``
+                is applied after the cache, so reads that differ only in it share an entry.
+                The cache counts toward the limits set by
+                :py:func:`~roboto.storage.configure_cache_limits`.
 
         Yields:
             :py:class:`pyarrow.RecordBatch` instances holding the in-window
@@ -370,6 +408,31 @@ class Topic:
             ...     fields_exclude=[("angular_velocity", "y")],
             ... ):
             ...     print(batch.to_pylist())
+
+            Read a day of IMU data as about 2,000 points that preserve its shape:
+
+            >>> from roboto.formats import Downsample, DownsampleMethod
+            >>> for batch in topic.get_data_as_record_batches(
+            ...     start_time=t0,
+            ...     end_time=t1,
+            ...     downsample=Downsample(target_points=2000, method=DownsampleMethod.LTTB),
+            ... ):
+            ...     print(batch.num_rows)
+
+            Find the moments the battery sagged:
+
+            >>> import pyarrow.compute as pc
+            >>> for batch in topic.get_data_as_record_batches(
+            ...     start_time=t0,
+            ...     end_time=t1,
+            ...     where=pc.field("battery", "voltage") < 11.0,
+            ... ):
+            ...     print(batch.num_rows)
+
+            Re-read the same window repeatedly without re-fetching it:
+
+            >>> for _ in range(3):
+            ...     batches = list(topic.get_data_as_record_batches(start_time=t0, end_time=t1, cache_results=True))
         """
         plan = self.__resolve_read_plan(
             start_time=start_time,
@@ -385,37 +448,26 @@ class Topic:
         if not plan.partitions:
             return
 
-        schema_fields = self.__fetch_schema_fields(plan)
-        projection_paths = _resolve_projection_paths(plan, schema_fields)
+        resolved_cache_dir = _resolve_topic_data_cache_dir(cache_dir)
 
-        resolved_cache_dir = (
-            pathlib.Path(cache_dir)
-            if cache_dir is not None
-            # A fresh RobotoEnv reads ROBOTO_CACHE_DIR as of this call, falling back to the
-            # platform-conventional per-user cache directory; ensure_exists=False never creates it.
-            else resolve_cache_dir(RobotoEnv(), ensure_exists=False) / TOPIC_DATA_CACHE_SUBDIR
-        )
-
-        # Mint every scan task's signed URL concurrently, each decode worker blocks only on its own URL's future.
-        url_executor, url_futures = self.__prefetch_signed_urls(plan, cache_policy, resolved_cache_dir)
-        try:
-
-            def signed_url_resolver(fs_node_id: str) -> str:
-                future = url_futures.get(fs_node_id)
-                return future.result() if future is not None else self.__signed_url_for_file(fs_node_id)
-
-            decoder = make_scan_task_decoder(
-                ScanTaskDecodeParams(
-                    signed_url_resolver=signed_url_resolver,
-                    cache_policy=cache_policy,
-                    cache_dir=resolved_cache_dir,
+        batches: collections.abc.Iterable[pyarrow.RecordBatch]
+        if not cache_results:
+            batches = self.__decode_plan(plan, cache_policy, resolved_cache_dir, where)
+        else:
+            result_cache_dir = resolved_cache_dir / RESULT_CACHE_SUBDIR
+            result_key = result_cache_key(plan, where)
+            cached = read_cached_result(result_cache_dir, result_key)
+            if cached is not None:
+                batches = cached
+            else:
+                batches = caching_result(
+                    self.__decode_plan(plan, cache_policy, resolved_cache_dir, where), result_cache_dir, result_key
                 )
-            )
 
-            yield from plan_execution.execute_plan(plan, projection_paths, decoder)
-        finally:
-            if url_executor is not None:
-                url_executor.shutdown(wait=False, cancel_futures=True)
+        if downsample is None:
+            yield from batches
+        else:
+            yield from _downsample_batches(batches, downsample, plan)
 
     def get_data_as_df(
         self,
@@ -431,6 +483,9 @@ class Topic:
         flatten: bool = False,
         cache_policy: CachePolicy = CachePolicy.ADAPTIVE,
         cache_dir: typing.Union[str, pathlib.Path, None] = None,
+        downsample: typing.Optional[Downsample] = None,
+        where: typing.Optional[pyarrow.compute.Expression] = None,
+        cache_results: bool = False,
     ) -> pandas.DataFrame:
         """Return this topic's data within a time window as a pandas DataFrame.
 
@@ -463,6 +518,9 @@ class Topic:
                 When ``False``, each struct-typed field is a single object-dtype column of dicts.
             cache_policy: See :py:meth:`get_data_as_record_batches`.
             cache_dir: See :py:meth:`get_data_as_record_batches`.
+            downsample: See :py:meth:`get_data_as_record_batches`.
+            where: See :py:meth:`get_data_as_record_batches`.
+            cache_results: See :py:meth:`get_data_as_record_batches`.
 
         Returns:
             DataFrame of the in-window rows indexed by a timezone-aware ``DatetimeIndex``.
@@ -492,6 +550,9 @@ class Topic:
                 timeline_source_name=timeline_source_name,
                 cache_policy=cache_policy,
                 cache_dir=cache_dir,
+                downsample=downsample,
+                where=where,
+                cache_results=cache_results,
             )
         )
 
@@ -520,20 +581,173 @@ class Topic:
         df.index.name = "_index"
         return df
 
+    def get_data_as_dataset(
+        self,
+        start_time: typing.Optional[Time] = None,
+        end_time: typing.Optional[Time] = None,
+        fields_include: typing.Optional[collections.abc.Iterable[FieldAddressLike]] = None,
+        fields_exclude: typing.Optional[collections.abc.Iterable[FieldAddressLike]] = None,
+        prefer: typing.Optional[RepresentationPreference] = None,
+        schema_id: typing.Optional[str] = None,
+        schema_checksum: typing.Optional[str] = None,
+        timeline_source_id: typing.Optional[str] = None,
+        timeline_source_name: typing.Optional[str] = None,
+        cache_policy: CachePolicy = CachePolicy.ADAPTIVE,
+        cache_dir: typing.Union[str, pathlib.Path, None] = None,
+        schema: typing.Optional[pyarrow.Schema] = None,
+    ) -> TopicDataset:
+        """Return this topic's data within a time window as a dataset that query engines scan with pushdown.
+
+        The :py:class:`~roboto.experimental.topics.TopicDataset` offers the scan
+        methods of :py:class:`pyarrow.dataset.Dataset` and the Arrow C stream
+        protocol, so pyarrow, Polars, and DuckDB can query the topic. Nothing is
+        read until it is scanned. Each scan resolves its own read plan, requesting
+        only the columns it selects or filters on, over only the part of the window
+        its filter on the timestamp column allows, with any other filter pushed
+        down as :py:meth:`get_data_as_record_batches`'s ``where``. Each read-plan
+        partition is a fragment (see :py:meth:`TopicDataset.get_fragments`).
+
+        The dataset's columns are this topic's top-level projected fields plus the
+        timestamp column, as in :py:meth:`get_data_as_record_batches`. Row order is
+        as documented there.
+
+        Requires the ``roboto[analytics]`` extra.
+
+        Args:
+            start_time: See :py:meth:`get_data_as_record_batches`. A scan filter
+                can narrow the window, never widen it.
+            end_time: See :py:meth:`get_data_as_record_batches`.
+            fields_include: See :py:meth:`get_data_as_record_batches`. A scan's
+                column selection narrows it.
+            fields_exclude: See :py:meth:`get_data_as_record_batches`.
+            prefer: See :py:meth:`get_data_as_record_batches`.
+            schema_id: See :py:meth:`get_data_as_record_batches`.
+            schema_checksum: See :py:meth:`get_data_as_record_batches`.
+            timeline_source_id: See :py:meth:`get_data_as_record_batches`.
+            timeline_source_name: See :py:meth:`get_data_as_record_batches`.
+            cache_policy: See :py:meth:`get_data_as_record_batches`.
+            cache_dir: See :py:meth:`get_data_as_record_batches`.
+            schema: The dataset's Arrow schema. ``None`` discovers it from the
+                first batch the window decodes to, when it is first needed; pass it
+                to skip that read, or to fix the types of columns whose types vary
+                across partitions.
+
+        Returns:
+            A :py:class:`~roboto.experimental.topics.TopicDataset` over the window.
+
+        Raises:
+            ValueError: The window cannot be resolved; see :py:meth:`get_data_as_record_batches`.
+
+        Examples:
+            Scan one field over part of a window with pyarrow:
+
+            >>> import pyarrow.compute as pc
+            >>> from roboto.experimental.topics import Topic
+            >>> dataset = Topic.from_id("ti_abc123").get_data_as_dataset(start_time=t0, end_time=t1)
+            >>> table = dataset.to_table(
+            ...     columns=["_index", "battery"],
+            ...     filter=(pc.field("_index") >= t0 + 10**9) & (pc.field("battery", "voltage") < 11.0),
+            ... )
+
+            Query it lazily with Polars:
+
+            >>> import polars as pl
+            >>> df = pl.scan_pyarrow_dataset(dataset).filter(pl.col("_index") >= t0 + 10**9).collect()
+        """
+        start_ns, end_ns = self.__resolve_window(start_time, end_time)
+        # Coerced once up front: each scan resolves a plan from them, and an iterator argument reads only once.
+        coerced_include = _coerce_field_addresses(fields_include)
+        coerced_exclude = _coerce_field_addresses(fields_exclude)
+        resolved_cache_dir = _resolve_topic_data_cache_dir(cache_dir)
+
+        def resolve_plan(window: TimeWindow, columns: typing.Optional[frozenset[str]]) -> ReadPlan:
+            return self.__resolve_read_plan(
+                start_time=window.start,
+                end_time=window.end,
+                fields_include=coerced_include if columns is None else _narrow_fields_include(coerced_include, columns),
+                fields_exclude=coerced_exclude,
+                prefer=prefer,
+                schema_id=schema_id,
+                schema_checksum=schema_checksum,
+                timeline_source_id=timeline_source_id,
+                timeline_source_name=timeline_source_name,
+            )
+
+        def decode_plan(
+            plan: ReadPlan,
+            columns: typing.Optional[frozenset[str]],
+            where: typing.Optional[pyarrow.compute.Expression],
+        ) -> collections.abc.Iterator[pyarrow.RecordBatch]:
+            return self.__decode_plan(plan, cache_policy, resolved_cache_dir, where, columns)
+
+        return TopicDataset(resolve_plan, decode_plan, TimeWindow(start=start_ns, end=end_ns), schema=schema)
+
     def set_context(self, session_context: typing.Optional[SessionContext]) -> None:
         self.__session_context = session_context
 
+    def __decode_plan(
+        self,
+        plan: ReadPlan,
+        cache_policy: CachePolicy,
+        cache_dir: pathlib.Path,
+        where: typing.Optional[pyarrow.compute.Expression],
+        columns: typing.Optional[collections.abc.Set[str]] = None,
+    ) -> collections.abc.Generator[pyarrow.RecordBatch, None, None]:
+        """Fetch and decode the files a non-empty plan names, yielding its rows as RecordBatches.
+
+        ``columns`` narrows the plan's projection to the named top-level fields; when
+        it names none of them, the whole projection is read.
+        """
+        schema_fields = self.__fetch_schema_fields(plan)
+        projection_paths = _resolve_projection_paths(plan, schema_fields)
+        if columns is not None:
+            projection_paths = [path for path in projection_paths if path[0] in columns] or projection_paths
+
+        # Mint every scan task's signed URL in bulk on the shared read scheduler;
+        # each decode blocks only on the batch holding its URL (or mints that batch
+        # itself, if no worker has reached it yet).
+        scheduler = shared_read_scheduler()
+        read_id = scheduler.new_read_id()
+        url_tasks = self.__prefetch_signed_urls(plan, cache_policy, cache_dir, scheduler, read_id)
+        try:
+
+            def signed_url_resolver(fs_node_id: str) -> str:
+                task = url_tasks.get(fs_node_id)
+                return task.result()[fs_node_id] if task is not None else self.__signed_url_for_file(fs_node_id)
+
+            decoder = make_scan_task_decoder(
+                ScanTaskDecodeParams(
+                    signed_url_resolver=signed_url_resolver,
+                    cache_policy=cache_policy,
+                    cache_dir=cache_dir,
+                )
+            )
+
+            yield from plan_execution.execute_plan(plan, projection_paths, decoder, read_id=read_id, predicate=where)
+        finally:
+            for task in url_tasks.values():
+                task.cancel()
+
     def __fetch_schema_fields(self, plan: ReadPlan) -> list[SchemaFieldRecord]:
-        """Fetch every declared field for the plan's schema."""
+        """Fetch every declared field for the plan's schema, from the shared cache by checksum when present."""
         if plan.schema_ is None:
             # The plan model documents `schema` as set exactly when the plan is
             # non-empty, and the caller only gets here with partitions present.
             raise RobotoInternalException("Read plan has partitions but names no schema.")
 
-        return self.__roboto_client.get(
+        schema_cache = shared_schema_field_cache()
+        if schema_cache is not None:
+            cached = schema_cache.get(self.org_id, plan.schema_.checksum)
+            if cached is not None:
+                return list(cached)
+
+        fields = self.__roboto_client.get(
             f"v2/topics/schema/id/{plan.schema_.schema_id}/fields",
             owner_org_id=self.org_id,
         ).to_record_list(SchemaFieldRecord)
+        if schema_cache is not None:
+            schema_cache.put(self.org_id, plan.schema_.checksum, fields)
+        return fields
 
     def __resolve_read_plan(
         self,
@@ -547,22 +761,7 @@ class Topic:
         timeline_source_id: typing.Optional[str],
         timeline_source_name: typing.Optional[str],
     ) -> ReadPlan:
-        start_ns = (
-            to_epoch_nanoseconds(start_time)
-            if start_time is not None
-            else (self.__session_context.start_time if self.__session_context else None)
-        )
-        end_ns = (
-            to_epoch_nanoseconds(end_time)
-            if end_time is not None
-            else (self.__session_context.end_time if self.__session_context else None)
-        )
-        if start_ns is None or end_ns is None:
-            raise ValueError(
-                "start_time and end_time are required; they default to the session's time window only "
-                "for a topic obtained from Session.list_topics() or Session.get_topic() "
-                "(and only when that session has bounds)."
-            )
+        start_ns, end_ns = self.__resolve_window(start_time, end_time)
         request = ReadPlanRequest(
             start_time=start_ns,
             end_time=end_ns,
@@ -575,23 +774,41 @@ class Topic:
             timeline_source_name=timeline_source_name,
             session_id=self.__session_context.session_id if self.__session_context else None,
         )
-        return self.__roboto_client.post(
+        # Identical back-to-back requests (e.g. re-reading a window while scrubbing) reuse a
+        # plan resolved moments ago rather than posting the request again.
+        memo = shared_read_plan_memo()
+        request_key = request.model_dump_json()
+        if memo is not None:
+            memoized = memo.get(self.__roboto_client, self.org_id, self.topic_id, request_key)
+            if memoized is not None:
+                return memoized
+
+        plan = self.__roboto_client.post(
             f"v2/topics/id/{self.topic_id}/read-plan",
             data=request,
             owner_org_id=self.org_id,
         ).to_record(ReadPlan)
+        if memo is not None:
+            memo.put(self.__roboto_client, self.org_id, self.topic_id, request_key, plan)
+        return plan
 
     def __prefetch_signed_urls(
         self,
         plan: ReadPlan,
         cache_policy: CachePolicy,
         cache_dir: pathlib.Path,
-    ) -> tuple[typing.Optional[concurrent.futures.ThreadPoolExecutor], dict[str, concurrent.futures.Future[str]]]:
-        """Start minting, concurrently, the signed URLs every scan task will need.
-
-        Returns the minting executor (``None`` when nothing needs a URL) and one
-        future per file id; the caller blocks on individual futures as decode
-        reaches each file, and owns shutting the executor down.
+        scheduler: ReadScheduler,
+        read_id: int,
+    ) -> dict[str, ScheduledTask[dict[str, str]]]:
+        """Start minting, in bulk, the signed URLs every scan task will need.
+
+        Files are taken in the order decode first needs them and minted
+        :py:data:`~roboto.storage.SIGNED_URL_BATCH_SIZE` at a time, one API call
+        per batch (or concurrent single-file calls, against an API without the
+        bulk route). Returns each file id's batch task; the caller blocks on a
+        batch as decode reaches one of its files, and cancels the rest when done.
+        Each batch is queued at the plan position of the first partition that
+        reads any of its files, so batches are minted in the order decode needs them.
 
         A Parquet scan task whose file is already in the local cache is read
         from disk and never mints a URL, so it is skipped here to avoid a wasted
@@ -599,27 +816,89 @@ class Topic:
         resolver falls back to a direct mint for any id missing from this map, so
         a skipped file that nonetheless ends up streaming stays correct.
         """
-        fs_node_ids: set[str] = set()
-        for partition in plan.partitions:
+        first_positions: dict[str, int] = {}
+        for position, partition in enumerate(plan.partitions):
             for scan_task in partition.scan_tasks:
                 fs_node_id = scan_task.object.fs_node_id
                 if scan_task.format == RepresentationStorageFormat.PARQUET:
                     cached_outfile = cache_dir / CACHED_PARQUET_NAME_PATTERN.format(fs_node_id=fs_node_id)
                     if cache_policy is not CachePolicy.NEVER and cached_outfile.exists():
                         continue
-                fs_node_ids.add(fs_node_id)
+                first_positions.setdefault(fs_node_id, position)
+
+        # Insertion order is plan order, so each batch's first file has its lowest position.
+        ordered = list(first_positions.items())
+        tasks: dict[str, ScheduledTask[dict[str, str]]] = {}
+        for start in range(0, len(ordered), SIGNED_URL_BATCH_SIZE):
+            batch = ordered[start : start + SIGNED_URL_BATCH_SIZE]
+            fs_node_ids = [fs_node_id for fs_node_id, _ in batch]
+            task = scheduler.submit(self.__signed_urls_for_files, fs_node_ids, priority=(batch[0][1], read_id))
+            tasks.update(dict.fromkeys(fs_node_ids, task))
+        return tasks
+
+    def __resolve_window(self, start_time: typing.Optional[Time], end_time: typing.Optional[Time]) -> tuple[int, int]:
+        """Resolve a read's window bounds to epoch nanoseconds, defaulting to the session's bounds."""
+        start_ns = (
+            to_epoch_nanoseconds(start_time)
+            if start_time is not None
+            else (self.__session_context.start_time if self.__session_context else None)
+        )
+        end_ns = (
+            to_epoch_nanoseconds(end_time)
+            if end_time is not None
+            else (self.__session_context.end_time if self.__session_context else None)
+        )
+        if start_ns is None or end_ns is None:
+            raise ValueError(
+                "start_time and end_time are required; they default to the session's time window only "
+                "for a topic obtained from Session.list_topics() or Session.get_topic() "
+                "(and only when that session has bounds)."
+            )
+        return start_ns, end_ns
+
+    def __signed_url_for_file(self, fs_node_id: str) -> str:
+        return signed_url_for_file(self.__roboto_client, fs_node_id)
 
-        if not fs_node_ids:
-            return None, {}
+    def __signed_urls_for_files(self, fs_node_ids: list[str]) -> dict[str, str]:
+        return signed_urls_for_files(self.__roboto_client, fs_node_ids)
 
-        executor = concurrent.futures.ThreadPoolExecutor(max_workers=min(_MAX_SIGNED_URL_WORKERS, len(fs_node_ids)))
-        return executor, {
-            fs_node_id: executor.submit(self.__signed_url_for_file, fs_node_id) for fs_node_id in fs_node_ids
-        }
 
-    def __signed_url_for_file(self, fs_node_id: str) -> str:
-        response = self.__roboto_client.get(f"v1/files/{fs_node_id}/signed-url")
-        return response.to_dict(json_path=["data", "url"])
+def _downsample_batches(
+    batches: collections.abc.Iterable["pyarrow.RecordBatch"], downsample: Downsample, plan: ReadPlan
+) -> collections.abc.Generator["pyarrow.RecordBatch", None, None]:
+    """Fold decoded batches into one downsampled batch, yielding nothing when no rows were read."""
+    pa = import_optional_dependency("pyarrow", "analytics")
+
+    downsampler = Downsampler(downsample, start_time=plan.window.start, end_time=plan.window.end)
+    for batch in batches:
+        timestamp_index = batch_transforms.timestamp_column_index(batch.schema)
+        downsampler.add(batch.column(timestamp_index), batch.remove_column(timestamp_index))
+
+    timestamps, values = downsampler.finish()
+    if len(timestamps) == 0:
+        return
+
+    ts_name = batch_transforms.TIMESTAMP_FIELD_NAME
+    while ts_name in values.column_names:
+        ts_name += "_"
+    fields = [batch_transforms.timestamp_field(ts_name), *values.schema]
+    arrays = [timestamps, *(column.combine_chunks() for column in values.columns)]
+    yield pa.RecordBatch.from_arrays(arrays, schema=pa.schema(fields))
+
+
+def _narrow_fields_include(
+    fields_include: typing.Optional[tuple[FieldAddress, ...]], columns: collections.abc.Set[str]
+) -> tuple[FieldAddress, ...]:
+    """Narrow a read's field inclusions to the top-level fields named by ``columns``.
+
+    An inclusion addressed by ``field_id`` cannot be placed without resolving it, so
+    it is kept. When nothing is left (or nothing was included, or the schema root
+    was), the columns themselves are included.
+    """
+    if fields_include is None or any(address.path == () for address in fields_include):
+        return tuple(FieldAddress(path=(name,)) for name in sorted(columns))
+    narrowed = tuple(address for address in fields_include if address.path is None or address.path[0] in columns)
+    return narrowed or tuple(FieldAddress(path=(name,)) for name in sorted(columns))
 
 
 def _resolve_projection_paths(
@@ -635,6 +914,15 @@ def _resolve_projection_paths(
     return [field.path for field in plan.projection.fields or ()]
 
 
+def _resolve_topic_data_cache_dir(cache_dir: typing.Union[str, pathlib.Path, None]) -> pathlib.Path:
+    """The directory topic data files are cached under: ``cache_dir``, or the SDK default."""
+    if cache_dir is not None:
+        return pathlib.Path(cache_dir)
+    # A fresh RobotoEnv reads ROBOTO_CACHE_DIR as of this call, falling back to the
+    # platform-conventional per-user cache directory; ensure_exists=False never creates it.
+    return resolve_cache_dir(RobotoEnv(), ensure_exists=False) / TOPIC_DATA_CACHE_SUBDIR
+
+
 def _coerce_field_addresses(
     addresses: typing.Optional[collections.abc.Iterable[FieldAddressLike]],
 ) -> typing.Optional[tuple[FieldAddress, ...]]:
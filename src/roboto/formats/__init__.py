@@ -8,13 +8,26 @@
 
 This package decodes MCAP and Parquet topic data into Roboto's nested row /
 Arrow representation: per-format parsing and read planning, field projection,
-and timestamp extraction. The byte-transport it builds on (HTTP range reads,
-local disk caching, sparse buffering) lives in ``roboto.storage``; this package
-depends on the topic record and message-path types in ``roboto.domain.topics``
-without depending back on the topic readers, so the readers in both
-``roboto.domain.topics`` and ``roboto.experimental.topics`` build on it.
+timestamp extraction, and time-bucketed downsampling of the decoded batches.
+The byte-transport it builds on (HTTP range reads, local disk caching, sparse
+buffering) lives in ``roboto.storage``; this package depends on the topic
+record and message-path types in ``roboto.domain.topics`` without depending
+back on the topic readers, so the readers in both ``roboto.domain.topics`` and
+``roboto.experimental.topics`` build on it.
 """
 
+from .downsample import (
+    LTTB_CANDIDATE_BUCKETS_PER_POINT,
+    Downsample,
+    DownsampleMethod,
+    Downsampler,
+)
 from .fields import FieldSelection
 
-__all__ = ("FieldSelection",)
+__all__ = (
+    "LTTB_CANDIDATE_BUCKETS_PER_POINT",
+    "Downsample",
+    "DownsampleMethod",
+    "Downsampler",
+    "FieldSelection",
+)
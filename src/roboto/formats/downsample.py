@@ -0,0 +1,393 @@
+# Copyright (c) 2026 Roboto Technologies, Inc.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Time-bucketed downsampling of topic data, applied batch by batch as it is read.
+
+Plotting hours of a high-rate topic needs a few thousand points, not every row.
+A :py:class:`Downsampler` folds each decoded batch into per-bucket partial
+aggregates as it arrives and discards the batch, so a read holds one batch plus
+a plot-sized summary at a time rather than the whole window.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import enum
+import math
+import typing
+
+from ..compat import import_optional_dependency
+
+if typing.TYPE_CHECKING:
+    import numpy  # pants: no-infer-dep
+    import pyarrow  # pants: no-infer-dep
+
+LTTB_CANDIDATE_BUCKETS_PER_POINT = 4
+"""Time buckets per requested point that :py:attr:`DownsampleMethod.LTTB` keeps candidate rows for.
+
+Each bucket keeps its earliest, latest, lowest, and highest row, which preserves
+the series' visual envelope, so LTTB runs at the end over at most 16 candidate
+rows per requested point instead of over every row read."""
+
+_BUCKET = "__roboto_bucket"
+_TIMESTAMP = "__roboto_timestamp"
+_PARTIAL_PREFIX = "__roboto_partial"
+
+_PartialAggregation = typing.Literal["min", "max", "sum"]
+"""Arrow aggregate functions that merge partials of the same bucket."""
+
+
+class DownsampleMethod(str, enum.Enum):
+    """How the rows falling in one time bucket are reduced to one output row."""
+
+    MIN = "min"
+    """Each numeric column's minimum, at the bucket's start time."""
+
+    MAX = "max"
+    """Each numeric column's maximum, at the bucket's start time."""
+
+    MEAN = "mean"
+    """Each numeric column's mean over its non-null values, at the bucket's start time."""
+
+    FIRST = "first"
+    """The bucket's earliest row, at its own timestamp."""
+
+    LAST = "last"
+    """The bucket's latest row, at its own timestamp."""
+
+    LTTB = "lttb"
+    """Largest-Triangle-Three-Buckets: the rows, at their own timestamps, that best
+    preserve the shape of :py:attr:`Downsample.value_field` when drawn as a line."""
+
+
+@dataclasses.dataclass(frozen=True)
+class Downsample:
+    """Reduce topic data to plot size while it is read.
+
+    Give exactly one of ``bucket_width`` or ``target_points``. Buckets are
+    aligned to the read's start time. With ``target_points`` the bucket width is
+    the window's length divided by the point count, or, when the window is
+    unbounded, is derived from the data and doubled as more arrives, so the
+    result never exceeds ``target_points`` rows.
+
+    Under ``MIN``, ``MAX`` and ``MEAN``, columns that are not integer or
+    floating point (strings, booleans, lists) carry the value from the bucket's
+    earliest row. Struct-typed fields are flattened into dot-delimited leaf
+    columns (e.g. ``pose.position.x``) in every method.
+
+    Examples:
+        >>> from roboto.formats import Downsample, DownsampleMethod
+        >>> Downsample(target_points=2000, method=DownsampleMethod.LTTB, value_field="linear_acceleration.x")
+        >>> Downsample(bucket_width=1_000_000_000, method=DownsampleMethod.MEAN)  # one row per second
+    """
+
+    method: DownsampleMethod = DownsampleMethod.MEAN
+    """How each bucket's rows are reduced."""
+
+    bucket_width: typing.Optional[int] = None
+    """Width of each time bucket, in nanoseconds."""
+
+    target_points: typing.Optional[int] = None
+    """Most rows to return."""
+
+    value_field: typing.Optional[str] = None
+    """Dot-delimited column ``LTTB`` selects rows by. ``None`` uses the first numeric column.
+    Other methods ignore it."""
+
+    def __post_init__(self) -> None:
+        if (self.bucket_width is None) == (self.target_points is None):
+            raise ValueError("Exactly one of bucket_width or target_points must be given")
+        if self.bucket_width is not None and self.bucket_width < 1:
+            raise ValueError(f"bucket_width must be at least 1, got {self.bucket_width}")
+        if self.target_points is not None and self.target_points < 1:
+            raise ValueError(f"target_points must be at least 1, got {self.target_points}")
+        if self.method is DownsampleMethod.LTTB and (self.target_points is None or self.target_points < 3):
+            raise ValueError("DownsampleMethod.LTTB requires target_points of at least 3")
+
+
+class Downsampler:
+    """Folds batches of topic data into a :py:class:`Downsample` result, one batch at a time.
+
+    Call :py:meth:`add` with each decoded batch in any order, then :py:meth:`finish`.
+    Memory is bounded by one batch plus the per-bucket state, which is about
+    the size of the result.
+    """
+
+    def __init__(
+        self,
+        downsample: Downsample,
+        start_time: typing.Optional[int] = None,
+        end_time: typing.Optional[int] = None,
+    ):
+        """
+        Args:
+            downsample: What to compute.
+            start_time: The read's lower time bound in nanoseconds, which buckets
+                are aligned to, or ``None`` to align them to the earliest row seen first.
+            end_time: The read's upper time bound in nanoseconds, or ``None`` if unbounded.
+        """
+        self.__downsample = downsample
+        self.__origin = start_time
+        self.__width = downsample.bucket_width
+        self.__max_buckets: typing.Optional[int] = None
+        if downsample.target_points is not None:
+            self.__max_buckets = downsample.target_points
+            if downsample.method is DownsampleMethod.LTTB:
+                self.__max_buckets *= LTTB_CANDIDATE_BUCKETS_PER_POINT
+            if start_time is not None and end_time is not None and end_time > start_time:
+                self.__width = max(1, math.ceil((end_time - start_time + 1) / self.__max_buckets))
+        # Column name -> whether it aggregates numerically, in first-seen order.
+        self.__columns: dict[str, bool] = {}
+        # Partial-aggregate column name -> how partials of it merge.
+        self.__partials: dict[str, _PartialAggregation] = {}
+        self.__value_field = downsample.value_field
+        self.__state: typing.Optional[pyarrow.Table] = None
+
+    def add(self, timestamps: pyarrow.Array, values: typing.Union[pyarrow.Table, pyarrow.RecordBatch]) -> None:
+        """Fold one batch into the result.
+
+        Args:
+            timestamps: Each row's timestamp, in nanoseconds since the Unix epoch.
+                Rows whose timestamp is null are skipped.
+            values: The rows, one per timestamp.
+
+        Raises:
+            ValueError: ``LTTB`` was asked to select by a column the data does not have, or has no numeric column.
+        """
+        np = import_optional_dependency("numpy", "analytics")
+        pa = import_optional_dependency("pyarrow", "analytics")
+
+        table = typing.cast(
+            "pyarrow.Table", pa.Table.from_batches([values]) if isinstance(values, pa.RecordBatch) else values
+        )
+        if timestamps.null_count:
+            table = table.filter(timestamps.is_valid())
+            timestamps = timestamps.drop_null()
+        if len(timestamps) == 0:
+            return
+        table = _flatten(table)
+        ts = np.asarray(timestamps.to_numpy(zero_copy_only=False), dtype=np.int64)
+
+        if self.__origin is None:
+            self.__origin = int(ts.min())
+        if self.__width is None:
+            max_buckets = typing.cast(int, self.__max_buckets)
+            self.__width = max(1, math.ceil((int(ts.max()) - self.__origin + 1) / max_buckets))
+        for field in table.schema:
+            if field.name not in self.__columns and not pa.types.is_null(field.type):
+                self.__columns[field.name] = pa.types.is_integer(field.type) or pa.types.is_floating(field.type)
+
+        buckets = np.floor_divide(ts - self.__origin, self.__width)
+        rows = table.append_column(_TIMESTAMP, pa.array(ts, pa.int64())).append_column(
+            _BUCKET, pa.array(buckets, pa.int64())
+        )
+        if self.__downsample.method in (DownsampleMethod.MIN, DownsampleMethod.MAX, DownsampleMethod.MEAN):
+            rows = self.__to_partials(rows)
+        elif self.__downsample.method is DownsampleMethod.LTTB:
+            rows = rows.filter(rows.column(self.__lttb_value_field()).is_valid())
+
+        self.__state = rows if self.__state is None else _concat(self.__state, rows)
+        self.__state = self.__reduce(self.__state)
+        if self.__max_buckets is not None:
+            while len(_unique_buckets(self.__state)) > self.__max_buckets:
+                self.__width *= 2
+                halved = np.floor_divide(self.__state.column(_BUCKET).to_numpy(), 2)
+                self.__state = self.__reduce(
+                    self.__state.set_column(
+                        self.__state.schema.get_field_index(_BUCKET), _BUCKET, pa.array(halved, pa.int64())
+                    )
+                )
+
+    def finish(self) -> tuple[pyarrow.Array, pyarrow.Table]:
+        """The downsampled rows, in time order.
+
+        Returns:
+            ``(timestamps, values)``: each output row's timestamp in nanoseconds
+            since the Unix epoch, and a table of the rows with one column per
+            (flattened) field, in the order the fields were first seen.
+        """
+        pa = import_optional_dependency("pyarrow", "analytics")
+
+        method = self.__downsample.method
+        state = self.__state
+        if state is None or state.num_rows == 0:
+            return pa.array([], pa.int64()), pa.table({})
+
+        names = list(self.__columns)
+        if method in (DownsampleMethod.FIRST, DownsampleMethod.LAST):
+            return state.column(_TIMESTAMP).combine_chunks(), _select(state, names)
+        if method is DownsampleMethod.LTTB:
+            target_points = typing.cast(int, self.__downsample.target_points)
+            state = state.take(_lttb(state, self.__lttb_value_field(), target_points))
+            return state.column(_TIMESTAMP).combine_chunks(), _select(state, names)
+        return self.__from_partials(state, names)
+
+    def __lttb_value_field(self) -> str:
+        if self.__value_field is None:
+            self.__value_field = next((name for name, numeric in self.__columns.items() if numeric), None)
+            if self.__value_field is None:
+                raise ValueError("DownsampleMethod.LTTB needs a numeric column to select rows by; none was read")
+        elif self.__value_field not in self.__columns:
+            raise ValueError(f"value_field {self.__value_field!r} is not a column of the data read")
+        elif not self.__columns[self.__value_field]:
+            raise ValueError(f"value_field {self.__value_field!r} is not numeric")
+        return self.__value_field
+
+    def __to_partials(self, rows: pyarrow.Table) -> pyarrow.Table:
+        """Restate raw rows as single-row partial aggregates, which :py:meth:`__reduce` merges."""
+        pa = import_optional_dependency("pyarrow", "analytics")
+        pc = import_optional_dependency("pyarrow.compute", "analytics")
+
+        method = self.__downsample.method
+        columns: dict[str, typing.Any] = {_BUCKET: rows.column(_BUCKET), _TIMESTAMP: rows.column(_TIMESTAMP)}
+        for index, (name, numeric) in enumerate(self.__columns.items()):
+            if name not in rows.column_names:
+                continue
+            column = rows.column(name)
+            if not numeric:
+                columns[name] = column
+            elif method is DownsampleMethod.MEAN:
+                columns[self.__partial(index, "sum", "sum")] = column.cast(pa.float64())
+                columns[self.__partial(index, "count", "sum")] = pc.if_else(column.is_valid(), 1, 0).cast(pa.int64())
+            else:
+                aggregation: _PartialAggregation = "min" if method is DownsampleMethod.MIN else "max"
+                columns[self.__partial(index, aggregation, aggregation)] = column
+        return pa.table(columns)
+
+    def __partial(self, index: int, kind: str, aggregation: _PartialAggregation) -> str:
+        """Name of column ``index``'s ``kind`` partial, recorded as merging by ``aggregation``."""
+        name = f"{_PARTIAL_PREFIX}_{kind}_{index}"
+        self.__partials[name] = aggregation
+        return name
+
+    def __reduce(self, state: pyarrow.Table) -> pyarrow.Table:
+        """Merge every bucket's rows (or partials) into the state that method keeps per bucket."""
+        np = import_optional_dependency("numpy", "analytics")
+
+        method = self.__downsample.method
+        buckets = state.column(_BUCKET).to_numpy()
+        timestamps = state.column(_TIMESTAMP).to_numpy()
+        by_time = np.lexsort((timestamps, buckets))
+        starts, ends = _group_bounds(buckets[by_time])
+
+        if method is DownsampleMethod.FIRST:
+            return state.take(by_time[starts])
+        if method is DownsampleMethod.LAST:
+            return state.take(by_time[ends])
+        if method is DownsampleMethod.LTTB:
+            # Each bucket's earliest, latest, lowest, and highest row.
+            values = state.column(self.__lttb_value_field()).to_numpy(zero_copy_only=False).astype(np.float64)
+            by_value = np.lexsort((values, buckets))
+            value_starts, value_ends = _group_bounds(buckets[by_value])
+            keep = np.unique(
+                np.concatenate([by_time[starts], by_time[ends], by_value[value_starts], by_value[value_ends]])
+            )
+            return state.take(keep)
+
+        # MIN / MAX / MEAN: numeric partials aggregate per bucket; other columns keep the earliest row's value.
+        ordered = state.take(by_time)
+        present = set(ordered.column_names)
+        aggregations = [(name, aggregation) for name, aggregation in self.__partials.items() if name in present]
+        earliest = ordered.take(starts)
+        if not aggregations:
+            return earliest
+        aggregated = ordered.group_by(_BUCKET, use_threads=False).aggregate(aggregations).sort_by(_BUCKET)
+        for name, aggregation in aggregations:
+            earliest = earliest.set_column(
+                earliest.schema.get_field_index(name), name, aggregated.column(f"{name}_{aggregation}")
+            )
+        return earliest
+
+    def __from_partials(self, state: pyarrow.Table, names: list[str]) -> tuple[pyarrow.Array, pyarrow.Table]:
+        pa = import_optional_dependency("pyarrow", "analytics")
+        pc = import_optional_dependency("pyarrow.compute", "analytics")
+
+        state = state.sort_by(_BUCKET)
+        present = set(state.column_names)
+        method = self.__downsample.method
+        columns: dict[str, typing.Any] = {}
+        for index, (name, numeric) in enumerate(self.__columns.items()):
+            if not numeric:
+                if name in present:
+                    columns[name] = state.column(name)
+            elif method is DownsampleMethod.MEAN:
+                total = f"{_PARTIAL_PREFIX}_sum_{index}"
+                count = f"{_PARTIAL_PREFIX}_count_{index}"
+                if total in present:
+                    mean = pc.divide(state.column(total), state.column(count).cast(pa.float64()))
+                    has_values = pc.greater(state.column(count), 0)
+                    columns[name] = pc.if_else(has_values, mean, pa.scalar(None, pa.float64()))
+            elif f"{_PARTIAL_PREFIX}_{method.value}_{index}" in present:
+                columns[name] = state.column(f"{_PARTIAL_PREFIX}_{method.value}_{index}")
+        bucket_starts = pc.add(pc.multiply(state.column(_BUCKET), self.__width), self.__origin)
+        return bucket_starts.combine_chunks(), _select(pa.table(columns), names)
+
+
+def _flatten(table: pyarrow.Table) -> pyarrow.Table:
+    """Expand struct columns into dot-delimited leaf columns, recursively."""
+    pa = import_optional_dependency("pyarrow", "analytics")
+
+    while any(pa.types.is_struct(field.type) for field in table.schema):
+        table = table.flatten()
+    return table
+
+
+def _concat(left: pyarrow.Table, right: pyarrow.Table) -> pyarrow.Table:
+    pa = import_optional_dependency("pyarrow", "analytics")
+    return pa.concat_tables([left, right], promote_options="permissive")
+
+
+def _select(table: pyarrow.Table, names: list[str]) -> pyarrow.Table:
+    """``table``'s columns among ``names``, in that order."""
+    present = set(table.column_names)
+    return table.select([name for name in names if name in present])
+
+
+def _unique_buckets(state: pyarrow.Table) -> numpy.ndarray:
+    np = import_optional_dependency("numpy", "analytics")
+    return np.unique(state.column(_BUCKET).to_numpy())
+
+
+def _group_bounds(sorted_keys: numpy.ndarray) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """Index of the first and last element of each run of equal keys."""
+    np = import_optional_dependency("numpy", "analytics")
+
+    boundaries = np.flatnonzero(sorted_keys[1:] != sorted_keys[:-1]) + 1
+    starts = np.concatenate(([0], boundaries))
+    ends = np.concatenate((boundaries - 1, [len(sorted_keys) - 1]))
+    return starts, ends
+
+
+def _lttb(state: pyarrow.Table, value_field: str, target_points: int) -> numpy.ndarray:
+    """Indices, in time order, of the ``target_points`` rows LTTB selects from ``state``."""
+    np = import_optional_dependency("numpy", "analytics")
+
+    timestamps = state.column(_TIMESTAMP).to_numpy()
+    order = np.argsort(timestamps, kind="stable")
+    count = len(order)
+    if count <= target_points:
+        return order
+
+    # Offsets from the first timestamp keep float64 precise at nanosecond epochs.
+    x = (timestamps[order] - timestamps[order[0]]).astype(np.float64)
+    y = state.column(value_field).to_numpy(zero_copy_only=False).astype(np.float64)[order]
+
+    selected = [0]
+    anchor = 0
+    step = (count - 2) / (target_points - 2)
+    for bucket in range(target_points - 2):
+        start = int(bucket * step) + 1
+        end = int((bucket + 1) * step) + 1
+        next_end = min(int((bucket + 2) * step) + 1, count)
+        next_x = x[end:next_end].mean() if next_end > end else x[-1]
+        next_y = y[end:next_end].mean() if next_end > end else y[-1]
+        areas = np.abs(
+            (x[anchor] - next_x) * (y[start:end] - y[anchor]) - (x[anchor] - x[start:end]) * (next_y - y[anchor])
+        )
+        anchor = start + int(np.argmax(areas))
+        selected.append(anchor)
+    selected.append(count - 1)
+    return order[np.asarray(selected)]
@@ -21,11 +21,13 @@ from .accessor import (
     sequence_resolution,
     simple_resolution,
 )
+from .columnar import ColumnarMcapDecoder
 from .fetch import open_for_window
 from .reader import END_OF_STREAM, McapReader
 
 __all__ = (
     "Accessor",
+    "ColumnarMcapDecoder",
     "END_OF_STREAM",
     "McapReader",
     "Resolution",
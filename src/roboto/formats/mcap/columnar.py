@@ -0,0 +1,251 @@
+# Copyright (c) 2026 Roboto Technologies, Inc.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Columnar decoding of MCAP topic data straight into Arrow.
+
+:py:class:`~roboto.formats.mcap.reader.McapReader` decodes one message at a time
+into a nested ``dict`` and projects it through the accessors; that suits
+streaming consumers, but building a table that way costs several Python objects
+per field per message. :py:class:`ColumnarMcapDecoder` instead hands whole
+chunks to the Rust ``mcap_codec`` batch decoder, which decodes, projects, and
+window-filters them into Arrow columns without materializing any message.
+"""
+
+from __future__ import annotations
+
+import collections.abc
+import typing
+
+from ...compat import import_optional_dependency
+from ..fields import FieldSelection
+
+if typing.TYPE_CHECKING:
+    import mcap.summary  # pants: no-infer-dep
+    import pyarrow  # pants: no-infer-dep
+
+    from ...storage import HttpRangeReader
+
+COLUMNAR_SCHEMA_ENCODINGS = frozenset({"ros1msg", "ros2msg", "ros2idl", "omgidl"})
+"""Schema encodings :py:class:`ColumnarMcapDecoder` decodes.
+
+The ROS/CDR family, which :py:class:`~roboto.formats.mcap.reader.McapReader` also
+decodes with ``mcap_codec``, so both produce the same values. JSON and msgpack are
+left to the reader: it keeps ``json.loads`` semantics (``None`` for nulls, untyped
+lists, arbitrary-precision ints) that the codec's schema-typed columns do not.
+"""
+
+_LOG_TIME_COLUMN = "log_time"
+"""Requested name of the codec's log-time column; the codec renames it on a collision."""
+
+
+class ColumnarMcapDecoder:
+    """Decodes a projected time window of a single-schema MCAP file into an Arrow table.
+
+    Obtain one with :py:meth:`for_summary`. The table has a column per key of
+    :py:meth:`DecodedMessage.to_dict <roboto.formats.mcap.decoded_message.DecodedMessage.to_dict>`
+    output for the same fields, flattened depth first: struct members become
+    dot-joined columns (as :py:func:`pandas.json_normalize` names them), while
+    sequences stay single list-valued columns.
+    """
+
+    def __init__(
+        self,
+        decoder: typing.Any,
+        summary: mcap.summary.Summary,
+        paths: collections.abc.Sequence[tuple[str, ...]],
+    ):
+        self.__decoder = decoder
+        self.__summary = summary
+        self.__paths = paths
+
+    @classmethod
+    def for_summary(
+        cls,
+        summary: typing.Optional[mcap.summary.Summary],
+        fields: collections.abc.Sequence[FieldSelection],
+    ) -> typing.Optional[ColumnarMcapDecoder]:
+        """Build a decoder for a file, or return ``None`` if the file needs the message-wise reader.
+
+        Columnar decoding covers chunked, single-schema files in one of the
+        :py:data:`COLUMNAR_SCHEMA_ENCODINGS`, projected to fields the schema
+        declares under their exact names (which is what topic-data ingestion
+        produces). Anything else returns ``None``, including legacy ``nsec``
+        message paths into ROS2 time values, which only the reader's accessors remap.
+
+        Args:
+            summary: The file's summary section.
+            fields: Fields to project messages to.
+        """
+        if summary is None or not summary.chunk_indexes or len(summary.schemas) != 1 or not fields:
+            return None
+        (schema,) = summary.schemas.values()
+        if schema.encoding not in COLUMNAR_SCHEMA_ENCODINGS:
+            return None
+
+        # Imported lazily so the Rust extension loads only when a supported channel is read.
+        from mcap_codec import McapBatchDecoder
+
+        paths = [tuple(field.path_in_schema) for field in fields]
+        message_encoding = next(
+            channel.message_encoding for channel in summary.channels.values() if channel.schema_id == schema.id
+        )
+        try:
+            decoder = McapBatchDecoder(
+                schema.encoding,
+                message_encoding,
+                schema.data,
+                schema.name,
+                [list(path) for path in _root_most(paths)],
+                "log_time",
+                _LOG_TIME_COLUMN,
+                None,
+                None,
+            )
+        except Exception:
+            # The codec rejects a projected root the schema does not declare.
+            return None
+        # Deeper undeclared components come back as empty structs rather than an
+        # error, so check every path against the decoder's output schema.
+        empty = decoder.decode_chunks([], None, None)
+        if not all(_declares(empty.schema, path) for path in paths):
+            return None
+        return cls(decoder, summary, paths)
+
+    def decode_window(
+        self,
+        http_reader: HttpRangeReader,
+        start_time: typing.Optional[int] = None,
+        end_time: typing.Optional[int] = None,
+    ) -> tuple[pyarrow.Array, pyarrow.Table]:
+        """Decode the messages logged in ``[start_time, end_time)``.
+
+        Each in-window chunk is read from ``http_reader`` (fetching any bytes not
+        already prefetched, e.g. by :py:func:`~roboto.formats.mcap.open_for_window`),
+        decoded, and then dropped from the reader's memory.
+
+        Args:
+            http_reader: Reader over the file whose summary built this decoder.
+            start_time: Inclusive lower bound on log time in nanoseconds, or ``None`` for unbounded.
+            end_time: Exclusive upper bound on log time in nanoseconds, or ``None`` for unbounded.
+
+        Returns:
+            ``(log_times, values)``: each message's log time, and a table with one
+            row per message and one column per projected leaf, both in log-time
+            order. Messages sharing a log time keep their file order.
+        """
+        pa = import_optional_dependency("pyarrow", "analytics")
+        pc = import_optional_dependency("pyarrow.compute", "analytics")
+
+        chunk_indexes = sorted(
+            (
+                chunk_index
+                for chunk_index in self.__summary.chunk_indexes
+                if (start_time is None or chunk_index.message_end_time >= start_time)
+                and (end_time is None or chunk_index.message_start_time < end_time)
+            ),
+            key=lambda chunk_index: chunk_index.chunk_start_offset,
+        )
+        # The codec's window bounds are both inclusive.
+        codec_end_time = None if end_time is None else end_time - 1
+        batches = []
+        for chunk_index in chunk_indexes:
+            chunk_start = chunk_index.chunk_start_offset
+            chunk_end = chunk_start + chunk_index.chunk_length - 1
+            http_reader.prefetch_range(chunk_start, chunk_end)
+            chunk_bytes = bytes(http_reader.view(chunk_start, chunk_index.chunk_length))
+            http_reader.discard(chunk_start, chunk_end)
+            batches.append(self.__decoder.decode_chunks([chunk_bytes], start_time, codec_end_time))
+
+        table = pa.Table.from_batches(batches or [self.__decoder.decode_chunks([], None, None)])
+
+        ts_name = self.__decoder.timestamp_column_name
+        log_times = table.column(ts_name)
+        if len(log_times) > 1 and not pc.all(pc.greater_equal(log_times[1:], log_times[:-1])).as_py():
+            # Chunks may overlap in time and messages within a chunk need not be
+            # time-ordered; a stable sort keeps file order among equal log times.
+            table = table.take(pc.sort_indices(table, sort_keys=[(ts_name, "ascending")]))
+            log_times = table.column(ts_name)
+
+        values = table.drop_columns([ts_name])
+        while any(pa.types.is_struct(field.type) for field in values.schema):
+            values = values.flatten()
+        order = _column_order(self.__paths)
+        names = sorted(values.column_names, key=lambda name: _column_sort_key(name.split("."), order))
+        return log_times.combine_chunks(), values.select(names)
+
+
+def _declares(schema: pyarrow.Schema, path: tuple[str, ...]) -> bool:
+    """Whether ``path`` names a field of ``schema``, stepping into sequence elements along the way."""
+    pa = import_optional_dependency("pyarrow", "analytics")
+
+    root, *rest = path
+    index = schema.get_field_index(root)
+    if index < 0:
+        return False
+    field_type = schema.field(index).type
+    for component in rest:
+        while (
+            pa.types.is_list(field_type)
+            or pa.types.is_large_list(field_type)
+            or pa.types.is_fixed_size_list(field_type)
+        ):
+            field_type = field_type.value_type
+        if not pa.types.is_struct(field_type) or field_type.get_field_index(component) < 0:
+            return False
+        field_type = field_type.field(component).type
+    return True
+
+
+def _root_most(paths: collections.abc.Sequence[tuple[str, ...]]) -> list[tuple[str, ...]]:
+    """Drop every path that has a strict ancestor in the set, keeping the rest in order.
+
+    :py:meth:`DecodedMessage.to_dict` copies a projected struct whole, so a field
+    projected alongside its parent adds nothing; the parent alone covers it.
+    """
+    unique = set(paths)
+    kept: list[tuple[str, ...]] = []
+    for path in paths:
+        if path in kept or any(path[:depth] in unique for depth in range(1, len(path))):
+            continue
+        kept.append(path)
+    return kept
+
+
+_ColumnOrder = dict[str, tuple[int, typing.Optional["_ColumnOrder"]]]
+"""Per path component, its first-insertion rank and the order of its children.
+
+Children of ``None`` (a struct projected whole) keep the schema's member order."""
+
+
+def _column_order(paths: collections.abc.Sequence[tuple[str, ...]]) -> _ColumnOrder:
+    """The order in which :py:meth:`DecodedMessage.to_dict` first inserts each key along ``paths``."""
+    order: _ColumnOrder = {}
+    for path in paths:
+        level: typing.Optional[_ColumnOrder] = order
+        for depth, component in enumerate(path):
+            if level is None:
+                break
+            rank, children = level.setdefault(component, (len(level), {}))
+            if depth == len(path) - 1:
+                level[component] = (rank, None)
+                break
+            level = children
+    return order
+
+
+def _column_sort_key(components: collections.abc.Sequence[str], order: _ColumnOrder) -> tuple[int, ...]:
+    """Sort key placing a flattened column where :py:meth:`DecodedMessage.to_dict` inserts its key.
+
+    Columns under a struct projected whole tie, so a stable sort leaves them in schema order.
+    """
+    key: list[int] = []
+    level: typing.Optional[_ColumnOrder] = order
+    for component in components:
+        if level is None:
+            break
+        rank, level = level.get(component, (len(level), None))
+        key.append(rank)
+    return tuple(key)
@@ -17,6 +17,8 @@ def open_for_window(
     signed_url: str,
     start_time: typing.Optional[int] = None,
     end_time: typing.Optional[int] = None,
+    cache_id: typing.Optional[str] = None,
+    size_bytes: typing.Optional[int] = None,
 ) -> HttpRangeReader:
     """Open a remote MCAP file for reading, prefetching only the chunks in a log-time window.
 
@@ -31,16 +33,24 @@ def open_for_window(
     timestamps come from somewhere other than the message log time, pass no
     bounds (prefetching then covers every chunk) and filter rows after decode.
 
+    With the on-disk byte-range cache enabled
+    (:py:func:`~roboto.storage.configure_range_cache`), passing ``cache_id``
+    serves previously fetched summary and chunk bytes from disk; passing
+    ``size_bytes`` as well makes reopening a warm window issue no HTTP requests.
+
     Args:
         signed_url: Resolved download URL of the MCAP file.
         start_time: Inclusive window lower bound in nanoseconds, or ``None`` for unbounded.
         end_time: Exclusive window upper bound in nanoseconds, or ``None`` for unbounded.
+        cache_id: Stable identifier of the file (e.g. its file id) keying it in
+            the on-disk byte-range cache, or ``None`` to bypass that cache.
+        size_bytes: The file's size in bytes, if known.
 
     Returns:
         An :py:class:`~roboto.storage.HttpRangeReader` over the file, primed
         with the in-window chunk bytes and positioned at offset 0.
     """
-    http_reader = HttpRangeReader(signed_url)
+    http_reader = HttpRangeReader(signed_url, cache_id=cache_id, size=size_bytes)
     try:
         seeking_reader = mcap.reader.SeekingReader(as_io_bytes(http_reader))
         summary = seeking_reader.get_summary()
@@ -6,20 +6,28 @@
 
 """Fetching and decoding topic data stored in Parquet files.
 
-Covers cache-policy-driven opening of remote Parquet files (local cache reuse,
-atomic download, or HTTP streaming), row-group time filtering, column
-projection from schema field paths, and timestamp extraction.
+Covers cache-policy-driven opening of remote Parquet files (memory-mapped
+local cache reuse, atomic download, or HTTP streaming), concurrent pre-buffered
+row-group reads, row-group time and value-predicate filtering, column projection
+from schema field paths, and timestamp extraction.
 """
 
 from .arrow_to_roboto import generate_message_path_requests
-from .fetch import open_parquet_file, parquet_file_from_url
+from .fetch import (
+    open_cached_parquet_file,
+    open_parquet_file,
+    parquet_file_from_url,
+    read_row_groups,
+)
 from .parquet_parser import ParquetParser
 from .table_transforms import (
     compute_time_filter_mask,
     extract_timestamp_field,
     extract_timestamps,
+    filter_rows,
     narrow_list_nested_fields,
     resolve_columns,
+    row_groups_matching,
     should_narrow_list_nested_fields,
     should_read_row_group,
 )
@@ -31,11 +39,15 @@ __all__ = (
     "compute_time_filter_mask",
     "extract_timestamp_field",
     "extract_timestamps",
+    "filter_rows",
     "generate_message_path_requests",
     "narrow_list_nested_fields",
+    "open_cached_parquet_file",
     "open_parquet_file",
     "parquet_file_from_url",
+    "read_row_groups",
     "resolve_columns",
+    "row_groups_matching",
     "should_narrow_list_nested_fields",
     "should_read_row_group",
 )
@@ -6,8 +6,11 @@
 
 from __future__ import annotations
 
+import collections
+import collections.abc
 import pathlib
 import typing
+import weakref
 
 from ...compat import import_optional_dependency
 from ...logging import default_logger
@@ -17,16 +20,40 @@ from ...storage.cache import (
     cached_file_is_current,
     choose_fetch_mode,
     download_to_cache,
+    record_cache_hit,
 )
+from ...storage.connection_pool import shared_pool_manager
+from ...storage.http_range_reader import HttpRangeReader
+
+_T = typing.TypeVar("_T")
 
 if typing.TYPE_CHECKING:
     import pyarrow.parquet  # pants: no-infer-dep
 
+    from ...experimental.topics.scheduler import ReadScheduler, ScheduledTask
+
+    _RowGroupTask = typing.Union[ScheduledTask[_T], "_InlineTask[_T]"]
+    """Work :py:func:`read_row_groups` submitted, to a scheduler or to run inline."""
+
 logger = default_logger()
 
 _STREAM_WHOLE_FILE_PROBE_BYTES = 16 * 1024 * 1024
 """Streamed Parquet files whose head probe returns fewer bytes than this are read whole from memory."""
 
+_PREBUFFER_WAVE_BYTES = 32 * 1024 * 1024
+"""Compressed column-chunk bytes pre-buffered together by :py:func:`read_row_groups`.
+
+A wave is fetched in parallel while the one before it decodes, so at most two
+waves of a streamed file are held in memory at once."""
+
+_MAX_ROW_GROUPS_IN_FLIGHT = 8
+"""Row groups :py:func:`read_row_groups` submits for decoding ahead of the one it yields next."""
+
+_STREAMED_RANGE_READERS: weakref.WeakKeyDictionary[pyarrow.parquet.ParquetFile, HttpRangeReader] = (
+    weakref.WeakKeyDictionary()
+)
+"""The range reader behind each Parquet file opened for HTTP streaming, so its reads can be pre-buffered."""
+
 
 def parquet_file_from_url(
     signed_url: str,
@@ -34,11 +61,12 @@ def parquet_file_from_url(
 ) -> pyarrow.parquet.ParquetFile:
     """Open a Parquet file over HTTP via a signed URL (no local download).
 
-    A single ranged GET over fsspec's shared HTTP session probes the first
+    A single ranged GET over the shared storage connection pool probes the first
     ``_STREAM_WHOLE_FILE_PROBE_BYTES`` of the file. A file smaller than the probe
     arrives whole in that one request and is read from an in-memory buffer; a
     larger file (or a failed probe) falls back to HTTP range-request streaming
-    through pyarrow's filesystem layer.
+    through an :py:class:`~roboto.storage.HttpRangeReader`, which draws its
+    connections from the same pool.
 
     When ``size_bytes`` is known and at least ``_STREAM_WHOLE_FILE_PROBE_BYTES``,
     the file is known-large up front: the whole-file probe could never win (a
@@ -47,6 +75,9 @@ def parquet_file_from_url(
     ``size_bytes`` of ``None`` (an older server omits the size) preserves the
     probe-then-decide behavior.
 
+    Files are opened without Arrow's own pre-buffering, so that
+    :py:func:`read_row_groups` can read their row groups concurrently.
+
     Args:
         signed_url: The file's signed download URL.
         size_bytes: The backing object's size in bytes when the server reports
@@ -56,22 +87,21 @@ def parquet_file_from_url(
         ValueError: The probe succeeds but the object is empty (0 bytes), which
             is not a readable Parquet file.
     """
-    fs = import_optional_dependency("pyarrow.fs", "analytics")
-    fsspec_http = import_optional_dependency("fsspec.implementations.http", "analytics")
     pa = import_optional_dependency("pyarrow", "analytics")
     pq = import_optional_dependency("pyarrow.parquet", "analytics")
 
-    http_fs = fsspec_http.HTTPFileSystem()
-
     def _range_stream() -> pyarrow.parquet.ParquetFile:
-        return pq.ParquetFile(signed_url, filesystem=fs.PyFileSystem(fs.FSSpecHandler(http_fs)))
+        range_reader = HttpRangeReader(signed_url)
+        parquet_file = pq.ParquetFile(range_reader, pre_buffer=False)
+        _STREAMED_RANGE_READERS[parquet_file] = range_reader
+        return parquet_file
 
     if size_bytes is not None and size_bytes >= _STREAM_WHOLE_FILE_PROBE_BYTES:
         # Known-large file: skip the probe that could never win and stream directly.
         return _range_stream()
 
     try:
-        data = http_fs.cat_file(signed_url, start=0, end=_STREAM_WHOLE_FILE_PROBE_BYTES)
+        data = _probe_head(signed_url)
     except Exception:
         logger.debug(
             "Head probe of streamed Parquet file failed; falling back to range-request streaming",
@@ -91,24 +121,42 @@ def parquet_file_from_url(
         )
 
     if data is not None and len(data) < _STREAM_WHOLE_FILE_PROBE_BYTES:
-        return pq.ParquetFile(pa.BufferReader(data))
+        return pq.ParquetFile(pa.BufferReader(data), pre_buffer=False)
 
     return _range_stream()
 
 
+def _probe_head(signed_url: str) -> bytes:
+    """Fetch up to the first ``_STREAM_WHOLE_FILE_PROBE_BYTES`` of the file in one ranged GET.
+
+    An empty object answers a range request with 416 (Range Not Satisfiable);
+    that is reported as zero bytes rather than an error.
+    """
+    resp = shared_pool_manager().request(
+        "GET", signed_url, headers={"Range": f"bytes=0-{_STREAM_WHOLE_FILE_PROBE_BYTES - 1}"}
+    )
+    if resp.status == 416:
+        return b""
+    if resp.status not in (200, 206):
+        raise OSError(f"HTTP {resp.status} from Parquet head probe")
+    return resp.data
+
+
 def open_parquet_file(
     url_provider: typing.Callable[[], str],
     cache_outfile: typing.Optional[pathlib.Path],
     policy: CachePolicy,
     estimated_column_count: int,
     size_bytes: typing.Optional[int] = None,
+    source_id: typing.Optional[str] = None,
 ) -> pyarrow.parquet.ParquetFile:
     """Open a remote Parquet file under a cache policy, from the cheapest available source.
 
     Dispatches on :py:func:`~roboto.storage.cache.choose_fetch_mode`: an
     already-cached copy is reused, a download is performed (concurrency-safe,
     atomic) when the policy calls for one, and otherwise the file is streamed
-    over HTTP range requests without touching disk.
+    over HTTP range requests without touching disk. A local copy is opened
+    memory-mapped, by :py:func:`open_cached_parquet_file`.
 
     Args:
         url_provider: Resolves the file's signed download URL. Called at most
@@ -124,12 +172,12 @@ def open_parquet_file(
             STREAM path it lets a known-large file skip the whole-file head probe;
             on the DOWNLOAD path it verifies the downloaded file is complete before
             it is promoted to the cache.
+        source_id: Id of the Roboto file, recorded in the cache index so the
+            cached copy can be pinned against eviction.
 
     Returns:
-        An open ``pyarrow.parquet.ParquetFile``.
+        An open ``pyarrow.parquet.ParquetFile``, ready for :py:func:`read_row_groups`.
     """
-    pq = import_optional_dependency("pyarrow.parquet", "analytics")
-
     effective_policy = policy if cache_outfile is not None else CachePolicy.NEVER
     mode = choose_fetch_mode(
         policy=effective_policy,
@@ -143,9 +191,198 @@ def open_parquet_file(
 
     # choose_fetch_mode returns CACHED or DOWNLOAD only when a cache path exists.
     outfile = typing.cast(pathlib.Path, cache_outfile)
-    if mode is FetchMode.DOWNLOAD:
-        logger.debug("Downloading Parquet file to local cache at %s (policy=%s)", outfile, effective_policy.value)
-        download_to_cache(url_provider, outfile, expected_size=size_bytes)
-    else:
+    if mode is FetchMode.CACHED:
         logger.debug("Using already-cached Parquet file at %s", outfile)
-    return pq.ParquetFile(outfile)
+        record_cache_hit(outfile, source_id)
+        try:
+            return open_cached_parquet_file(outfile)
+        except FileNotFoundError:
+            # Evicted by another process between the existence check and the open.
+            logger.debug("Cached Parquet file at %s was evicted before it could be opened", outfile)
+
+    logger.debug("Downloading Parquet file to local cache at %s (policy=%s)", outfile, effective_policy.value)
+    download_to_cache(url_provider, outfile, expected_size=size_bytes, source_id=source_id)
+    return open_cached_parquet_file(outfile)
+
+
+def open_cached_parquet_file(path: pathlib.Path, memory_map: bool = True) -> pyarrow.parquet.ParquetFile:
+    """Open a Parquet file in the local cache, memory-mapped unless ``memory_map`` is ``False``.
+
+    A mapped file is read straight out of the OS page cache: Arrow slices its
+    pages from the mapping without copying them, where buffered reads would copy
+    each one into the heap first, and every process reading the same cached file
+    shares one copy of its pages. Decoded column arrays are still materialized.
+    Evicting a mapped file from the cache is safe on POSIX, where the mapping
+    outlives the unlink; elsewhere eviction leaves an in-use file in place.
+
+    Like every file from this module, it is opened ready for :py:func:`read_row_groups`.
+
+    Args:
+        path: The cached file.
+        memory_map: Whether to map the file rather than read it through buffered I/O.
+
+    Raises:
+        FileNotFoundError: ``path`` does not exist (e.g. it was just evicted).
+    """
+    pq = import_optional_dependency("pyarrow.parquet", "analytics")
+
+    return pq.ParquetFile(path, memory_map=memory_map, pre_buffer=False)
+
+
+def read_row_groups(
+    parquet_file: pyarrow.parquet.ParquetFile,
+    row_groups: collections.abc.Sequence[int],
+    columns: typing.Optional[collections.abc.Sequence[str]] = None,
+    scheduler: typing.Optional[ReadScheduler] = None,
+) -> collections.abc.Generator[pyarrow.Table, None, None]:
+    """Read row groups concurrently, yielding their tables in the order given.
+
+    Reading one row group at a time leaves a streamed file paying a round trip
+    for each of its column chunks. Instead, every requested row group is planned
+    up front: for a file opened by :py:func:`parquet_file_from_url` that is
+    range-streamed, the byte ranges of the projected column chunks are grouped
+    into waves of about ``_PREBUFFER_WAVE_BYTES``, and each wave is coalesced and
+    fetched in parallel through the file's :py:class:`~roboto.storage.HttpRangeReader`
+    (the next wave while the current one decodes), then dropped from memory once
+    its row groups are decoded. Up to ``_MAX_ROW_GROUPS_IN_FLIGHT`` row groups are
+    queued for decoding at once; Arrow releases the GIL while decoding.
+
+    The wave fetches and row-group decodes run on ``scheduler``, at the priority
+    of the scheduled task iterating this generator, so they share its worker
+    threads with every other read rather than starting threads of their own.
+
+    The file must be opened with ``pre_buffer=False``, as every file from this
+    module is: Arrow's own pre-buffering keeps per-file state that concurrent
+    row-group reads would race on.
+
+    Args:
+        parquet_file: The file to read.
+        row_groups: Indices of the row groups to read, in output order.
+        columns: Columns to project, as accepted by ``ParquetFile.read_row_group``;
+            ``None`` reads all of them.
+        scheduler: Where to run the fetches and decodes, usually
+            :py:func:`~roboto.experimental.topics.scheduler.shared_read_scheduler`.
+            ``None`` runs them one after another on the calling thread.
+    """
+    if not row_groups:
+        return
+
+    range_reader = _STREAMED_RANGE_READERS.get(parquet_file)
+    waves: list[list[tuple[int, int]]] = []
+    wave_of: list[int] = []
+    if range_reader is not None:
+        waves, wave_of = _plan_prebuffer_waves(parquet_file.metadata, row_groups, columns)
+
+    def submit(fn: typing.Callable[..., _T], *args: typing.Any) -> _RowGroupTask[_T]:
+        return _InlineTask(fn, args) if scheduler is None else scheduler.submit(fn, *args)
+
+    prefetches: dict[int, _RowGroupTask[None]] = {}
+
+    def prefetch(wave: int) -> _RowGroupTask[None]:
+        if wave not in prefetches:
+            prefetches[wave] = submit(typing.cast(HttpRangeReader, range_reader).prefetch_ranges, waves[wave])
+        return prefetches[wave]
+
+    def decode(row_group: int, prefetched: typing.Optional[_RowGroupTask[None]]) -> pyarrow.Table:
+        if prefetched is not None:
+            # Runs the prefetch here if no worker has started it. A failed prefetch
+            # is not fatal: the read fetches whatever is missing itself.
+            prefetched.wait()
+        return parquet_file.read_row_group(row_group, columns=list(columns) if columns is not None else None)
+
+    pending: collections.deque[_RowGroupTask[pyarrow.Table]] = collections.deque()
+    submitted = 0
+    try:
+        for position in range(len(row_groups)):
+            while submitted < len(row_groups) and submitted - position < _MAX_ROW_GROUPS_IN_FLIGHT:
+                prefetched = None
+                if range_reader is not None:
+                    prefetched = prefetch(wave_of[submitted])
+                    if wave_of[submitted] + 1 < len(waves):
+                        prefetch(wave_of[submitted] + 1)
+                pending.append(submit(decode, row_groups[submitted], prefetched))
+                submitted += 1
+
+            table = pending.popleft().result()
+
+            if range_reader is not None and (
+                position + 1 == len(row_groups) or wave_of[position + 1] != wave_of[position]
+            ):
+                for start, end in waves[wave_of[position]]:
+                    range_reader.discard(start, end)
+
+            yield table
+    finally:
+        # On an early close or a failure, drop the work not yet started and wait
+        # out the running work before the caller closes the file under it.
+        for task in [*pending, *prefetches.values()]:
+            if not task.cancel():
+                task.wait()
+
+
+class _InlineTask(typing.Generic[_T]):
+    """Work run on the thread that first waits for it, for :py:func:`read_row_groups` without a scheduler."""
+
+    def __init__(self, fn: typing.Callable[..., _T], args: tuple[typing.Any, ...]) -> None:
+        self.__fn: typing.Optional[typing.Callable[..., _T]] = fn
+        self.__args = args
+        self.__result: typing.Optional[_T] = None
+        self.__exception: typing.Optional[BaseException] = None
+
+    def cancel(self) -> bool:
+        cancelled = self.__fn is not None
+        self.__fn = None
+        return cancelled
+
+    def result(self) -> _T:
+        self.wait()
+        if self.__exception is not None:
+            raise self.__exception
+        return typing.cast(_T, self.__result)
+
+    def wait(self) -> None:
+        fn, self.__fn = self.__fn, None
+        if fn is None:
+            return
+        try:
+            self.__result = fn(*self.__args)
+        except Exception as exc:
+            self.__exception = exc
+        finally:
+            self.__args = ()
+
+
+def _plan_prebuffer_waves(
+    file_metadata: pyarrow.parquet.FileMetaData,
+    row_groups: collections.abc.Sequence[int],
+    columns: typing.Optional[collections.abc.Sequence[str]],
+) -> tuple[list[list[tuple[int, int]]], list[int]]:
+    """Group the projected column-chunk byte ranges of ``row_groups`` into pre-buffering waves.
+
+    Returns the waves, each a list of inclusive ``(start, end)`` byte ranges, and
+    the index of the wave holding each row group. A selected column (e.g.
+    ``battery``) covers every leaf column chunk beneath it (``battery.voltage``).
+    """
+    waves: list[list[tuple[int, int]]] = []
+    wave_of: list[int] = []
+    wave_bytes = _PREBUFFER_WAVE_BYTES
+    for row_group in row_groups:
+        if wave_bytes >= _PREBUFFER_WAVE_BYTES:
+            waves.append([])
+            wave_bytes = 0
+
+        row_group_metadata = file_metadata.row_group(row_group)
+        for column_index in range(row_group_metadata.num_columns):
+            chunk = row_group_metadata.column(column_index)
+            path = chunk.path_in_schema
+            if columns is not None and not any(path == column or path.startswith(column + ".") for column in columns):
+                continue
+            # A column chunk's dictionary page, when present, precedes its data pages.
+            start = chunk.data_page_offset
+            if chunk.has_dictionary_page and chunk.dictionary_page_offset:
+                start = min(start, chunk.dictionary_page_offset)
+            waves[-1].append((start, start + chunk.total_compressed_size - 1))
+            wave_bytes += chunk.total_compressed_size
+
+        wave_of.append(len(waves) - 1)
+    return waves, wave_of
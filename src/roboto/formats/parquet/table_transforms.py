@@ -7,7 +7,10 @@
 from __future__ import annotations
 
 import collections.abc
+import functools
+import itertools
 import math
+import operator
 import typing
 
 from ...compat import import_optional_dependency
@@ -17,8 +20,16 @@ from .timestamp import Timestamp
 
 if typing.TYPE_CHECKING:
     import pyarrow  # pants: no-infer-dep
+    import pyarrow.compute  # pants: no-infer-dep
     import pyarrow.parquet  # pants: no-infer-dep
 
+_MAX_ROW_GROUP_GUARANTEES = 64
+"""Most statistics-derived cases :py:func:`row_groups_matching` checks a predicate against per row group.
+
+A column chunk that may hold nulls or NaNs, alongside its ``[min, max]`` range,
+contributes one case per possibility, and a row group's cases are their product
+across the predicate's columns. A row group with more is read rather than pruned."""
+
 
 def compute_time_filter_mask(
     timestamps: "pyarrow.Array",
@@ -158,6 +169,163 @@ def should_read_row_group(
     return True
 
 
+def row_groups_matching(
+    file_metadata: "pyarrow.parquet.FileMetaData",
+    schema: "pyarrow.Schema",
+    predicate: "pyarrow.compute.Expression",
+) -> list[bool]:
+    """For each row group, whether its column-chunk statistics leave room for a row satisfying ``predicate``.
+
+    The value-predicate counterpart of :py:func:`should_read_row_group`. Each
+    column the predicate references contributes what its statistics guarantee
+    about every row: a value within ``[min, max]``, or a null when the chunk
+    may hold nulls, or a NaN for floating-point columns (Parquet writers leave
+    NaNs out of min/max). Arrow's own expression simplifier then decides whether
+    the predicate can hold under any combination of those guarantees, so a row
+    group is skipped only when no row in it could match.
+
+    Conservative: a column without statistics, a struct child inside a list, or
+    a statistic that does not convert to the column's Arrow type contributes no
+    guarantee, and every row group is kept when the predicate references no
+    column with statistics.
+    """
+    pa = import_optional_dependency("pyarrow", "analytics")
+    ds = import_optional_dependency("pyarrow.dataset", "analytics")
+
+    num_row_groups = file_metadata.num_row_groups
+    referenced = _predicate_leaves(schema, predicate)
+    if not referenced:
+        return [True] * num_row_groups
+
+    file_format = ds.ParquetFileFormat()
+    matching: list[bool] = []
+    for row_group_index in range(num_row_groups):
+        row_group_metadata = file_metadata.row_group(row_group_index)
+        cases: list[list["pyarrow.compute.Expression"]] = []
+        for col_idx in range(row_group_metadata.num_columns):
+            col_chunk_meta = row_group_metadata.column(col_idx)
+            leaf = referenced.get(col_chunk_meta.path_in_schema)
+            if leaf is None:
+                continue
+            column_cases = _column_chunk_cases(col_chunk_meta, row_group_metadata.num_rows, *leaf)
+            if column_cases:
+                cases.append(column_cases)
+
+        if not cases or math.prod(len(column_cases) for column_cases in cases) > _MAX_ROW_GROUP_GUARANTEES:
+            matching.append(True)
+            continue
+
+        # A fragment's partition expression is a guarantee about all of its rows, and
+        # a dataset keeps only the fragments the filter may still be true for. The
+        # fragments are never read: they stand in for one case of this row group each.
+        fragments = [
+            file_format.make_fragment(
+                pa.BufferReader(b""),
+                partition_expression=functools.reduce(operator.and_, combination),
+            )
+            for combination in itertools.product(*cases)
+        ]
+        dataset = ds.FileSystemDataset(fragments, schema, file_format)
+        matching.append(next(iter(dataset.get_fragments(filter=predicate)), None) is not None)
+    return matching
+
+
+def filter_rows(
+    table: "pyarrow.Table",
+    timestamps: "pyarrow.Array",
+    predicate: "pyarrow.compute.Expression",
+) -> tuple["pyarrow.Table", "pyarrow.Array"]:
+    """Keep the rows of ``table`` that satisfy ``predicate``, along with their timestamps.
+
+    Rows for which the predicate is null are dropped, as :py:meth:`pyarrow.Table.filter` does.
+
+    Raises:
+        pyarrow.ArrowInvalid: The predicate references a column ``table`` does not have.
+    """
+    name = "__roboto_timestamps"
+    while name in table.column_names:
+        name += "_"
+    filtered = table.append_column(name, timestamps).filter(predicate)
+    return filtered.drop_columns([name]), filtered.column(name).combine_chunks()
+
+
+def _predicate_leaves(
+    schema: "pyarrow.Schema",
+    predicate: "pyarrow.compute.Expression",
+) -> dict[str, tuple[tuple[str, ...], "pyarrow.DataType"]]:
+    """The struct-reachable leaf columns ``predicate`` may reference, keyed by Parquet ``path_in_schema``.
+
+    Expressions are opaque to Python, so a column counts as referenced when its
+    field reference appears in the predicate's text. A false match only costs
+    pruning work, never correctness.
+    """
+    pa = import_optional_dependency("pyarrow", "analytics")
+    pc = import_optional_dependency("pyarrow.compute", "analytics")
+
+    predicate_text = str(predicate)
+    leaves: dict[str, typing.Optional[tuple[tuple[str, ...], "pyarrow.DataType"]]] = {}
+    pending: list[tuple[tuple[str, ...], "pyarrow.DataType"]] = [((field.name,), field.type) for field in schema]
+    while pending:
+        path, data_type = pending.pop()
+        if pa.types.is_struct(data_type):
+            struct_type = typing.cast("pyarrow.StructType", data_type)
+            pending.extend(
+                (path + (struct_type.field(index).name,), struct_type.field(index).type)
+                for index in range(struct_type.num_fields)
+            )
+            continue
+        if pa.types.is_nested(data_type) or str(pc.field(*path)) not in predicate_text:
+            continue
+        dotted = ".".join(path)
+        # Names containing "." can make two leaves share a path_in_schema; trust neither.
+        leaves[dotted] = None if dotted in leaves else (path, data_type)
+    return {dotted: leaf for dotted, leaf in leaves.items() if leaf is not None}
+
+
+def _column_chunk_cases(
+    col_chunk_meta: "pyarrow.parquet.ColumnChunkMetaData",
+    num_rows: int,
+    path: tuple[str, ...],
+    data_type: "pyarrow.DataType",
+) -> list["pyarrow.compute.Expression"]:
+    """What a column chunk's statistics say each of its values may be, one expression per possibility.
+
+    Empty when the statistics guarantee nothing usable.
+    """
+    pa = import_optional_dependency("pyarrow", "analytics")
+    pc = import_optional_dependency("pyarrow.compute", "analytics")
+
+    stats = col_chunk_meta.statistics
+    if stats is None:
+        return []
+
+    field = pc.field(*path)
+    # pyarrow's type stubs omit Statistics.has_null_count (present at runtime); read it dynamically.
+    has_null_count: bool = getattr(stats, "has_null_count")
+    if has_null_count and stats.null_count == num_rows:
+        return [field.is_null()]
+    if not stats.has_min_max:
+        return []
+
+    try:
+        low = pa.scalar(stats.min, type=data_type)
+        high = pa.scalar(stats.max, type=data_type)
+    except (pa.ArrowException, TypeError, ValueError, OverflowError):
+        return []
+    if not low.is_valid or not high.is_valid or low.as_py() != low.as_py() or high.as_py() != high.as_py():
+        # A null or NaN bound bounds nothing.
+        return []
+
+    cases = [(field >= low) & (field <= high)]
+    if not has_null_count or stats.null_count:
+        cases.append(field.is_null())
+    if pa.types.is_floating(data_type):
+        # An equality guarantee substitutes NaN into the predicate, which then folds
+        # to whatever the predicate says of a NaN (false for v < 11, true for v != 3).
+        cases.append(field == pa.scalar(math.nan, type=data_type))
+    return cases
+
+
 def _list_ancestor_column(
     schema: "pyarrow.Schema",
     path_in_schema: collections.abc.Sequence[str],
@@ -27,11 +27,17 @@ from .http_client import (
 )
 from .options import (
     HttpClientOptions,
+    HttpCompressionOptions,
     HttpLoggingOptions,
     HttpRetryOptions,
     RetryPredicate,
     never_retry,
 )
+from .paginator import (
+    DEFAULT_PAGE_LOOKAHEAD,
+    iter_items,
+    iter_pages,
+)
 from .request import BatchRequest, HttpRequest
 from .request_decorators import (
     BearerTokenDecorator,
@@ -53,6 +59,11 @@ from .response import (
     StreamedList,
 )
 from .roboto_client import DEFAULT_HTTP_TIMEOUT, RobotoClient
+from .transport import (
+    HttpTransport,
+    PooledHttpTransport,
+    UrllibTransport,
+)
 
 __all__ = (
     "BEARER_TOKEN_HEADER",
@@ -64,12 +75,15 @@ __all__ = (
     "CONNECTION_CONSISTENCY_HEADER",
     "ClientError",
     "DEFAULT_HTTP_TIMEOUT",
+    "DEFAULT_PAGE_LOOKAHEAD",
     "HttpClient",
     "HttpClientOptions",
+    "HttpCompressionOptions",
     "HttpError",
     "HttpLoggingOptions",
     "HttpRequest",
     "HttpRetryOptions",
+    "HttpTransport",
     "InvalidPaginationTokenError",
     "ORG_OVERRIDE_HEADER",
     "ORG_OVERRIDE_QUERY_PARAM",
@@ -77,15 +91,19 @@ __all__ = (
     "PaginationToken",
     "PaginationTokenEncoding",
     "PaginationTokenScheme",
+    "PooledHttpTransport",
     "RESOURCE_OWNER_OVERRIDE_HEADER",
     "RESOURCE_OWNER_OVERRIDE_QUERY_PARAM",
     "ROBOTO_REQUESTER_HEADER",
     "RetryPredicate",
     "ServerError",
     "is_expected_to_be_transient",
+    "iter_items",
+    "iter_pages",
     "never_retry",
     "SigV4AuthDecorator",
     "StreamedList",
+    "UrllibTransport",
     "USER_OVERRIDE_HEADER",
     "USER_OVERRIDE_QUERY_PARAM",
     "roboto_headers",
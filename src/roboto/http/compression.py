@@ -0,0 +1,112 @@
+# Copyright (c) 2026 Roboto Technologies, Inc.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Content codings for HTTP bodies: what a client can accept, and how to decode and encode them.
+
+Every :py:class:`~roboto.http.HttpTransport` decodes response bodies with
+:py:func:`decode_content`, so the codings listed by :py:func:`accept_encoding`
+are exactly the ones a response may safely arrive in.
+"""
+
+import functools
+import gzip
+import importlib
+import types
+import typing
+import zlib
+
+GZIP_COMPRESSION_LEVEL = 6
+"""zlib's own default level: most of level 9's size reduction at a fraction of its CPU cost."""
+
+
+@functools.cache
+def _zstandard() -> typing.Optional[types.ModuleType]:
+    """The ``zstandard`` module if installed (it ships with ``mcap``), else ``None``."""
+    try:
+        return importlib.import_module("zstandard")
+    except ImportError:
+        return None
+
+
+def accept_encoding() -> str:
+    """The ``Accept-Encoding`` value naming every coding :py:func:`decode_content` can undo, preferred first."""
+    if _zstandard() is not None:
+        return "zstd, gzip, deflate"
+    return "gzip, deflate"
+
+
+def decode_content(body: bytes, content_encoding: typing.Optional[str]) -> bytes:
+    """Undo the codings a ``Content-Encoding`` header lists, last applied first.
+
+    A body in a coding this module does not know is returned as received, which
+    is how it arrived before any coding was negotiated.
+
+    Args:
+        body: The body as received.
+        content_encoding: The response's ``Content-Encoding`` header, or ``None`` if absent.
+
+    Raises:
+        OSError: The body is not valid in a coding it claims (e.g. a truncated gzip stream).
+    """
+    if not content_encoding or not body:
+        return body
+
+    codings = [coding.strip().lower() for coding in content_encoding.split(",")]
+    zstandard = _zstandard()
+    decoded = body
+    for coding in reversed(codings):
+        if coding in ("", "identity"):
+            continue
+        if coding in ("gzip", "x-gzip"):
+            decoded = _gunzip(decoded)
+        elif coding == "deflate":
+            decoded = _inflate(decoded)
+        elif coding == "zstd" and zstandard is not None:
+            decoded = _unzstd(zstandard, decoded)
+        else:
+            return body
+    return decoded
+
+
+def gzip_content(body: bytes) -> bytes:
+    """Encode a request body for ``Content-Encoding: gzip``."""
+    return gzip.compress(body, compresslevel=GZIP_COMPRESSION_LEVEL, mtime=0)
+
+
+def _gunzip(body: bytes) -> bytes:
+    try:
+        return gzip.decompress(body)
+    except (EOFError, zlib.error) as exc:
+        raise gzip.BadGzipFile(f"Invalid gzip response body: {exc}") from exc
+
+
+def _inflate(body: bytes) -> bytes:
+    # "deflate" means a zlib stream, but some servers send a raw deflate stream instead.
+    try:
+        return zlib.decompress(body)
+    except zlib.error:
+        pass
+    try:
+        return zlib.decompress(body, -zlib.MAX_WBITS)
+    except zlib.error as exc:
+        raise OSError(f"Invalid deflate response body: {exc}") from exc
+
+
+def _unzstd(zstandard: types.ModuleType, body: bytes) -> bytes:
+    # A streaming decompressor handles frames that omit their content size;
+    # a body may also hold several concatenated frames.
+    parts: list[bytes] = []
+    remaining = body
+    try:
+        while remaining:
+            decompressor = zstandard.ZstdDecompressor().decompressobj()
+            parts.append(decompressor.decompress(remaining))
+            if not decompressor.eof:
+                raise OSError("Invalid zstd response body: truncated frame")
+            remaining = decompressor.unused_data
+    except zstandard.ZstdError as exc:
+        raise OSError(f"Invalid zstd response body: {exc}") from exc
+    return b"".join(parts)
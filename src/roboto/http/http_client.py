@@ -11,7 +11,6 @@ import logging
 import socket
 import typing
 import urllib.error
-import urllib.request
 
 import tenacity
 import tenacity.wait
@@ -24,6 +23,7 @@ from ..exceptions import (
 )
 from ..logging import LOGGER_NAME
 from ..sentinels import NotSet, is_set
+from .compression import accept_encoding, gzip_content
 from .options import HttpClientOptions
 from .request import (
     HttpRequest,
@@ -35,6 +35,7 @@ from .requester import (
     RobotoRequester,
 )
 from .response import HttpResponse
+from .transport import HttpTransport, PooledHttpTransport
 
 logger = logging.getLogger(LOGGER_NAME)
 
@@ -113,6 +114,7 @@ class HttpClient:
     __extra_headers_provider: typing.Optional[typing.Callable[[], dict[str, str]]]
     __default_timeout: typing.Optional[float]
     __options: HttpClientOptions
+    __transport: HttpTransport
 
     def __init__(
         self,
@@ -123,6 +125,7 @@ class HttpClient:
         extra_headers_provider: typing.Optional[typing.Callable[[], dict[str, str]]] = None,
         default_timeout: typing.Optional[float] = None,  # None means no timeout
         options: typing.Optional[HttpClientOptions] = None,
+        transport: typing.Optional[HttpTransport] = None,  # None means a PooledHttpTransport of its own
     ):
         self.__base_headers = base_headers if base_headers is not None else {}
         self.__extra_headers_provider = extra_headers_provider
@@ -134,6 +137,7 @@ class HttpClient:
         self.__default_endpoint = default_endpoint
         self.__default_timeout = default_timeout
         self.__options = options if options is not None else HttpClientOptions()
+        self.__transport = transport if transport is not None else PooledHttpTransport()
 
     def delete(
         self,
@@ -245,6 +249,10 @@ class HttpClient:
     def auth_decorator(self) -> typing.Optional[HttpRequestDecorator]:
         return self.__default_auth
 
+    @property
+    def transport(self) -> HttpTransport:
+        return self.__transport
+
     def __resolve_timeout(self, timeout: Timeout) -> typing.Optional[float]:
         return timeout if is_set(timeout) else self.__default_timeout
 
@@ -259,7 +267,20 @@ class HttpClient:
 
         return headers
 
+    def __compress_body(self, request_ctx: HttpRequest) -> None:
+        threshold = self.__options.compression.compress_requests_over
+        if threshold is None or any(key.lower() == "content-encoding" for key in request_ctx.headers):
+            return
+
+        body = request_ctx.body
+        if body is not None and len(body) > threshold:
+            request_ctx.data = gzip_content(body)
+            request_ctx.headers["Content-Encoding"] = "gzip"
+
     def __request(self, request_ctx: HttpRequest, timeout: typing.Optional[float]) -> HttpResponse:
+        # Before auth decoration, so a signature covers the body as sent.
+        self.__compress_body(request_ctx)
+
         if self.__default_auth is not None:
             request_ctx = self.__default_auth(request_ctx)
 
@@ -267,6 +288,10 @@ class HttpClient:
             logger.debug(request_ctx.describe(scrub_headers=self.__options.logging.scrub_headers))
 
         headers = self.__request_headers(request_ctx)
+        if self.__options.compression.accept_compressed_responses and not any(
+            key.lower() == "accept-encoding" for key in headers
+        ):
+            headers["Accept-Encoding"] = accept_encoding()
 
         retry = self.__options.retry
         predicate = retry.predicate if retry.predicate is not None else is_expected_to_be_transient
@@ -279,17 +304,9 @@ class HttpClient:
                 wait=self.__wait(request_ctx.retry_wait),
             ):
                 with attempt:
-                    # S310: URL is constructed by SDK from a configured endpoint, not from user input
-                    request = urllib.request.Request(request_ctx.url, method=request_ctx.method)  # noqa: S310
-
-                    req_body = request_ctx.body
-                    if req_body is not None:
-                        request.data = req_body
-
-                    for key, value in headers.items():
-                        request.add_header(key, value)
-
-                    response = HttpResponse(urllib.request.urlopen(request, timeout=timeout))  # noqa: S310
+                    response = self.__transport.send(
+                        request_ctx.method, request_ctx.url, request_ctx.body, headers, timeout
+                    )
                     logger.debug("Response: %s %s", response.status, response.headers)
                     return response
         except urllib.error.HTTPError as exc:
@@ -22,6 +22,28 @@ def never_retry(_request: HttpRequest, _exc: BaseException) -> bool:
     return False
 
 
+@dataclasses.dataclass(frozen=True)
+class HttpCompressionOptions:
+    """Whether a :py:class:`~roboto.http.HttpClient` compresses the bodies it exchanges.
+
+    Both directions are off by default. Compression trades a little CPU for
+    fewer bytes on the wire, which pays off for large JSON bodies (pages of
+    records, read plans) on slow or metered links.
+    """
+
+    accept_compressed_responses: bool = False
+    """Advertise the codings in :py:func:`~roboto.http.compression.accept_encoding` (gzip and
+    deflate, plus zstd when the ``zstandard`` package is installed) with ``Accept-Encoding`` on
+    every request that sets no ``Accept-Encoding`` of its own. Responses are decoded before they
+    are returned either way, so nothing else changes for callers."""
+
+    compress_requests_over: typing.Optional[int] = None
+    """Gzip request bodies larger than this many bytes and send them with ``Content-Encoding:
+    gzip``, unless the request already sets a ``Content-Encoding``. ``None`` never compresses.
+    The receiving server must accept gzip-encoded requests; bodies are compressed before the
+    request is signed, so signatures cover the bytes sent."""
+
+
 @dataclasses.dataclass(frozen=True)
 class HttpLoggingOptions:
     """How a :py:class:`~roboto.http.HttpClient` renders requests into its logs."""
@@ -52,5 +74,6 @@ class HttpRetryOptions:
 class HttpClientOptions:
     """Behavior of a :py:class:`~roboto.http.HttpClient`, applied to every request it makes."""
 
+    compression: HttpCompressionOptions = HttpCompressionOptions()
     logging: HttpLoggingOptions = HttpLoggingOptions()
     retry: HttpRetryOptions = HttpRetryOptions()
@@ -0,0 +1,182 @@
+# Copyright (c) 2026 Roboto Technologies, Inc.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Iteration over paginated API results, with the next pages fetched in the background.
+
+A loop that requests page N+1 only once its caller has consumed page N pays the
+full round trip of every page on top of the caller's own work. :py:func:`iter_pages`
+instead fetches ahead on a background thread while the caller processes the
+current page, keeping at most ``lookahead`` unconsumed pages in memory.
+"""
+
+import collections
+import collections.abc
+import contextvars
+import threading
+import typing
+
+from .response import PaginatedList
+
+Model = typing.TypeVar("Model")
+
+DEFAULT_PAGE_LOOKAHEAD = 2
+"""Default number of pages fetched ahead of the one being consumed."""
+
+
+def iter_pages(
+    fetch_page: typing.Callable[[typing.Optional[str]], PaginatedList[Model]],
+    page_token: typing.Optional[str] = None,
+    lookahead: int = DEFAULT_PAGE_LOOKAHEAD,
+) -> collections.abc.Generator[PaginatedList[Model], None, None]:
+    """Yield every page of a paginated result, fetching upcoming pages in the background.
+
+    Nothing is fetched until the first page is requested. From then on a
+    background thread follows ``next_token`` from page to page, staying up to
+    ``lookahead`` pages ahead of the caller, until a page has no ``next_token``.
+    A failed fetch is raised to the caller when it reaches the page that failed,
+    after every page before it has been yielded. Closing the generator (or
+    abandoning it) stops the fetching; a fetch already in flight is discarded.
+
+    ``fetch_page`` runs on the background thread, in a copy of the caller's
+    context, so it must not mutate state the caller may be using.
+
+    Args:
+        fetch_page: Fetches the page a pagination token points to, given ``None`` for the first page.
+        page_token: Token of the first page to fetch, or ``None`` to start at the beginning.
+        lookahead: Most pages fetched ahead of the caller. ``0`` fetches each page
+            on the caller's thread when it is requested, without a background thread.
+
+    Raises:
+        ValueError: ``lookahead`` is negative.
+
+    Examples:
+        >>> from roboto import RobotoClient
+        >>> from roboto.domain.devices import DeviceRecord
+        >>> from roboto.http import iter_pages
+        >>> client = RobotoClient.from_env()
+        >>> def fetch_page(token):
+        ...     query = {"page_token": token} if token else None
+        ...     return client.get("v1/devices/org/og_abc123", query=query).to_paginated_list(DeviceRecord)
+        >>> for page in iter_pages(fetch_page):
+        ...     print(len(page.items))
+    """
+    if lookahead < 0:
+        raise ValueError(f"lookahead must be non-negative, got {lookahead}")
+
+    if lookahead == 0:
+        while True:
+            page = fetch_page(page_token)
+            yield page
+            if not page.next_token:
+                return
+            page_token = page.next_token
+
+    buffer: _PageBuffer[Model] = _PageBuffer(lookahead)
+    context = contextvars.copy_context()
+    threading.Thread(
+        target=context.run,
+        args=(_fetch_pages, fetch_page, page_token, buffer),
+        name="roboto-page-prefetch",
+        daemon=True,
+    ).start()
+    try:
+        while True:
+            prefetched = buffer.take()
+            if prefetched is None:
+                return
+            yield prefetched
+    finally:
+        buffer.close()
+
+
+def iter_items(
+    fetch_page: typing.Callable[[typing.Optional[str]], PaginatedList[Model]],
+    page_token: typing.Optional[str] = None,
+    lookahead: int = DEFAULT_PAGE_LOOKAHEAD,
+) -> collections.abc.Generator[Model, None, None]:
+    """Yield every item of a paginated result, fetching upcoming pages in the background.
+
+    The item-wise counterpart of :py:func:`iter_pages`, which documents the arguments.
+    """
+    for page in iter_pages(fetch_page, page_token=page_token, lookahead=lookahead):
+        yield from page.items
+
+
+class _PageBuffer(typing.Generic[Model]):
+    """Pages fetched ahead of their consumer, handed from the fetching thread to the consuming one."""
+
+    def __init__(self, capacity: int):
+        self.__capacity = capacity
+        self.__condition = threading.Condition()
+        self.__pages: collections.deque[PaginatedList[Model]] = collections.deque()
+        self.__error: typing.Optional[BaseException] = None
+        self.__finished = False
+        self.__closed = False
+
+    def close(self) -> None:
+        """Tell the fetching thread the consumer is gone."""
+        with self.__condition:
+            self.__closed = True
+            self.__pages.clear()
+            self.__condition.notify_all()
+
+    def fail(self, error: BaseException) -> None:
+        with self.__condition:
+            self.__error = error
+            self.__finished = True
+            self.__condition.notify_all()
+
+    def put(self, page: PaginatedList[Model]) -> bool:
+        """Add a fetched page; return whether the consumer wants more."""
+        with self.__condition:
+            if self.__closed:
+                return False
+            self.__pages.append(page)
+            if not page.next_token:
+                self.__finished = True
+            self.__condition.notify_all()
+            return not self.__finished
+
+    def take(self) -> typing.Optional[PaginatedList[Model]]:
+        """The next page, waiting for it to be fetched; ``None`` after the last one.
+
+        Raises:
+            BaseException: Whatever fetching the next page raised.
+        """
+        with self.__condition:
+            while not self.__pages and not self.__finished:
+                self.__condition.wait()
+            if self.__pages:
+                page = self.__pages.popleft()
+                self.__condition.notify_all()
+                return page
+            if self.__error is not None:
+                raise self.__error
+            return None
+
+    def wait_for_room(self) -> bool:
+        """Wait until fewer than ``capacity`` pages are buffered; return whether the consumer wants more."""
+        with self.__condition:
+            while len(self.__pages) >= self.__capacity and not self.__closed:
+                self.__condition.wait()
+            return not self.__closed
+
+
+def _fetch_pages(
+    fetch_page: typing.Callable[[typing.Optional[str]], PaginatedList[Model]],
+    page_token: typing.Optional[str],
+    buffer: _PageBuffer[Model],
+) -> None:
+    """Body of the background thread behind :py:func:`iter_pages`."""
+    while buffer.wait_for_room():
+        try:
+            page = fetch_page(page_token)
+        except BaseException as exc:
+            buffer.fail(exc)
+            return
+        if not buffer.put(page):
+            return
+        page_token = page.next_token
@@ -7,9 +7,11 @@
 import base64
 import collections.abc
 import enum
+import functools
 import http
 import http.client
 import json
+import types
 import typing
 import urllib.response
 
@@ -20,6 +22,7 @@ from roboto.exceptions import (
 )
 
 from ..collection_utils import get_by_path
+from ..compat import import_optional_dependency
 from ..logging import default_logger
 
 logger = default_logger()
@@ -231,36 +234,31 @@ class HttpResponse:
         return dict(self.__response.headers.items())
 
     def to_paginated_list(self, record_type: typing.Type[PydanticModel]) -> PaginatedList[PydanticModel]:
-        unmarshalled = self.to_dict(json_path=["data"])
-        return PaginatedList(
-            items=[record_type.model_validate(item) for item in unmarshalled["items"]],
-            next_token=unmarshalled["next_token"],
-        )
+        return self.__to_payload(PaginatedList[record_type], DEFAULT_RESPONSE_JSONPATH)  # type: ignore[valid-type]
 
     def to_record(
         self,
         record_type: typing.Type[PydanticModel],
         json_path: typing.Optional[collections.abc.Sequence[str]] = DEFAULT_RESPONSE_JSONPATH,
     ) -> PydanticModel:
-        return record_type.model_validate(self.to_dict(json_path=json_path))
+        return self.__to_payload(record_type, json_path)
 
     def to_record_list(
         self,
         record_type: typing.Type[PydanticModel],
         json_path: typing.Optional[collections.abc.Sequence[str]] = DEFAULT_RESPONSE_JSONPATH,
     ) -> list[PydanticModel]:
-        return [record_type.model_validate(item) for item in self.to_dict(json_path=json_path)]
+        return self.__to_payload(list[record_type], json_path)  # type: ignore[valid-type]
 
     def to_string_list(self) -> list[str]:
         return [str(item) for item in self.to_dict(json_path=["data"])]
 
     def to_dict(self, json_path: typing.Optional[collections.abc.Sequence[str]] = None) -> typing.Any:
-        with self.__response:
-            unmarshalled = json.loads(self.__response.read().decode("utf-8"))
-            if json_path is None:
-                return unmarshalled
+        unmarshalled = _loads(self.__read())
+        if json_path is None:
+            return unmarshalled
 
-            return get_by_path(unmarshalled, json_path)
+        return get_by_path(unmarshalled, json_path)
 
     def to_string(self):
         with self.__response:
@@ -268,3 +266,54 @@ class HttpResponse:
 
     def to_int(self) -> int:
         return int(self.to_string())
+
+    def __read(self) -> bytes:
+        with self.__response:
+            return self.__response.read()
+
+    def __to_payload(
+        self,
+        payload_type: typing.Any,
+        json_path: typing.Optional[collections.abc.Sequence[str]],
+    ) -> typing.Any:
+        """Validate the body, or the value at ``json_path`` in it, as ``payload_type``.
+
+        The body is parsed and validated in one pass straight from bytes when the
+        payload is the whole body or sits under ``data``, as in every Roboto API
+        response, instead of being loaded into Python objects first.
+        """
+        if json_path is None:
+            return _adapter(payload_type).validate_json(self.__read())
+        if tuple(json_path) == DEFAULT_RESPONSE_JSONPATH:
+            return _adapter(_DataEnvelope[payload_type]).validate_json(self.__read()).data  # type: ignore[valid-type]
+        return _adapter(payload_type).validate_python(self.to_dict(json_path=json_path))
+
+
+class _DataEnvelope(pydantic.BaseModel, typing.Generic[Model]):
+    """A response body carrying its payload under ``data``."""
+
+    data: Model
+
+
+@functools.lru_cache(maxsize=256)
+def _adapter(payload_type: typing.Any) -> pydantic.TypeAdapter:
+    """A validator for ``payload_type``, built once per type (building one compiles a schema)."""
+    return pydantic.TypeAdapter(payload_type)
+
+
+@functools.cache
+def _orjson() -> typing.Optional[types.ModuleType]:
+    return import_optional_dependency("orjson", "analytics", errors="ignore")
+
+
+def _loads(body: bytes) -> typing.Any:
+    """Parse a JSON body, with ``orjson`` when installed."""
+    orjson = _orjson()
+    if orjson is not None:
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            # orjson rejects a few documents the standard library accepts
+            # (NaN, integers beyond 64 bits); defer to it for those.
+            pass
+    return json.loads(body.decode("utf-8"))
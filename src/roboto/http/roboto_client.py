@@ -16,6 +16,7 @@ from ..logging import LOGGER_NAME
 from ..sentinels import NotSet, is_set
 from .headers import roboto_headers
 from .http_client import HttpClient
+from .options import HttpClientOptions, HttpCompressionOptions
 from .request import HttpRequestDecorator
 from .request_decorators import (
     BearerTokenDecorator,
@@ -23,6 +24,7 @@ from .request_decorators import (
 from .requester import RobotoRequester, RobotoTool
 from .response import HttpResponse
 from .retry import RetryWaitFn
+from .transport import DEFAULT_MAX_CONNECTIONS_PER_HOST, PooledHttpTransport
 
 logger = logging.getLogger(LOGGER_NAME)
 
@@ -45,13 +47,34 @@ class RobotoClient:
         return RobotoClient.from_config(RobotoConfig.from_env(profile_override=profile))
 
     @classmethod
-    def from_config(cls, config: RobotoConfig) -> "RobotoClient":
+    def from_config(
+        cls,
+        config: RobotoConfig,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        compression: typing.Optional[HttpCompressionOptions] = None,
+    ) -> "RobotoClient":
+        """Create a client for the endpoint and credentials in ``config``.
+
+        Args:
+            config: Endpoint, API key, and default timeout to use.
+            max_connections: Most kept-alive connections the client opens to the
+                Roboto API at once. Requests made concurrently beyond this many
+                (e.g. from a large worker pool) wait for a free connection.
+            compression: Whether to compress request and response bodies. ``None``
+                compresses neither.
+        """
         auth_decorator = BearerTokenDecorator(token=config.api_key)
         default_timeout = config.default_http_timeout if is_set(config.default_http_timeout) else DEFAULT_HTTP_TIMEOUT
         return RobotoClient(
             endpoint=config.endpoint,
             auth_decorator=auth_decorator,
-            http_client_kwargs={"default_timeout": default_timeout},
+            http_client_kwargs={
+                "default_timeout": default_timeout,
+                "transport": PooledHttpTransport(max_connections_per_host=max_connections),
+                "options": HttpClientOptions(
+                    compression=compression if compression is not None else HttpCompressionOptions()
+                ),
+            },
         )
 
     @classmethod
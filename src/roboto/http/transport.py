@@ -0,0 +1,300 @@
+# Copyright (c) 2026 Roboto Technologies, Inc.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Transports: how an :py:class:`~roboto.http.HttpClient` puts a request on the wire.
+
+:py:class:`HttpClient` owns everything above the wire -- auth decoration, header
+assembly, retries, and mapping failures to Roboto exceptions -- and hands each
+attempt to an :py:class:`HttpTransport`. Every transport honors the error
+contract of :py:func:`urllib.request.urlopen`, which the client's retry
+predicate and error mapping are written against: an error status raises
+:py:class:`urllib.error.HTTPError`, a timeout waiting for the response raises
+:py:class:`TimeoutError`, and any other failure to connect, send, or read raises
+:py:class:`urllib.error.URLError` whose ``reason`` is the underlying
+:py:class:`OSError` (e.g. :py:class:`ConnectionRefusedError`,
+:py:class:`ConnectionResetError`, :py:class:`socket.gaierror`).
+
+Transports also return bodies, of errors and successes alike, with any
+``Content-Encoding`` listed by :py:func:`~roboto.http.compression.accept_encoding`
+already decoded, so a client that advertises those codings reads plain bytes.
+"""
+
+import abc
+import http.client
+import io
+import os
+import sys
+import threading
+import typing
+import urllib.error
+import urllib.parse
+import urllib.request
+import urllib.response
+
+import urllib3
+import urllib3.exceptions
+import urllib3.util
+
+from .compression import decode_content
+from .response import HttpResponse
+
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 32
+"""Default bound on kept-alive connections to any one host.
+
+Matches the read scheduler's default worker count, so a read minting signed URLs
+on every worker never waits for a connection."""
+
+DEFAULT_MAX_HOSTS = 10
+"""Default number of distinct hosts kept pooled at once.
+
+A client talks almost exclusively to its Roboto API endpoint; the least recently
+used host's connections are closed when this is exceeded."""
+
+_MAX_REDIRECTS = 10
+"""Redirects followed per request, as many as :py:func:`urllib.request.urlopen` follows."""
+
+_DEFAULT_USER_AGENT = "Python-urllib/{}.{}".format(*sys.version_info[:2])
+"""The ``User-Agent`` :py:func:`urllib.request.urlopen` sends when a request sets none."""
+
+
+class HttpTransport(abc.ABC):
+    """Sends one HTTP request attempt and returns its response.
+
+    Implementations must be safe to call from many threads at once, and must
+    raise as described in the module documentation.
+    """
+
+    @abc.abstractmethod
+    def send(
+        self,
+        method: str,
+        url: str,
+        body: typing.Optional[bytes],
+        headers: dict[str, str],
+        timeout: typing.Optional[float],
+    ) -> HttpResponse:
+        """Send a request and return its (successful) response.
+
+        Args:
+            method: HTTP method.
+            url: Absolute request URL.
+            body: Request body, or ``None`` for none.
+            headers: Request headers, fully assembled.
+            timeout: Seconds to wait to connect and for each read, or ``None`` to wait indefinitely.
+
+        Returns:
+            The response, its body already decoded of any ``Content-Encoding``.
+
+        Raises:
+            urllib.error.HTTPError: The server responded with an error status (400 or above).
+            TimeoutError: The response did not arrive within ``timeout``.
+            urllib.error.URLError: The request could not be sent or its response read.
+        """
+
+    def close(self) -> None:
+        """Release any connections the transport holds. The transport stays usable."""
+
+
+class UrllibTransport(HttpTransport):
+    """Sends each request over a new connection with :py:func:`urllib.request.urlopen`.
+
+    Every request pays a TCP (and TLS) handshake; prefer :py:class:`PooledHttpTransport`
+    unless connections must not outlive their request.
+    """
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        body: typing.Optional[bytes],
+        headers: dict[str, str],
+        timeout: typing.Optional[float],
+    ) -> HttpResponse:
+        # S310: URL is constructed by SDK from a configured endpoint, not from user input
+        request = urllib.request.Request(url, method=method)  # noqa: S310
+        if body is not None:
+            request.data = body
+        for key, value in headers.items():
+            request.add_header(key, value)
+        try:
+            response = urllib.request.urlopen(request, timeout=timeout)  # noqa: S310
+        except urllib.error.HTTPError as exc:
+            if not exc.headers.get("Content-Encoding"):
+                raise
+            with exc:
+                body = decode_content(exc.read(), exc.headers.get("Content-Encoding"))
+            raise urllib.error.HTTPError(exc.url, exc.code, exc.msg, exc.headers, io.BytesIO(body)) from None
+
+        if not response.headers.get("Content-Encoding"):
+            return HttpResponse(response)
+        with response:
+            body = decode_content(response.read(), response.headers.get("Content-Encoding"))
+        return HttpResponse(
+            urllib.response.addinfourl(io.BytesIO(body), response.headers, response.url, response.status)
+        )
+
+
+class PooledHttpTransport(HttpTransport):
+    """Sends requests over kept-alive connections pooled per host.
+
+    Successive requests to a host reuse an idle connection instead of opening a
+    new one, so a burst of API calls (listing a large dataset page by page, or
+    minting a signed URL per file) pays one handshake per connection rather than
+    per request. The pool is thread-safe: concurrent requests each take their own
+    connection, up to ``max_connections_per_host``, beyond which they wait for
+    one to be returned rather than opening more.
+
+    Requests behave as with :py:class:`UrllibTransport`: the same default
+    headers, redirects followed, and proxies taken from the environment
+    (``HTTPS_PROXY``, ``NO_PROXY``, ...). The transport never retries itself;
+    retries are the :py:class:`~roboto.http.HttpClient`'s.
+    """
+
+    def __init__(
+        self,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        max_hosts: int = DEFAULT_MAX_HOSTS,
+    ):
+        """
+        Args:
+            max_connections_per_host: Most connections open to any one host.
+            max_hosts: Most distinct hosts pooled at once.
+
+        Raises:
+            ValueError: Either bound is less than 1.
+        """
+        if max_connections_per_host < 1:
+            raise ValueError(f"max_connections_per_host must be at least 1, got {max_connections_per_host}")
+        if max_hosts < 1:
+            raise ValueError(f"max_hosts must be at least 1, got {max_hosts}")
+        self.__max_connections_per_host = max_connections_per_host
+        self.__max_hosts = max_hosts
+        self.__lock = threading.Lock()
+        self.__pid = os.getpid()
+        self.__direct: typing.Optional[urllib3.PoolManager] = None
+        self.__proxied: dict[str, urllib3.ProxyManager] = {}
+
+    def close(self) -> None:
+        with self.__lock:
+            managers = self.__managers()
+            self.__direct = None
+            self.__proxied = {}
+        for manager in managers:
+            manager.clear()
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        body: typing.Optional[bytes],
+        headers: dict[str, str],
+        timeout: typing.Optional[float],
+    ) -> HttpResponse:
+        # urlopen's defaults, which caller headers replace whatever their capitalization.
+        defaults = {"User-Agent": _DEFAULT_USER_AGENT}
+        if body is not None:
+            defaults["Content-Type"] = "application/x-www-form-urlencoded"
+        given = {key.lower() for key in headers}
+        request_headers = {key: value for key, value in defaults.items() if key.lower() not in given}
+        request_headers.update(headers)
+
+        try:
+            response = self.__manager_for(url).request(
+                method,
+                url,
+                body=body,
+                headers=request_headers,
+                timeout=urllib3.Timeout(connect=timeout, read=timeout),
+                retries=urllib3.Retry(total=None, connect=0, read=0, status=0, other=0, redirect=_MAX_REDIRECTS),
+                # Decoded below, so both transports accept the same codings.
+                decode_content=False,
+            )
+        except urllib3.exceptions.HTTPError as exc:
+            raise _as_urllib_error(exc) from exc
+
+        message = http.client.HTTPMessage()
+        for key, value in response.headers.items():
+            message[key] = value
+        body_stream = io.BytesIO(decode_content(response.data, response.headers.get("Content-Encoding")))
+        final_url = response.url or url
+        if response.status >= 400:
+            raise urllib.error.HTTPError(final_url, response.status, response.reason or "", message, body_stream)
+        return HttpResponse(urllib.response.addinfourl(body_stream, message, final_url, response.status))
+
+    def __manager_for(self, url: str) -> urllib3.PoolManager:
+        """The pool to send a request for ``url`` through: direct, or via the environment's proxy for it."""
+        parsed = urllib.parse.urlsplit(url)
+        proxy = urllib.request.getproxies().get(parsed.scheme)
+        if proxy is not None and urllib.request.proxy_bypass(parsed.hostname or ""):
+            proxy = None
+
+        with self.__lock:
+            if self.__pid != os.getpid():
+                # A forked child must not share its parent's sockets: both would
+                # read and write the same streams. Start over with fresh pools.
+                self.__pid = os.getpid()
+                self.__direct = None
+                self.__proxied = {}
+
+            if proxy is None:
+                if self.__direct is None:
+                    self.__direct = urllib3.PoolManager(
+                        num_pools=self.__max_hosts,
+                        maxsize=self.__max_connections_per_host,
+                        block=True,
+                    )
+                return self.__direct
+
+            manager = self.__proxied.get(proxy)
+            if manager is None:
+                proxy_auth = urllib3.util.parse_url(proxy).auth
+                manager = urllib3.ProxyManager(
+                    proxy,
+                    num_pools=self.__max_hosts,
+                    maxsize=self.__max_connections_per_host,
+                    block=True,
+                    proxy_headers=urllib3.make_headers(proxy_basic_auth=proxy_auth) if proxy_auth else None,
+                )
+                self.__proxied[proxy] = manager
+            return manager
+
+    def __managers(self) -> list[urllib3.PoolManager]:
+        managers: list[urllib3.PoolManager] = list(self.__proxied.values())
+        if self.__direct is not None:
+            managers.append(self.__direct)
+        return managers
+
+
+def _as_urllib_error(exc: urllib3.exceptions.HTTPError) -> Exception:
+    """Restate a urllib3 failure as the exception ``urlopen`` raises for it.
+
+    Outside a read timeout, that is a :py:class:`urllib.error.URLError` whose
+    ``reason`` is the underlying :py:class:`OSError` where urllib3 kept one, so
+    retry predicates see the same exception types under either transport.
+    """
+    failure: Exception = exc
+    if isinstance(exc, urllib3.exceptions.MaxRetryError) and exc.reason is not None:
+        failure = exc.reason
+
+    if isinstance(failure, urllib3.exceptions.ReadTimeoutError):
+        return TimeoutError(str(failure))
+
+    reason: BaseException
+    if (
+        isinstance(failure, urllib3.exceptions.ProtocolError)
+        and len(failure.args) > 1
+        and isinstance(failure.args[1], OSError)
+    ):
+        # e.g. ("Connection aborted.", RemoteDisconnected(...))
+        reason = failure.args[1]
+    elif isinstance(failure.__cause__, OSError):
+        # Connection failures (refused, DNS resolution, TLS) chain the socket error.
+        reason = failure.__cause__
+    elif isinstance(failure, urllib3.exceptions.TimeoutError):
+        reason = TimeoutError(str(failure))
+    else:
+        reason = OSError(str(failure))
+    return urllib.error.URLError(reason)
@@ -9,7 +9,7 @@ import math
 import typing
 
 from ..config import RobotoConfig
-from ..http import RobotoClient
+from ..http import PaginatedList, RobotoClient, iter_items
 from ..waiters import wait_for
 from .api import (
     QueryContentMode,
@@ -63,21 +63,15 @@ class QueryClient:
     def get_query_results(
         self, query_id: str, owner_org_id: typing.Optional[str] = None
     ) -> collections.abc.Generator[dict[str, typing.Any], None, None]:
-        query_params: dict[str, str] = {}
-        while True:
+        def fetch_page(page_token: typing.Optional[str]) -> PaginatedList[dict[str, typing.Any]]:
             response = self.__roboto_client.get(
                 f"v1/query/id/{query_id}/results",
-                query=query_params,
+                query={"next_page_token": page_token} if page_token else {},
                 owner_org_id=owner_org_id or self.__owner_org_id,
             )
-            response_data = response.to_dict(json_path=["data"])
-            for record in response_data["items"]:
-                yield record
-
-            if "next_token" in response_data and response_data["next_token"]:
-                query_params["next_page_token"] = response_data["next_token"]
-            else:
-                break
+            return response.to_record(PaginatedList[dict[str, typing.Any]])
+
+        yield from iter_items(fetch_page)
 
     def submit_query(
         self,
@@ -8,8 +8,10 @@
 
 Whole-file transfer (upload transactions, download sessions, credentials, and
 the object-store abstraction) for moving files in and out of Roboto storage,
-plus the range-reader, local cache, and sparse-buffer primitives for streaming
-byte-range reads that the format decoders in ``roboto.formats`` build on.
+plus the range-reader, local cache (and its size-bounded cache manager), shared
+connection pool, signed-URL cache, on-disk byte-range cache, and sparse-buffer
+primitives for streaming byte-range reads that the format decoders in
+``roboto.formats`` build on.
 """
 
 from .api_operations import (
@@ -19,12 +21,25 @@ from .api_operations import (
     BeginUploadRequest,
     BeginUploadResponse,
     ReportUploadProgressRequest,
+    SignedUrlBatchRequest,
+    SignedUrlBatchResponse,
 )
 from .cache import CachePolicy
+from .cache_manager import CacheEntry, CacheManager, configure_cache_limits
+from .connection_pool import configure_connection_pool
 from .credentials import RobotoCredentials
 from .download_session import DownloadableFile
 from .file_service import FileService
 from .http_range_reader import HttpRangeReader, as_io_bytes
+from .range_cache import RangeCache, configure_range_cache
+from .signed_url_cache import (
+    SIGNED_URL_BATCH_SIZE,
+    SignedUrlCache,
+    configure_signed_url_cache,
+    shared_signed_url_cache,
+    signed_url_for_file,
+    signed_urls_for_files,
+)
 from .sparse_buffer import SparseBuffer
 
 __all__ = (
@@ -33,12 +48,26 @@ __all__ = (
     "BeginSignedUrlUploadResponse",
     "BeginUploadRequest",
     "BeginUploadResponse",
+    "CacheEntry",
+    "CacheManager",
     "CachePolicy",
     "DownloadableFile",
     "FileService",
     "HttpRangeReader",
+    "RangeCache",
     "ReportUploadProgressRequest",
     "RobotoCredentials",
+    "SIGNED_URL_BATCH_SIZE",
+    "SignedUrlBatchRequest",
+    "SignedUrlBatchResponse",
+    "SignedUrlCache",
     "SparseBuffer",
     "as_io_bytes",
+    "configure_cache_limits",
+    "configure_connection_pool",
+    "configure_range_cache",
+    "configure_signed_url_cache",
+    "shared_signed_url_cache",
+    "signed_url_for_file",
+    "signed_urls_for_files",
 )
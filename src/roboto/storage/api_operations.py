@@ -103,3 +103,20 @@ class ReportUploadProgressRequest(pydantic.BaseModel):
 
     manifest_items: list[str]
     """List of file URIs that have completed upload."""
+
+
+class SignedUrlBatchRequest(pydantic.BaseModel):
+    """Request payload for minting signed download URLs for several files in one call."""
+
+    file_ids: list[str]
+    """IDs of the files to mint download URLs for."""
+
+
+class SignedUrlBatchResponse(pydantic.BaseModel):
+    """Response containing signed download URLs for a batch of files.
+
+    Files that do not exist, or that the caller may not read, are omitted.
+    """
+
+    signed_urls: dict[str, str]
+    """Dictionary mapping file IDs to their signed download URLs."""
@@ -9,13 +9,16 @@ from __future__ import annotations
 import enum
 import os
 import pathlib
+import shutil
+import sqlite3
 import threading
 import typing
-import urllib.request
 import uuid
 import weakref
 
 from ..logging import default_logger
+from .cache_manager import cache_manager_for
+from .connection_pool import shared_pool_manager
 
 logger = default_logger()
 
@@ -146,10 +149,26 @@ def get_download_lock(key: str) -> threading.Lock:
         return lock
 
 
+def record_cache_hit(path: pathlib.Path, source_id: typing.Optional[str] = None) -> None:
+    """Mark a reused cached file as most recently used, so size-bounded eviction keeps it longest.
+
+    Bookkeeping failures are logged and ignored: they never fail the read.
+
+    Args:
+        path: The cached file being reused.
+        source_id: Id of the Roboto file it was downloaded from, if known.
+    """
+    try:
+        cache_manager_for(path.parent).record_access(path, source_id)
+    except (OSError, sqlite3.Error):
+        logger.debug("Failed to record access to cached file %s", path, exc_info=True)
+
+
 def download_to_cache(
     url_provider: typing.Callable[[], str],
     outfile: pathlib.Path,
     expected_size: typing.Optional[int] = None,
+    source_id: typing.Optional[str] = None,
 ) -> None:
     """Download a remote file to ``outfile`` safely under concurrency.
 
@@ -165,11 +184,20 @@ def download_to_cache(
     * If the download raises, the ``.part`` file is removed and ``outfile``
       is left untouched.
 
+    The body is streamed to the ``.part`` file over the process-wide
+    connection pool (:py:func:`~roboto.storage.connection_pool.shared_pool_manager`),
+    so successive downloads from the same storage host reuse kept-alive
+    connections instead of re-handshaking per file.
+
     When ``expected_size`` is supplied, the written ``.part`` file's size is
     verified against it before the atomic rename. A truncated body — which
-    :func:`urllib.request.urlretrieve` does not flag when the response carries
-    no ``Content-Length`` — fails this check, so the ``.part`` is discarded and
-    nothing is promoted to the cache: a partial download is never made sticky.
+    goes unflagged when the response carries no ``Content-Length`` — fails this
+    check, so the ``.part`` is discarded and nothing is promoted to the cache: a
+    partial download is never made sticky.
+
+    A completed download is recorded in the cache directory's index and the
+    directory's limits (see :py:func:`~roboto.storage.configure_cache_limits`)
+    are enforced, evicting least recently used files other than ``outfile``.
 
     Args:
         url_provider: Resolves the download URL. Called only when the download
@@ -178,8 +206,12 @@ def download_to_cache(
         outfile: Final cache path for the downloaded file.
         expected_size: The backing object's size in bytes when the server
             reports it; ``None`` skips the completeness check.
+        source_id: Id of the Roboto file being downloaded, recorded in the
+            cache index so the file can be pinned against eviction.
 
     Raises:
+        OSError: The server answered with a non-200 status (e.g. 403 on an
+            expired signed URL).
         ValueError: ``expected_size`` is supplied and the downloaded file's size
             does not match it (a truncated or otherwise incomplete download).
     """
@@ -194,7 +226,7 @@ def download_to_cache(
         url = url_provider()
         logger.debug("Downloading file to local cache at %s", outfile)
         try:
-            urllib.request.urlretrieve(url, str(tmpfile))  # noqa: S310 — presigned S3 URL from Roboto API
+            _stream_to_file(url, tmpfile)
             if expected_size is not None:
                 actual_size = tmpfile.stat().st_size
                 if actual_size != expected_size:
@@ -207,3 +239,29 @@ def download_to_cache(
         except BaseException:
             tmpfile.unlink(missing_ok=True)
             raise
+
+    try:
+        manager = cache_manager_for(outfile.parent)
+        manager.record_access(outfile, source_id)
+        manager.enforce_limits(keep=outfile)
+    except (OSError, sqlite3.Error):
+        logger.debug("Failed to update the cache index for %s", outfile, exc_info=True)
+
+
+def _stream_to_file(url: str, outfile: pathlib.Path) -> None:
+    """GET ``url`` over the shared connection pool and write the body to ``outfile``.
+
+    The body is streamed rather than buffered, so a large file never sits
+    whole in memory; the connection returns to the pool once it is drained.
+    It is written as stored, without undoing any ``Content-Encoding``, so the
+    file matches the object byte for byte and its size can be checked.
+    """
+    resp = shared_pool_manager().request("GET", url, preload_content=False, decode_content=False)
+    try:
+        if resp.status != 200:
+            resp.drain_conn()
+            raise OSError(f"HTTP {resp.status} downloading file to local cache; the response body is not file bytes.")
+        with open(outfile, "wb") as f:
+            shutil.copyfileobj(resp, f)
+    finally:
+        resp.release_conn()
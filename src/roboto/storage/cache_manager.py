@@ -0,0 +1,349 @@
+# Copyright (c) 2026 Roboto Technologies, Inc.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Size- and age-bounded bookkeeping for directories of locally cached data files.
+
+:py:func:`~roboto.storage.cache.download_to_cache` only ever adds files, so a
+cache directory left alone grows until the disk fills. A :py:class:`CacheManager`
+keeps a small SQLite index beside the cached files recording each one's size,
+last access, and the Roboto file it was downloaded from, and evicts the least
+recently used files once the directory exceeds its size budget (or a file
+outlives its maximum age). Files recorded under one source id are evicted
+together, and can be pinned by that id to exempt them.
+
+SQLite's own file locking makes the index safe to share between processes, so
+several notebooks or jobs on one machine can use, and bound, the same cache.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import datetime
+import pathlib
+import sqlite3
+import threading
+import time
+import typing
+
+from ..logging import default_logger
+
+logger = default_logger()
+
+
+DEFAULT_CACHE_MAX_BYTES = 20 * 1024 * 1024 * 1024
+"""Default size budget for a cache directory (20 GiB)."""
+
+INDEX_FILE_NAME = ".cache-index.sqlite3"
+"""Name of the index database kept inside each managed cache directory."""
+
+_BUSY_TIMEOUT_SECONDS = 30.0
+"""How long an index operation waits on another process's write lock before failing."""
+
+_IN_USE_GRACE_SECONDS = 60.0
+"""Files accessed within this many seconds are never evicted.
+
+Another process may have just downloaded or chosen to reuse such a file and
+not yet opened it; deleting it in that window would fail its read. The price is
+that a directory may briefly exceed its size budget while files are in use.
+"""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    name TEXT PRIMARY KEY,
+    source_id TEXT,
+    size_bytes INTEGER NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pins (
+    source_id TEXT PRIMARY KEY
+);
+"""
+
+
+@dataclasses.dataclass(frozen=True)
+class CacheEntry:
+    """One file tracked in a managed cache directory."""
+
+    path: pathlib.Path
+    """Location of the cached file."""
+
+    source_id: typing.Optional[str]
+    """Id of what the cached file was made from, such as the Roboto file it was downloaded
+    from; ``None`` for a file found in the directory without a recorded source."""
+
+    size_bytes: int
+    """Size of the cached file in bytes."""
+
+    last_access: datetime.datetime
+    """When the cached file was last downloaded or read, in UTC."""
+
+    pinned: bool
+    """Whether the entry is exempt from eviction."""
+
+
+class CacheManager:
+    """Bounds a directory of cached files by total size and age, evicting least recently used files first.
+
+    Files are recorded when downloaded and touched each time they are reused;
+    :py:meth:`enforce_limits` then deletes unpinned files, oldest access first,
+    until the directory fits. Files sharing a source id form one unit, used as
+    recently as its most recently used file and evicted whole, so a cached item
+    stored as several files is never left partly deleted by eviction. Files already in the directory but never recorded
+    (e.g. written before the index existed) are adopted on the next enforcement
+    with their modification time as their last access.
+
+    Examples:
+        Pin a file so eviction never removes it:
+
+        >>> from roboto.domain.topics import TopicDataService
+        >>> from roboto.storage import CacheManager
+        >>> CacheManager(TopicDataService.DEFAULT_CACHE_DIR).pin("fl_abc123")
+    """
+
+    def __init__(
+        self,
+        cache_dir: typing.Union[str, pathlib.Path],
+        max_bytes: typing.Optional[int] = DEFAULT_CACHE_MAX_BYTES,
+        max_age: typing.Optional[datetime.timedelta] = None,
+    ):
+        """
+        Args:
+            cache_dir: The cache directory to manage.
+            max_bytes: Size budget for the directory's cached files, or ``None`` for no size bound.
+            max_age: Longest a cached file may go unaccessed before it is evicted,
+                or ``None`` for no age bound.
+
+        Raises:
+            ValueError: ``max_bytes`` is negative or ``max_age`` is not positive.
+        """
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError(f"max_bytes must not be negative, got {max_bytes}")
+        if max_age is not None and max_age <= datetime.timedelta(0):
+            raise ValueError(f"max_age must be positive, got {max_age}")
+        self.__cache_dir = pathlib.Path(cache_dir)
+        self.__max_bytes = max_bytes
+        self.__max_age = max_age
+
+    @property
+    def cache_dir(self) -> pathlib.Path:
+        """The managed cache directory."""
+        return self.__cache_dir
+
+    @property
+    def max_age(self) -> typing.Optional[datetime.timedelta]:
+        """Longest a cached file may go unaccessed before it is evicted."""
+        return self.__max_age
+
+    @property
+    def max_bytes(self) -> typing.Optional[int]:
+        """Size budget for the directory's cached files."""
+        return self.__max_bytes
+
+    def enforce_limits(self, keep: typing.Optional[pathlib.Path] = None) -> list[CacheEntry]:
+        """Evict unpinned files, least recently used first, until the directory is within its limits.
+
+        Files whose last access is older than ``max_age`` are evicted first, then
+        the oldest remaining files until the total size is at most ``max_bytes``.
+        Files sharing a source id are evicted together, when the most recently
+        used of them qualifies. Files accessed in the last minute, which a
+        concurrent read may be about to open, are left in place, as is a file that
+        cannot be deleted (e.g. held open on Windows).
+
+        Args:
+            keep: A cached file never to evict in this pass, along with the files
+                sharing its source id, such as the one just downloaded for the read
+                in progress.
+
+        Returns:
+            The evicted entries.
+        """
+        if not self.__cache_dir.is_dir():
+            return []
+
+        with self.__connect() as conn:
+            # BEGIN IMMEDIATE takes the index's write lock up front, so concurrent
+            # enforcements in other processes run one at a time.
+            conn.execute("BEGIN IMMEDIATE")
+            self.__reconcile(conn)
+            rows = conn.execute(
+                "SELECT name, source_id, size_bytes, last_access, source_id IN (SELECT source_id FROM pins)"
+                " FROM entries ORDER BY last_access"
+            ).fetchall()
+
+            # Files sharing a source id form one unit; files without one stand alone.
+            units: dict[typing.Any, list[typing.Any]] = {}
+            for row in rows:
+                name, source_id = row[0], row[1]
+                units.setdefault(source_id if source_id is not None else (name,), []).append(row)
+
+            total = sum(row[2] for row in rows)
+            now = time.time()
+            age_cutoff = now - self.__max_age.total_seconds() if self.__max_age is not None else None
+            in_use_cutoff = now - _IN_USE_GRACE_SECONDS
+            evicted: list[CacheEntry] = []
+            # A unit is as recently used as its most recently used file.
+            for members in sorted(units.values(), key=lambda members: max(row[3] for row in members)):
+                last_access = max(row[3] for row in members)
+                expired = age_cutoff is not None and last_access < age_cutoff
+                over_budget = self.__max_bytes is not None and total > self.__max_bytes
+                if not (expired or over_budget):
+                    # Units are oldest first: once one is within both limits, so are the rest.
+                    break
+                if (
+                    any(row[4] for row in members)
+                    or last_access > in_use_cutoff
+                    or (keep is not None and any(self.__cache_dir / row[0] == keep for row in members))
+                ):
+                    continue
+                for name, source_id, size_bytes, file_last_access, pinned in members:
+                    path = self.__cache_dir / name
+                    try:
+                        path.unlink(missing_ok=True)
+                    except OSError:
+                        logger.debug("Could not evict cached file %s; leaving it in place", path, exc_info=True)
+                        continue
+                    conn.execute("DELETE FROM entries WHERE name = ?", (name,))
+                    total -= size_bytes
+                    evicted.append(self.__to_entry(name, source_id, size_bytes, file_last_access, bool(pinned)))
+
+        if evicted:
+            logger.debug("Evicted %d files from cache directory %s", len(evicted), self.__cache_dir)
+        return evicted
+
+    def entries(self) -> list[CacheEntry]:
+        """Every file tracked in the cache directory, least recently used first."""
+        if not self.__index_path().exists():
+            return []
+        with self.__connect() as conn:
+            rows = conn.execute(
+                "SELECT name, source_id, size_bytes, last_access, source_id IN (SELECT source_id FROM pins)"
+                " FROM entries ORDER BY last_access"
+            ).fetchall()
+        return [self.__to_entry(*row) for row in rows]
+
+    def pin(self, source_id: str) -> None:
+        """Exempt files downloaded from a Roboto file from eviction, including ones cached later."""
+        with self.__connect() as conn:
+            conn.execute("INSERT OR IGNORE INTO pins (source_id) VALUES (?)", (source_id,))
+
+    def record_access(self, path: pathlib.Path, source_id: typing.Optional[str] = None) -> None:
+        """Record that a cached file was just downloaded or read, making it the most recently used.
+
+        Args:
+            path: The cached file, inside the managed directory.
+            source_id: Id of the Roboto file it was downloaded from, if known.
+        """
+        try:
+            size_bytes = path.stat().st_size
+        except FileNotFoundError:
+            return
+        with self.__connect() as conn:
+            conn.execute(
+                "INSERT INTO entries (name, source_id, size_bytes, last_access) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT (name) DO UPDATE SET"
+                " source_id = COALESCE(excluded.source_id, source_id),"
+                " size_bytes = excluded.size_bytes, last_access = excluded.last_access",
+                (path.name, source_id, size_bytes, time.time()),
+            )
+
+    def unpin(self, source_id: str) -> None:
+        """Make files downloaded from a Roboto file evictable again."""
+        if not self.__index_path().exists():
+            return
+        with self.__connect() as conn:
+            conn.execute("DELETE FROM pins WHERE source_id = ?", (source_id,))
+
+    @contextlib.contextmanager
+    def __connect(self) -> typing.Iterator[sqlite3.Connection]:
+        """Open the index, creating it if needed, and commit (or roll back) on exit."""
+        self.__cache_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.__index_path(), timeout=_BUSY_TIMEOUT_SECONDS, isolation_level=None)
+        try:
+            conn.executescript(_SCHEMA)
+            yield conn
+            if conn.in_transaction:
+                conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def __index_path(self) -> pathlib.Path:
+        return self.__cache_dir / INDEX_FILE_NAME
+
+    def __reconcile(self, conn: sqlite3.Connection) -> None:
+        """Bring the index in line with the directory: drop rows for deleted files, adopt unrecorded ones."""
+        on_disk: dict[str, typing.Any] = {}
+        for path in self.__cache_dir.iterdir():
+            # Skip the index itself (and its journal files) and in-flight ``.part`` downloads.
+            if path.name.startswith(".") or path.name.endswith(".part") or not path.is_file():
+                continue
+            on_disk[path.name] = path.stat()
+
+        indexed = {name for (name,) in conn.execute("SELECT name FROM entries")}
+        conn.executemany("DELETE FROM entries WHERE name = ?", [(name,) for name in indexed - on_disk.keys()])
+        conn.executemany(
+            "INSERT INTO entries (name, source_id, size_bytes, last_access) VALUES (?, NULL, ?, ?)",
+            [(name, on_disk[name].st_size, on_disk[name].st_mtime) for name in on_disk.keys() - indexed],
+        )
+
+    def __to_entry(
+        self, name: str, source_id: typing.Optional[str], size_bytes: int, last_access: float, pinned: bool
+    ) -> CacheEntry:
+        return CacheEntry(
+            path=self.__cache_dir / name,
+            source_id=source_id,
+            size_bytes=size_bytes,
+            last_access=datetime.datetime.fromtimestamp(last_access, tz=datetime.timezone.utc),
+            pinned=bool(pinned),
+        )
+
+
+_limits: tuple[typing.Optional[int], typing.Optional[datetime.timedelta]] = (DEFAULT_CACHE_MAX_BYTES, None)
+"""The ``(max_bytes, max_age)`` the SDK applies to the cache directories it downloads into."""
+
+_limits_guard = threading.Lock()
+"""Guards replacement of ``_limits``."""
+
+
+def configure_cache_limits(
+    max_bytes: typing.Optional[int] = DEFAULT_CACHE_MAX_BYTES,
+    max_age: typing.Optional[datetime.timedelta] = None,
+) -> None:
+    """Set the limits the SDK enforces on the local directories it caches downloaded data files in.
+
+    Applies to topic-data files downloaded by ``get_data``/``get_data_as_df``
+    reads. Limits are enforced by each process whenever it downloads a file, so
+    processes sharing a cache directory should agree on them.
+
+    Args:
+        max_bytes: Size budget per cache directory, or ``None`` for no size bound.
+        max_age: Longest a cached file may go unaccessed before it is evicted,
+            or ``None`` for no age bound.
+
+    Raises:
+        ValueError: ``max_bytes`` is negative or ``max_age`` is not positive.
+
+    Examples:
+        >>> import datetime
+        >>> from roboto.storage import configure_cache_limits
+        >>> configure_cache_limits(max_bytes=100 * 1024**3, max_age=datetime.timedelta(days=30))
+    """
+    # Validate eagerly, the same way the manager will.
+    CacheManager(".", max_bytes=max_bytes, max_age=max_age)
+
+    global _limits
+    with _limits_guard:
+        _limits = (max_bytes, max_age)
+
+
+def cache_manager_for(cache_dir: typing.Union[str, pathlib.Path]) -> CacheManager:
+    """Return a manager for ``cache_dir`` applying the limits set by :py:func:`configure_cache_limits`."""
+    max_bytes, max_age = _limits
+    return CacheManager(cache_dir, max_bytes=max_bytes, max_age=max_age)
@@ -0,0 +1,133 @@
+# Copyright (c) 2026 Roboto Technologies, Inc.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Process-wide HTTP connection pool for object-storage reads.
+
+Every byte-range read, streamed Parquet open, and cache download in the SDK
+talks to the same handful of storage hosts (typically one S3 endpoint). Sharing
+one host-keyed :py:class:`urllib3.PoolManager` across them lets a connection
+opened for one file be reused, kept alive, for the next, so a read over many
+representation files pays one TCP + TLS handshake per connection slot rather
+than one per file.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import typing
+
+import urllib3
+
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 32
+"""Default bound on open connections to any one storage host.
+
+Matches the per-reader parallel prefetch bound in
+:py:mod:`~roboto.storage.http_range_reader`, so a single reader's parallel
+fetch never waits on the pool; concurrent readers of the same host share
+(and block on) the same slots instead of opening connections without limit.
+"""
+
+DEFAULT_MAX_HOSTS = 16
+"""Default number of distinct hosts kept pooled at once.
+
+Signed URLs almost always point at a single storage endpoint, so a small bound
+suffices; the least recently used host's pool is closed when it is exceeded.
+"""
+
+_RETRIES = urllib3.Retry(total=3)
+"""Retry policy applied to every pooled request (connect errors, read errors, and redirects)."""
+
+_pool_bounds: tuple[int, int] = (DEFAULT_MAX_CONNECTIONS_PER_HOST, DEFAULT_MAX_HOSTS)
+"""The ``(max_connections_per_host, max_hosts)`` the shared pool is (re)created with."""
+
+_pool_manager: typing.Optional[urllib3.PoolManager] = None
+"""The shared pool manager, created lazily on first use."""
+
+_pool_manager_guard = threading.Lock()
+"""Guards creation and replacement of ``_pool_manager``."""
+
+
+def _new_pool_manager(max_connections_per_host: int, max_hosts: int) -> urllib3.PoolManager:
+    return urllib3.PoolManager(
+        num_pools=max_hosts,
+        maxsize=max_connections_per_host,
+        block=True,
+        retries=_RETRIES,
+    )
+
+
+def configure_connection_pool(
+    max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    max_hosts: int = DEFAULT_MAX_HOSTS,
+) -> None:
+    """Resize the process-wide storage connection pool.
+
+    Replaces the shared pool; requests already in flight finish on the
+    connections they hold, and the previous pool's idle connections are closed.
+    Call once at startup (e.g. at the top of a batch job or notebook) before
+    issuing reads.
+
+    Args:
+        max_connections_per_host: Most connections kept open to any one host.
+            Requests beyond it wait for a connection to be returned rather than
+            opening a new one.
+        max_hosts: Most distinct hosts pooled at once; the least recently used
+            host's connections are closed when exceeded.
+
+    Raises:
+        ValueError: Either bound is less than 1.
+
+    Examples:
+        >>> from roboto.storage import configure_connection_pool
+        >>> configure_connection_pool(max_connections_per_host=64)
+    """
+    if max_connections_per_host < 1:
+        raise ValueError(f"max_connections_per_host must be at least 1, got {max_connections_per_host}")
+    if max_hosts < 1:
+        raise ValueError(f"max_hosts must be at least 1, got {max_hosts}")
+
+    global _pool_bounds, _pool_manager
+    with _pool_manager_guard:
+        previous = _pool_manager
+        _pool_bounds = (max_connections_per_host, max_hosts)
+        _pool_manager = _new_pool_manager(max_connections_per_host, max_hosts)
+    if previous is not None:
+        previous.clear()
+
+
+def shared_pool_manager() -> urllib3.PoolManager:
+    """Return the process-wide storage connection pool, creating it with the configured bounds on first use.
+
+    Pools are keyed by scheme, host, and port, so any URL on an already-pooled
+    host reuses that host's kept-alive connections. Issue requests through the
+    manager (``request``/``urlopen``) rather than holding on to a per-host pool:
+    a host's pool may be closed when it falls out of the ``max_hosts`` bound.
+    """
+    global _pool_manager
+    manager = _pool_manager
+    if manager is not None:
+        return manager
+    with _pool_manager_guard:
+        if _pool_manager is None:
+            _pool_manager = _new_pool_manager(*_pool_bounds)
+        return _pool_manager
+
+
+def _reset_after_fork() -> None:
+    """Drop the inherited pool in a forked child so it opens connections of its own.
+
+    A child shares its parent's open sockets; if both kept using the same pooled
+    connection, their requests and responses would interleave on one stream and
+    each could read the other's bytes. The configured bounds carry over.
+    """
+    global _pool_manager, _pool_manager_guard
+    _pool_manager = None
+    _pool_manager_guard = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
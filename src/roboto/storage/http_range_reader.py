@@ -14,14 +14,15 @@ downloading the entire file.
 
 from __future__ import annotations
 
+import collections.abc
 import concurrent.futures
 import logging
 import os
+import threading
 import typing
-import urllib.parse
-
-import urllib3
 
+from .connection_pool import shared_pool_manager
+from .range_cache import shared_range_cache
 from .sparse_buffer import SparseBuffer
 
 logger = logging.getLogger(__name__)
@@ -155,57 +156,65 @@ class HttpRangeReader:
     simple single-buffer approach, this cache retains all fetched regions, so
     seeking back to previously-read data doesn't trigger re-fetches.
 
-    This class implements the IO[bytes] protocol methods needed by mcap.reader.
-
-    Uses urllib3 connection pooling to reuse HTTP connections across requests,
-    reducing TCP handshake and TLS negotiation overhead.
+    This class implements the IO[bytes] protocol methods needed by mcap.reader
+    and by pyarrow's Python-file adapter.
+
+    Requests go through the process-wide pool from
+    :py:func:`~roboto.storage.connection_pool.shared_pool_manager`, so
+    connections to a storage host are kept alive and reused across requests
+    and across readers, avoiding a TCP handshake and TLS negotiation per file.
+
+    When the on-disk byte-range cache is enabled
+    (:py:func:`~roboto.storage.configure_range_cache`) and the reader is given a
+    ``cache_id``, the in-memory cache is backed by it: missing bytes are loaded
+    from disk before falling back to HTTP, and every fetched region is written
+    back. Given the file's ``size`` as well, a reader over a warm file skips the
+    open-time probes and issues no HTTP requests at all.
+
+    :py:meth:`prefetch_range`, :py:meth:`prefetch_ranges`, :py:meth:`view`, and
+    :py:meth:`discard` may be called from several threads at once (e.g. a
+    pipeline fetching upcoming chunks while earlier ones decode); the cache is
+    guarded by a lock that is never held across a network request. The ``read``/``seek`` position is
+    shared state and belongs to a single caller.
     """
 
-    __pool: urllib3.HTTPConnectionPool | urllib3.HTTPSConnectionPool
-
-    def __init__(self, url: str, read_ahead_size: int = _READ_AHEAD_SIZE):
+    def __init__(
+        self,
+        url: str,
+        read_ahead_size: int = _READ_AHEAD_SIZE,
+        cache_id: typing.Optional[str] = None,
+        size: typing.Optional[int] = None,
+    ):
         """
         Initialize the reader with a presigned URL.
 
         Args:
             url: HTTP(S) URL supporting Range requests (e.g., S3 presigned URL)
             read_ahead_size: Number of bytes to fetch per cache miss
+            cache_id: Stable identifier of the remote file (e.g., its file id),
+                keying it in the on-disk byte-range cache. Without one, the
+                disk cache is not used; presigned URLs change on every signing
+                and cannot serve as the key.
+            size: Total size of the remote file in bytes, if already known.
+                Lets an open over disk-cached bytes skip the network probes.
         """
         self.__url = url
         self.__read_ahead_size = read_ahead_size
         self.__pos = 0
-
-        # Parse URL to set up connection pool
-        parsed = urllib.parse.urlparse(url)
-        self.__scheme = parsed.scheme
-        self.__host = parsed.netloc
-        # Reconstruct path with query string for requests
-        self.__path = parsed.path
-        if parsed.query:
-            self.__path += "?" + parsed.query
-
-        # Create a connection pool for HTTP connection reuse.
-        # This avoids TCP handshake + TLS negotiation overhead on subsequent requests.
-        # Pool size matches max parallel threads - connections are reused across
-        # sequential reads (header/footer/summary) and parallel prefetch phases.
-        if self.__scheme == "https":
-            self.__pool = urllib3.HTTPSConnectionPool(
-                self.__host, maxsize=_MAX_PREFETCH_THREADS, block=True, retries=urllib3.Retry(total=3)
-            )
-        else:
-            self.__pool = urllib3.HTTPConnectionPool(
-                self.__host, maxsize=_MAX_PREFETCH_THREADS, block=True, retries=urllib3.Retry(total=3)
-            )
-
-        # Once the pool exists it owns OS resources (sockets) that must be
-        # released even if the opening probes fail. Nothing has taken ownership
-        # via ``with`` yet, so a raise here would otherwise leak the pool; close
-        # it on any construction failure and re-raise.
-        try:
+        self.__closed = False
+        self.__cache_id = cache_id
+        self.__range_cache = shared_range_cache() if cache_id is not None else None
+        # Guards self.__buffer. Held only around in-memory cache operations,
+        # never across an HTTP request or disk-cache I/O, so concurrent
+        # prefetches fetch in parallel.
+        self.__buffer_lock = threading.Lock()
+
+        # Each request looks up the shared, host-keyed pool rather than holding
+        # it, so a reader made before a fork or a configure_connection_pool call
+        # uses the current pool. The reader itself owns no sockets: a failure in
+        # the opening probes leaves nothing to release.
+        if size is None or not self.__open_from_disk_cache(size):
             self.__open(url)
-        except BaseException:
-            self.__pool.close()
-            raise
 
     def __enter__(self) -> "HttpRangeReader":
         return self
@@ -213,47 +222,96 @@ class HttpRangeReader:
     def __exit__(self, *args: object) -> None:
         self.close()
 
+    @property
+    def closed(self) -> bool:
+        """Whether :py:meth:`close` has been called."""
+        return self.__closed
+
     @property
     def size(self) -> int:
         """Get the total size of the remote file in bytes."""
         return self.__size
 
     def close(self) -> None:
-        """Close the reader and release resources."""
-        self.__buffer.clear()
-        self.__pool.close()
+        """Close the reader and release its buffered bytes.
+
+        Pooled connections stay open in the shared pool for reuse by later readers.
+        """
+        self.__closed = True
+        with self.__buffer_lock:
+            self.__buffer.clear()
+
+    def discard(self, start: int, end: int) -> None:
+        """Drop the in-memory cached bytes of an inclusive byte range.
+
+        For streaming consumers that are done with a span (e.g. an MCAP chunk
+        already handed to the decoder) and want its memory back instead of
+        holding the whole read in the cache until :py:meth:`close`. Reading the
+        span again re-fetches it (from the on-disk cache, when enabled). Views
+        already taken over the span stay valid.
+
+        Args:
+            start: Start byte offset (inclusive)
+            end: End byte offset (inclusive)
+        """
+        with self.__buffer_lock:
+            self.__buffer.discard(start, end + 1)
 
     def prefetch_range(self, start: int, end: int) -> None:
         """Prefetch a byte range using parallel HTTP requests.
 
         Byte spans already in the cache (e.g., placed there by the footer
-        read-behind at open, which covers the whole file when it is small)
-        are not re-fetched; only the uncovered gaps are requested.
+        read-behind at open, which covers the whole file when it is small,
+        or loaded from the on-disk byte-range cache) are not re-fetched; only
+        the uncovered gaps are requested.
 
         Args:
             start: Start byte offset (inclusive)
             end: End byte offset (inclusive)
         """
-        # Subtract cached regions from [start, end], leaving uncovered spans.
-        spans = [(start, end)]
-        for region_start, region_end in self.__buffer.regions:  # region_end is exclusive
-            remaining: list[tuple[int, int]] = []
-            for span_start, span_end in spans:
-                if region_end <= span_start or region_start > span_end:
-                    remaining.append((span_start, span_end))
-                    continue
-                if span_start < region_start:
-                    remaining.append((span_start, region_start - 1))
-                if span_end >= region_end:
-                    remaining.append((region_end, span_end))
-            spans = remaining
-            if not spans:
-                return
-
-        # Batch size is derived from the full requested range, not the uncovered
+        self.prefetch_ranges([(start, end)])
+
+    def prefetch_ranges(self, ranges: collections.abc.Iterable[tuple[int, int]]) -> None:
+        """Prefetch several byte ranges at once, using parallel HTTP requests.
+
+        Ranges separated by less than ``_GAP_COALESCE_THRESHOLD`` are coalesced
+        into one, so many small, nearby spans (e.g. the column chunks of a
+        Parquet row group) cost a handful of requests rather than one each. The
+        uncovered parts of the coalesced ranges are then fetched together over
+        one pool of connections, as :py:meth:`prefetch_range` does for one range.
+
+        Args:
+            ranges: Inclusive ``(start, end)`` byte offsets, in any order.
+        """
+        coalesced: list[tuple[int, int]] = []
+        for start, end in sorted(ranges):
+            end = min(end, self.__size - 1)
+            if end < start:
+                continue
+            if coalesced and start <= coalesced[-1][1] + _GAP_COALESCE_THRESHOLD:
+                coalesced[-1] = (coalesced[-1][0], max(coalesced[-1][1], end))
+            else:
+                coalesced.append((start, end))
+        if not coalesced:
+            return
+
+        for start, end in coalesced:
+            self.__load_from_disk_cache(start, end + 1)
+
+        # Uncovered spans of the coalesced ranges, as inclusive (start, end) pairs.
+        with self.__buffer_lock:
+            spans = [
+                (gap_start, gap_end - 1)
+                for start, end in coalesced
+                for gap_start, gap_end in self.__buffer.gaps(start, end + 1)
+            ]
+        if not spans:
+            return
+
+        # Batch size is derived from the full requested ranges, not the uncovered
         # remainder, so cache clipping never reduces transfer parallelism below
         # what the unclipped request would have used.
-        total_size = end - start + 1
+        total_size = sum(end - start + 1 for start, end in coalesced)
         num_batches = max(1, min(total_size // _MIN_BYTES_PER_THREAD, _MAX_PREFETCH_THREADS))
         chunk_size = (total_size + num_batches - 1) // num_batches
 
@@ -275,30 +333,30 @@ class HttpRangeReader:
 
         # Clamp to file size
         size = min(size, self.__size - self.__pos)
+        if size == 0:
+            return b""
 
         # Check if fully cached first (fast path)
-        cached = self.__buffer.find_region(self.__pos, size)
-        if cached is not None:
-            self.__pos += len(cached)
-            return cached
-
-        # Not fully cached - fetch missing data
-        fetch_start, fetch_end = self.__compute_fetch_range(self.__pos, size)
-        if fetch_start < fetch_end:
-            data = self.__fetch(fetch_start, fetch_end - fetch_start)
-            self.__buffer.add_region(fetch_start, data)
-
-        # Read from buffer - should now be fully satisfied
-        self.__buffer.seek(self.__pos)
-        result = self.__buffer.read(size)
-
-        if len(result) < size:
-            raise RuntimeError(
-                f"Incomplete read after fetch: got {len(result)}, expected {size}. "
-                f"pos={self.__pos}, fetch_range=({fetch_start}, {fetch_end}). "
-                f"This indicates a bug in fetch range calculation or buffer merge logic."
-            )
-
+        with self.__buffer_lock:
+            cached = self.__buffer.find_region(self.__pos, size)
+        if cached is None:
+            self.__ensure_cached(self.__pos, size)
+            with self.__buffer_lock:
+                cached = typing.cast(bytes, self.__buffer.find_region(self.__pos, size))
+
+        self.__pos += len(cached)
+        return cached
+
+    def read_buffer(self, size: int = -1) -> memoryview:
+        """Zero-copy counterpart of :py:meth:`read`: read from the current position as a read-only view.
+
+        pyarrow's Python-file adapter calls this in preference to ``read`` when
+        it exists, so Parquet pages streamed through this reader reach Arrow
+        without being copied out of the cache. See :py:meth:`view`.
+        """
+        if size < 0:
+            size = self.__size - self.__pos
+        result = self.view(self.__pos, size)
         self.__pos += len(result)
         return result
 
@@ -320,13 +378,41 @@ class HttpRangeReader:
     def tell(self) -> int:
         return self.__pos
 
+    def view(self, offset: int, size: int) -> memoryview:
+        """Read ``size`` bytes at ``offset`` as a zero-copy, read-only view of the cache.
+
+        Unlike :py:meth:`read`, which copies the bytes out into a new ``bytes``
+        object, the view references the cached region directly, so handing a large
+        span (e.g. an MCAP chunk) to a decoder costs no extra copy or memory. The
+        view keeps the bytes it covers alive for as long as the caller holds it,
+        even after :py:meth:`close`. The read position is not moved.
+
+        Args:
+            offset: Start byte offset.
+            size: Number of bytes; clamped to the end of the file.
+
+        Returns:
+            A read-only memoryview of the requested bytes.
+        """
+        size = min(size, self.__size - offset)
+        if size <= 0:
+            return memoryview(b"")
+        with self.__buffer_lock:
+            cached = self.__buffer.view(offset, size)
+        if cached is None:
+            self.__ensure_cached(offset, size)
+            with self.__buffer_lock:
+                cached = typing.cast(memoryview, self.__buffer.view(offset, size))
+        return cached
+
     def writable(self) -> bool:
         return False
 
     def __compute_fetch_range(self, start: int, min_size: int) -> tuple[int, int]:
         """Compute optimal fetch range, avoiding re-fetching cached data.
 
-        Returns (fetch_start, fetch_end) where fetch_end is exclusive.
+        Returns (fetch_start, fetch_end) where fetch_end is exclusive. The
+        caller holds the buffer lock.
         """
         # Detect magic byte check: small read at position 0
         # For these, don't use read-ahead - just fetch what's requested
@@ -351,17 +437,21 @@ class HttpRangeReader:
         # Note: If a cached region is entirely within the fetch range, we may
         # re-fetch it (simpler than splitting into multiple fetches). The buffer's
         # add_region handles merging correctly.
-        for region_start, region_end in self.__buffer.regions:
-            # Snap fetch_start forward to this region's end when it lands inside
-            # the region (already cached) or within the coalesce gap just past
-            # it — filling a small gap beats issuing a second request for it.
-            if region_start <= fetch_start <= region_end + _GAP_COALESCE_THRESHOLD:
-                fetch_start = region_end
-
-            # Symmetrically, pull fetch_end back to this region's start when it
-            # lands inside the region or within the coalesce gap just before it.
-            if region_start - _GAP_COALESCE_THRESHOLD <= fetch_end <= region_end:
-                fetch_end = region_start
+
+        # Snap fetch_start forward to the end of the region it lands inside
+        # (already cached) or within the coalesce gap just past — filling a
+        # small gap beats issuing a second request for it.
+        before, _ = self.__buffer.adjacent_regions(fetch_start)
+        if before is not None and fetch_start <= before[1] + _GAP_COALESCE_THRESHOLD:
+            fetch_start = before[1]
+
+        # Symmetrically, pull fetch_end back to the start of the region it lands
+        # inside or within the coalesce gap just before.
+        before, after = self.__buffer.adjacent_regions(fetch_end)
+        if before is not None and fetch_end <= before[1]:
+            fetch_end = before[0]
+        elif after is not None and after[0] - _GAP_COALESCE_THRESHOLD <= fetch_end:
+            fetch_end = after[0]
 
         # Ensure we still fetch something
         if fetch_start >= fetch_end:
@@ -369,33 +459,61 @@ class HttpRangeReader:
 
         return fetch_start, fetch_end
 
+    def __ensure_cached(self, start: int, size: int) -> None:
+        """Bring [start, start+size) into the in-memory cache, from disk or over HTTP."""
+        # Try the disk cache over the span a fetch would cover
+        if self.__load_from_disk_cache(start, start + max(size, self.__read_ahead_size)):
+            with self.__buffer_lock:
+                if not self.__buffer.gaps(start, start + size):
+                    return
+
+        # Not fully cached - fetch missing data
+        with self.__buffer_lock:
+            fetch_start, fetch_end = self.__compute_fetch_range(start, size)
+        if fetch_start < fetch_end:
+            data = self.__fetch(fetch_start, fetch_end - fetch_start)
+            self.__store(fetch_start, data)
+
+        # The requested span must now be cached (so, merged, within one region)
+        with self.__buffer_lock:
+            missing = self.__buffer.gaps(start, start + size)
+        if missing:
+            raise RuntimeError(
+                f"Incomplete read after fetch: [{start}, {start + size}) not fully cached. "
+                f"fetch_range=({fetch_start}, {fetch_end}). "
+                f"This indicates a bug in fetch range calculation or buffer merge logic."
+            )
+
     def __fetch(self, start: int, length: int) -> bytes:
         """Fetch bytes from remote URL using HTTP Range request."""
         end = min(start + length - 1, self.__size - 1)
-        resp = self.__pool.request("GET", self.__path, headers={"Range": f"bytes={start}-{end}"})
+        resp = shared_pool_manager().request("GET", self.__url, headers={"Range": f"bytes={start}-{end}"})
         return self.__ranged_bytes(resp, start, f"range fetch bytes={start}-{end}")
 
     def __fetch_batches_parallel(self, batches: list[tuple[int, int]]) -> None:
-        """Fetch batches in parallel using connection pool."""
+        """Fetch batches in parallel over the shared connection pool."""
         if not batches:
             return
 
         if len(batches) == 1:
             batch_start, batch_end = batches[0]
             data = self.__fetch(batch_start, batch_end - batch_start + 1)
-            self.__buffer.add_region(batch_start, data)
+            self.__store(batch_start, data)
             return
 
         def fetch_one(batch: tuple[int, int]) -> tuple[int, bytes]:
             batch_start, batch_end = batch
-            resp = self.__pool.request("GET", self.__path, headers={"Range": f"bytes={batch_start}-{batch_end}"})
+            resp = shared_pool_manager().request(
+                "GET", self.__url, headers={"Range": f"bytes={batch_start}-{batch_end}"}
+            )
             return (
                 batch_start,
                 self.__ranged_bytes(resp, batch_start, f"parallel range fetch bytes={batch_start}-{batch_end}"),
             )
 
         results: list[tuple[int, bytes]] = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=len(batches)) as executor:
+        # prefetch_ranges can produce a batch per column chunk; queue those beyond the thread bound.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(batches), _MAX_PREFETCH_THREADS)) as executor:
             futures = [executor.submit(fetch_one, batch) for batch in batches]
             for future in concurrent.futures.as_completed(futures):
                 results.append(future.result())
@@ -404,15 +522,28 @@ class HttpRangeReader:
         # sequentially rather than triggering repeated merge copies.
         results.sort(key=lambda r: r[0])
         for start, data in results:
-            self.__buffer.add_region(start, data)
+            self.__store(start, data)
+
+    def __load_from_disk_cache(self, start: int, end: int) -> bool:
+        """Load the disk-cached parts of ``[start, end)`` missing from memory; return whether any were found."""
+        if self.__range_cache is None or self.__cache_id is None:
+            return False
+        with self.__buffer_lock:
+            gaps = self.__buffer.gaps(start, min(end, self.__size))
+        loaded = False
+        for gap_start, gap_end in gaps:
+            for offset, data in self.__range_cache.read(self.__cache_id, self.__size, gap_start, gap_end):
+                with self.__buffer_lock:
+                    self.__buffer.add_region(offset, data)
+                loaded = True
+        return loaded
 
     def __open(self, url: str) -> None:
         """Probe the remote file at open time and warm the sparse cache.
 
         Issues the magic-prefix and footer-suffix requests, parses the total
         file size, seeds the sparse buffer, and — for small files — fetches the
-        remaining gap upfront. Separated from ``__init__`` so a failure here is
-        wrapped by the pool-cleanup guard.
+        remaining gap upfront.
         """
         # Fetch the magic bytes (first 8 bytes) and the footer window (last
         # _FOOTER_READ_BEHIND_SIZE bytes, as a suffix range) concurrently. The
@@ -421,9 +552,14 @@ class HttpRangeReader:
         # MCAP read first — for files smaller than the footer window it is the
         # entire file.
         with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
-            head_future = executor.submit(self.__pool.request, "GET", self.__path, headers={"Range": "bytes=0-7"})
+            head_future = executor.submit(
+                shared_pool_manager().request, "GET", self.__url, headers={"Range": "bytes=0-7"}
+            )
             tail_future = executor.submit(
-                self.__pool.request, "GET", self.__path, headers={"Range": f"bytes=-{_FOOTER_READ_BEHIND_SIZE}"}
+                shared_pool_manager().request,
+                "GET",
+                self.__url,
+                headers={"Range": f"bytes=-{_FOOTER_READ_BEHIND_SIZE}"},
             )
             head_resp = head_future.result()
             tail_resp = tail_future.result()
@@ -450,7 +586,7 @@ class HttpRangeReader:
 
         # Initialize sparse buffer now that we know the file size
         self.__buffer = SparseBuffer(self.__size)
-        self.__buffer.add_region(0, head_resp.data)
+        self.__store(0, head_resp.data)
 
         # Only place the tail bytes if the server honored the suffix range
         # (a Content-Range of "bytes <start>-<end>/<total>" pins their offset).
@@ -465,7 +601,7 @@ class HttpRangeReader:
             except (ValueError, IndexError):
                 tail_start = self.__size
             else:
-                self.__buffer.add_region(tail_start, tail_resp.data)
+                self.__store(tail_start, tail_resp.data)
                 # The suffix region must reach the final byte; a proxy that
                 # normalizes the suffix range differently can return data that
                 # stops short, leaving a silent coverage gap at EOF.
@@ -487,7 +623,33 @@ class HttpRangeReader:
             if tail_start > 8:
                 # Fetch the gap between the magic bytes and the cached tail
                 remaining = self.__fetch(8, tail_start - 8)
-                self.__buffer.add_region(8, remaining)
+                self.__store(8, remaining)
+
+    def __open_from_disk_cache(self, size: int) -> bool:
+        """Open from the on-disk byte-range cache without any HTTP request, if it holds what open would fetch.
+
+        That is the magic prefix and the footer window, or the whole file when it
+        is small; on a partial hit nothing is loaded and the caller probes as usual.
+        """
+        if self.__range_cache is None or self.__cache_id is None or size <= 0:
+            return False
+        if size <= _SMALL_FILE_THRESHOLD:
+            wanted = [(0, size)]
+        else:
+            wanted = [(0, 8), (size - _FOOTER_READ_BEHIND_SIZE, size)]
+
+        loaded: list[tuple[int, bytes]] = []
+        for start, end in wanted:
+            spans = self.__range_cache.read(self.__cache_id, size, start, end)
+            if sum(len(data) for _, data in spans) != end - start:
+                return False
+            loaded.extend(spans)
+
+        self.__size = size
+        self.__buffer = SparseBuffer(size)
+        for offset, data in loaded:
+            self.__buffer.add_region(offset, data)
+        return True
 
     def __ranged_bytes(self, resp: typing.Any, expected_start: int, what: str) -> bytes:
         """Validate a ranged-fetch response and return its body as the bytes at ``expected_start``.
@@ -528,6 +690,13 @@ class HttpRangeReader:
 
         return resp.data
 
+    def __store(self, offset: int, data: bytes) -> None:
+        """Add fetched bytes to the in-memory cache and, when enabled, the on-disk byte-range cache."""
+        with self.__buffer_lock:
+            self.__buffer.add_region(offset, data)
+        if self.__range_cache is not None and self.__cache_id is not None:
+            self.__range_cache.write(self.__cache_id, self.__size, offset, data)
+
 
 def as_io_bytes(reader: HttpRangeReader) -> typing.IO[bytes]:
     """Cast an HttpRangeReader to typing.IO[bytes] for type-checking purposes."""
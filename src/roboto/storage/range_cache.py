@@ -0,0 +1,402 @@
+# Copyright (c) 2026 Roboto Technologies, Inc.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Persistent on-disk cache of byte ranges fetched from remote files.
+
+An :py:class:`~roboto.storage.HttpRangeReader` keeps the regions it fetches in
+memory for its own lifetime only, so re-reading the same window of a file (a
+dashboard refresh, a repeated similarity scan) downloads the same bytes again.
+This module adds an optional disk tier under that in-memory buffer: every
+fetched region is also written to a sparse local file, and a later reader of the
+same remote object loads the covered spans from disk instead of the network.
+
+The tier is off by default; enable it once per process with
+:py:func:`configure_range_cache`.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import threading
+import typing
+
+import filelock
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_RANGE_CACHE_MAX_BYTES = 10 * 1024 * 1024 * 1024
+"""Default disk budget for cached byte ranges (10 GiB).
+
+Entries are sparse, so the budget counts the blocks actually allocated on disk
+(the fetched bytes), not the apparent size of the remote files.
+"""
+
+RANGE_CACHE_SUBDIR = "byte-ranges"
+"""Directory, under the SDK cache directory, that holds cached byte ranges by default."""
+
+_DATA_SUFFIX = ".bin"
+_INDEX_SUFFIX = ".idx"
+
+_LOCK_STRIPES = 256
+"""Number of lock files entries are striped across.
+
+Locking per entry would leave a lock file behind for every object ever cached, and
+deleting a lock file while another process waits on it breaks the lock; a fixed
+set of striped locks avoids both at the cost of rare false sharing between entries.
+"""
+
+_RESCAN_FRACTION = 16
+"""Fraction of the budget, as a divisor, a process writes between rescans of the cache directory.
+
+A process counts the bytes it writes on top of the usage its last scan found,
+and only rescans (and evicts) once that estimate exceeds the budget. Other
+processes sharing the directory write too, so a rescan also happens after every
+``max_bytes / _RESCAN_FRACTION`` bytes written, bounding how far over budget
+their writes can take the cache unnoticed.
+"""
+
+
+def _merge_range(ranges: list[list[int]], start: int, end: int) -> list[list[int]]:
+    """Add ``[start, end)`` to sorted, disjoint ``ranges``, merging overlapping and adjacent ranges."""
+    merged: list[list[int]] = []
+    for range_start, range_end in ranges:
+        if range_end < start or range_start > end:
+            merged.append([range_start, range_end])
+        else:
+            start = min(start, range_start)
+            end = max(end, range_end)
+    merged.append([start, end])
+    merged.sort()
+    return merged
+
+
+def _intersect(ranges: list[list[int]], start: int, end: int) -> list[tuple[int, int]]:
+    """The parts of ``[start, end)`` covered by ``ranges``, as ``(start, end)`` pairs in offset order."""
+    spans: list[tuple[int, int]] = []
+    for range_start, range_end in ranges:
+        span_start = max(start, range_start)
+        span_end = min(end, range_end)
+        if span_start < span_end:
+            spans.append((span_start, span_end))
+    return spans
+
+
+def _disk_usage(stat: os.stat_result) -> int:
+    """Bytes a file actually occupies on disk, which for a sparse file is less than its apparent size."""
+    blocks = getattr(stat, "st_blocks", None)
+    return blocks * 512 if blocks is not None else stat.st_size
+
+
+class RangeCache:
+    """A size-bounded, cross-process-safe disk store of byte ranges from remote files.
+
+    An entry is keyed by the remote object's id and its total size, so a file whose
+    content changes size is never served stale bytes. Each entry is a sparse data
+    file the size of the remote object, with fetched regions written at their own
+    offsets, plus a small JSON index of the ``[start, end)`` ranges present. The
+    index is replaced atomically and only after the bytes it lists are written, so
+    a reader never sees a range whose bytes are not on disk.
+
+    Eviction is least-recently-used: the index file's modification time records the
+    entry's last read or write, and whenever the entries' allocated disk usage
+    exceeds ``max_bytes`` the oldest entries are deleted until it fits. Usage is
+    tracked incrementally from the bytes written, and the directory scan that
+    measures and evicts runs on a background thread, so a write on the fetch path
+    costs no more filesystem calls than storing its own bytes.
+
+    The cache is a performance tier only. Any error reading or writing it is logged
+    and treated as a miss, never failing the read it backs.
+    """
+
+    def __init__(self, cache_dir: typing.Union[str, pathlib.Path], max_bytes: int = DEFAULT_RANGE_CACHE_MAX_BYTES):
+        """
+        Args:
+            cache_dir: Directory holding the cache's entries; created on first write.
+            max_bytes: Disk budget for cached bytes.
+
+        Raises:
+            ValueError: ``max_bytes`` is less than 1.
+        """
+        if max_bytes < 1:
+            raise ValueError(f"max_bytes must be at least 1, got {max_bytes}")
+        self.__cache_dir = pathlib.Path(cache_dir)
+        self.__max_bytes = max_bytes
+        # Guards the usage estimate and the scan state below.
+        self.__usage_guard = threading.Lock()
+        # Disk usage found by the last scan plus the bytes written since; None until the first scan.
+        self.__usage: typing.Optional[int] = None
+        self.__written_since_scan = 0
+        self.__scanning = False
+
+    @property
+    def cache_dir(self) -> pathlib.Path:
+        """Directory holding the cache's entries."""
+        return self.__cache_dir
+
+    @property
+    def max_bytes(self) -> int:
+        """Disk budget for cached bytes."""
+        return self.__max_bytes
+
+    def clear(self) -> None:
+        """Delete every cached entry."""
+        for index_path in self.__cache_dir.glob(f"*{_INDEX_SUFFIX}"):
+            key = index_path.name.removesuffix(_INDEX_SUFFIX)
+            with self.__entry_lock(key):
+                self.__delete_entry(key)
+        with self.__usage_guard:
+            self.__usage = 0
+            self.__written_since_scan = 0
+
+    def read(self, object_id: str, size: int, start: int, end: int) -> list[tuple[int, bytes]]:
+        """Load the cached parts of ``[start, end)`` of a remote object.
+
+        Args:
+            object_id: Stable identifier of the remote object (e.g. its file id).
+            size: Total size of the remote object in bytes.
+            start: Start byte offset (inclusive).
+            end: End byte offset (exclusive).
+
+        Returns:
+            ``(offset, data)`` pairs for the covered spans, in offset order; empty on a miss.
+        """
+        key = self.__key(object_id, size)
+        try:
+            with self.__entry_lock(key):
+                index = self.__load_index(key)
+                if index is None:
+                    return []
+                spans = _intersect(index, start, end)
+                if not spans:
+                    return []
+                loaded: list[tuple[int, bytes]] = []
+                with open(self.__data_path(key), "rb") as f:
+                    for span_start, span_end in spans:
+                        f.seek(span_start)
+                        data = f.read(span_end - span_start)
+                        if len(data) != span_end - span_start:
+                            return []
+                        loaded.append((span_start, data))
+                os.utime(self.__index_path(key))
+                return loaded
+        except OSError:
+            logger.debug("Byte-range cache read failed for %s; treating as a miss", object_id, exc_info=True)
+            return []
+
+    def write(self, object_id: str, size: int, offset: int, data: bytes) -> None:
+        """Store bytes fetched from a remote object at their offset.
+
+        When the cache may have outgrown its budget, least recently used entries are
+        evicted in the background; the write does not wait for it.
+
+        Args:
+            object_id: Stable identifier of the remote object (e.g. its file id).
+            size: Total size of the remote object in bytes.
+            offset: Byte offset of ``data`` within the object.
+            data: The fetched bytes.
+        """
+        if not data:
+            return
+        key = self.__key(object_id, size)
+        try:
+            self.__cache_dir.mkdir(parents=True, exist_ok=True)
+            with self.__entry_lock(key):
+                data_path = self.__data_path(key)
+                index = self.__load_index(key) if data_path.exists() else None
+                with open(data_path, "r+b" if index is not None else "w+b") as f:
+                    if index is None:
+                        # Sized up front, without allocating: unwritten spans stay holes.
+                        f.truncate(size)
+                    f.seek(offset)
+                    f.write(data)
+                self.__save_index(key, _merge_range(index or [], offset, offset + len(data)))
+        except OSError:
+            logger.debug("Byte-range cache write failed for %s; skipping", object_id, exc_info=True)
+            return
+        self.__account_write(len(data), keep=key)
+
+    def __account_write(self, written: int, keep: str) -> None:
+        """Count ``written`` bytes towards the usage estimate, starting a background eviction scan when due."""
+        with self.__usage_guard:
+            self.__written_since_scan += written
+            if self.__usage is not None:
+                self.__usage += written
+            due = (
+                self.__usage is None
+                or self.__usage > self.__max_bytes
+                or self.__written_since_scan * _RESCAN_FRACTION >= self.__max_bytes
+            )
+            if not due or self.__scanning:
+                return
+            self.__scanning = True
+            self.__written_since_scan = 0
+        threading.Thread(
+            target=self.__scan_and_evict, args=(keep,), name="roboto-range-cache-evict", daemon=True
+        ).start()
+
+    def __data_path(self, key: str) -> pathlib.Path:
+        return self.__cache_dir / f"{key}{_DATA_SUFFIX}"
+
+    def __delete_entry(self, key: str) -> None:
+        # Index first: once it is gone, no reader trusts the data file.
+        for path in (self.__index_path(key), self.__data_path(key)):
+            with contextlib.suppress(FileNotFoundError):
+                path.unlink()
+
+    @contextlib.contextmanager
+    def __entry_lock(self, key: str, blocking: bool = True) -> typing.Iterator[bool]:
+        """Hold the lock guarding ``key``'s files, yielding whether it was acquired (always, when blocking)."""
+        lock_dir = self.__cache_dir / "locks"
+        lock_dir.mkdir(parents=True, exist_ok=True)
+        stripe = int(key[:8], 16) % _LOCK_STRIPES
+        lock = filelock.FileLock(lock_dir / f"{stripe:03d}.lock", timeout=-1 if blocking else 0)
+        try:
+            lock.acquire()
+        except filelock.Timeout:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            lock.release()
+
+    def __scan_and_evict(self, keep: str) -> None:
+        """Measure the cache's disk usage, evicting least recently used entries other than ``keep`` past the budget."""
+        total = None
+        try:
+            total = self.__evict(keep)
+        finally:
+            with self.__usage_guard:
+                # Bytes written while scanning may already be counted in the total;
+                # overestimating only brings the next scan forward.
+                self.__usage = None if total is None else total + self.__written_since_scan
+                self.__scanning = False
+
+    def __evict(self, keep: str) -> typing.Optional[int]:
+        """Delete least recently used entries, other than ``keep``, until the cache fits its budget.
+
+        Returns:
+            The entries' disk usage afterwards, or ``None`` if the scan failed.
+        """
+        try:
+            entries: list[tuple[float, int, str]] = []
+            total = 0
+            for index_path in self.__cache_dir.glob(f"*{_INDEX_SUFFIX}"):
+                key = index_path.name.removesuffix(_INDEX_SUFFIX)
+                try:
+                    last_used = index_path.stat().st_mtime
+                    usage = _disk_usage(self.__data_path(key).stat())
+                except FileNotFoundError:
+                    continue
+                total += usage
+                if key != keep:
+                    entries.append((last_used, usage, key))
+            if total <= self.__max_bytes:
+                return total
+
+            entries.sort()
+            for _, usage, key in entries:
+                # An entry busy in another thread or process is in use, so not a
+                # good eviction candidate anyway; skip it rather than wait.
+                with self.__entry_lock(key, blocking=False) as acquired:
+                    if not acquired:
+                        continue
+                    self.__delete_entry(key)
+                total -= usage
+                if total <= self.__max_bytes:
+                    break
+            return total
+        except OSError:
+            logger.debug("Byte-range cache eviction failed", exc_info=True)
+            return None
+
+    def __index_path(self, key: str) -> pathlib.Path:
+        return self.__cache_dir / f"{key}{_INDEX_SUFFIX}"
+
+    def __key(self, object_id: str, size: int) -> str:
+        return hashlib.sha256(f"{object_id}/{size}".encode()).hexdigest()
+
+    def __load_index(self, key: str) -> typing.Optional[list[list[int]]]:
+        """The entry's cached ranges, or ``None`` if it has no (readable) index."""
+        try:
+            with open(self.__index_path(key), "r") as f:
+                return json.load(f)["ranges"]
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError):
+            logger.debug("Discarding unreadable byte-range cache index %s", key)
+            return None
+
+    def __save_index(self, key: str, ranges: list[list[int]]) -> None:
+        index_path = self.__index_path(key)
+        tmp_path = index_path.with_suffix(f"{_INDEX_SUFFIX}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"ranges": ranges}, f)
+        os.replace(tmp_path, index_path)
+
+
+_range_cache: typing.Optional[RangeCache] = None
+"""The process-wide range cache, or ``None`` while the disk tier is disabled."""
+
+_range_cache_guard = threading.Lock()
+"""Guards replacement of ``_range_cache``."""
+
+
+def configure_range_cache(
+    cache_dir: typing.Union[str, pathlib.Path, None] = None,
+    max_bytes: int = DEFAULT_RANGE_CACHE_MAX_BYTES,
+    enabled: bool = True,
+) -> typing.Optional[RangeCache]:
+    """Enable, resize, or disable the process-wide on-disk byte-range cache.
+
+    Once enabled, range readers opened for a known remote object (such as the
+    topic-data readers, which key on file id) load previously fetched byte ranges
+    from disk and write newly fetched ones there, so re-reading a warm window of a
+    file issues no HTTP requests. Call once at startup, before issuing reads.
+
+    Args:
+        cache_dir: Directory for cached ranges. Defaults to a ``byte-ranges``
+            directory under the SDK cache directory (``ROBOTO_CACHE_DIR`` or the
+            platform's per-user cache directory).
+        max_bytes: Disk budget for cached bytes; least recently used entries are
+            evicted beyond it.
+        enabled: Pass ``False`` to turn the disk tier back off. Cached entries are
+            left on disk.
+
+    Returns:
+        The configured cache, or ``None`` when disabled.
+
+    Raises:
+        ValueError: ``max_bytes`` is less than 1.
+
+    Examples:
+        >>> from roboto.storage import configure_range_cache
+        >>> configure_range_cache(max_bytes=50 * 1024**3)
+    """
+    global _range_cache
+    cache: typing.Optional[RangeCache] = None
+    if enabled:
+        if cache_dir is None:
+            # Imported here so the storage layer does not load config at import time.
+            from ..config import resolve_cache_dir
+            from ..env import RobotoEnv
+
+            cache_dir = resolve_cache_dir(RobotoEnv(), ensure_exists=False) / RANGE_CACHE_SUBDIR
+        cache = RangeCache(cache_dir, max_bytes)
+    with _range_cache_guard:
+        _range_cache = cache
+    return cache
+
+
+def shared_range_cache() -> typing.Optional[RangeCache]:
+    """Return the process-wide on-disk byte-range cache, or ``None`` if it is not enabled."""
+    return _range_cache
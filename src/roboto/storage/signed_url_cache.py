@@ -0,0 +1,436 @@
+# Copyright (c) 2026 Roboto Technologies, Inc.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Process-wide cache of signed download URLs for Roboto files.
+
+Reading topic data starts by minting a signed URL for each representation file
+(``v1/files/{file_id}/signed-url``), a full API round trip before any data moves.
+A signed URL stays valid until it expires, so repeated reads of the same file
+(events over one topic, a dashboard refresh) can reuse it. The shared
+:py:class:`SignedUrlCache` does that for every topic-data reader:
+
+* Each URL's expiry is read from its own query string (S3/SigV4, legacy S3 and
+  CloudFront ``Expires``, GCS, and Azure SAS forms). A URL handed out always has
+  at least a refresh margin of validity left; one closer to expiry is minted
+  anew. A URL whose expiry cannot be determined is never reused.
+* Concurrent requests for the same file's URL share one mint.
+* URLs requested together (:py:meth:`SignedUrlCache.signed_urls`) are minted in
+  bulk, one ``v1/files/signed-url/batch`` call per :py:data:`SIGNED_URL_BATCH_SIZE`
+  files, falling back to concurrent single-file calls against an API without
+  that route. Whether the route exists is judged by the status it answers with,
+  not by the exception that status maps to.
+* Entries are kept per :py:class:`~roboto.http.RobotoClient`, so a URL minted
+  with one identity's credentials is never handed to a reader using another's.
+"""
+
+from __future__ import annotations
+
+import calendar
+import collections
+import collections.abc
+import concurrent.futures
+import datetime
+import functools
+import os
+import threading
+import time
+import typing
+import urllib.parse
+import weakref
+
+from ..exceptions import HttpError, RobotoDomainException
+from ..logging import default_logger
+from .api_operations import SignedUrlBatchRequest, SignedUrlBatchResponse
+
+if typing.TYPE_CHECKING:
+    from ..http import RobotoClient
+
+logger = default_logger()
+
+DEFAULT_REFRESH_MARGIN_SECONDS = 300.0
+"""Default minimum validity, in seconds, left on a URL handed out from the cache.
+
+Long enough for a read that starts with the URL to finish its range requests
+before the URL expires. URLs issued for less than twice this long are reused
+for the first half of their lifetime instead."""
+
+DEFAULT_MAX_ENTRIES = 10_000
+"""Default number of URLs kept per client; the least recently used are dropped beyond it."""
+
+SIGNED_URL_BATCH_SIZE = 500
+"""Most files whose URLs are minted in one bulk call, the API's limit for its batch routes."""
+
+_FALLBACK_MINT_WORKERS = 16
+"""Single-file mints in flight at once when the API lacks the bulk route."""
+
+_BULK_ROUTE_MISSING_STATUSES = frozenset({404, 405, 501})
+"""Statuses with which an API lacking the bulk route answers it."""
+
+_BULK_ROUTE_REFUSED_STATUSES = frozenset({400, 403})
+"""Statuses with which an API lacking the bulk route may also answer it (e.g. API Gateway's
+403 "Missing Authentication Token"), but which a real refusal of the request shares."""
+
+_bulk_unsupported: weakref.WeakSet[RobotoClient] = weakref.WeakSet()
+"""Clients whose API does not serve the bulk route."""
+
+
+class SignedUrlCache:
+    """Reuses signed download URLs until shortly before they expire.
+
+    See the module documentation for the caching rules. Obtain the shared
+    instance with :py:func:`shared_signed_url_cache`. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        refresh_margin_seconds: float = DEFAULT_REFRESH_MARGIN_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """
+        Args:
+            refresh_margin_seconds: Minimum validity left on a URL handed out from the cache.
+            max_entries: Most URLs kept per client.
+
+        Raises:
+            ValueError: ``refresh_margin_seconds`` is negative or ``max_entries`` is less than 1.
+        """
+        if refresh_margin_seconds < 0:
+            raise ValueError(f"refresh_margin_seconds must be non-negative, got {refresh_margin_seconds}")
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        self.__refresh_margin_seconds = refresh_margin_seconds
+        self.__max_entries = max_entries
+        self.__lock = threading.Lock()
+        self.__clients: weakref.WeakKeyDictionary[RobotoClient, _ClientEntries] = weakref.WeakKeyDictionary()
+
+    @property
+    def max_entries(self) -> int:
+        """Most URLs kept per client."""
+        return self.__max_entries
+
+    @property
+    def refresh_margin_seconds(self) -> float:
+        """Minimum validity left on a URL handed out from the cache."""
+        return self.__refresh_margin_seconds
+
+    def clear(self) -> None:
+        """Forget every cached URL. Mints already in flight still complete for their waiters."""
+        with self.__lock:
+            for entries in self.__clients.values():
+                entries.urls.clear()
+
+    def invalidate(self, roboto_client: RobotoClient, file_id: str) -> None:
+        """Forget the cached URL for a file, e.g. after storage rejected it, so the next request mints a new one."""
+        with self.__lock:
+            entries = self.__clients.get(roboto_client)
+            if entries is not None:
+                entries.urls.pop(file_id, None)
+
+    def signed_url(self, roboto_client: RobotoClient, file_id: str) -> str:
+        """A signed download URL for a file, reused from the cache when it has enough validity left.
+
+        Args:
+            roboto_client: Client to mint the URL with, and whose cached URLs to reuse.
+            file_id: The file's id.
+
+        Raises:
+            RobotoNotFoundException: The file does not exist.
+            RobotoUnauthorizedException: The caller may not read the file.
+        """
+        return self.signed_urls(roboto_client, [file_id])[file_id]
+
+    def signed_urls(self, roboto_client: RobotoClient, file_ids: collections.abc.Iterable[str]) -> dict[str, str]:
+        """Signed download URLs for several files, minting those not cached in as few API calls as possible.
+
+        Args:
+            roboto_client: Client to mint the URLs with, and whose cached URLs to reuse.
+            file_ids: The files' ids.
+
+        Returns:
+            Each file id mapped to its URL, in the order given.
+
+        Raises:
+            RobotoNotFoundException: A file does not exist.
+            RobotoUnauthorizedException: The caller may not read a file.
+        """
+        wanted = list(dict.fromkeys(file_ids))
+        urls: dict[str, str] = {}
+        owned: dict[str, concurrent.futures.Future[str]] = {}
+        waiting: dict[str, concurrent.futures.Future[str]] = {}
+        with self.__lock:
+            entries = self.__clients.get(roboto_client)
+            if entries is None:
+                entries = _ClientEntries()
+                self.__clients[roboto_client] = entries
+
+            now = time.time()
+            for file_id in wanted:
+                cached = entries.urls.get(file_id)
+                if cached is not None:
+                    url, refresh_at = cached
+                    if now < refresh_at:
+                        entries.urls.move_to_end(file_id)
+                        urls[file_id] = url
+                        continue
+                    del entries.urls[file_id]
+
+                pending = entries.minting.get(file_id)
+                if pending is None:
+                    pending = concurrent.futures.Future()
+                    entries.minting[file_id] = pending
+                    owned[file_id] = pending
+                else:
+                    waiting[file_id] = pending
+
+        # Mint this call's share before waiting on anyone else's, so two calls
+        # claiming overlapping ids never wait on each other.
+        if owned:
+            urls.update(self.__mint(roboto_client, entries, owned))
+        for file_id, pending in waiting.items():
+            urls[file_id] = pending.result()
+        return {file_id: urls[file_id] for file_id in wanted}
+
+    def __mint(
+        self,
+        roboto_client: RobotoClient,
+        entries: _ClientEntries,
+        owned: dict[str, concurrent.futures.Future[str]],
+    ) -> dict[str, str]:
+        """Mint the URLs a call claimed, cache the reusable ones, and hand each to its waiters."""
+        try:
+            minted_at = time.time()
+            minted = _mint_many(roboto_client, list(owned))
+        except BaseException as exc:
+            with self.__lock:
+                for file_id in owned:
+                    entries.minting.pop(file_id, None)
+            for pending in owned.values():
+                pending.set_exception(exc)
+            raise
+
+        with self.__lock:
+            for file_id, url in minted.items():
+                entries.minting.pop(file_id, None)
+                reusable_until = self.__refresh_at(url, minted_at)
+                if reusable_until is not None:
+                    entries.urls[file_id] = (url, reusable_until)
+                    entries.urls.move_to_end(file_id)
+            while len(entries.urls) > self.__max_entries:
+                entries.urls.popitem(last=False)
+        for file_id, pending in owned.items():
+            pending.set_result(minted[file_id])
+        return minted
+
+    def __refresh_at(self, url: str, minted_at: float) -> typing.Optional[float]:
+        """When a URL minted at ``minted_at`` stops being handed out, or ``None`` if it is not to be reused."""
+        expires_at = signed_url_expiry(url, minted_at)
+        if expires_at is None or expires_at <= minted_at:
+            logger.debug("Not caching signed URL with unknown or past expiry")
+            return None
+        margin = min(self.__refresh_margin_seconds, (expires_at - minted_at) / 2)
+        return expires_at - margin
+
+
+class _ClientEntries:
+    """One client's cached URLs (LRU-ordered ``file_id -> (url, refresh_at)``) and in-flight mints."""
+
+    def __init__(self) -> None:
+        self.urls: collections.OrderedDict[str, tuple[str, float]] = collections.OrderedDict()
+        self.minting: dict[str, concurrent.futures.Future[str]] = {}
+
+
+def _mint(roboto_client: RobotoClient, file_id: str) -> str:
+    response = roboto_client.get(f"v1/files/{file_id}/signed-url")
+    return response.to_dict(json_path=["data", "url"])
+
+
+def _mint_many(roboto_client: RobotoClient, file_ids: list[str]) -> dict[str, str]:
+    """Mint URLs for distinct ``file_ids``: in bulk where the API supports it, else one call per file, concurrently.
+
+    Files a bulk response omits are minted singly, so a missing or unreadable
+    file raises the same exception it would on its own.
+    """
+    if len(file_ids) == 1:
+        return {file_ids[0]: _mint(roboto_client, file_ids[0])}
+
+    minted: dict[str, str] = {}
+    refused_status: typing.Optional[int] = None
+    if roboto_client not in _bulk_unsupported:
+        for start in range(0, len(file_ids), SIGNED_URL_BATCH_SIZE):
+            batch = file_ids[start : start + SIGNED_URL_BATCH_SIZE]
+            try:
+                response = roboto_client.post(
+                    "v1/files/signed-url/batch",
+                    data=SignedUrlBatchRequest(file_ids=batch),
+                    idempotent=True,
+                )
+            except (RobotoDomainException, HttpError) as exc:
+                status = _returned_status(exc)
+                if status in _BULK_ROUTE_MISSING_STATUSES:
+                    _bulk_unsupported.add(roboto_client)
+                elif status in _BULK_ROUTE_REFUSED_STATUSES:
+                    # A refusal after an earlier batch went through is not of the route.
+                    refused_status = status if start == 0 else None
+                else:
+                    raise
+                logger.debug("Bulk signed-URL minting failed with HTTP %s, minting one file at a time: %s", status, exc)
+                break
+            signed_urls = response.to_record(SignedUrlBatchResponse).signed_urls
+            minted.update((file_id, signed_urls[file_id]) for file_id in batch if file_id in signed_urls)
+
+    remaining = [file_id for file_id in file_ids if file_id not in minted]
+    if len(remaining) == 1:
+        minted[remaining[0]] = _mint(roboto_client, remaining[0])
+    elif remaining:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(remaining), _FALLBACK_MINT_WORKERS),
+            thread_name_prefix="roboto-signed-url",
+        ) as pool:
+            minted.update(zip(remaining, pool.map(functools.partial(_mint, roboto_client), remaining)))
+
+    if refused_status is not None:
+        # Every file the bulk call was refused for minted fine on its own, so the
+        # refusal was of the route itself, not of the caller's access to the files.
+        logger.debug("Bulk signed-URL route refused with HTTP %s, not retrying it", refused_status)
+        _bulk_unsupported.add(roboto_client)
+    return {file_id: minted[file_id] for file_id in file_ids}
+
+
+def _returned_status(exc: BaseException) -> typing.Optional[int]:
+    """The HTTP status of the response an API call raised ``exc`` for, or ``None`` if it did not get one.
+
+    :py:class:`~roboto.http.RobotoClient` maps an error response to a
+    :py:class:`~roboto.exceptions.RobotoDomainException` by its status and body
+    (a plain 501 becomes ``RobotoServiceException``, API Gateway's 403 for an
+    unknown route ``RobotoUnauthorizedException``), raising it while handling the
+    :py:class:`~roboto.exceptions.HttpError`, which stays on ``__context__``.
+    """
+    seen: set[int] = set()
+    current: typing.Optional[BaseException] = exc
+    while current is not None and id(current) not in seen:
+        if isinstance(current, HttpError):
+            return None if current.status is None else int(current.status)
+        seen.add(id(current))
+        current = current.__cause__ or current.__context__
+    return None
+
+
+def signed_url_expiry(url: str, minted_at: typing.Optional[float] = None) -> typing.Optional[float]:
+    """When a signed URL expires, as seconds since the epoch, read from its query string.
+
+    Recognizes AWS SigV4 (``X-Amz-Date`` + ``X-Amz-Expires``), GCS V4
+    (``X-Goog-Date`` + ``X-Goog-Expires``), legacy S3 and CloudFront (``Expires``),
+    and Azure SAS (``se``) URLs.
+
+    Args:
+        url: The signed URL.
+        minted_at: When the URL was obtained, by the local clock. For the forms
+            that state a lifetime rather than an instant, the earlier of "signed
+            at + lifetime" and "obtained at + lifetime" is returned, so a local
+            clock running ahead of or behind the signer's never overstates it.
+
+    Returns:
+        The expiry, or ``None`` if the URL carries none in a recognized form.
+    """
+    query = {key.lower(): values[-1] for key, values in urllib.parse.parse_qs(urllib.parse.urlsplit(url).query).items()}
+    try:
+        for date_key, lifetime_key in (("x-amz-date", "x-amz-expires"), ("x-goog-date", "x-goog-expires")):
+            if lifetime_key in query:
+                lifetime = float(query[lifetime_key])
+                candidates = [] if minted_at is None else [minted_at + lifetime]
+                if date_key in query:
+                    signed_at = calendar.timegm(time.strptime(query[date_key], "%Y%m%dT%H%M%SZ"))
+                    candidates.append(signed_at + lifetime)
+                return min(candidates) if candidates else None
+        if "expires" in query:
+            return float(query["expires"])
+        if "se" in query:
+            expiry = datetime.datetime.fromisoformat(query["se"].replace("Z", "+00:00"))
+            if expiry.tzinfo is None:
+                expiry = expiry.replace(tzinfo=datetime.timezone.utc)
+            return expiry.timestamp()
+    except (ValueError, OverflowError):
+        return None
+    return None
+
+
+_signed_url_cache: typing.Optional[SignedUrlCache] = SignedUrlCache()
+"""The shared cache, or ``None`` when disabled."""
+
+
+def configure_signed_url_cache(
+    refresh_margin_seconds: float = DEFAULT_REFRESH_MARGIN_SECONDS,
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+    enabled: bool = True,
+) -> typing.Optional[SignedUrlCache]:
+    """Resize or disable the process-wide signed-URL cache the topic-data readers share.
+
+    The cache is enabled by default. Replacing it forgets every URL cached so far.
+
+    Args:
+        refresh_margin_seconds: Minimum validity left on a URL handed out from the cache.
+        max_entries: Most URLs kept per client.
+        enabled: Pass ``False`` to mint a new URL for every read.
+
+    Returns:
+        The configured cache, or ``None`` when disabled.
+
+    Raises:
+        ValueError: ``refresh_margin_seconds`` is negative or ``max_entries`` is less than 1.
+
+    Examples:
+        >>> from roboto.storage import configure_signed_url_cache
+        >>> configure_signed_url_cache(refresh_margin_seconds=900)
+    """
+    global _signed_url_cache
+    _signed_url_cache = SignedUrlCache(refresh_margin_seconds, max_entries) if enabled else None
+    return _signed_url_cache
+
+
+def shared_signed_url_cache() -> typing.Optional[SignedUrlCache]:
+    """Return the process-wide signed-URL cache, or ``None`` if it is disabled."""
+    return _signed_url_cache
+
+
+def signed_url_for_file(roboto_client: RobotoClient, file_id: str) -> str:
+    """A signed download URL for a file, from the shared cache when enabled.
+
+    Raises:
+        RobotoNotFoundException: The file does not exist.
+        RobotoUnauthorizedException: The caller may not read the file.
+    """
+    cache = _signed_url_cache
+    if cache is None:
+        return _mint(roboto_client, file_id)
+    return cache.signed_url(roboto_client, file_id)
+
+
+def signed_urls_for_files(roboto_client: RobotoClient, file_ids: collections.abc.Iterable[str]) -> dict[str, str]:
+    """Signed download URLs for several files, from the shared cache when enabled, minted in bulk otherwise.
+
+    Returns:
+        Each file id mapped to its URL, in the order given.
+
+    Raises:
+        RobotoNotFoundException: A file does not exist.
+        RobotoUnauthorizedException: The caller may not read a file.
+    """
+    cache = _signed_url_cache
+    if cache is None:
+        return _mint_many(roboto_client, list(dict.fromkeys(file_ids)))
+    return cache.signed_urls(roboto_client, file_ids)
+
+
+def _reset_after_fork() -> None:
+    """Give a forked child a fresh cache, whose lock no parent thread can be holding."""
+    global _signed_url_cache
+    cache = _signed_url_cache
+    if cache is not None:
+        _signed_url_cache = SignedUrlCache(cache.refresh_margin_seconds, cache.max_entries)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -14,6 +14,9 @@ Only the regions that have been explicitly loaded are stored in memory.
 
 from __future__ import annotations
 
+import bisect
+import typing
+
 
 class SparseBuffer:
     """A seekable, read-only file-like object backed by sparse in-memory byte regions.
@@ -22,6 +25,11 @@ class SparseBuffer:
     reading from them. Regions are automatically merged when they overlap or are
     adjacent, keeping the internal representation compact.
 
+    Regions are indexed by start offset in a sorted list, so locating the region
+    around an offset (for reads, inserts, merges, and gap computation) is a
+    binary search rather than a scan over every region; a long file read as
+    thousands of non-contiguous chunks stays cheap to look up and extend.
+
     This is intended to be used as:
     1. The cache backend for HttpRangeReader (sparse storage with smart fetching)
     2. The stream for mcap.reader.SeekingReader after bulk-fetching byte ranges
@@ -45,10 +53,13 @@ class SparseBuffer:
         """
         self.__size = file_size
         self.__pos = 0
-        # Sparse cache: list of (start_offset, data) tuples, kept sorted by start_offset.
-        # Regions are bytearrays so sequential appends can extend in place instead of
-        # re-copying the accumulated region on every merge.
-        self.__regions: list[tuple[int, bytearray]] = []
+        # Sparse cache as two parallel lists kept sorted by start offset: the
+        # starts are the bisect index, the bytearrays the region data. Regions are
+        # disjoint and never adjacent (adjacent regions merge), and are bytearrays
+        # so sequential appends can extend in place instead of re-copying the
+        # accumulated region on every merge.
+        self.__starts: list[int] = []
+        self.__regions: list[bytearray] = []
 
     @property
     def regions(self) -> list[tuple[int, int]]:
@@ -56,7 +67,7 @@ class SparseBuffer:
 
         End is exclusive. Useful for fetch planning and debugging.
         """
-        return [(start, start + len(data)) for start, data in self.__regions]
+        return [(start, start + len(data)) for start, data in zip(self.__starts, self.__regions)]
 
     @property
     def size(self) -> int:
@@ -66,7 +77,8 @@ class SparseBuffer:
     def add_region(self, offset: int, data: bytes) -> None:
         """Store a byte region at the given file offset.
 
-        Merges with any overlapping or adjacent existing regions.
+        Merges with any overlapping or adjacent existing regions. Where the new
+        data overlaps cached bytes, the new data wins.
 
         Args:
             offset: Byte offset within the virtual file.
@@ -77,74 +89,124 @@ class SparseBuffer:
 
         end = offset + len(data)
 
-        # Fast path: data appends exactly to the end of an existing region and
-        # touches no other region — extend in place (amortized O(len(data)))
-        # instead of re-copying the accumulated region.
-        for i, (region_start, region_data) in enumerate(self.__regions):
-            if region_start + len(region_data) == offset:
-                next_start = self.__regions[i + 1][0] if i + 1 < len(self.__regions) else None
-                if next_start is None or end < next_start:
-                    region_data += data
-                    return
-                break
-            if region_start > end:
-                break
-
-        # Find regions that overlap or are adjacent
-        merged_start = offset
-        merged_end = end
-        regions_to_remove: list[int] = []
+        # Involved regions are those overlapping or adjacent to [offset, end): the
+        # last region starting at or before offset (if it reaches offset), through
+        # the last region starting at or before end.
+        first = bisect.bisect_right(self.__starts, offset) - 1
+        if first < 0 or self.__starts[first] + len(self.__regions[first]) < offset:
+            first += 1
+        stop = bisect.bisect_right(self.__starts, end)
+
+        if first == stop:
+            # Touches nothing cached: a new region.
+            self.__starts.insert(first, offset)
+            self.__regions.insert(first, bytearray(data))
+            return
 
-        for i, (region_start, region_data) in enumerate(self.__regions):
-            region_end = region_start + len(region_data)
-            # Check if regions overlap or are adjacent
-            if region_end >= offset and region_start <= end:
-                regions_to_remove.append(i)
-                merged_start = min(merged_start, region_start)
-                merged_end = max(merged_end, region_end)
-
-        if regions_to_remove:
-            first_start, first_data = self.__regions[regions_to_remove[0]]
-            if first_start == merged_start:
-                # The lowest-start involved region anchors the merged span at
-                # its own start, so it already holds the head of the result.
-                # Grow it in place and overlay the other pieces, instead of
-                # allocating a fresh buffer and re-copying the (typically large)
-                # accumulated head region.
-                merged_data = first_data
-                merged_data.extend(bytes(merged_end - merged_start - len(first_data)))
-                for i in regions_to_remove[1:]:
-                    region_start, region_data = self.__regions[i]
-                    off = region_start - merged_start
-                    merged_data[off : off + len(region_data)] = region_data
-            else:
-                # The new data starts before the lowest-start region, so the
-                # anchor's bytes do not begin at merged_start; build a fresh
-                # buffer and copy the existing regions into place.
-                merged_data = bytearray(merged_end - merged_start)
-                for i in regions_to_remove:
-                    region_start, region_data = self.__regions[i]
-                    off = region_start - merged_start
-                    merged_data[off : off + len(region_data)] = region_data
-            # Then overlay new data (takes precedence)
-            off = offset - merged_start
-            merged_data[off : off + len(data)] = data
-
-            # Remove old regions in reverse order to preserve indices
-            for i in reversed(regions_to_remove):
-                del self.__regions[i]
-
-            self.__regions.append((merged_start, merged_data))
+        first_start = self.__starts[first]
+        last_end = self.__starts[stop - 1] + len(self.__regions[stop - 1])
+        merged_start = min(offset, first_start)
+        merged_end = max(end, last_end)
+
+        if first_start == merged_start:
+            # The lowest-start involved region anchors the merged span at its own
+            # start, so it already holds the head of the result. Grow it in place
+            # and overlay the other pieces, instead of allocating a fresh buffer
+            # and re-copying the (typically large) accumulated head region. A
+            # sequential append onto a lone region lands here and costs
+            # amortized O(len(data)).
+            merged_data = self.__regions[first]
+            try:
+                merged_data.extend(bytes(merged_end - merged_start - len(merged_data)))
+            except BufferError:
+                # A zero-copy view (see view()) pins this region's memory, so it
+                # cannot be resized; grow a copy instead and leave the viewed
+                # bytes intact for as long as the view lives.
+                merged_data = merged_data + bytes(merged_end - merged_start - len(merged_data))
+            others = range(first + 1, stop)
         else:
-            self.__regions.append((offset, bytearray(data)))
+            # The new data starts before the lowest-start region, so the anchor's
+            # bytes do not begin at merged_start; build a fresh buffer and copy the
+            # existing regions into place.
+            merged_data = bytearray(merged_end - merged_start)
+            others = range(first, stop)
+        for i in others:
+            off = self.__starts[i] - merged_start
+            merged_data[off : off + len(self.__regions[i])] = self.__regions[i]
+        # Then overlay new data (takes precedence)
+        off = offset - merged_start
+        merged_data[off : off + len(data)] = data
+
+        self.__starts[first:stop] = [merged_start]
+        self.__regions[first:stop] = [merged_data]
+
+    def adjacent_regions(
+        self, offset: int
+    ) -> tuple[typing.Optional[tuple[int, int]], typing.Optional[tuple[int, int]]]:
+        """The cached ranges on either side of an offset.
+
+        Args:
+            offset: Byte offset to look around.
 
-        # Keep sorted by start offset for efficient lookup
-        self.__regions.sort(key=lambda r: r[0])
+        Returns:
+            ``(before, after)``: the (start, end) range of the last region starting
+            at or before ``offset`` (which contains ``offset`` when its end is past
+            it), and of the first region starting after ``offset``. Either is
+            ``None`` when no such region exists. End is exclusive.
+        """
+        i = bisect.bisect_right(self.__starts, offset)
+        before = (self.__starts[i - 1], self.__starts[i - 1] + len(self.__regions[i - 1])) if i > 0 else None
+        after = (self.__starts[i], self.__starts[i] + len(self.__regions[i])) if i < len(self.__starts) else None
+        return before, after
 
     def clear(self) -> None:
         """Remove all cached regions."""
+        self.__starts.clear()
         self.__regions.clear()
 
+    def discard(self, start: int, end: int) -> None:
+        """Remove cached bytes in [start, end), keeping the parts of regions outside it.
+
+        Trimming a region's head or tail resizes it in place (CPython drops
+        leading bytearray bytes without moving the rest), so releasing spans in
+        read order off the front of one large region stays cheap. Only a region
+        split in the middle copies its tail. Views taken over discarded bytes
+        stay valid.
+
+        Args:
+            start: Start byte offset (inclusive).
+            end: End byte offset (exclusive).
+        """
+        if start >= end:
+            return
+        first = bisect.bisect_right(self.__starts, start) - 1
+        if first < 0 or self.__starts[first] + len(self.__regions[first]) <= start:
+            first += 1
+        stop = bisect.bisect_left(self.__starts, end)
+        if first >= stop:
+            return
+
+        kept_starts: list[int] = []
+        kept_regions: list[bytearray] = []
+        for i in range(first, stop):
+            region_start = self.__starts[i]
+            region_data = self.__regions[i]
+            region_end = region_start + len(region_data)
+            if region_start < start and region_end > end:
+                # Split: copy the tail out before the head is truncated in place.
+                tail = region_data[end - region_start :]
+                kept_starts += [region_start, end]
+                kept_regions += [_trimmed(region_data, 0, start - region_start), tail]
+            elif region_start < start:
+                kept_starts.append(region_start)
+                kept_regions.append(_trimmed(region_data, 0, start - region_start))
+            elif region_end > end:
+                kept_starts.append(end)
+                kept_regions.append(_trimmed(region_data, end - region_start, len(region_data)))
+
+        self.__starts[first:stop] = kept_starts
+        self.__regions[first:stop] = kept_regions
+
     def find_region(self, start: int, size: int) -> bytes | None:
         """Check if [start, start+size) is fully contained in a cached region.
 
@@ -155,12 +217,42 @@ class SparseBuffer:
         Returns:
             The requested bytes if fully cached, None otherwise.
         """
-        for region_start, region_data in self.__regions:
-            region_end = region_start + len(region_data)
-            if region_start <= start and start + size <= region_end:
-                offset = start - region_start
-                return bytes(memoryview(region_data)[offset : offset + size])
-        return None
+        i = bisect.bisect_right(self.__starts, start) - 1
+        if i < 0:
+            return None
+        region_start = self.__starts[i]
+        region_data = self.__regions[i]
+        if start + size > region_start + len(region_data):
+            return None
+        offset = start - region_start
+        return bytes(memoryview(region_data)[offset : offset + size])
+
+    def gaps(self, start: int, end: int) -> list[tuple[int, int]]:
+        """The sub-ranges of [start, end) not covered by any cached region.
+
+        Args:
+            start: Start byte offset (inclusive).
+            end: End byte offset (exclusive).
+
+        Returns:
+            The uncovered (start, end) ranges in offset order, end exclusive;
+            empty when the whole range is cached.
+        """
+        gaps: list[tuple[int, int]] = []
+        # Begin at the region that may contain start; every later region is
+        # visited only while it begins before end.
+        i = max(bisect.bisect_right(self.__starts, start) - 1, 0)
+        while i < len(self.__starts) and start < end:
+            region_start = self.__starts[i]
+            if region_start >= end:
+                break
+            if region_start > start:
+                gaps.append((start, region_start))
+            start = max(start, region_start + len(self.__regions[i]))
+            i += 1
+        if start < end:
+            gaps.append((start, end))
+        return gaps
 
     def read(self, size: int = -1) -> bytes:
         """Read up to size bytes from the current position.
@@ -189,12 +281,13 @@ class SparseBuffer:
         size = min(size, self.__size - self.__pos)
 
         # Find region containing current position
-        for region_start, region_data in self.__regions:
-            region_end = region_start + len(region_data)
-            if region_start <= self.__pos < region_end:
-                available = region_end - self.__pos
-                read_size = min(size, available)
-                region_offset = self.__pos - region_start
+        i = bisect.bisect_right(self.__starts, self.__pos) - 1
+        if i >= 0:
+            region_start = self.__starts[i]
+            region_data = self.__regions[i]
+            region_offset = self.__pos - region_start
+            if region_offset < len(region_data):
+                read_size = min(size, len(region_data) - region_offset)
                 result = bytes(memoryview(region_data)[region_offset : region_offset + read_size])
                 self.__pos += len(result)
                 return result
@@ -233,6 +326,48 @@ class SparseBuffer:
         """Return the current read position."""
         return self.__pos
 
+    def view(self, start: int, size: int) -> memoryview | None:
+        """Zero-copy counterpart of :py:meth:`find_region`: a read-only view of cached bytes.
+
+        The view references the region's memory directly instead of copying it
+        out, and keeps that memory alive for as long as the caller holds it, even
+        across :py:meth:`clear` or later merges (a region pinned by a view is
+        copied rather than resized when it next grows).
+
+        Args:
+            start: Start byte offset.
+            size: Number of bytes.
+
+        Returns:
+            A read-only memoryview of [start, start+size) if fully cached, None otherwise.
+        """
+        i = bisect.bisect_right(self.__starts, start) - 1
+        if i < 0:
+            return None
+        region_start = self.__starts[i]
+        region_data = self.__regions[i]
+        if start + size > region_start + len(region_data):
+            return None
+        offset = start - region_start
+        return memoryview(region_data).toreadonly()[offset : offset + size]
+
     def writable(self) -> bool:
         """Return False - this buffer is read-only."""
         return False
+
+
+def _trimmed(data: bytearray, lo: int, hi: int) -> bytearray:
+    """``data[lo:hi]``, cutting ``data`` down in place when the slice is its head or tail.
+
+    A region pinned by a view cannot be resized; it is sliced into a copy instead.
+    """
+    try:
+        if hi == len(data):
+            del data[:lo]
+            return data
+        if lo == 0:
+            del data[hi:]
+            return data
+    except BufferError:
+        pass
+    return data[lo:hi]